@@ -380,6 +380,9 @@ plugins: Dict[str, Set[str]] = {
     },
     # Misc plugins.
     "sql-parser": sqlglot_lib,
+    # A faster JSON backend for the emitters and file sink / source, which is used
+    # with DATAHUB_JSON_BACKEND=orjson.
+    "fast-json": {"orjson>=3.8.0"},
     # Source plugins
     # sqlalchemy-bigquery is included here since it provides an implementation of
     # a SQLalchemy-conform STRUCT type definition
@@ -928,6 +931,7 @@ See the [DataHub docs](https://datahubproject.io/docs/metadata-ingestion).
                         "datahub-kafka",
                         "sync-file-emitter",
                         "sql-parser",
+                        "fast-json",
                         "iceberg",
                         "feast",
                     }
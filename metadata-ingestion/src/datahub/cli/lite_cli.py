@@ -196,7 +196,7 @@ def nuke(ctx: click.Context) -> None:
 @click.pass_context
 @telemetry.with_telemetry()
 def reindex(ctx: click.Context) -> None:
-    """Reindex the catalog"""
+    """Reindex the catalog, including the free text search index"""
     lite = _get_datahub_lite()
     lite.reindex()
 
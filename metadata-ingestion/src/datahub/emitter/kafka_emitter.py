@@ -1,5 +1,6 @@
 import logging
-from typing import Callable, Dict, Optional, Union
+import threading
+from typing import Any, Callable, Dict, Optional, Union
 
 import pydantic
 from confluent_kafka import SerializingProducer
@@ -57,7 +58,22 @@ class KafkaEmitterConfig(ConfigModel):
 
 
 class DatahubKafkaEmitter(Closeable, Emitter):
-    def __init__(self, config: KafkaEmitterConfig):
+    """Emits MCEs and MCPs to Kafka.
+
+    By default, the producers are polled for delivery reports before every message
+    is produced. If poll_interval_seconds is set, they are polled by a background
+    thread instead, and delivery callbacks are called on that thread.
+
+    The default_producer_config is applied to both producers, unless the options
+    are overridden in the connection's producer_config.
+    """
+
+    def __init__(
+        self,
+        config: KafkaEmitterConfig,
+        poll_interval_seconds: Optional[float] = None,
+        default_producer_config: Optional[Dict[str, Any]] = None,
+    ):
         self.config = config
         schema_registry_conf = {
             "url": self.config.connection.schema_registry_url,
@@ -88,19 +104,24 @@ class DatahubKafkaEmitter(Closeable, Emitter):
             to_dict=convert_mcp_to_dict,
         )
 
+        producer_config = {
+            **(default_producer_config or {}),
+            **self.config.connection.producer_config,
+        }
+
         # We maintain a map of producers for each kind of event
         producers_config = {
             MCE_KEY: {
                 "bootstrap.servers": self.config.connection.bootstrap,
                 "key.serializer": StringSerializer("utf_8"),
                 "value.serializer": mce_avro_serializer,
-                **self.config.connection.producer_config,
+                **producer_config,
             },
             MCP_KEY: {
                 "bootstrap.servers": self.config.connection.bootstrap,
                 "key.serializer": StringSerializer("utf_8"),
                 "value.serializer": mcp_avro_serializer,
-                **self.config.connection.producer_config,
+                **producer_config,
             },
         }
 
@@ -108,6 +129,37 @@ class DatahubKafkaEmitter(Closeable, Emitter):
             key: SerializingProducer(value) for (key, value) in producers_config.items()
         }
 
+        self._stop_polling = threading.Event()
+        self._poll_thread: Optional[threading.Thread] = None
+        if poll_interval_seconds is not None:
+            self._poll_thread = threading.Thread(
+                target=self._poll_loop,
+                args=(poll_interval_seconds,),
+                name="kafka-emitter-poll",
+                daemon=True,
+            )
+            self._poll_thread.start()
+
+    def _poll_loop(self, poll_interval_seconds: float) -> None:
+        while not self._stop_polling.is_set():
+            for producer in self.producers.values():
+                producer.poll(0)
+            self._stop_polling.wait(poll_interval_seconds)
+
+    def _produce(self, producer: SerializingProducer, **kwargs: Any) -> None:
+        if self._poll_thread is None:
+            # Call poll to trigger any callbacks on success / failure of previous writes
+            producer.poll(0)
+
+        while True:
+            try:
+                producer.produce(**kwargs)
+                return
+            except BufferError:
+                # The producer's queue is full, so we wait for some of the
+                # queued messages to be delivered.
+                producer.poll(1)
+
     def emit(
         self,
         item: Union[
@@ -127,10 +179,8 @@ class DatahubKafkaEmitter(Closeable, Emitter):
         mce: MetadataChangeEvent,
         callback: Callable[[Exception, str], None],
     ) -> None:
-        # Call poll to trigger any callbacks on success / failure of previous writes
-        producer: SerializingProducer = self.producers[MCE_KEY]
-        producer.poll(0)
-        producer.produce(
+        self._produce(
+            self.producers[MCE_KEY],
             topic=self.config.topic_routes[MCE_KEY],
             key=mce.proposedSnapshot.urn,
             value=mce,
@@ -142,10 +192,8 @@ class DatahubKafkaEmitter(Closeable, Emitter):
         mcp: Union[MetadataChangeProposal, MetadataChangeProposalWrapper],
         callback: Callable[[Exception, str], None],
     ) -> None:
-        # Call poll to trigger any callbacks on success / failure of previous writes
-        producer: SerializingProducer = self.producers[MCP_KEY]
-        producer.poll(0)
-        producer.produce(
+        self._produce(
+            self.producers[MCP_KEY],
             topic=self.config.topic_routes[MCP_KEY],
             key=mcp.entityUrn,
             value=mcp,
@@ -157,6 +205,10 @@ class DatahubKafkaEmitter(Closeable, Emitter):
             producer.flush()
 
     def close(self) -> None:
+        if self._poll_thread is not None:
+            self._stop_polling.set()
+            self._poll_thread.join()
+            self._poll_thread = None
         self.flush()
 
 
@@ -22,8 +22,12 @@ if TYPE_CHECKING:
 _ENTITY_TYPE_UNSET = "ENTITY_TYPE_UNSET"
 
 
+def _make_aspect_json(codegen_obj: DictWrapper) -> dict:
+    return pre_json_transform(codegen_obj.to_obj(), schema=codegen_obj.RECORD_SCHEMA)
+
+
 def _make_generic_aspect(codegen_obj: DictWrapper) -> GenericAspectClass:
-    serialized = json.dumps(pre_json_transform(codegen_obj.to_obj()))
+    serialized = json.dumps(_make_aspect_json(codegen_obj))
     return GenericAspectClass(
         value=serialized.encode(),
         contentType=JSON_CONTENT_TYPE,
@@ -50,7 +54,7 @@ def _try_from_generic_aspect(
     aspect_cls = ASPECT_MAP[aspectName]
 
     serialized = aspect.value.decode()
-    obj = post_json_transform(json.loads(serialized))
+    obj = post_json_transform(json.loads(serialized), schema=aspect_cls.RECORD_SCHEMA)
 
     return True, aspect_cls.from_obj(obj)
 
@@ -146,17 +150,22 @@ class MetadataChangeProposalWrapper:
 
     def to_obj(self, tuples: bool = False, simplified_structure: bool = False) -> dict:
         # The simplified_structure parameter is used to make the output
-        # not contain nested JSON strings. Instead, it unpacks the JSON
-        # string into an object.
-
-        obj = self.make_mcp().to_obj(tuples=tuples)
-        if simplified_structure:
-            # Undo the double JSON serialization that happens in the MCP aspect.
-            if (
-                obj.get("aspect")
-                and obj["aspect"].get("contentType") == JSON_CONTENT_TYPE
-            ):
-                obj["aspect"] = {"json": json.loads(obj["aspect"]["value"])}
+        # not contain nested JSON strings. Instead, the aspect is included
+        # as an object.
+
+        if not simplified_structure or self.aspect is None:
+            return self.make_mcp().to_obj(tuples=tuples)
+
+        # PERF: Serializing the aspect straight into an object is much faster than
+        # encoding it into a JSON string with make_mcp() and decoding it again.
+        mcp = self._make_mcp_without_aspects()
+        if isinstance(self.entityKeyAspect, DictWrapper):
+            mcp.entityKeyAspect = _make_generic_aspect(self.entityKeyAspect)
+        # The placeholder keeps the aspect in the same position in the output.
+        mcp.aspect = GenericAspectClass(value=b"", contentType=JSON_CONTENT_TYPE)
+
+        obj = mcp.to_obj(tuples=tuples)
+        obj["aspect"] = {"json": _make_aspect_json(self.aspect)}
         return obj
 
     @classmethod
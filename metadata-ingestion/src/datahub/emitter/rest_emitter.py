@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import contextlib
 import functools
-import json
 import logging
 import os
+import queue
+import threading
 import time
 import warnings
 from collections import defaultdict
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import auto
 from json.decoder import JSONDecodeError
@@ -16,6 +19,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -58,6 +62,8 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeProposal,
 )
 from datahub.metadata.com.linkedin.pegasus2avro.usage import UsageAggregation
+from datahub.utilities import fast_json
+from datahub.utilities.perf_timer import PerfTimer
 
 if TYPE_CHECKING:
     from datahub.ingestion.graph.client import DataHubGraph
@@ -98,6 +104,14 @@ BATCH_INGEST_MAX_PAYLOAD_LENGTH = int(
     os.getenv("DATAHUB_REST_EMITTER_BATCH_MAX_PAYLOAD_LENGTH", 200)
 )
 
+# The number of OpenAPI chunks that a single emit_mcps call may have in flight.
+# Chunks for the same entity url are always sent serially and in order, so this
+# only helps when a batch spans multiple entity types or many chunks of each.
+# A value of 1 keeps the original serial behavior.
+DEFAULT_MAX_CONCURRENT_CHUNKS = int(
+    os.getenv("DATAHUB_REST_EMITTER_MAX_CONCURRENT_CHUNKS", 1)
+)
+
 
 class RestTraceMode(ConfigEnum):
     ENABLED = auto()
@@ -208,12 +222,44 @@ class _Chunk:
         return "[" + ",".join(chunk.items) + "]"
 
 
+@dataclass
+class ChunkLatencyStats:
+    """Aggregated timings for the chunked requests sent by emit_mcps."""
+
+    chunks_emitted: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record(self, latency_seconds: float) -> None:
+        with self._lock:
+            self.chunks_emitted += 1
+            self.total_seconds += latency_seconds
+            self.max_seconds = max(self.max_seconds, latency_seconds)
+
+    def avg_seconds(self) -> float:
+        if not self.chunks_emitted:
+            return 0.0
+        return self.total_seconds / self.chunks_emitted
+
+    def as_obj(self) -> dict:
+        return {
+            "chunks_emitted": self.chunks_emitted,
+            "total_seconds": round(self.total_seconds, 3),
+            "avg_seconds": round(self.avg_seconds(), 3),
+            "max_seconds": round(self.max_seconds, 3),
+        }
+
+
 class DataHubRestEmitter(Closeable, Emitter):
     _gms_server: str
     _token: Optional[str]
     _session: requests.Session
     _openapi_ingestion: bool
     _default_trace_mode: bool
+    _max_concurrent_chunks: int
 
     def __init__(
         self,
@@ -233,6 +279,7 @@ class DataHubRestEmitter(Closeable, Emitter):
             DEFAULT_REST_EMITTER_ENDPOINT == RestSinkEndpoint.OPENAPI
         ),
         default_trace_mode: bool = False,
+        max_concurrent_chunks: int = DEFAULT_MAX_CONCURRENT_CHUNKS,
     ):
         if not gms_server:
             raise ConfigurationError("gms server is required")
@@ -247,8 +294,16 @@ class DataHubRestEmitter(Closeable, Emitter):
         self.server_config: Dict[str, Any] = {}
         self._openapi_ingestion = openapi_ingestion
         self._default_trace_mode = default_trace_mode
+        if max_concurrent_chunks < 1:
+            raise ConfigurationError("max_concurrent_chunks must be at least 1")
+        self._max_concurrent_chunks = max_concurrent_chunks
+        self.chunk_latency = ChunkLatencyStats()
         self._session = requests.Session()
 
+        # Extra sessions used for concurrent chunk dispatch. These are created
+        # lazily and reused across calls so that their connection pools stay warm.
+        self._session_pool: "queue.Queue[requests.Session]" = queue.Queue()
+
         logger.debug(
             f"Using {'OpenAPI' if self._openapi_ingestion else 'Restli'} for ingestion."
         )
@@ -256,6 +311,11 @@ class DataHubRestEmitter(Closeable, Emitter):
         if self._default_trace_mode:
             logger.debug("Using API Tracing for ingestion.")
 
+        if self._max_concurrent_chunks > 1:
+            logger.debug(
+                f"Dispatching up to {self._max_concurrent_chunks} OpenAPI chunks concurrently."
+            )
+
         headers = {
             "X-RestLi-Protocol-Version": "2.0.0",
             "X-DataHub-Py-Cli-Version": nice_version_name(),
@@ -357,14 +417,14 @@ class DataHubRestEmitter(Closeable, Emitter):
 
             if isinstance(mcp, MetadataChangeProposalWrapper):
                 aspect_value = pre_json_transform(
-                    mcp.to_obj(simplified_structure=True)
-                )["aspect"]["json"]
+                    mcp.aspect.to_obj(), schema=mcp.aspect.RECORD_SCHEMA
+                )
             else:
                 obj = mcp.aspect.to_obj()
                 content_type = obj.get("contentType")
                 if obj.get("value") and content_type == JSON_CONTENT_TYPE:
                     # Undo double serialization.
-                    obj = json.loads(obj["value"])
+                    obj = fast_json.loads(obj["value"])
                 elif content_type == JSON_PATCH_CONTENT_TYPE:
                     raise NotImplementedError(
                         "Patches are not supported for OpenAPI ingestion. Set the endpoint to RESTLI."
@@ -430,7 +490,7 @@ class DataHubRestEmitter(Closeable, Emitter):
             "entity": {"value": {snapshot_fqn: mce_obj}},
             "systemMetadata": system_metadata_obj,
         }
-        payload = json.dumps(snapshot)
+        payload = fast_json.dumps(snapshot)
 
         self._emit_generic(url, payload)
 
@@ -462,7 +522,7 @@ class DataHubRestEmitter(Closeable, Emitter):
             if async_flag is not None:
                 payload_dict["async"] = "true" if async_flag else "false"
 
-            payload = json.dumps(payload_dict)
+            payload = fast_json.dumps(payload_dict)
 
             response = self._emit_generic(url, payload)
 
@@ -513,6 +573,10 @@ class DataHubRestEmitter(Closeable, Emitter):
         The chunking logic handles edge cases (always accepting at least one item per chunk)
         The joining logic is efficient with a simple string concatenation
 
+        3. Sending the chunks. If max_concurrent_chunks > 1, chunks for different
+        entity urls are sent concurrently over a pool of sessions, while chunks for
+        the same entity url are still sent serially and in order.
+
         :param mcps: metadata change proposals to transmit
         :param async_flag: the mode
         :return: number of requests
@@ -527,7 +591,7 @@ class DataHubRestEmitter(Closeable, Emitter):
             if request:
                 current_chunk = batches[request[0]][-1]  # Get the last chunk
                 # Only serialize once
-                serialized_item = json.dumps(request[1][0])
+                serialized_item = fast_json.dumps(request[1][0])
                 item_bytes = len(serialized_item.encode())
 
                 # If adding this item would exceed max_bytes, create a new chunk
@@ -542,11 +606,12 @@ class DataHubRestEmitter(Closeable, Emitter):
 
                 current_chunk.add_item(serialized_item)
 
-        responses = []
-        for url, chunks in batches.items():
-            for chunk in chunks:
-                response = self._emit_generic(url, payload=_Chunk.join(chunk))
-                responses.append(response)
+        if self._max_concurrent_chunks > 1 and len(batches) > 1:
+            responses = self._emit_chunks_concurrently(batches)
+        else:
+            responses = []
+            for url, chunks in batches.items():
+                responses.extend(self._emit_chunks_serially(url, chunks))
 
         if self._should_trace(async_flag, trace_flag, async_default=True):
             trace_data = []
@@ -554,12 +619,71 @@ class DataHubRestEmitter(Closeable, Emitter):
                 data = extract_trace_data(response) if response else None
                 if data is not None:
                     trace_data.append(data)
+            trace_data = _merge_trace_data(trace_data)
 
             if trace_data:
                 self._await_status(trace_data, trace_timeout)
 
         return len(responses)
 
+    def _emit_chunks_serially(
+        self,
+        url: str,
+        chunks: List[_Chunk],
+        session: Optional[requests.Session] = None,
+    ) -> List[requests.Response]:
+        responses = []
+        for chunk in chunks:
+            with PerfTimer() as timer:
+                if session is None:
+                    response = self._emit_generic(url, payload=_Chunk.join(chunk))
+                else:
+                    response = self._emit_generic(
+                        url, payload=_Chunk.join(chunk), session=session
+                    )
+            latency = timer.elapsed_seconds()
+            self.chunk_latency.record(latency)
+            logger.debug(
+                f"Emitted chunk of {len(chunk.items)} items ({chunk.total_bytes} bytes) to {url} in {latency:.3f} seconds"
+            )
+            responses.append(response)
+        return responses
+
+    def _emit_chunks_concurrently(
+        self, batches: Dict[str, List[_Chunk]]
+    ) -> List[requests.Response]:
+        # Each entity url is handled by a single task, so chunks for the same url
+        # are still sent in order. Results are collected in submission order so
+        # that the returned responses (and hence trace data) are deterministic.
+        max_workers = min(self._max_concurrent_chunks, len(batches))
+
+        def _emit_url(url: str, chunks: List[_Chunk]) -> List[requests.Response]:
+            with self._borrow_session() as session:
+                return self._emit_chunks_serially(url, chunks, session=session)
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="rest-emitter-chunk"
+        ) as executor:
+            futures = [
+                executor.submit(_emit_url, url, chunks)
+                for url, chunks in batches.items()
+            ]
+            responses: List[requests.Response] = []
+            for future in futures:
+                responses.extend(future.result())
+        return responses
+
+    @contextlib.contextmanager
+    def _borrow_session(self) -> Iterator[requests.Session]:
+        try:
+            session = self._session_pool.get_nowait()
+        except queue.Empty:
+            session = self._session_config.build_session()
+        try:
+            yield session
+        finally:
+            self._session_pool.put(session)
+
     def _emit_restli_mcps(
         self,
         mcps: Sequence[Union[MetadataChangeProposal, MetadataChangeProposalWrapper]],
@@ -567,43 +691,40 @@ class DataHubRestEmitter(Closeable, Emitter):
     ) -> int:
         url = f"{self._gms_server}/aspects?action=ingestProposalBatch"
 
-        mcp_objs = [pre_json_transform(mcp.to_obj()) for mcp in mcps]
-
         # As a safety mechanism, we need to make sure we don't exceed the max payload size for GMS.
         # If we will exceed the limit, we need to break it up into chunks.
-        mcp_obj_chunks: List[List[str]] = []
-        current_chunk_size = INGEST_MAX_PAYLOAD_BYTES
-        for mcp_obj in mcp_objs:
-            mcp_obj_size = len(json.dumps(mcp_obj))
+        # Each MCP is serialized exactly once, and the serialized fragments are reused
+        # both to measure the chunk size and to assemble the request body.
+        mcp_obj_chunks: List[_Chunk] = []
+        for mcp in mcps:
+            serialized_mcp = fast_json.dumps(pre_json_transform(mcp.to_obj()))
+            mcp_obj_size = len(serialized_mcp)
             if _DATAHUB_EMITTER_TRACE:
                 logger.debug(
-                    f"Iterating through object with size {mcp_obj_size} (type: {mcp_obj.get('aspectName')}"
+                    f"Iterating through object with size {mcp_obj_size} (type: {mcp.aspectName}"
                 )
 
             if (
-                mcp_obj_size + current_chunk_size > INGEST_MAX_PAYLOAD_BYTES
-                or len(mcp_obj_chunks[-1]) >= BATCH_INGEST_MAX_PAYLOAD_LENGTH
+                not mcp_obj_chunks
+                or mcp_obj_size + mcp_obj_chunks[-1].total_bytes
+                > INGEST_MAX_PAYLOAD_BYTES
+                or len(mcp_obj_chunks[-1].items) >= BATCH_INGEST_MAX_PAYLOAD_LENGTH
             ):
                 if _DATAHUB_EMITTER_TRACE:
                     logger.debug("Decided to create new chunk")
-                mcp_obj_chunks.append([])
-                current_chunk_size = 0
-            mcp_obj_chunks[-1].append(mcp_obj)
-            current_chunk_size += mcp_obj_size
+                mcp_obj_chunks.append(_Chunk(items=[]))
+            mcp_obj_chunks[-1].items.append(serialized_mcp)
+            mcp_obj_chunks[-1].total_bytes += mcp_obj_size
         if len(mcp_obj_chunks) > 0:
             logger.debug(
                 f"Decided to send {len(mcps)} MCP batch in {len(mcp_obj_chunks)} chunks"
             )
 
         for mcp_obj_chunk in mcp_obj_chunks:
-            # TODO: We're calling json.dumps on each MCP object twice, once to estimate
-            # the size when chunking, and again for the actual request.
-            payload_dict: dict = {"proposals": mcp_obj_chunk}
-            if async_flag is not None:
-                payload_dict["async"] = "true" if async_flag else "false"
-
-            payload = json.dumps(payload_dict)
-            self._emit_generic(url, payload)
+            payload = _make_restli_batch_payload(mcp_obj_chunk, async_flag)
+            with PerfTimer() as timer:
+                self._emit_generic(url, payload)
+            self.chunk_latency.record(timer.elapsed_seconds())
 
         return len(mcp_obj_chunks)
 
@@ -615,15 +736,25 @@ class DataHubRestEmitter(Closeable, Emitter):
         usage_obj = pre_json_transform(raw_usage_obj)
 
         snapshot = {"buckets": [usage_obj]}
-        payload = json.dumps(snapshot)
+        payload = fast_json.dumps(snapshot)
         self._emit_generic(url, payload)
 
-    def _emit_generic(self, url: str, payload: Union[str, Any]) -> requests.Response:
+    def _emit_generic(
+        self,
+        url: str,
+        payload: Union[str, Any],
+        session: Optional[requests.Session] = None,
+    ) -> requests.Response:
         if not isinstance(payload, str):
-            payload = json.dumps(payload)
-
-        curl_command = make_curl_command(self._session, "POST", url, payload)
-        payload_size = len(payload)
+            payload = fast_json.dumps(payload)
+        if session is None:
+            session = self._session
+
+        curl_command = make_curl_command(session, "POST", url, payload)
+        # The payload may contain non-ASCII characters if a fast JSON backend is
+        # in use, so we always send it as UTF-8 encoded bytes.
+        payload_bytes = payload.encode()
+        payload_size = len(payload_bytes)
         if payload_size > INGEST_MAX_PAYLOAD_BYTES:
             # since we know total payload size here, we could simply avoid sending such payload at all and report a warning, with current approach we are going to cause whole ingestion to fail
             logger.warning(
@@ -635,7 +766,7 @@ class DataHubRestEmitter(Closeable, Emitter):
             curl_command,
         )
         try:
-            response = self._session.post(url, data=payload)
+            response = session.post(url, data=payload_bytes)
             response.raise_for_status()
             return response
         except HTTPError as e:
@@ -781,6 +912,38 @@ class DataHubRestEmitter(Closeable, Emitter):
 
     def close(self) -> None:
         self._session.close()
+        while True:
+            try:
+                self._session_pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+def _make_restli_batch_payload(chunk: _Chunk, async_flag: Optional[bool]) -> str:
+    # Equivalent to json.dumps({"proposals": [...], "async": ...}), but reuses the
+    # already serialized proposals instead of encoding them a second time.
+    payload = '{"proposals": [' + ", ".join(chunk.items) + "]"
+    if async_flag is not None:
+        payload += ', "async": ' + ('"true"' if async_flag else '"false"')
+    return payload + "}"
+
+
+def _merge_trace_data(trace_data: List[TraceData]) -> List[TraceData]:
+    # Responses that share a trace id are merged so that _await_status only
+    # polls each trace once.
+    merged: Dict[str, TraceData] = {}
+    for data in trace_data:
+        existing = merged.get(data.trace_id)
+        if existing is None:
+            merged[data.trace_id] = TraceData(
+                trace_id=data.trace_id,
+                data={urn: list(aspects) for urn, aspects in data.data.items()},
+            )
+            continue
+        for urn, aspects in data.data.items():
+            existing_aspects = existing.data.setdefault(urn, [])
+            existing_aspects.extend(a for a in aspects if a not in existing_aspects)
+    return list(merged.values())
 
 
 """This class exists as a pass-through for backwards compatibility"""
@@ -1,5 +1,12 @@
+import functools
+import threading
 from collections import OrderedDict
-from typing import Any, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import avro.schema
+
+_PRE_FROM_PATTERN = "com.linkedin.pegasus2avro."
+_PRE_TO_PATTERN = "com.linkedin."
 
 
 def _pre_handle_union_with_aliases(
@@ -93,21 +100,220 @@ def _json_transform(obj: Any, from_pattern: str, to_pattern: str, pre: bool) ->
     return obj
 
 
-def pre_json_transform(obj: Any) -> Any:
-    """Usually called before sending avro-serialized json over to the rest.li server"""
+_Transform = Callable[[Any], Any]
+
+
+class _SchemaTransformCompiler:
+    """Compiles _json_transform into a transform that is specialized for a schema.
+
+    The compiled transform only walks the parts of an object that _json_transform
+    would change: records with optional fields, whose None values are dropped, unions
+    of named types, whose keys are renamed, and bytes. Subtrees that can't contain
+    any of those, like arrays of strings, are returned as is, so they aren't checked
+    against the schema. For objects that match the schema, the result is the same as
+    _json_transform's. Fields and union branches that the schema doesn't know about,
+    e.g. in responses from a newer server, are handed to _json_transform, as are maps
+    and the unions with aliases.
+    """
+
+    def __init__(self, from_pattern: str, to_pattern: str, pre: bool):
+        self.from_pattern = from_pattern
+        self.to_pattern = to_pattern
+        self.pre = pre
+        self.generic: _Transform = functools.partial(
+            _json_transform, from_pattern=from_pattern, to_pattern=to_pattern, pre=pre
+        )
+        self._records: Dict[str, Optional[_Transform]] = {}
+
+    def compile(self, schema: avro.schema.Schema) -> Optional[_Transform]:
+        """Returns the transform for the schema, or None if it is the identity."""
+
+        if isinstance(schema, avro.schema.RecordSchema):
+            return self._compile_record(schema)
+        elif isinstance(schema, avro.schema.UnionSchema):
+            return self._compile_union(schema)
+        elif isinstance(schema, avro.schema.ArraySchema):
+            return self._compile_array(schema)
+        elif isinstance(schema, avro.schema.MapSchema) or schema.type in {
+            "bytes",
+            "fixed",
+        }:
+            # Maps may have keys that look like union keys, so we don't special case them.
+            return self.generic
+        return None
+
+    def _compile_record(self, schema: avro.schema.RecordSchema) -> Optional[_Transform]:
+        if schema.fullname in self._records:
+            return self._records[schema.fullname]
+
+        # Recursive schemas refer to the record's transform before it is compiled.
+        compiled: Optional[_Transform] = None
+        self._records[schema.fullname] = lambda obj: (
+            compiled(obj) if compiled is not None else obj
+        )
+
+        field_transforms = {
+            field.name: self.compile(field.type) for field in schema.fields
+        }
+        is_union_with_aliases = (
+            "fieldDiscriminator" in field_transforms
+            if self.pre
+            else {"cost", "costType"}.issubset(field_transforms)
+        )
+        has_optional_fields = any(_is_nullable(field.type) for field in schema.fields)
+
+        if is_union_with_aliases:
+            compiled = self.generic
+        elif has_optional_fields or any(
+            transform is not None for transform in field_transforms.values()
+        ):
+            compiled = functools.partial(
+                self._transform_record, field_transforms=field_transforms
+            )
+        self._records[schema.fullname] = compiled
+        return compiled
+
+    def _transform_record(
+        self, obj: Any, field_transforms: Dict[str, Optional[_Transform]]
+    ) -> Any:
+        if not isinstance(obj, dict):
+            return self.generic(obj)
+
+        new_obj = {}
+        for key, value in obj.items():
+            if value is None:
+                continue
+            if key not in field_transforms:
+                return self.generic(obj)
+            transform = field_transforms[key]
+            new_obj[key] = transform(value) if transform is not None else value
+        return new_obj
+
+    def _compile_union(self, schema: avro.schema.UnionSchema) -> Optional[_Transform]:
+        branches = [branch for branch in schema.schemas if branch.type != "null"]
+        named_branches: Dict[str, Tuple[str, Optional[_Transform]]] = {}
+        for branch in branches:
+            # The key that wraps the value of a named branch, before and after renaming.
+            if isinstance(branch, avro.schema.NamedSchema):
+                if self.pre and branch.fullname.startswith(self.from_pattern):
+                    key = branch.fullname
+                    new_key = key.replace(self.from_pattern, self.to_pattern, 1)
+                    named_branches[key] = (new_key, self.compile(branch))
+                elif not self.pre and branch.fullname.startswith(self.to_pattern):
+                    new_key = branch.fullname
+                    key = new_key.replace(self.to_pattern, self.from_pattern, 1)
+                    named_branches[key] = (new_key, self.compile(branch))
+
+        single_branch = self.compile(branches[0]) if len(branches) == 1 else None
+        if (
+            len(branches) == 1
+            and single_branch is None
+            and not isinstance(branches[0], avro.schema.NamedSchema)
+        ):
+            # An optional primitive or array, which is never wrapped outside of arrays.
+            return None
+
+        return functools.partial(
+            self._transform_union,
+            named_branches=named_branches,
+            single_branch=single_branch if len(branches) == 1 else self.generic,
+        )
+
+    def _transform_union(
+        self,
+        obj: Any,
+        named_branches: Dict[str, Tuple[str, Optional[_Transform]]],
+        single_branch: Optional[_Transform],
+    ) -> Any:
+        if isinstance(obj, dict) and len(obj) == 1:
+            key = next(iter(obj))
+            if key in named_branches:
+                new_key, transform = named_branches[key]
+                value = obj[key]
+                return {new_key: transform(value) if transform is not None else value}
+            return self.generic(obj)
+        elif isinstance(obj, (dict, list)):
+            # Unions with a single non-null type are not wrapped.
+            return single_branch(obj) if single_branch is not None else obj
+        elif isinstance(obj, bytes):
+            return obj.decode()
+        return obj
+
+    def _compile_array(self, schema: avro.schema.ArraySchema) -> Optional[_Transform]:
+        item_transform = self.compile(schema.items)
+        if item_transform is None:
+            return None
+        return functools.partial(self._transform_array, item_transform=item_transform)
+
+    def _transform_array(self, obj: Any, item_transform: _Transform) -> Any:
+        if not isinstance(obj, list):
+            return self.generic(obj)
+        return [item_transform(item) for item in obj]
+
+
+def _is_nullable(schema: avro.schema.Schema) -> bool:
+    if isinstance(schema, avro.schema.UnionSchema):
+        return any(branch.type == "null" for branch in schema.schemas)
+    return schema.type == "null"
+
+
+_compiled_transforms: Dict[Tuple[str, bool], Optional[_Transform]] = {}
+_compiled_transforms_lock = threading.Lock()
+
+
+def _get_compiled_transform(
+    schema: avro.schema.RecordSchema, pre: bool
+) -> Optional[_Transform]:
+    cache_key = (schema.fullname, pre)
+    if cache_key not in _compiled_transforms:
+        with _compiled_transforms_lock:
+            if cache_key not in _compiled_transforms:
+                if pre:
+                    compiler = _SchemaTransformCompiler(
+                        _PRE_FROM_PATTERN, _PRE_TO_PATTERN, pre=True
+                    )
+                else:
+                    compiler = _SchemaTransformCompiler(
+                        _PRE_TO_PATTERN, _PRE_FROM_PATTERN, pre=False
+                    )
+                _compiled_transforms[cache_key] = compiler.compile(schema)
+    return _compiled_transforms[cache_key]
+
+
+def pre_json_transform(
+    obj: Any, schema: Optional[avro.schema.RecordSchema] = None
+) -> Any:
+    """Usually called before sending avro-serialized json over to the rest.li server
+
+    If the schema of obj is known, e.g. because obj is the output of an aspect's
+    to_obj(), passing its RECORD_SCHEMA lets us skip the parts of obj that don't
+    need to be transformed.
+    """
+    if schema is not None:
+        transform = _get_compiled_transform(schema, pre=True)
+        return transform(obj) if transform is not None else obj
     return _json_transform(
         obj,
-        from_pattern="com.linkedin.pegasus2avro.",
-        to_pattern="com.linkedin.",
+        from_pattern=_PRE_FROM_PATTERN,
+        to_pattern=_PRE_TO_PATTERN,
         pre=True,
     )
 
 
-def post_json_transform(obj: Any) -> Any:
-    """Usually called after receiving restli-serialized json before instantiating into avro-generated Python classes"""
+def post_json_transform(
+    obj: Any, schema: Optional[avro.schema.RecordSchema] = None
+) -> Any:
+    """Usually called after receiving restli-serialized json before instantiating into avro-generated Python classes
+
+    As with pre_json_transform, passing the RECORD_SCHEMA of the class that obj will
+    be instantiated into makes the transform faster.
+    """
+    if schema is not None:
+        transform = _get_compiled_transform(schema, pre=False)
+        return transform(obj) if transform is not None else obj
     return _json_transform(
         obj,
-        from_pattern="com.linkedin.",
-        to_pattern="com.linkedin.pegasus2avro.",
+        from_pattern=_PRE_TO_PATTERN,
+        to_pattern=_PRE_FROM_PATTERN,
         pre=False,
     )
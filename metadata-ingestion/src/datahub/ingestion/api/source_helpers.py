@@ -43,6 +43,7 @@ from datahub.metadata.urns import DatasetUrn, GlossaryTermUrn, TagUrn, Urn
 from datahub.sdk.entity import Entity
 from datahub.specific.dataset import DatasetPatchBuilder
 from datahub.telemetry import telemetry
+from datahub.utilities.urn_set import UrnSet
 from datahub.utilities.urns.error import InvalidUrnError
 from datahub.utilities.urns.urn import guess_entity_type
 from datahub.utilities.urns.urn_iter import list_urns, lowercase_dataset_urns
@@ -115,8 +116,8 @@ def auto_status_aspect(
     """
     For all entities that don't have a status aspect, add one with removed set to false.
     """
-    all_urns: Set[str] = set()
-    status_urns: Set[str] = set()
+    all_urns = UrnSet()
+    status_urns = UrnSet()
     for wu in stream:
         urn = wu.get_urn()
         all_urns.add(urn)
@@ -141,17 +142,21 @@ def auto_status_aspect(
 
         yield wu
 
-    for urn in sorted(all_urns - status_urns):
-        entity_type = guess_entity_type(urn)
-        if not entity_supports_aspect(entity_type, StatusClass):
-            # If any entity does not support aspect 'status' then skip that entity from adding status aspect.
-            # Example like dataProcessInstance doesn't suppport status aspect.
-            # If not skipped gives error: java.lang.RuntimeException: Unknown aspect status for entity dataProcessInstance
-            continue
-        yield MetadataChangeProposalWrapper(
-            entityUrn=urn,
-            aspect=StatusClass(removed=False),
-        ).as_workunit()
+    try:
+        for urn in all_urns.difference(status_urns, sort=True):
+            entity_type = guess_entity_type(urn)
+            if not entity_supports_aspect(entity_type, StatusClass):
+                # If any entity does not support aspect 'status' then skip that entity from adding status aspect.
+                # Example like dataProcessInstance doesn't suppport status aspect.
+                # If not skipped gives error: java.lang.RuntimeException: Unknown aspect status for entity dataProcessInstance
+                continue
+            yield MetadataChangeProposalWrapper(
+                entityUrn=urn,
+                aspect=StatusClass(removed=False),
+            ).as_workunit()
+    finally:
+        all_urns.close()
+        status_urns.close()
 
 
 T = TypeVar("T", bound=MetadataWorkUnit)
@@ -334,7 +334,7 @@ class DataHubGraph(DatahubRestEmitter, EntityVersioningAPI):
         aspect_json = response_json.get("aspect", {}).get(aspect_type_name)
         if aspect_json is not None:
             # need to apply a transform to the response to match rest.li and avro serialization
-            post_json_obj = post_json_transform(aspect_json)
+            post_json_obj = post_json_transform(aspect_json, schema=record_schema)
             return aspect_type.from_obj(post_json_obj)
         else:
             raise GraphError(
@@ -1816,7 +1816,9 @@ class DataHubGraph(DatahubRestEmitter, EntityVersioningAPI):
                     continue
 
                 try:
-                    post_json_obj = post_json_transform(aspect_value)
+                    post_json_obj = post_json_transform(
+                        aspect_value, schema=aspect_class.RECORD_SCHEMA
+                    )
                     typed_aspect = aspect_class.from_obj(post_json_obj)
                     assert isinstance(typed_aspect, aspect_class) and isinstance(
                         typed_aspect, _Aspect
@@ -9,7 +9,7 @@ import sys
 import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Iterator, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import click
 import humanfriendly
@@ -26,19 +26,23 @@ from datahub.ingestion.api.common import EndOfStream, PipelineContext, RecordEnv
 from datahub.ingestion.api.global_context import set_graph_context
 from datahub.ingestion.api.pipeline_run_listener import PipelineRunListener
 from datahub.ingestion.api.report import Report
-from datahub.ingestion.api.sink import Sink, SinkReport
+from datahub.ingestion.api.sink import Sink, SinkReport, WriteCallback
 from datahub.ingestion.api.source import Extractor, Source
 from datahub.ingestion.api.transform import Transformer
+from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.extractor.extractor_registry import extractor_registry
 from datahub.ingestion.graph.client import DataHubGraph, get_default_graph
 from datahub.ingestion.reporting.reporting_provider_registry import (
     reporting_provider_registry,
 )
 from datahub.ingestion.run.pipeline_config import PipelineConfig, ReporterConfig
+from datahub.ingestion.run.pipeline_stage import PipelineStage, PipelineStageReport
 from datahub.ingestion.run.sink_callback import DeadLetterQueueCallback, LoggingCallback
 from datahub.ingestion.sink.datahub_rest import DatahubRestSink
 from datahub.ingestion.sink.sink_registry import sink_registry
 from datahub.ingestion.source.source_registry import source_registry
+from datahub.ingestion.transformer.aspect_prefetcher import ServerAspectPrefetcher
+from datahub.ingestion.transformer.base_transformer import BaseTransformer
 from datahub.ingestion.transformer.transform_registry import transform_registry
 from datahub.sdk._attribution import KnownAttribution, change_default_attribution
 from datahub.telemetry import stats
@@ -49,6 +53,8 @@ from datahub.utilities.global_warning_util import (
     get_global_warnings,
 )
 from datahub.utilities.lossy_collections import LossyList
+from datahub.utilities.perf_timer import PerfTimer
+from datahub.utilities.urns._urn_base import get_urn_parse_cache_info
 
 logger = logging.getLogger(__name__)
 _REPORT_PRINT_INTERVAL_SECONDS = 60
@@ -98,6 +104,10 @@ class CliReport(Report):
     thread_count: Optional[int] = None
     peak_thread_count: Optional[int] = None
 
+    pipeline_stages: Optional[Dict[str, PipelineStageReport]] = None
+
+    urn_parse_cache: Optional[dict] = None
+
     def compute_stats(self) -> None:
         try:
             mem_usage = psutil.Process(os.getpid()).memory_info().rss
@@ -132,6 +142,8 @@ class CliReport(Report):
         except Exception as e:
             logger.warning(f"Failed to compute thread count: {e}")
 
+        self.urn_parse_cache = get_urn_parse_cache_info()
+
         return super().compute_stats()
 
 
@@ -150,6 +162,7 @@ class Pipeline:
     sink_type: str
     sink: Sink[ConfigModel, SinkReport]
     transformers: List[Transformer]
+    aspect_prefetcher: Optional[ServerAspectPrefetcher] = None
 
     def __init__(
         self,
@@ -283,6 +296,21 @@ class Pipeline:
                     f"Transformer type:{transformer_type},{transformer_class} configured"
                 )
 
+        # Transformers that read aspects from DataHub for every entity, e.g. with PATCH
+        # semantics, share a prefetcher that fetches those aspects in batches.
+        if self.ctx.graph is not None:
+            for instance in self.transformers:
+                if not isinstance(instance, BaseTransformer):
+                    continue
+                server_aspects = instance.server_aspects()
+                if server_aspects:
+                    if self.aspect_prefetcher is None:
+                        self.aspect_prefetcher = ServerAspectPrefetcher(self.ctx.graph)
+                    self.aspect_prefetcher.register(
+                        instance.entity_types(), server_aspects
+                    )
+                    instance.aspect_prefetcher = self.aspect_prefetcher
+
     def _configure_reporting(self, report_to: Optional[str]) -> None:
         if self.dry_run:
             # In dry run mode, we don't want to report anything.
@@ -422,68 +450,16 @@ class Pipeline:
                         )
                     )
                 )
-                for wu in itertools.islice(
+                workunits: Iterable[MetadataWorkUnit] = itertools.islice(
                     self.source.get_workunits(),
                     self.preview_workunits if self.preview_mode else None,
-                ):
-                    try:
-                        if self._time_to_print() and not self.no_progress:
-                            self.pretty_print_summary(currently_running=True)
-                    except Exception as e:
-                        logger.warning(f"Failed to print summary {e}")
-
-                    if not self.dry_run:
-                        self.sink.handle_work_unit_start(wu)
-                    try:
-                        # Most of this code is meant to be fully stream-based instead of generating all records into memory.
-                        # However, the extractor in particular will never generate a particularly large list. We want the
-                        # exception reporting to be associated with the source, and not the transformer. As such, we
-                        # need to materialize the generator returned by get_records().
-                        record_envelopes = list(self.extractor.get_records(wu))
-                    except Exception as e:
-                        self.source.get_report().failure(
-                            "Source produced bad metadata", context=wu.id, exc=e
-                        )
-                        continue
-                    try:
-                        for record_envelope in self.transform(record_envelopes):
-                            if not self.dry_run:
-                                try:
-                                    self.sink.write_record_async(
-                                        record_envelope, callback
-                                    )
-                                except Exception as e:
-                                    # In case the sink's error handling is bad, we still want to report the error.
-                                    self.sink.report.report_failure(
-                                        f"Failed to write record: {e}"
-                                    )
-
-                    except (RuntimeError, SystemExit):
-                        raise
-                    except Exception as e:
-                        logger.error(
-                            "Failed to process some records. Continuing.",
-                            exc_info=e,
-                        )
-                        # TODO: Transformer errors should be reported more loudly / as part of the pipeline report.
-
-                    if not self.dry_run:
-                        self.sink.handle_work_unit_end(wu)
-
-                # no more data is coming, we need to let the transformers produce any additional records if they are holding on to state
-                for record_envelope in self.transform(
-                    [
-                        RecordEnvelope(
-                            record=EndOfStream(),
-                            metadata={"workunit_id": "end-of-stream"},
-                        )
-                    ]
-                ):
-                    if not self.dry_run and not isinstance(
-                        record_envelope.record, EndOfStream
-                    ):
-                        # TODO: propagate EndOfStream and other control events to sinks, to allow them to flush etc.
-                        self.sink.write_record_async(record_envelope, callback)
+                )
+                if self.aspect_prefetcher is not None:
+                    workunits = self.aspect_prefetcher.prefetch(workunits)
+                if self.config.flags.pipelined_execution:
+                    self._run_pipelined(workunits, callback)
+                else:
+                    self._run_sequential(workunits, callback)
 
                 # Stateful ingestion generates the updated state objects as part of the
                 # source's close method. Because of that, we need to close the source
@@ -504,6 +480,167 @@ class Pipeline:
 
                 self._notify_reporters_on_ingestion_completion()
 
+    def _print_progress(self) -> None:
+        try:
+            if self._time_to_print() and not self.no_progress:
+                self.pretty_print_summary(currently_running=True)
+        except Exception as e:
+            logger.warning(f"Failed to print summary {e}")
+
+    def _extract_records(self, wu: MetadataWorkUnit) -> Optional[List[RecordEnvelope]]:
+        try:
+            # Most of this code is meant to be fully stream-based instead of generating all records into memory.
+            # However, the extractor in particular will never generate a particularly large list. We want the
+            # exception reporting to be associated with the source, and not the transformer. As such, we
+            # need to materialize the generator returned by get_records().
+            return list(self.extractor.get_records(wu))
+        except Exception as e:
+            self.source.get_report().failure(
+                "Source produced bad metadata", context=wu.id, exc=e
+            )
+            return None
+
+    def _write_record(
+        self, record_envelope: RecordEnvelope, callback: WriteCallback
+    ) -> None:
+        if not self.dry_run:
+            try:
+                self.sink.write_record_async(record_envelope, callback)
+            except Exception as e:
+                # In case the sink's error handling is bad, we still want to report the error.
+                self.sink.report.report_failure(f"Failed to write record: {e}")
+
+    def _end_of_stream_records(self) -> Iterable[RecordEnvelope]:
+        # no more data is coming, we need to let the transformers produce any additional records if they are holding on to state
+        return self.transform(
+            [
+                RecordEnvelope(
+                    record=EndOfStream(),
+                    metadata={"workunit_id": "end-of-stream"},
+                )
+            ]
+        )
+
+    def _write_end_of_stream_records(
+        self,
+        record_envelopes: Iterable[RecordEnvelope],
+        callback: WriteCallback,
+    ) -> None:
+        for record_envelope in record_envelopes:
+            if not self.dry_run and not isinstance(record_envelope.record, EndOfStream):
+                # TODO: propagate EndOfStream and other control events to sinks, to allow them to flush etc.
+                self.sink.write_record_async(record_envelope, callback)
+
+    def _run_sequential(
+        self,
+        workunits: Iterable[MetadataWorkUnit],
+        callback: WriteCallback,
+    ) -> None:
+        for wu in workunits:
+            self._print_progress()
+
+            if not self.dry_run:
+                self.sink.handle_work_unit_start(wu)
+            record_envelopes = self._extract_records(wu)
+            if record_envelopes is None:
+                continue
+            try:
+                for record_envelope in self.transform(record_envelopes):
+                    self._write_record(record_envelope, callback)
+            except (RuntimeError, SystemExit):
+                raise
+            except Exception as e:
+                logger.error(
+                    "Failed to process some records. Continuing.",
+                    exc_info=e,
+                )
+                # TODO: Transformer errors should be reported more loudly / as part of the pipeline report.
+
+            if not self.dry_run:
+                self.sink.handle_work_unit_end(wu)
+
+        self._write_end_of_stream_records(self._end_of_stream_records(), callback)
+
+    def _transform_workunits(
+        self,
+        extracted: Iterable[Tuple[MetadataWorkUnit, Optional[List[RecordEnvelope]]]],
+    ) -> Iterable[Tuple[Optional[MetadataWorkUnit], Optional[List[RecordEnvelope]]]]:
+        for wu, record_envelopes in extracted:
+            if record_envelopes is None:
+                yield wu, None
+                continue
+
+            transformed: List[RecordEnvelope] = []
+            try:
+                transformed.extend(self.transform(record_envelopes))
+            except (RuntimeError, SystemExit):
+                raise
+            except Exception as e:
+                logger.error(
+                    "Failed to process some records. Continuing.",
+                    exc_info=e,
+                )
+            yield wu, transformed
+
+        # A workunit of None marks the records produced at the end of the stream.
+        yield None, list(self._end_of_stream_records())
+
+    def _run_pipelined(
+        self,
+        workunits: Iterable[MetadataWorkUnit],
+        callback: WriteCallback,
+    ) -> None:
+        """
+        Runs the source and extractor, the transformers, and the sink on separate
+        threads, connected by bounded queues. The records reach the sink in the
+        same order as in sequential mode.
+        """
+
+        queue_size = self.config.flags.pipelined_execution_queue_size
+        source_stage = PipelineStage(
+            "source",
+            ((wu, self._extract_records(wu)) for wu in workunits),
+            queue_size=queue_size,
+        )
+        transform_stage = PipelineStage(
+            "transform",
+            self._transform_workunits(source_stage),
+            queue_size=queue_size,
+            upstream=source_stage,
+        )
+        sink_report = PipelineStageReport()
+        self.cli_report.pipeline_stages = {
+            "source": source_stage.report,
+            "transform": transform_stage.report,
+            "sink": sink_report,
+        }
+
+        source_stage.start()
+        transform_stage.start()
+        try:
+            for wu, record_envelopes in transform_stage:
+                with PerfTimer() as timer:
+                    if wu is None:
+                        assert record_envelopes is not None
+                        self._write_end_of_stream_records(record_envelopes, callback)
+                    else:
+                        self._print_progress()
+
+                        if not self.dry_run:
+                            self.sink.handle_work_unit_start(wu)
+                        if record_envelopes is not None:
+                            for record_envelope in record_envelopes:
+                                self._write_record(record_envelope, callback)
+                            if not self.dry_run:
+                                self.sink.handle_work_unit_end(wu)
+                sink_report.items_processed += 1
+                sink_report.busy_time_sec = round(
+                    sink_report.busy_time_sec + timer.elapsed_seconds(), 2
+                )
+        finally:
+            transform_stage.stop()
+            source_stage.stop()
+
     def transform(self, records: Iterable[RecordEnvelope]) -> Iterable[RecordEnvelope]:
         """
         Transforms the given sequence of records by passing the records through the transformers
@@ -71,6 +71,19 @@ class FlagsConfig(ConfigModel):
         description="Set system metadata pipeline name. Requires `set_system_metadata` to be enabled.",
     )
 
+    pipelined_execution: bool = Field(
+        default=False,
+        description=(
+            "Run the source, the transformers and the sink on separate threads, so that their work overlaps. "
+            "Records are written in the same order as without this flag."
+        ),
+    )
+    pipelined_execution_queue_size: int = Field(
+        default=100,
+        ge=1,
+        description="Number of workunits that can be buffered between stages when `pipelined_execution` is enabled.",
+    )
+
 
 def _generate_run_id(source_type: Optional[str] = None) -> str:
     current_time = datetime.datetime.now().strftime("%Y_%m_%d-%H_%M_%S")
@@ -0,0 +1,123 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Generic, Iterable, Iterator, Optional, TypeVar
+
+from datahub.ingestion.api.report import Report
+
+T = TypeVar("T")
+
+_POLL_INTERVAL_SECONDS = 0.1
+
+
+@dataclass
+class PipelineStageReport(Report):
+    items_processed: int = 0
+    busy_time_sec: float = 0.0
+    queue_depth: int = 0
+    peak_queue_depth: int = 0
+
+
+class _StageDone:
+    pass
+
+
+@dataclass
+class _StageError:
+    exc: BaseException
+
+
+class PipelineStage(Generic[T]):
+    """
+    Consumes an iterable on a background thread, handing its items to the consumer
+    through a bounded queue.
+
+    Chaining stages lets the work of each one overlap with the others, while items
+    stay in order. If the queue is full, the stage waits for the consumer to catch up.
+    Exceptions raised while producing items are re-raised to the consumer after the
+    items produced before them.
+
+    The busy time of a stage excludes the time it spent waiting for items from its
+    upstream stage.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        items: Iterable[T],
+        queue_size: int,
+        upstream: Optional["PipelineStage"] = None,
+    ):
+        self.name = name
+        self.report = PipelineStageReport()
+
+        self._items = items
+        self._upstream = upstream
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=queue_size)
+        self._stopped = threading.Event()
+        self._consumer_wait_sec = 0.0
+        self._thread = threading.Thread(
+            target=self._run, name=f"pipeline-{name}", daemon=True
+        )
+
+    def start(self) -> "PipelineStage[T]":
+        self._thread.start()
+        return self
+
+    def _put(self, item: object) -> bool:
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=_POLL_INTERVAL_SECONDS)
+            except queue.Full:
+                continue
+
+            depth = self._queue.qsize()
+            self.report.queue_depth = depth
+            self.report.peak_queue_depth = max(self.report.peak_queue_depth, depth)
+            return True
+        return False
+
+    def _run(self) -> None:
+        total_sec = 0.0
+        try:
+            iterator = iter(self._items)
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                finally:
+                    total_sec += time.perf_counter() - start
+                    upstream_wait_sec = (
+                        self._upstream._consumer_wait_sec if self._upstream else 0.0
+                    )
+                    self.report.busy_time_sec = round(total_sec - upstream_wait_sec, 2)
+
+                self.report.items_processed += 1
+                if not self._put(item):
+                    return
+        except BaseException as e:
+            self._put(_StageError(e))
+            return
+        self._put(_StageDone())
+
+    def __iter__(self) -> Iterator[T]:
+        while True:
+            start = time.perf_counter()
+            item = self._queue.get()
+            self._consumer_wait_sec += time.perf_counter() - start
+            self.report.queue_depth = self._queue.qsize()
+
+            if isinstance(item, _StageDone):
+                return
+            elif isinstance(item, _StageError):
+                raise item.exc
+            yield item  # type: ignore
+
+    def stop(self) -> None:
+        """Stops the stage after the item that it is currently producing."""
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join()
@@ -1,5 +1,9 @@
+import functools
+import queue
 from dataclasses import dataclass
-from typing import Optional, Union
+from typing import Any, Callable, Optional, Union
+
+import pydantic
 
 from datahub.emitter.kafka_emitter import DatahubKafkaEmitter, KafkaEmitterConfig
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
@@ -12,9 +16,71 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
 
 
 class KafkaSinkConfig(KafkaEmitterConfig):
-    # This extra layer of indirection exists in case we need to add extra
-    # config options to the sink config.
-    pass
+    high_throughput: bool = pydantic.Field(
+        default=False,
+        description="Lets the producers batch and compress messages across work units. "
+        "Instead of flushing after every work unit, messages are only flushed when the sink is closed, "
+        "and delivery reports are polled by a background thread.",
+    )
+
+    # Options set in connection.producer_config take precedence over these.
+    linger_ms: pydantic.NonNegativeInt = pydantic.Field(
+        default=100,
+        description="How long the producers wait for more messages to batch, in milliseconds. "
+        "Only applies in high throughput mode.",
+    )
+    batch_size: pydantic.PositiveInt = pydantic.Field(
+        default=1_000_000,
+        description="The maximum size of a batch of messages, in bytes. "
+        "Only applies in high throughput mode.",
+    )
+    compression_type: str = pydantic.Field(
+        default="lz4",
+        description="The compression codec for batches of messages, e.g. none, gzip, snappy, lz4 or zstd. "
+        "Only applies in high throughput mode.",
+    )
+    poll_interval_seconds: pydantic.PositiveFloat = pydantic.Field(
+        default=0.1,
+        description="How often the background thread polls for delivery reports. "
+        "Only applies in high throughput mode.",
+    )
+
+
+@dataclass
+class KafkaSinkReport(SinkReport):
+    messages_delivered: int = 0
+    messages_failed: int = 0
+    bytes_delivered: int = 0
+    total_delivery_latency_seconds: float = 0.0
+    max_delivery_latency_seconds: float = 0.0
+
+    def report_delivery(self, err: Optional[Exception], msg: Any) -> None:
+        if err is not None:
+            self.messages_failed += 1
+            return
+
+        self.messages_delivered += 1
+        self.bytes_delivered += len(_get_message_attribute(msg, "value") or b"")
+        latency = _get_message_attribute(msg, "latency")
+        if latency is not None:
+            self.total_delivery_latency_seconds += latency
+            self.max_delivery_latency_seconds = max(
+                self.max_delivery_latency_seconds, latency
+            )
+
+    def compute_stats(self) -> None:
+        super().compute_stats()
+        self.total_delivery_latency_seconds = round(
+            self.total_delivery_latency_seconds, 3
+        )
+        self.max_delivery_latency_seconds = round(self.max_delivery_latency_seconds, 3)
+
+
+def _get_message_attribute(msg: Any, name: str) -> Any:
+    # Delivery callbacks get a confluent_kafka Message, but we also report our own
+    # failures with a plain string.
+    getter = getattr(msg, name, None)
+    return getter() if callable(getter) else None
 
 
 @dataclass
@@ -24,6 +90,9 @@ class _KafkaCallback:
     write_callback: WriteCallback
 
     def kafka_callback(self, err: Optional[Exception], msg: str) -> None:
+        if isinstance(self.reporter, KafkaSinkReport):
+            self.reporter.report_delivery(err, msg)
+
         if err is not None:
             self.reporter.report_failure(err)
             self.write_callback.on_failure(
@@ -34,17 +103,53 @@ class _KafkaCallback:
             self.write_callback.on_success(self.record_envelope, {"msg": msg})
 
 
-class DatahubKafkaSink(Sink[KafkaSinkConfig, SinkReport]):
+class DatahubKafkaSink(Sink[KafkaSinkConfig, KafkaSinkReport]):
     emitter: DatahubKafkaEmitter
 
     def __post_init__(self):
-        self.emitter = DatahubKafkaEmitter(self.config)
+        # In high throughput mode, delivery callbacks are called on the emitter's
+        # poll thread. Since neither the report nor the write callbacks are
+        # thread-safe, they only queue the delivery reports, which are then
+        # handled on the thread that writes the records.
+        self._delivery_reports: "queue.SimpleQueue[Callable[[], None]]" = (
+            queue.SimpleQueue()
+        )
+        if self.config.high_throughput:
+            self.emitter = DatahubKafkaEmitter(
+                self.config,
+                poll_interval_seconds=self.config.poll_interval_seconds,
+                default_producer_config={
+                    "linger.ms": self.config.linger_ms,
+                    "batch.size": self.config.batch_size,
+                    "compression.type": self.config.compression_type,
+                },
+            )
+        else:
+            self.emitter = DatahubKafkaEmitter(self.config)
 
     def handle_work_unit_start(self, workunit: WorkUnit) -> None:
         pass
 
     def handle_work_unit_end(self, workunit: WorkUnit) -> None:
-        self.emitter.flush()
+        if not self.config.high_throughput:
+            self.emitter.flush()
+        self._handle_delivery_reports()
+
+    def _queue_delivery_report(
+        self, callback: Callable[[Optional[Exception], Any], None]
+    ) -> Callable[[Optional[Exception], Any], None]:
+        def _on_delivery(err: Optional[Exception], msg: Any) -> None:
+            self._delivery_reports.put(functools.partial(callback, err, msg))
+
+        return _on_delivery
+
+    def _handle_delivery_reports(self) -> None:
+        while True:
+            try:
+                handle_delivery_report = self._delivery_reports.get_nowait()
+            except queue.Empty:
+                return
+            handle_delivery_report()
 
     def write_record_async(
         self,
@@ -57,6 +162,7 @@ class DatahubKafkaSink(Sink[KafkaSinkConfig, SinkReport]):
         ],
         write_callback: WriteCallback,
     ) -> None:
+        self._handle_delivery_reports()
         callback = _KafkaCallback(
             self.report, record_envelope, write_callback
         ).kafka_callback
@@ -64,7 +170,9 @@ class DatahubKafkaSink(Sink[KafkaSinkConfig, SinkReport]):
             record = record_envelope.record
             self.emitter.emit(
                 record,
-                callback=callback,
+                callback=self._queue_delivery_report(callback)
+                if self.config.high_throughput
+                else callback,
             )
         except Exception as err:
             # In case we throw an exception while trying to emit the record,
@@ -74,4 +182,5 @@ class DatahubKafkaSink(Sink[KafkaSinkConfig, SinkReport]):
             callback(err, f"Failed to write record: {err}")
 
     def close(self) -> None:
-        self.emitter.flush()
+        self.emitter.close()
+        self._handle_delivery_reports()
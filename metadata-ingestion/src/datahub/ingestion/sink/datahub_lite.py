@@ -1,6 +1,8 @@
 import logging
 import os
-from typing import Union
+from typing import List, Union
+
+import pydantic
 
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import RecordEnvelope
@@ -18,10 +20,17 @@ class DataHubLiteSinkConfig(LiteLocalConfig):
     type: str = "duckdb"
     config: dict = {"file": os.path.expanduser("~/.datahub/lite/datahub.duckdb")}
 
+    # Records are buffered and written to the lite store in batches of this size.
+    batch_size: pydantic.PositiveInt = 1000
+
 
 class DataHubLiteSink(Sink[DataHubLiteSinkConfig, SinkReport]):
     def __post_init__(self) -> None:
-        self.datahub_lite = get_datahub_lite(self.config.dict())
+        self.datahub_lite = get_datahub_lite(self.config.dict(exclude={"batch_size"}))
+        self._pending: List[
+            RecordEnvelope[Union[MetadataChangeEvent, MetadataChangeProposalWrapper]]
+        ] = []
+        self._pending_callbacks: List[WriteCallback] = []
 
     def write_record_async(
         self,
@@ -39,17 +48,33 @@ class DataHubLiteSink(Sink[DataHubLiteSinkConfig, SinkReport]):
             self.report.report_warning(f"datahub-local does not support {type(record)}")
             return
 
+        self._pending.append(record_envelope)  # type: ignore
+        self._pending_callbacks.append(write_callback)
+        if len(self._pending) >= self.config.batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        callbacks, self._pending_callbacks = self._pending_callbacks, []
         try:
-            self.datahub_lite.write(record)
-            self.report.report_record_written(record_envelope)
+            self.datahub_lite.write_batch([envelope.record for envelope in pending])
         except Exception as e:
-            self.report.report_failure(f"{record_envelope.metadata}: {type(e)}: {e}")
-            if write_callback:
-                write_callback.on_failure(record_envelope, e, {})
+            for record_envelope, write_callback in zip(pending, callbacks):
+                self.report.report_failure(
+                    f"{record_envelope.metadata}: {type(e)}: {e}"
+                )
+                if write_callback:
+                    write_callback.on_failure(record_envelope, e, {})
         else:
-            if write_callback:
-                write_callback.on_success(record_envelope, success_metadata={})
+            for record_envelope, write_callback in zip(pending, callbacks):
+                self.report.report_record_written(record_envelope)
+                if write_callback:
+                    write_callback.on_success(record_envelope, success_metadata={})
 
     def close(self):
+        self._flush()
         if self.datahub_lite:
             self.datahub_lite.close()
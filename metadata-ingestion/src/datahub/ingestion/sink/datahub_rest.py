@@ -20,8 +20,10 @@ from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.emitter.mcp_builder import mcps_from_mce
 from datahub.emitter.rest_emitter import (
     BATCH_INGEST_MAX_PAYLOAD_LENGTH,
+    DEFAULT_MAX_CONCURRENT_CHUNKS,
     DEFAULT_REST_EMITTER_ENDPOINT,
     DEFAULT_REST_TRACE_MODE,
+    ChunkLatencyStats,
     DataHubRestEmitter,
     RestSinkEndpoint,
     RestTraceMode,
@@ -80,6 +82,10 @@ class DatahubRestSinkConfig(DatahubClientConfig):
     # Only applies in async batch mode.
     max_per_batch: pydantic.PositiveInt = 100
 
+    # Only applies with the OpenAPI endpoint. Setting this above 1 lets a single batch
+    # send its chunks for different entity types concurrently.
+    max_concurrent_chunks: pydantic.PositiveInt = DEFAULT_MAX_CONCURRENT_CHUNKS
+
     @pydantic.validator("max_per_batch", always=True)
     def validate_max_per_batch(cls, v):
         if v > BATCH_INGEST_MAX_PAYLOAD_LENGTH:
@@ -98,6 +104,9 @@ class DataHubRestSinkReport(SinkReport):
 
     async_batches_prepared: int = 0
     async_batches_split: int = 0
+    chunk_latency: ChunkLatencyStats = dataclasses.field(
+        default_factory=ChunkLatencyStats
+    )
 
     main_thread_blocking_timer: PerfTimer = dataclasses.field(default_factory=PerfTimer)
 
@@ -180,6 +189,7 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
             disable_ssl_verification=config.disable_ssl_verification,
             openapi_ingestion=config.endpoint == RestSinkEndpoint.OPENAPI,
             default_trace_mode=config.default_trace_mode == RestTraceMode.ENABLED,
+            max_concurrent_chunks=config.max_concurrent_chunks,
         )
 
     @property
@@ -191,6 +201,8 @@ class DatahubRestSink(Sink[DatahubRestSinkConfig, DataHubRestSinkReport]):
         thread_local = self._emitter_thread_local
         if not hasattr(thread_local, "emitter"):
             thread_local.emitter = DatahubRestSink._make_emitter(self.config)
+            # All of the per-thread emitters share the report's latency stats.
+            thread_local.emitter.chunk_latency = self.report.chunk_latency
         return thread_local.emitter
 
     def handle_work_unit_start(self, workunit: WorkUnit) -> None:
@@ -1,4 +1,3 @@
-import json
 import logging
 import pathlib
 from typing import Iterable, Union
@@ -13,6 +12,7 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeProposal,
 )
 from datahub.metadata.com.linkedin.pegasus2avro.usage import UsageAggregation
+from datahub.utilities import fast_json
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +34,9 @@ def _to_obj_for_file(
             JSON_CONTENT_TYPE,
             JSON_PATCH_CONTENT_TYPE,
         ]:
-            serialized["aspect"] = {"json": json.loads(serialized["aspect"]["value"])}
+            serialized["aspect"] = {
+                "json": fast_json.loads(serialized["aspect"]["value"])
+            }
         return serialized
     return obj.to_obj()
 
@@ -48,7 +50,8 @@ class FileSinkConfig(ConfigModel):
 class FileSink(Sink[FileSinkConfig, SinkReport]):
     def __post_init__(self) -> None:
         fpath = pathlib.Path(self.config.filename)
-        self.file = fpath.open("w")
+        # With a fast JSON backend, non-ASCII characters are not escaped.
+        self.file = fpath.open("w", encoding="utf-8")
         self.file.write("[\n")
         self.wrote_something = False
 
@@ -71,7 +74,7 @@ class FileSink(Sink[FileSinkConfig, SinkReport]):
         if self.wrote_something:
             self.file.write(",\n")
 
-        json.dump(obj, self.file, indent=4)
+        fast_json.dump(obj, self.file, indent=4)
         self.wrote_something = True
 
         self.report.report_record_written(record_envelope)
@@ -96,12 +99,12 @@ def write_metadata_file(
     ],
 ) -> None:
     # This simplified version of the FileSink can be used for testing purposes.
-    with file.open("w") as f:
+    with file.open("w", encoding="utf-8") as f:
         f.write("[\n")
         for i, record in enumerate(records):
             if i > 0:
                 f.write(",\n")
             if not isinstance(record, dict):
                 record = _to_obj_for_file(record)
-            json.dump(record, f, indent=4)
+            fast_json.dump(record, f, indent=4)
         f.write("\n]")
@@ -103,6 +103,13 @@ class BigQueryQueriesExtractorConfig(BigQueryBaseConfig):
         default=10, description="Number of top queries to save to each table."
     )
 
+    sql_parsing_workers: int = Field(
+        default=1,
+        description="[Advanced] Number of worker processes to use for parsing queries. "
+        "Parsing is CPU-bound, so large query logs benefit from using multiple cores. "
+        "By default, queries are parsed in the main process.",
+    )
+
     include_lineage: bool = True
     include_queries: bool = True
     include_usage_statistics: bool = True
@@ -182,6 +189,7 @@ class BigQueryQueriesExtractor(Closeable):
             is_temp_table=self.is_temp_table,
             is_allowed_table=self.is_allowed_table,
             format_queries=False,
+            sql_parsing_workers=self.config.sql_parsing_workers,
         )
 
         self.report.sql_aggregator = self.aggregator.report
@@ -69,6 +69,24 @@ class DataHubSourceConfig(StatefulIngestionConfigBase):
         description="Number of records to fetch from the database at a time",
     )
 
+    database_export_parallelism: pydantic.PositiveInt = Field(
+        default=1,
+        description=(
+            "Number of createdon ranges of the database table to read concurrently, "
+            "each over its own database connection. "
+            "If 1, the whole table is read with a single query."
+        ),
+    )
+
+    database_export_preserve_order: bool = Field(
+        default=True,
+        description=(
+            "With a `database_export_parallelism` above 1, whether to still ingest aspects in createdon order. "
+            "Otherwise, the aspects of each range are ingested as soon as they are read, "
+            "and the progress of each range is checkpointed separately."
+        ),
+    )
+
     database_table_name: str = Field(
         default=DEFAULT_DATABASE_TABLE_NAME,
         description="Name of database table containing all versioned aspects",
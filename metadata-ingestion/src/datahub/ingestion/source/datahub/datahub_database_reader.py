@@ -1,8 +1,22 @@
 import contextlib
 import json
 import logging
-from datetime import datetime
-from typing import Any, Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from sqlalchemy import create_engine
 
@@ -22,6 +36,45 @@ DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
 
 ROW = TypeVar("ROW", bound=Dict[str, Any])
 
+# How many batches of rows the reader of a createdon range can get ahead of ingestion.
+_MAX_PENDING_BATCHES = 2
+_QUEUE_PUT_TIMEOUT_SECONDS = 0.1
+
+# Continues after the last row of the previous page, in the order of the query.
+_AFTER_ROW_CONDITION = """
+                AND (
+                    mav.createdon > %(since_createdon)s
+                    OR mav.urn > %(after_urn)s
+                    OR (mav.urn = %(after_urn)s AND mav.aspect > %(after_aspect)s)
+                    OR (
+                        mav.urn = %(after_urn)s
+                        AND mav.aspect = %(after_aspect)s
+                        AND mav.version > %(after_version)s
+                    )
+                )
+"""
+
+
+class CreatedonRange(NamedTuple):
+    """A range of createdon timestamps, in UTC, from start (inclusive) to end (exclusive)."""
+
+    start: datetime
+    # Unset for a range that includes all the aspects created after its start.
+    end: Optional[datetime]
+
+
+def _to_naive_utc(value: datetime) -> datetime:
+    # The database stores createdon without a timezone, in UTC.
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _truncate_to_millis(value: datetime) -> datetime:
+    # Checkpoints store createdon timestamps in millis, so range boundaries have to
+    # be representable as such.
+    return value.replace(microsecond=value.microsecond // 1000 * 1000)
+
 
 class VersionOrderer(Generic[ROW]):
     """Orders rows by (createdon, version == 0).
@@ -80,9 +133,13 @@ class DataHubDatabaseReader:
     ):
         self.config = config
         self.report = report
+        options = dict(connection_config.options)
+        if config.database_export_parallelism > 1:
+            # Each createdon range is read over its own pooled connection.
+            options.setdefault("pool_size", config.database_export_parallelism)
         self.engine = create_engine(
             url=connection_config.get_sql_alchemy_url(),
-            **connection_config.options,
+            **options,
         )
 
     @property
@@ -100,8 +157,29 @@ class DataHubDatabaseReader:
             ORDER BY mav.urn
         """
 
+    @property
+    def createdon_bounds_query(self) -> str:
+        return f"""
+            SELECT MIN(createdon), MAX(createdon)
+            FROM {self.engine.dialect.identifier_preparer.quote(self.config.database_table_name)}
+            WHERE createdon >= %(since_createdon)s
+        """
+
     @property
     def query(self) -> str:
+        return self._get_query()
+
+    def _get_query(
+        self, bounded: bool = False, paginated: bool = False, after_row: bool = False
+    ) -> str:
+        """Returns the query for the aspects created since `since_createdon`.
+
+        If `bounded`, only aspects created before `until_createdon` are included.
+        If `paginated`, only the first `database_query_batch_size` aspects are returned.
+        If `after_row`, only aspects after the row given by `since_createdon` and the
+        `after_*` parameters are included.
+        """
+
         # May repeat rows for the same date
         # Offset is generally 0, unless we repeat the same createdon twice
 
@@ -132,6 +210,8 @@ class DataHubDatabaseReader:
                 {"" if self.config.include_all_versions else "AND mav.version = 0"}
                 {"" if not self.config.exclude_aspects else "AND mav.aspect NOT IN %(exclude_aspects)s"}
                 AND mav.createdon >= %(since_createdon)s
+                {"AND mav.createdon < %(until_createdon)s" if bounded else ""}
+                {_AFTER_ROW_CONDITION if after_row else ""}
             ORDER BY
                 createdon,
                 urn,
@@ -145,6 +225,7 @@ class DataHubDatabaseReader:
             urn,
             aspect,
             version
+        {f"LIMIT {self.config.database_query_batch_size}" if paginated else ""}
         """
 
     def execute_server_cursor(
@@ -176,18 +257,188 @@ class DataHubDatabaseReader:
         }
         yield from self.execute_server_cursor(self.query, params)
 
+    def get_createdon_ranges(self, from_createdon: datetime) -> List[CreatedonRange]:
+        """Splits the aspects created since `from_createdon` into ranges to be read
+        concurrently, one per `database_export_parallelism`.
+
+        The ranges span equal amounts of time, so that splitting them only requires the
+        bounds of the createdon index, but they may hold very different numbers of
+        aspects. The last range is open-ended, to include the aspects that are written
+        while the export runs.
+        """
+        start = _to_naive_utc(from_createdon)
+        with self.engine.connect() as conn:
+            min_createdon, max_createdon = conn.execute(
+                self.createdon_bounds_query,
+                {"since_createdon": start.strftime(DATETIME_FORMAT)},
+            ).fetchone()
+
+        boundaries: List[datetime] = []
+        if min_createdon is not None and max_createdon is not None:
+            parallelism = self.config.database_export_parallelism
+            step = (max_createdon - min_createdon) / parallelism
+            for i in range(1, parallelism):
+                boundary = _truncate_to_millis(min_createdon + step * i)
+                if boundary > (boundaries[-1] if boundaries else start):
+                    boundaries.append(boundary)
+
+        return [
+            CreatedonRange(start=range_start, end=range_end)
+            for range_start, range_end in zip([start, *boundaries], [*boundaries, None])
+        ]
+
+    def _get_range_rows(
+        self, createdon_range: CreatedonRange
+    ) -> Iterable[Dict[str, Any]]:
+        """Reads the rows of a createdon range, one page at a time.
+
+        Each page is a separate query, over a pooled connection, that starts after the
+        last row of the previous page. Unlike with a server-side cursor, no connection
+        is held while the rows wait to be ingested, which could otherwise exceed the
+        server's write timeout.
+        """
+        params: Dict[str, Any] = {
+            "exclude_aspects": list(self.config.exclude_aspects),
+            "since_createdon": createdon_range.start.strftime(DATETIME_FORMAT),
+        }
+        if createdon_range.end is not None:
+            params["until_createdon"] = createdon_range.end.strftime(DATETIME_FORMAT)
+
+        after_row = False
+        while True:
+            query = self._get_query(
+                bounded=createdon_range.end is not None,
+                paginated=True,
+                after_row=after_row,
+            )
+            with self.engine.connect() as conn:
+                page = [dict(row) for row in conn.execute(query, params)]
+            yield from page
+
+            if len(page) < self.config.database_query_batch_size:
+                return
+            last_row = page[-1]
+            params.update(
+                since_createdon=last_row["createdon"].strftime(DATETIME_FORMAT),
+                after_urn=last_row["urn"],
+                after_aspect=last_row["aspect"],
+                after_version=last_row["version"],
+            )
+            after_row = True
+
+    def _read_ranges(
+        self, ranges: List[CreatedonRange], in_order: bool
+    ) -> Iterable[Tuple[int, List[Dict[str, Any]]]]:
+        """Reads the createdon ranges concurrently, and yields batches of their rows,
+        along with the index of their range.
+
+        If `in_order`, all the batches of a range are yielded before those of the next
+        one, while the next ones are read ahead. Otherwise, batches are yielded as soon
+        as they are read.
+        """
+        batch_size = self.config.database_query_batch_size
+        stop = threading.Event()
+        # Each item is a batch of rows, the error that stopped the reader of the range,
+        # or None once the range has been read.
+        queues: List[
+            "queue.Queue[Tuple[int, Union[List[Dict[str, Any]], Exception, None]]]"
+        ] = (
+            [queue.Queue(maxsize=_MAX_PENDING_BATCHES) for _ in ranges]
+            if in_order
+            else [queue.Queue(maxsize=_MAX_PENDING_BATCHES * len(ranges))]
+        )
+
+        def _put(
+            index: int, item: Union[List[Dict[str, Any]], Exception, None]
+        ) -> bool:
+            # Gives up once the consumer is gone, instead of blocking forever.
+            out = queues[index if in_order else 0]
+            while not stop.is_set():
+                try:
+                    out.put((index, item), timeout=_QUEUE_PUT_TIMEOUT_SECONDS)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def _read_range(index: int, createdon_range: CreatedonRange) -> None:
+            try:
+                orderer = VersionOrderer[Dict[str, Any]](
+                    enabled=self.config.include_all_versions
+                )
+                batch: List[Dict[str, Any]] = []
+                for row in orderer(self._get_range_rows(createdon_range)):
+                    batch.append(row)
+                    if len(batch) == batch_size:
+                        if not _put(index, batch):
+                            return
+                        batch = []
+                if batch and not _put(index, batch):
+                    return
+                logger.debug(f"Finished reading aspects in {createdon_range}")
+                _put(index, None)
+            except Exception as e:
+                _put(index, e)
+
+        with ThreadPoolExecutor(
+            max_workers=len(ranges), thread_name_prefix="datahub_database_reader"
+        ) as executor:
+            try:
+                for index, createdon_range in enumerate(ranges):
+                    executor.submit(_read_range, index, createdon_range)
+
+                remaining = len(ranges)
+                while remaining:
+                    # When in order, the ranges are consumed one after the other.
+                    out = queues[len(ranges) - remaining if in_order else 0]
+                    index, item = out.get()
+                    if item is None:
+                        remaining -= 1
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        yield index, item
+            finally:
+                stop.set()
+
     def get_aspects(
         self, from_createdon: datetime, stop_time: datetime
     ) -> Iterable[Tuple[MetadataChangeProposalWrapper, datetime]]:
-        orderer = VersionOrderer[Dict[str, Any]](
-            enabled=self.config.include_all_versions
-        )
-        rows = self._get_rows(from_createdon=from_createdon, stop_time=stop_time)
-        for row in orderer(rows):
+        rows: Iterable[Dict[str, Any]]
+        if self.config.database_export_parallelism > 1:
+            ranges = self.get_createdon_ranges(from_createdon)
+            rows = (
+                row
+                for _, batch in self._read_ranges(ranges, in_order=True)
+                for row in batch
+            )
+        else:
+            orderer = VersionOrderer[Dict[str, Any]](
+                enabled=self.config.include_all_versions
+            )
+            rows = orderer(
+                self._get_rows(from_createdon=from_createdon, stop_time=stop_time)
+            )
+
+        for row in rows:
             mcp = self._parse_row(row)
             if mcp:
                 yield mcp, row["createdon"]
 
+    def get_aspects_by_range(
+        self, ranges: List[CreatedonRange]
+    ) -> Iterable[Tuple[MetadataChangeProposalWrapper, datetime, int]]:
+        """Reads the createdon ranges concurrently, and yields their aspects as soon as
+        they are read, along with the index of their range.
+
+        Aspects are only in createdon order within each range.
+        """
+        for index, batch in self._read_ranges(ranges, in_order=False):
+            for row in batch:
+                mcp = self._parse_row(row)
+                if mcp:
+                    yield mcp, row["createdon"], index
+
     def get_soft_deleted_rows(self) -> Iterable[Dict[str, Any]]:
         """
         Fetches all soft-deleted entities from the database.
@@ -24,7 +24,12 @@ from datahub.ingestion.source.datahub.datahub_database_reader import (
 )
 from datahub.ingestion.source.datahub.datahub_kafka_reader import DataHubKafkaReader
 from datahub.ingestion.source.datahub.report import DataHubSourceReport
-from datahub.ingestion.source.datahub.state import StatefulDataHubIngestionHandler
+from datahub.ingestion.source.datahub.state import (
+    DatabasePartitionState,
+    DataHubIngestionState,
+    PartitionCreatedon,
+    StatefulDataHubIngestionHandler,
+)
 from datahub.ingestion.source.state.stateful_ingestion_base import (
     StatefulIngestionSourceBase,
 )
@@ -83,9 +88,18 @@ class DataHubSource(StatefulIngestionSourceBase):
                 self.config, self.config.database_connection, self.report
             )
 
-            yield from self._get_database_workunits(
-                from_createdon=state.database_createdon_datetime, reader=database_reader
-            )
+            if (
+                self.config.database_export_parallelism > 1
+                and not self.config.database_export_preserve_order
+            ):
+                yield from self._get_database_workunits_by_partition(
+                    state=state, reader=database_reader
+                )
+            else:
+                yield from self._get_database_workunits(
+                    from_createdon=state.database_createdon_datetime,
+                    reader=database_reader,
+                )
             self._commit_progress()
         else:
             logger.info(
@@ -139,6 +153,60 @@ class DataHubSource(StatefulIngestionSourceBase):
                 )
             self._commit_progress(i)
 
+    def _get_database_workunits_by_partition(
+        self, state: DataHubIngestionState, reader: DataHubDatabaseReader
+    ) -> Iterable[MetadataWorkUnit]:
+        partitions = state.database_partitions
+        if partitions:
+            logger.info(f"Resuming the export of {len(partitions)} database partitions")
+        else:
+            from_createdon = state.database_createdon_datetime
+            logger.info(f"Fetching database aspects starting from {from_createdon}")
+            partitions = [
+                DatabasePartitionState.from_range(createdon_range)
+                for createdon_range in reader.get_createdon_ranges(from_createdon)
+            ]
+        self.stateful_ingestion_handler.update_checkpoint(
+            database_partitions=partitions
+        )
+
+        last_createdon = max(
+            (p.last_createdon for p in partitions if p.last_createdon is not None),
+            default=None,
+        )
+        progress = ProgressTimer(report_every=timedelta(seconds=60))
+        mcps = reader.get_aspects_by_range([p.remaining_range for p in partitions])
+        for i, (mcp, createdon, partition) in enumerate(mcps):
+            if not self.urn_pattern.allowed(str(mcp.entityUrn)):
+                continue
+
+            if progress.should_report():
+                logger.info(f"Ingested {i} database aspects so far")
+
+            yield mcp.as_workunit()
+            self.report.num_database_aspects_ingested += 1
+            if last_createdon is None or createdon > last_createdon:
+                last_createdon = createdon
+
+            if (
+                self.config.commit_with_parse_errors
+                or not self.report.num_database_parse_errors
+            ):
+                self.stateful_ingestion_handler.update_checkpoint(
+                    last_partition_createdon=PartitionCreatedon(partition, createdon)
+                )
+            self._commit_progress(i)
+
+        # Now that all the partitions are exported, the next run can start from the
+        # most recent aspect, as for an export in createdon order.
+        if (
+            self.config.commit_with_parse_errors
+            or not self.report.num_database_parse_errors
+        ):
+            self.stateful_ingestion_handler.update_checkpoint(
+                last_createdon=last_createdon, database_partitions=[]
+            )
+
     def _get_kafka_workunits(
         self, from_offsets: Dict[int, int], soft_deleted_urns: List[str]
     ) -> Iterable[MetadataWorkUnit]:
@@ -1,11 +1,13 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from functools import lru_cache
-from typing import TYPE_CHECKING, Dict, NamedTuple, Optional, cast
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, cast
 
 from pydantic import Field
 from pydantic.types import NonNegativeInt
 
+from datahub.configuration.common import ConfigModel
 from datahub.ingestion.api.ingestion_job_checkpointing_provider_base import JobId
+from datahub.ingestion.source.datahub.datahub_database_reader import CreatedonRange
 from datahub.ingestion.source.state.checkpoint import Checkpoint, CheckpointStateBase
 from datahub.ingestion.source.state.use_case_handler import (
     StatefulIngestionUsecaseHandlerBase,
@@ -15,9 +17,75 @@ if TYPE_CHECKING:
     from datahub.ingestion.source.datahub.datahub_source import DataHubSource
 
 
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _to_millis(createdon: datetime) -> int:
+    # Database createdon timestamps have no timezone, and are in UTC.
+    if createdon.tzinfo is not None:
+        createdon = createdon.astimezone(timezone.utc).replace(tzinfo=None)
+    return (createdon - _EPOCH) // timedelta(milliseconds=1)
+
+
+def _from_millis(millis: int) -> datetime:
+    return _EPOCH + timedelta(milliseconds=millis)
+
+
+class DatabasePartitionState(ConfigModel):
+    """The progress of the export of a createdon range of the database."""
+
+    start_createdon_ts: NonNegativeInt
+    # Unset for the last range, which is open-ended.
+    end_createdon_ts: Optional[NonNegativeInt] = None
+    # The createdon timestamp of the last aspect ingested from the range, if any.
+    last_createdon_ts: Optional[NonNegativeInt] = None
+
+    @classmethod
+    def from_range(cls, createdon_range: CreatedonRange) -> "DatabasePartitionState":
+        return cls(
+            start_createdon_ts=_to_millis(createdon_range.start),
+            end_createdon_ts=(
+                _to_millis(createdon_range.end)
+                if createdon_range.end is not None
+                else None
+            ),
+        )
+
+    @property
+    def last_createdon(self) -> Optional[datetime]:
+        if self.last_createdon_ts is None:
+            return None
+        return _from_millis(self.last_createdon_ts)
+
+    @property
+    def remaining_range(self) -> CreatedonRange:
+        """The part of the range that is left to export.
+
+        Like for a non-partitioned export, it starts at the last ingested createdon
+        timestamp, so aspects with that timestamp are ingested again.
+        """
+        start_createdon_ts = (
+            self.last_createdon_ts
+            if self.last_createdon_ts is not None
+            else self.start_createdon_ts
+        )
+        return CreatedonRange(
+            start=_from_millis(start_createdon_ts),
+            end=(
+                _from_millis(self.end_createdon_ts)
+                if self.end_createdon_ts is not None
+                else None
+            ),
+        )
+
+
 class DataHubIngestionState(CheckpointStateBase):
     database_createdon_ts: NonNegativeInt = 0
 
+    # Only set while an export that doesn't preserve the createdon order is in
+    # progress, in which case it takes precedence over database_createdon_ts.
+    database_partitions: List[DatabasePartitionState] = Field(default_factory=list)
+
     # Maps partition -> offset
     kafka_offsets: Dict[int, NonNegativeInt] = Field(default_factory=dict)
 
@@ -33,6 +101,11 @@ class PartitionOffset(NamedTuple):
     offset: int
 
 
+class PartitionCreatedon(NamedTuple):
+    partition: int
+    createdon: datetime
+
+
 class StatefulDataHubIngestionHandler(
     StatefulIngestionUsecaseHandlerBase[DataHubIngestionState]
 ):
@@ -78,6 +151,8 @@ class StatefulDataHubIngestionHandler(
         *,
         last_createdon: Optional[datetime] = None,
         last_offset: Optional[PartitionOffset] = None,
+        database_partitions: Optional[List[DatabasePartitionState]] = None,
+        last_partition_createdon: Optional[PartitionCreatedon] = None,
     ) -> None:
         cur_checkpoint = self.state_provider.get_current_checkpoint(self.job_id)
         if cur_checkpoint:
@@ -86,6 +161,15 @@ class StatefulDataHubIngestionHandler(
                 cur_state.database_createdon_ts = int(last_createdon.timestamp() * 1000)
             if last_offset:
                 cur_state.kafka_offsets[last_offset.partition] = last_offset.offset + 1
+            if database_partitions is not None:
+                cur_state.database_partitions = list(database_partitions)
+            if last_partition_createdon:
+                partition = cur_state.database_partitions[
+                    last_partition_createdon.partition
+                ]
+                partition.last_createdon_ts = _to_millis(
+                    last_partition_createdon.createdon
+                )
 
     def commit_checkpoint(self) -> None:
         if self.state_provider.ingestion_checkpointing_state_provider:
@@ -1,5 +1,4 @@
 import datetime
-import json
 import logging
 import os.path
 import pathlib
@@ -50,6 +49,7 @@ from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeProposal,
 )
 from datahub.metadata.schema_classes import UsageAggregationClass
+from datahub.utilities import fast_json
 
 logger = logging.getLogger(__name__)
 
@@ -309,7 +309,7 @@ class GenericFileSource(StatefulIngestionSourceBase, TestableSource):
 
     def _iterate_file_batch(self, fp: Any) -> Iterable[Any]:
         # Read the file.
-        contents = json.load(fp)
+        contents = fast_json.load(fp)
 
         # Maintain backwards compatibility with the single-object format.
         if isinstance(contents, list):
@@ -435,8 +435,8 @@ def read_metadata_file(
     ]
 ]:
     # This simplified version of the FileSource can be used for testing purposes.
-    with file.open("r") as f:
-        for obj in json.load(f):
+    with file.open("r", encoding="utf-8") as f:
+        for obj in fast_json.load(f):
             item = _from_obj_for_file(obj)
             if item:
                 yield item
@@ -12,7 +12,6 @@ import threading
 import traceback
 import unittest.mock
 import uuid
-from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -48,18 +47,18 @@ from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.exc import ProgrammingError
 from typing_extensions import Concatenate, ParamSpec
 
-from datahub.emitter import mce_builder
 from datahub.emitter.mce_builder import get_sys_time
-from datahub.ingestion.graph.client import get_default_graph
 from datahub.ingestion.source.ge_profiling_config import GEProfilingConfig
 from datahub.ingestion.source.profiling.common import (
+    NORMALIZE_TYPE_PATTERN,
     Cardinality,
     convert_to_cardinality,
+    get_column_types_to_ignore,
+    get_columns_to_ignore_sampling,
 )
 from datahub.ingestion.source.sql.sql_report import SQLSourceReport
 from datahub.ingestion.source.sql.sql_types import resolve_sql_type
 from datahub.metadata.com.linkedin.pegasus2avro.schema import (
-    EditableSchemaMetadata,
     NumberType,
 )
 from datahub.metadata.schema_classes import (
@@ -128,8 +127,6 @@ ProfilerTypeMapping.BINARY_TYPE_NAMES.append("LargeBinary")
 
 _datasource_connection_injection_lock = threading.Lock()
 
-NORMALIZE_TYPE_PATTERN = re.compile(r"^(.*?)(?:[\[<(].*)?$")
-
 
 @contextlib.contextmanager
 def _inject_connection_into_datasource(conn: Connection) -> Iterator[None]:
@@ -425,7 +422,7 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
         if match:
             sql_type = match.group(1)
 
-        return sql_type in _get_column_types_to_ignore(self.dataset.engine.dialect.name)
+        return sql_type in get_column_types_to_ignore(self.dataset.engine.dialect.name)
 
     @_run_with_query_combiner
     def _get_column_type(self, column_spec: _SingleColumnSpec, column: str) -> None:
@@ -805,7 +802,7 @@ class _SingleDatasetProfiler(BasicDatasetProfilerBase):
         (
             ignore_table_sampling,
             columns_list_to_ignore_sampling,
-        ) = _get_columns_to_ignore_sampling(
+        ) = get_columns_to_ignore_sampling(
             self.dataset_name,
             self.config.tags_to_ignore_sampling,
             self.platform,
@@ -1432,18 +1429,6 @@ class DatahubGEProfiler:
         return batch
 
 
-# More dialect specific types to ignore can be added here
-# Stringified types are used to avoid dialect specific import errors
-@lru_cache(maxsize=1)
-def _get_column_types_to_ignore(dialect_name: str) -> List[str]:
-    if dialect_name.lower() == POSTGRESQL:
-        return ["JSON"]
-    elif dialect_name.lower() == BIGQUERY:
-        return ["ARRAY", "STRUCT", "GEOGRAPHY", "JSON"]
-
-    return []
-
-
 def create_athena_temp_table(
     instance: Union[DatahubGEProfiler, _SingleDatasetProfiler],
     sql: str,
@@ -1552,44 +1537,3 @@ def create_bigquery_temp_table(
         return bigquery_temp_table
     finally:
         raw_connection.close()
-
-
-def _get_columns_to_ignore_sampling(
-    dataset_name: str, tags_to_ignore: Optional[List[str]], platform: str, env: str
-) -> Tuple[bool, List[str]]:
-    logger.debug("Collecting columns to ignore for sampling")
-
-    ignore_table: bool = False
-    columns_to_ignore: List[str] = []
-
-    if not tags_to_ignore:
-        return ignore_table, columns_to_ignore
-
-    dataset_urn = mce_builder.make_dataset_urn(
-        name=dataset_name, platform=platform, env=env
-    )
-
-    datahub_graph = get_default_graph()
-
-    dataset_tags = datahub_graph.get_tags(dataset_urn)
-    if dataset_tags:
-        ignore_table = any(
-            tag_association.tag.split("urn:li:tag:")[1] in tags_to_ignore
-            for tag_association in dataset_tags.tags
-        )
-
-    if not ignore_table:
-        metadata = datahub_graph.get_aspect(
-            entity_urn=dataset_urn, aspect_type=EditableSchemaMetadata
-        )
-
-        if metadata:
-            for schemaField in metadata.editableSchemaFieldInfo:
-                if schemaField.globalTags:
-                    columns_to_ignore.extend(
-                        schemaField.fieldPath
-                        for tag_association in schemaField.globalTags.tags
-                        if tag_association.tag.split("urn:li:tag:")[1] in tags_to_ignore
-                    )
-
-    return ignore_table, columns_to_ignore
@@ -1,12 +1,13 @@
 import datetime
 import logging
 import os
+from enum import auto
 from typing import Any, Dict, List, Optional
 
 import pydantic
 from pydantic.fields import Field
 
-from datahub.configuration.common import AllowDenyPattern, ConfigModel
+from datahub.configuration.common import AllowDenyPattern, ConfigEnum, ConfigModel
 from datahub.ingestion.source_config.operation_config import OperationConfig
 
 _PROFILING_FLAGS_TO_REPORT = {
@@ -19,6 +20,14 @@ _PROFILING_FLAGS_TO_REPORT = {
 logger = logging.getLogger(__name__)
 
 
+class ProfilingEngine(ConfigEnum):
+    # Profiles each table with a series of Great Expectations expectations.
+    GREAT_EXPECTATIONS = auto()
+
+    # Profiles each table with a few aggregate queries that cover all of its columns.
+    SQL = auto()
+
+
 class GEProfilingBaseConfig(ConfigModel):
     enabled: bool = Field(
         default=False, description="Whether profiling should be done."
@@ -95,6 +104,15 @@ class GEProfilingBaseConfig(ConfigModel):
 
 
 class GEProfilingConfig(GEProfilingBaseConfig):
+    engine: ProfilingEngine = Field(
+        default=ProfilingEngine.GREAT_EXPECTATIONS,
+        description="The engine used to compute column-level profiles. `great_expectations` "
+        "issues one query per metric, and combines them where possible. `sql` computes the "
+        "metrics of all columns of a table in a single aggregate query, plus a few follow-up "
+        "queries for quantiles, histograms, value frequencies and sample values. It uses the "
+        "approximate aggregate functions of the platform where available, so distinct counts, "
+        "medians and quantiles may be approximate.",
+    )
     report_dropped_profiles: bool = Field(
         default=False,
         description="Whether to report datasets or dataset columns which were not profiled. Set to `True` for debugging purposes.",
@@ -127,6 +145,17 @@ class GEProfilingConfig(GEProfilingBaseConfig):
         "Supported only in `snowflake` and `BigQuery`.",
     )
 
+    incremental: bool = Field(
+        default=False,
+        description="Whether to skip profiling tables that haven't changed since they were last profiled, "
+        "based on their row count, last modified time and latest partition. For partitioned tables, "
+        "the statistics of newly profiled partitions are merged with those of the partitions profiled "
+        "in earlier runs, for the statistics where that is possible: null counts, min, max and mean. "
+        "The merged statistics are only reported, as a full table profile, once the profiled partitions "
+        "add up to the row count of the table. This assumes that older partitions are not modified. "
+        "Requires `enable_stateful_profiling`. Supported only in `snowflake`, `BigQuery` and `redshift`.",
+    )
+
     profile_table_size_limit: Optional[int] = Field(
         default=5,
         description="Profile tables only if their size is less than specified GBs. If set to `null`, "
@@ -1,5 +1,15 @@
+import logging
+import re
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from datahub.emitter import mce_builder
+from datahub.metadata.schema_classes import EditableSchemaMetadataClass
+
+logger = logging.getLogger(__name__)
+
+NORMALIZE_TYPE_PATTERN = re.compile(r"^(.*?)(?:[\[<(].*)?$")
 
 
 class Cardinality(Enum):
@@ -50,3 +60,58 @@ def convert_to_cardinality(
     else:
         cardinality = Cardinality.MANY
     return cardinality
+
+
+# More dialect specific types to ignore can be added here
+# Stringified types are used to avoid dialect specific import errors
+@lru_cache(maxsize=1)
+def get_column_types_to_ignore(dialect_name: str) -> List[str]:
+    if dialect_name.lower() == "postgresql":
+        return ["JSON"]
+    elif dialect_name.lower() == "bigquery":
+        return ["ARRAY", "STRUCT", "GEOGRAPHY", "JSON"]
+
+    return []
+
+
+def get_columns_to_ignore_sampling(
+    dataset_name: str, tags_to_ignore: Optional[List[str]], platform: str, env: str
+) -> Tuple[bool, List[str]]:
+    logger.debug("Collecting columns to ignore for sampling")
+
+    ignore_table: bool = False
+    columns_to_ignore: List[str] = []
+
+    if not tags_to_ignore:
+        return ignore_table, columns_to_ignore
+
+    from datahub.ingestion.graph.client import get_default_graph
+
+    dataset_urn = mce_builder.make_dataset_urn(
+        name=dataset_name, platform=platform, env=env
+    )
+
+    datahub_graph = get_default_graph()
+
+    dataset_tags = datahub_graph.get_tags(dataset_urn)
+    if dataset_tags:
+        ignore_table = any(
+            tag_association.tag.split("urn:li:tag:")[1] in tags_to_ignore
+            for tag_association in dataset_tags.tags
+        )
+
+    if not ignore_table:
+        metadata = datahub_graph.get_aspect(
+            entity_urn=dataset_urn, aspect_type=EditableSchemaMetadataClass
+        )
+
+        if metadata:
+            for schemaField in metadata.editableSchemaFieldInfo:
+                if schemaField.globalTags:
+                    columns_to_ignore.extend(
+                        schemaField.fieldPath
+                        for tag_association in schemaField.globalTags.tags
+                        if tag_association.tag.split("urn:li:tag:")[1] in tags_to_ignore
+                    )
+
+    return ignore_table, columns_to_ignore
@@ -0,0 +1,603 @@
+"""Profiles data lake tables with Apache Arrow, without a Spark session.
+
+Files are streamed as record batches, so memory use is bounded regardless of the
+size of the table: distinct counts are exact up to a limit and estimated beyond it,
+and medians, quantiles and histograms are computed from a uniform sample of the
+values of each column. For Parquet files, row counts are read from the footer, and
+so are null counts and min/max values where the row group statistics have them.
+"""
+
+import heapq
+import io
+import logging
+import random
+from enum import Enum
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Set
+
+import pyarrow
+import pyarrow.compute as pc
+import pyarrow.csv
+import pyarrow.json
+import pyarrow.parquet
+import ujson
+
+from datahub.emitter.mce_builder import get_sys_time
+from datahub.ingestion.source.profiling.common import (
+    Cardinality,
+    convert_to_cardinality,
+)
+from datahub.ingestion.source.s3.datalake_profiler_config import DataLakeProfilerConfig
+from datahub.ingestion.source.s3.report import DataLakeSourceReport
+from datahub.metadata.schema_classes import (
+    DatasetFieldProfileClass,
+    DatasetProfileClass,
+    HistogramClass,
+    QuantileClass,
+    ValueFrequencyClass,
+)
+from datahub.telemetry import stats, telemetry
+
+logger = logging.getLogger(__name__)
+
+NUM_SAMPLE_ROWS = 20
+QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
+MAX_HIST_BINS = 25
+
+SUPPORTED_EXTENSIONS = [".parquet", ".csv", ".tsv", ".json", ".jsonl"]
+
+_BATCH_SIZE = 65_536
+_JSON_BLOCK_SIZE = 16 * 2**20
+# JSON arrays can't be streamed, so they are parsed in memory, up to this size.
+_MAX_JSON_ARRAY_SIZE = 64 * 2**20
+
+# Beyond this many distinct values, the distinct count of a column is estimated.
+_MAX_EXACT_DISTINCT_VALUES = 10_000
+# The relative error of the estimate is about 1/sqrt(_DISTINCT_SKETCH_SIZE).
+_DISTINCT_SKETCH_SIZE = 4096
+_MAX_QUANTILE_SAMPLE_SIZE = 100_000
+
+_HASH_MASK = 2**64 - 1
+
+_FEW_VALUES_CARDINALITIES = [
+    Cardinality.ONE,
+    Cardinality.TWO,
+    Cardinality.VERY_FEW,
+    Cardinality.FEW,
+]
+_MANY_VALUES_CARDINALITIES = [Cardinality.MANY, Cardinality.VERY_MANY]
+
+
+class _ColumnKind(Enum):
+    NUMERIC = "numeric"
+    STRING = "string"
+    DATETIME = "datetime"
+    OTHER = "other"
+
+
+def _get_column_kind(type_: pyarrow.DataType) -> _ColumnKind:
+    if (
+        pyarrow.types.is_integer(type_)
+        or pyarrow.types.is_floating(type_)
+        or pyarrow.types.is_decimal(type_)
+    ):
+        return _ColumnKind.NUMERIC
+    elif pyarrow.types.is_string(type_) or pyarrow.types.is_large_string(type_):
+        return _ColumnKind.STRING
+    elif pyarrow.types.is_date(type_) or pyarrow.types.is_timestamp(type_):
+        return _ColumnKind.DATETIME
+    return _ColumnKind.OTHER
+
+
+def _mix_hash(value: Any) -> int:
+    # The finalizer of MurmurHash3, since Python's hash of an int is the int itself.
+    h = hash(value) & _HASH_MASK
+    h = ((h ^ (h >> 33)) * 0xFF51AFD7ED558CCD) & _HASH_MASK
+    h = ((h ^ (h >> 33)) * 0xC4CEB9FE1A85EC53) & _HASH_MASK
+    return h ^ (h >> 33)
+
+
+class _DistinctCounter:
+    """Counts distinct values, exactly while there are few of them.
+
+    Beyond _MAX_EXACT_DISTINCT_VALUES, the count is estimated with a k minimum values
+    sketch, which keeps the _DISTINCT_SKETCH_SIZE smallest hashes of the values.
+    """
+
+    def __init__(self) -> None:
+        self.value_counts: Optional[Dict[Any, int]] = {}
+        # A max-heap of the smallest hashes, stored negated.
+        self._sketch: List[int] = []
+        self._sketch_hashes: Set[int] = set()
+
+    def add(self, values: pyarrow.Array) -> None:
+        if self.value_counts is None:
+            self._add_to_sketch(pc.unique(values).to_pylist())
+            return
+
+        counts = pc.value_counts(values)
+        for value, count in zip(
+            counts.field("values").to_pylist(), counts.field("counts").to_pylist()
+        ):
+            self.value_counts[value] = self.value_counts.get(value, 0) + count
+        if len(self.value_counts) > _MAX_EXACT_DISTINCT_VALUES:
+            self._add_to_sketch(self.value_counts)
+            self.value_counts = None
+
+    def _add_to_sketch(self, values: Iterable[Any]) -> None:
+        for value in values:
+            h = _mix_hash(value)
+            if h in self._sketch_hashes:
+                continue
+            if len(self._sketch) < _DISTINCT_SKETCH_SIZE:
+                heapq.heappush(self._sketch, -h)
+                self._sketch_hashes.add(h)
+            elif h < -self._sketch[0]:
+                self._sketch_hashes.remove(-heapq.heappushpop(self._sketch, -h))
+                self._sketch_hashes.add(h)
+
+    def count(self) -> int:
+        if self.value_counts is not None:
+            return len(self.value_counts)
+        return int((_DISTINCT_SKETCH_SIZE - 1) * 2**64 / (-self._sketch[0] + 1))
+
+
+class _ValueSample:
+    """A uniform sample of the values of a numeric column."""
+
+    def __init__(self, rng: random.Random) -> None:
+        self.values: List[float] = []
+        self.num_values = 0
+        self._rng = rng
+
+    def add(self, values: pyarrow.Array) -> None:
+        num_values = self.num_values + len(values)
+        if num_values <= _MAX_QUANTILE_SAMPLE_SIZE:
+            self.values.extend(values.to_pylist())
+        else:
+            # The sample is made of samples of the previous values and of the new
+            # ones, in proportion to their number.
+            num_new = round(_MAX_QUANTILE_SAMPLE_SIZE * len(values) / num_values)
+            num_kept = min(len(self.values), _MAX_QUANTILE_SAMPLE_SIZE - num_new)
+            indices = sorted(self._rng.sample(range(len(values)), num_new))
+            self.values = (
+                self._rng.sample(self.values, num_kept)
+                + values.take(pyarrow.array(indices, pyarrow.int64())).to_pylist()
+            )
+        self.num_values = num_values
+
+
+def _quantile(sorted_values: List[float], q: float) -> float:
+    # Linear interpolation between the closest ranks.
+    position = q * (len(sorted_values) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (position - lower) * (
+        sorted_values[upper] - sorted_values[lower]
+    )
+
+
+class _ColumnStats:
+    def __init__(self, rng: random.Random) -> None:
+        self.kind: Optional[_ColumnKind] = None
+        self.null_count = 0
+        self.min: Any = None
+        self.max: Any = None
+        self.distinct: Optional[_DistinctCounter] = _DistinctCounter()
+
+        # The mean and variance are merged across batches with Chan's algorithm.
+        self.num_numeric_values = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.numeric_sample: Optional[_ValueSample] = _ValueSample(rng)
+
+        self.sample_values: List[str] = []
+
+    def update_min_max(self, min_value: Any, max_value: Any) -> None:
+        if min_value is not None and (self.min is None or min_value < self.min):
+            self.min = min_value
+        if max_value is not None and (self.max is None or max_value > self.max):
+            self.max = max_value
+
+    def add(
+        self, values: pyarrow.Array, count_nulls: bool, compute_min_max: bool
+    ) -> None:
+        if isinstance(values, pyarrow.ChunkedArray):
+            values = values.combine_chunks()
+        if self.kind is None:
+            self.kind = _get_column_kind(values.type)
+
+        if pyarrow.types.is_floating(values.type):
+            # Like the Spark profiler, NaNs are counted as nulls. Filtering on the NaN
+            # mask drops the nulls as well.
+            non_null_values = values.filter(pc.invert(pc.is_nan(values)))
+        else:
+            non_null_values = values.filter(pc.is_valid(values))
+        if count_nulls:
+            self.null_count += len(values) - len(non_null_values)
+        if len(non_null_values) == 0:
+            return
+
+        if len(self.sample_values) < NUM_SAMPLE_ROWS:
+            self.sample_values.extend(
+                str(value)
+                for value in non_null_values[
+                    : NUM_SAMPLE_ROWS - len(self.sample_values)
+                ].to_pylist()
+            )
+
+        if self.distinct is not None:
+            if pyarrow.types.is_nested(values.type):
+                self.distinct = None
+            else:
+                self.distinct.add(non_null_values)
+
+        if self.kind not in (_ColumnKind.NUMERIC, _ColumnKind.DATETIME):
+            return
+        if compute_min_max:
+            min_max = pc.min_max(non_null_values)
+            self.update_min_max(
+                min_max["min"].as_py(),
+                min_max["max"].as_py(),
+            )
+
+        if self.kind != _ColumnKind.NUMERIC or self.numeric_sample is None:
+            return
+        try:
+            numbers = non_null_values.cast(pyarrow.float64())
+        except pyarrow.ArrowException as e:
+            # E.g. decimals, with older versions of Arrow.
+            logger.debug(f"Unable to compute the mean of a {values.type} column: {e}")
+            self.numeric_sample = None
+            return
+        count = len(numbers)
+        mean = pc.mean(numbers).as_py()
+        m2 = pc.variance(numbers).as_py() * count
+        total = self.num_numeric_values + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta**2 * self.num_numeric_values * count / total
+        self.num_numeric_values = total
+        self.numeric_sample.add(numbers)
+
+
+class ArrowTableProfiler:
+    """Profiles the files of a data lake table with Arrow.
+
+    Files are added one at a time, and read in batches. Only the columns that are
+    profiled are read from Parquet files, and none at all for table level profiles.
+    """
+
+    def __init__(
+        self,
+        profiling_config: DataLakeProfilerConfig,
+        report: DataLakeSourceReport,
+        file_path: str,
+    ):
+        self.profiling_config = profiling_config
+        self.report = report
+        self.file_path = file_path
+
+        self.row_count = 0
+        self.columns: Optional[List[str]] = None
+        self.columns_to_profile: List[str] = []
+        self.column_stats: Dict[str, _ColumnStats] = {}
+        self._rng = random.Random(0)
+
+    def _init_columns(self, columns: List[str]) -> None:
+        self.columns = columns
+        if self.profiling_config.profile_table_level_only:
+            return
+
+        self.columns_to_profile = [
+            column
+            for column in columns
+            if self.profiling_config._allow_deny_patterns.allowed(column)
+        ]
+        max_columns = self.profiling_config.max_number_of_fields_to_profile
+        if max_columns is not None and len(self.columns_to_profile) > max_columns:
+            columns_being_dropped = self.columns_to_profile[max_columns:]
+            self.columns_to_profile = self.columns_to_profile[:max_columns]
+            self.report.report_file_dropped(
+                f"The max_number_of_fields_to_profile={max_columns} reached. Profile of columns {self.file_path}({', '.join(sorted(columns_being_dropped))})"
+            )
+        self.column_stats = {
+            column: _ColumnStats(self._rng) for column in self.columns_to_profile
+        }
+
+    def add_file(self, file: IO[bytes], extension: str) -> None:
+        if extension == ".parquet":
+            self._add_parquet_file(file)
+        elif extension in (".csv", ".tsv"):
+            reader = pyarrow.csv.open_csv(
+                file,
+                parse_options=pyarrow.csv.ParseOptions(
+                    delimiter="\t" if extension == ".tsv" else ","
+                ),
+            )
+            self._add_batches(reader, count_rows=True)
+        elif extension == ".json":
+            self._add_batches(_read_json(file), count_rows=True)
+        elif extension == ".jsonl":
+            self._add_batches(_read_json_lines(file), count_rows=True)
+        else:
+            raise ValueError(f"Unsupported file extension {extension}")
+
+    def _add_parquet_file(self, file: IO[bytes]) -> None:
+        parquet_file = pyarrow.parquet.ParquetFile(file)
+        schema = parquet_file.schema_arrow
+        if self.columns is None:
+            self._init_columns(schema.names)
+
+        num_rows = parquet_file.metadata.num_rows
+        self.row_count += num_rows
+
+        # Statistics that are in the footer don't need to be computed from the data.
+        footer_null_counts: Set[str] = set()
+        footer_min_max: Set[str] = set()
+        for column, footer_stats in _get_footer_stats(parquet_file).items():
+            stats = self.column_stats.get(column)
+            if stats is None:
+                continue
+            if footer_stats.null_count is not None:
+                stats.null_count += footer_stats.null_count
+                footer_null_counts.add(column)
+            if footer_stats.has_min_max:
+                stats.update_min_max(footer_stats.min, footer_stats.max)
+                footer_min_max.add(column)
+
+        columns = []
+        for column in self.columns_to_profile:
+            if column in schema.names:
+                columns.append(column)
+            else:
+                self.column_stats[column].null_count += num_rows
+        if not columns:
+            return
+
+        self._add_batches(
+            parquet_file.iter_batches(batch_size=_BATCH_SIZE, columns=columns),
+            count_rows=False,
+            footer_null_counts=footer_null_counts,
+            footer_min_max=footer_min_max,
+        )
+
+    def _add_batches(
+        self,
+        batches: Iterable[pyarrow.RecordBatch],
+        count_rows: bool,
+        footer_null_counts: Optional[Set[str]] = None,
+        footer_min_max: Optional[Set[str]] = None,
+    ) -> None:
+        for batch in batches:
+            if self.columns is None:
+                self._init_columns(batch.schema.names)
+            if count_rows:
+                self.row_count += batch.num_rows
+
+            for column in self.columns_to_profile:
+                stats = self.column_stats[column]
+                index = batch.schema.get_field_index(column)
+                if index == -1:
+                    if count_rows:
+                        stats.null_count += batch.num_rows
+                    continue
+                stats.add(
+                    batch.column(index),
+                    count_nulls=not (
+                        footer_null_counts and column in footer_null_counts
+                    ),
+                    compute_min_max=not (footer_min_max and column in footer_min_max),
+                )
+
+    def get_profile(self) -> DatasetProfileClass:
+        telemetry.telemetry_instance.ping(
+            "profile_data_lake_table",
+            {"rows_profiled": stats.discretize(self.row_count)},
+        )
+
+        profile = DatasetProfileClass(
+            timestampMillis=get_sys_time(),
+            rowCount=self.row_count,
+            columnCount=len(self.columns or []),
+        )
+        if self.profiling_config.profile_table_level_only:
+            return profile
+
+        profile.fieldProfiles = [
+            self._get_column_profile(column, self.column_stats[column])
+            for column in self.columns_to_profile
+        ]
+        return profile
+
+    def _get_column_profile(
+        self, column: str, column_stats: _ColumnStats
+    ) -> DatasetFieldProfileClass:
+        config = self.profiling_config
+        column_profile = DatasetFieldProfileClass(fieldPath=column)
+
+        non_null_count = self.row_count - column_stats.null_count
+        if config.include_field_null_count:
+            column_profile.nullCount = column_stats.null_count
+            if self.row_count > 0:
+                column_profile.nullProportion = column_stats.null_count / self.row_count
+
+        unique_count: Optional[int] = None
+        unique_proportion: Optional[float] = None
+        if column_stats.distinct is not None:
+            # The estimate may exceed the actual number of values.
+            unique_count = min(column_stats.distinct.count(), non_null_count)
+            column_profile.uniqueCount = unique_count
+            if non_null_count > 0:
+                unique_proportion = unique_count / non_null_count
+                column_profile.uniqueProportion = unique_proportion
+        cardinality = convert_to_cardinality(unique_count, unique_proportion)
+
+        if config.include_field_sample_values:
+            column_profile.sampleValues = sorted(column_stats.sample_values)
+
+        if (
+            config.include_field_distinct_value_frequencies
+            and cardinality in _FEW_VALUES_CARDINALITIES
+            and column_stats.kind != _ColumnKind.OTHER
+            and column_stats.distinct is not None
+            and column_stats.distinct.value_counts is not None
+        ):
+            column_profile.distinctValueFrequencies = sorted(
+                (
+                    ValueFrequencyClass(value=str(value), frequency=frequency)
+                    for value, frequency in column_stats.distinct.value_counts.items()
+                ),
+                key=lambda x: x.value,
+            )
+
+        if column_stats.kind == _ColumnKind.DATETIME or (
+            column_stats.kind == _ColumnKind.NUMERIC
+            and cardinality in [*_MANY_VALUES_CARDINALITIES, Cardinality.UNIQUE]
+        ):
+            if config.include_field_min_value and column_stats.min is not None:
+                column_profile.min = str(column_stats.min)
+            if config.include_field_max_value and column_stats.max is not None:
+                column_profile.max = str(column_stats.max)
+
+        if (
+            column_stats.kind == _ColumnKind.NUMERIC
+            and cardinality in [*_MANY_VALUES_CARDINALITIES, Cardinality.UNIQUE]
+            and column_stats.num_numeric_values > 0
+        ):
+            self._add_numeric_stats(column_profile, column_stats)
+
+        return column_profile
+
+    def _add_numeric_stats(
+        self, column_profile: DatasetFieldProfileClass, column_stats: _ColumnStats
+    ) -> None:
+        config = self.profiling_config
+        if config.include_field_mean_value:
+            column_profile.mean = str(column_stats.mean)
+        if config.include_field_stddev_value and column_stats.num_numeric_values > 1:
+            column_profile.stdev = str(
+                (column_stats.m2 / (column_stats.num_numeric_values - 1)) ** 0.5
+            )
+
+        if column_stats.numeric_sample is None:
+            return
+        sample = sorted(column_stats.numeric_sample.values)
+        if config.include_field_median_value:
+            column_profile.median = str(_quantile(sample, 0.5))
+        if config.include_field_quantiles:
+            column_profile.quantiles = [
+                QuantileClass(quantile=str(q), value=str(_quantile(sample, q)))
+                for q in QUANTILES
+            ]
+        if config.include_field_histogram and sample[0] < sample[-1]:
+            # The heights are estimated from the sample, and scaled to the number
+            # of values of the column.
+            low, high = sample[0], sample[-1]
+            width = (high - low) / MAX_HIST_BINS
+            counts = [0] * MAX_HIST_BINS
+            for value in sample:
+                counts[min(int((value - low) / width), MAX_HIST_BINS - 1)] += 1
+            scale = column_stats.num_numeric_values / len(sample)
+            column_profile.histogram = HistogramClass(
+                [str(low + i * width) for i in range(MAX_HIST_BINS + 1)],
+                [count * scale for count in counts],
+            )
+
+
+class _FooterStats:
+    def __init__(self) -> None:
+        self.null_count: Optional[int] = 0
+        self.has_min_max = True
+        self.min: Any = None
+        self.max: Any = None
+
+
+def _get_footer_stats(
+    parquet_file: pyarrow.parquet.ParquetFile,
+) -> Dict[str, _FooterStats]:
+    """Collects the null counts and min/max values of the top level columns from the
+    statistics of all row groups. A statistic is only returned if every row group has it.
+    """
+
+    metadata = parquet_file.metadata
+    schema = parquet_file.schema_arrow
+    footer_stats: Dict[str, _FooterStats] = {}
+    for i in range(metadata.num_columns):
+        column = metadata.schema.column(i).path
+        if column not in schema.names:
+            # A nested column.
+            continue
+        type_ = schema.field(column).type
+        if pyarrow.types.is_floating(type_):
+            # NaNs are counted as nulls, but footers don't count them.
+            continue
+
+        column_footer_stats = _FooterStats()
+        # Only integer statistics are used, as others may be truncated (strings) or
+        # have unreliable conversions (e.g. legacy timestamps).
+        column_footer_stats.has_min_max = pyarrow.types.is_integer(type_)
+        for row_group in range(metadata.num_row_groups):
+            column_chunk = metadata.row_group(row_group).column(i)
+            statistics = column_chunk.statistics
+            if statistics is None or not statistics.has_null_count:
+                column_footer_stats.null_count = None
+                column_footer_stats.has_min_max = False
+                break
+            if column_footer_stats.null_count is not None:
+                column_footer_stats.null_count += statistics.null_count
+            if statistics.has_min_max:
+                if column_footer_stats.has_min_max:
+                    if (
+                        column_footer_stats.min is None
+                        or statistics.min < column_footer_stats.min
+                    ):
+                        column_footer_stats.min = statistics.min
+                    if (
+                        column_footer_stats.max is None
+                        or statistics.max > column_footer_stats.max
+                    ):
+                        column_footer_stats.max = statistics.max
+            elif statistics.null_count != column_chunk.num_values:
+                # Row groups with only nulls have no min/max.
+                column_footer_stats.has_min_max = False
+        footer_stats[column] = column_footer_stats
+    return footer_stats
+
+
+def _read_json(file: IO[bytes]) -> Iterator[pyarrow.RecordBatch]:
+    # Files are either JSON Lines, or a single JSON array of records.
+    block = file.read(_JSON_BLOCK_SIZE)
+    if block.lstrip()[:1] == b"[":
+        yield from _read_json_array(block + file.read(_MAX_JSON_ARRAY_SIZE))
+    else:
+        yield from _read_json_lines(file, block)
+
+
+def _read_json_lines(
+    file: IO[bytes], block: Optional[bytes] = None
+) -> Iterator[pyarrow.RecordBatch]:
+    # Arrow parses whole files, so it's given blocks of complete lines.
+    if block is None:
+        block = file.read(_JSON_BLOCK_SIZE)
+    while block:
+        block += file.readline()
+        yield from pyarrow.json.read_json(io.BytesIO(block)).to_batches(_BATCH_SIZE)
+        block = file.read(_JSON_BLOCK_SIZE)
+
+
+def _read_json_array(document: bytes) -> Iterator[pyarrow.RecordBatch]:
+    if len(document) > _MAX_JSON_ARRAY_SIZE:
+        raise ValueError(
+            f"JSON arrays larger than {_MAX_JSON_ARRAY_SIZE} bytes are not supported, "
+            "use JSON Lines instead"
+        )
+    records = ujson.loads(document)
+    if not records:
+        return
+    # Unlike Table.from_pylist, this infers the columns from all the records.
+    array = pyarrow.array(records)
+    if not pyarrow.types.is_struct(array.type):
+        raise ValueError("JSON arrays must contain objects")
+    yield from pyarrow.Table.from_batches(
+        [pyarrow.RecordBatch.from_struct_array(array)]
+    ).to_batches(_BATCH_SIZE)
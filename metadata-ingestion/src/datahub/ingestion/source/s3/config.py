@@ -98,6 +98,13 @@ class DataLakeSourceConfig(
         description="Number of files to list to sample for schema inference. This will be ignored if sample_files is set to False in the pathspec.",
     )
 
+    max_workers: int = Field(
+        default=10,
+        description="Number of threads used to list S3 prefixes and to infer the schemas of tables concurrently. "
+        "Set to 1 to disable. boto3 keeps at most 10 connections to S3 by default, so when raising this, "
+        "also raise `max_pool_connections` in `aws_config.aws_advanced_config`.",
+    )
+
     _rename_path_spec_to_plural = pydantic_renamed_field(
         "path_spec", "path_specs", lambda path_spec: [path_spec]
     )
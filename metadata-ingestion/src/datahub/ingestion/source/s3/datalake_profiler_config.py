@@ -1,17 +1,35 @@
+from enum import auto
 from typing import Any, Dict, Optional
 
 import pydantic
 from pydantic.fields import Field
 
 from datahub.configuration import ConfigModel
-from datahub.configuration.common import AllowDenyPattern
+from datahub.configuration.common import AllowDenyPattern, ConfigEnum
 from datahub.ingestion.source_config.operation_config import OperationConfig
 
 
+class DataLakeProfilingEngine(ConfigEnum):
+    # Profiles tables with PyDeequ, on a local Spark session.
+    SPARK = auto()
+
+    # Profiles tables by streaming their files with Apache Arrow.
+    ARROW = auto()
+
+
 class DataLakeProfilerConfig(ConfigModel):
     enabled: bool = Field(
         default=False, description="Whether profiling should be done."
     )
+    engine: DataLakeProfilingEngine = Field(
+        default=DataLakeProfilingEngine.SPARK,
+        description="The engine used to profile tables. `spark` runs PyDeequ on a local Spark "
+        "session. `arrow` streams the files of each table with Apache Arrow, so it needs "
+        "neither Spark nor a JVM, and uses a bounded amount of memory. It reads the row counts, "
+        "and where possible the null counts and min/max values, from Parquet footers. Distinct "
+        "counts of columns with many values, medians, quantiles and histograms are approximate. "
+        "It supports Parquet, CSV, TSV and JSON lines files.",
+    )
     operation_config: OperationConfig = Field(
         default_factory=OperationConfig,
         description="Experimental feature. To specify operation configs.",
@@ -1,21 +1,34 @@
+import bisect
 import dataclasses
 import functools
+import heapq
+import io
+import itertools
 import logging
 import os
 import pathlib
 import re
+import threading
 import time
 from datetime import datetime
 from pathlib import PurePath
-from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 from urllib.parse import urlparse
 
 import smart_open.compression as so_compression
 from more_itertools import peekable
-from pyspark.conf import SparkConf
-from pyspark.sql import SparkSession
-from pyspark.sql.dataframe import DataFrame
-from pyspark.sql.utils import AnalysisException
 from smart_open import open as smart_open
 
 from datahub.emitter.mce_builder import (
@@ -44,7 +57,14 @@ from datahub.ingestion.source.aws.s3_util import (
 )
 from datahub.ingestion.source.data_lake_common.data_lake_utils import ContainerWUCreator
 from datahub.ingestion.source.data_lake_common.path_spec import FolderTraversalMethod
+from datahub.ingestion.source.s3.arrow_profiling import (
+    SUPPORTED_EXTENSIONS,
+    ArrowTableProfiler,
+)
 from datahub.ingestion.source.s3.config import DataLakeSourceConfig, PathSpec
+from datahub.ingestion.source.s3.datalake_profiler_config import (
+    DataLakeProfilingEngine,
+)
 from datahub.ingestion.source.s3.report import DataLakeSourceReport
 from datahub.ingestion.source.schema_inference import avro, csv_tsv, json, parquet
 from datahub.ingestion.source.schema_inference.base import SchemaInferenceBase
@@ -72,11 +92,15 @@ from datahub.metadata.schema_classes import (
     _Aspect,
 )
 from datahub.telemetry import stats, telemetry
+from datahub.utilities.backpressure_aware_executor import BackpressureAwareExecutor
 from datahub.utilities.groupby import groupby_unsorted
 from datahub.utilities.perf_timer import PerfTimer
 
 if TYPE_CHECKING:
+    from mypy_boto3_s3 import S3Client
     from mypy_boto3_s3.service_resource import Bucket
+    from mypy_boto3_s3.type_defs import ObjectTypeDef
+    from pyspark.sql.dataframe import DataFrame
 
 # hide annoying debug errors from py4j
 logging.getLogger("py4j").setLevel(logging.ERROR)
@@ -84,6 +108,17 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 PAGE_SIZE = 1000
 
+# When listing a prefix without templates, it is split into shards along its folders
+# until there are enough shards for all the threads, or this many levels deep.
+MAX_SHARDING_DEPTH = 3
+
+# The Parquet schema is stored in the footer, at the end of the file. This is how
+# much of the end of the file is read in the first request.
+PARQUET_FOOTER_READ_SIZE = 64 * 1024
+PARQUET_MAGIC = b"PAR1"
+
+_R = TypeVar("_R")
+
 # Hack to support the .gzip extension with smart_open.
 so_compression.register_compressor(".gzip", so_compression._COMPRESSOR_REGISTRY[".gz"])
 
@@ -203,6 +238,8 @@ class S3Source(StatefulIngestionSourceBase):
         self.source_config = config
         self.report = DataLakeSourceReport()
         self.profiling_times_taken = []
+        self._s3_client: Optional["S3Client"] = None
+        self._thread_local = threading.local()
         config_report = {
             config_option: config.dict().get(config_option)
             for config_option in config_options_to_report
@@ -225,7 +262,8 @@ class S3Source(StatefulIngestionSourceBase):
                     for config_flag in profiling_flags_to_report
                 },
             )
-            self.init_spark()
+            if config.profiling.engine == DataLakeProfilingEngine.SPARK:
+                self.init_spark()
 
     def init_spark(self):
         os.environ.setdefault("SPARK_VERSION", "3.5")
@@ -234,6 +272,8 @@ class S3Source(StatefulIngestionSourceBase):
         # Importing here to avoid Deequ dependency for non profiling use cases
         # Deequ fails if Spark is not available which is not needed for non profiling use cases
         import pydeequ
+        from pyspark.conf import SparkConf
+        from pyspark.sql import SparkSession
 
         conf = SparkConf()
         conf.set(
@@ -317,7 +357,9 @@ class S3Source(StatefulIngestionSourceBase):
 
         return cls(config, ctx)
 
-    def read_file_spark(self, file: str, ext: str) -> Optional[DataFrame]:
+    def read_file_spark(self, file: str, ext: str) -> Optional["DataFrame"]:
+        from pyspark.sql.utils import AnalysisException
+
         logger.debug(f"Opening file {file} for profiling in spark")
         file = file.replace("s3://", "s3a://")
 
@@ -368,38 +410,35 @@ class S3Source(StatefulIngestionSourceBase):
         return df.toDF(*(c.replace(".", "_") for c in df.columns))
 
     def get_fields(self, table_data: TableData, path_spec: PathSpec) -> List:
-        if self.is_s3_platform():
-            if self.source_config.aws_config is None:
-                raise ValueError("AWS config is required for S3 file sources")
-
-            s3_client = self.source_config.aws_config.get_s3_client(
-                self.source_config.verify_ssl
-            )
-
-            file = smart_open(
-                table_data.full_path, "rb", transport_params={"client": s3_client}
-            )
-        else:
-            # We still use smart_open here to take advantage of the compression
-            # capabilities of smart_open.
-            file = smart_open(table_data.full_path, "rb")
-
         extension = pathlib.Path(table_data.full_path).suffix
         from datahub.ingestion.source.data_lake_common.path_spec import (
             SUPPORTED_COMPRESSIONS,
         )
 
-        if path_spec.enable_compression and (extension[1:] in SUPPORTED_COMPRESSIONS):
+        is_compressed = extension[1:] in SUPPORTED_COMPRESSIONS
+        if path_spec.enable_compression and is_compressed:
             # Removing the compression extension and using the one before that like .json.gz -> .json
             extension = pathlib.Path(table_data.full_path).with_suffix("").suffix
         if extension == "" and path_spec.default_extension:
             extension = f".{path_spec.default_extension}"
 
-        fields = []
         inferrer = self._get_inferrer(extension, table_data.content_type)
+
+        fields = []
         if inferrer:
             try:
-                fields = inferrer.infer_schema(file)
+                # Reading the file is part of inferring the schema, so that a file
+                # that can't be read is reported like one that can't be parsed.
+                if (
+                    self.is_s3_platform()
+                    and not is_compressed
+                    and isinstance(inferrer, parquet.ParquetInferrer)
+                ):
+                    file = self._read_parquet_footer(table_data.full_path)
+                else:
+                    file = self._open_file(table_data.full_path)
+                with file:
+                    fields = inferrer.infer_schema(file)
                 logger.debug(f"Extracted fields in schema: {fields}")
             except Exception as e:
                 self.report.report_warning(
@@ -411,7 +450,6 @@ class S3Source(StatefulIngestionSourceBase):
                 table_data.full_path,
                 f"file {table_data.full_path} has unsupported extension",
             )
-        file.close()
 
         if self.source_config.sort_schema_fields:
             fields = sorted(fields, key=lambda f: f.fieldPath)
@@ -484,6 +522,10 @@ class S3Source(StatefulIngestionSourceBase):
     def get_table_profile(
         self, table_data: TableData, dataset_urn: str
     ) -> Iterable[MetadataWorkUnit]:
+        if self.source_config.profiling.engine == DataLakeProfilingEngine.ARROW:
+            yield from self.get_table_profile_arrow(table_data, dataset_urn)
+            return
+
         # Importing here to avoid Deequ dependency for non profiling use cases
         # Deequ fails if Spark is not available which is not needed for non profiling use cases
         from pydeequ.analyzers import AnalyzerContext
@@ -560,6 +602,146 @@ class S3Source(StatefulIngestionSourceBase):
             aspect=table_profiler.profile,
         ).as_workunit()
 
+    def _get_s3_client(self) -> "S3Client":
+        # boto3 clients are thread safe, so all the threads share the same one.
+        if self._s3_client is None:
+            if self.source_config.aws_config is None:
+                raise ValueError("AWS config is required for S3 file sources")
+
+            self._s3_client = self.source_config.aws_config.get_s3_client(
+                self.source_config.verify_ssl
+            )
+        return self._s3_client
+
+    def _get_s3_bucket(self, bucket_name: str) -> "Bucket":
+        # boto3 resources aren't thread safe, so every thread creates its own.
+        s3 = getattr(self._thread_local, "s3_resource", None)
+        if s3 is None:
+            if self.source_config.aws_config is None:
+                raise ValueError("aws_config not set. Cannot browse s3")
+
+            s3 = self.source_config.aws_config.get_s3_resource(
+                self.source_config.verify_ssl
+            )
+            self._thread_local.s3_resource = s3
+        return s3.Bucket(bucket_name)
+
+    def _map_concurrently(
+        self, fn: Callable[..., _R], args_list: Iterable[Tuple[Any, ...]]
+    ) -> Iterator[_R]:
+        """Calls `fn` with each of the arguments in parallel, and yields the results in order."""
+
+        for future in BackpressureAwareExecutor.map_ordered(
+            fn, args_list, max_workers=self.source_config.max_workers
+        ):
+            yield future.result()
+
+    def _open_file(self, path: str) -> IO[bytes]:
+        if self.is_s3_platform():
+            return smart_open(
+                path, "rb", transport_params={"client": self._get_s3_client()}
+            )
+        # We still use smart_open here to take advantage of the compression
+        # capabilities of smart_open.
+        return smart_open(path, "rb")
+
+    def _read_parquet_footer(self, path: str) -> IO[bytes]:
+        """Reads the footer of a Parquet file on S3 with ranged requests.
+
+        Returns a file with only the footer, which is enough to read the schema. Most of
+        the time, a single request is needed, instead of the several requests that a
+        seekable stream over the whole file would make.
+        """
+
+        s3_client = self._get_s3_client()
+        bucket_name = get_bucket_name(path)
+        key = get_bucket_relative_path(path)
+
+        response = s3_client.get_object(
+            Bucket=bucket_name, Key=key, Range=f"bytes=-{PARQUET_FOOTER_READ_SIZE}"
+        )
+        tail = response["Body"].read()
+        if len(tail) < 8 or tail[-4:] != PARQUET_MAGIC:
+            raise ValueError(f"{path} is not a Parquet file")
+
+        # The footer ends with the length of the metadata, followed by the magic bytes.
+        footer_size = int.from_bytes(tail[-8:-4], "little") + 8
+        if footer_size > len(tail):
+            object_size = int(response["ContentRange"].rsplit("/", 1)[1])
+            if footer_size > object_size:
+                raise ValueError(f"{path} has an invalid Parquet footer")
+            response = s3_client.get_object(
+                Bucket=bucket_name,
+                Key=key,
+                Range=f"bytes={object_size - footer_size}-{object_size - len(tail) - 1}",
+            )
+            tail = response["Body"].read() + tail
+
+        # Readers check the magic bytes at the start of the file too.
+        return io.BytesIO(PARQUET_MAGIC + tail)
+
+    def _list_table_files(self, table_data: TableData, extension: str) -> List[str]:
+        # Like the Spark profiler, partitioned tables are profiled as a whole.
+        if not table_data.partitions:
+            return [table_data.full_path]
+
+        if self.is_s3_platform():
+            bucket_name = get_bucket_name(table_data.table_path)
+            prefix = get_bucket_relative_path(table_data.table_path).rstrip("/") + "/"
+            return [
+                self.create_s3_path(bucket_name, obj.key)
+                for obj in self._get_s3_bucket(bucket_name)
+                .objects.filter(Prefix=prefix)
+                .page_size(PAGE_SIZE)
+                if obj.key.endswith(extension)
+            ]
+
+        return sorted(
+            PurePath(os.path.join(root, file)).as_posix()
+            for root, _, files in os.walk(table_data.table_path)
+            for file in files
+            if file.endswith(extension)
+        )
+
+    def get_table_profile_arrow(
+        self, table_data: TableData, dataset_urn: str
+    ) -> Iterable[MetadataWorkUnit]:
+        extension = os.path.splitext(table_data.full_path)[1]
+        if extension not in SUPPORTED_EXTENSIONS:
+            self.report.report_warning(
+                table_data.display_name,
+                f"file {table_data.full_path} has an extension that the arrow profiling engine does not support",
+            )
+            return
+
+        with PerfTimer() as timer:
+            table_profiler = ArrowTableProfiler(
+                self.source_config.profiling, self.report, table_data.full_path
+            )
+            try:
+                for file_path in self._list_table_files(table_data, extension):
+                    logger.debug(f"Profiling {file_path} with arrow")
+                    with self._open_file(file_path) as file:
+                        table_profiler.add_file(file, extension)
+            except Exception as e:
+                self.report.report_warning(
+                    table_data.display_name,
+                    f"unable to profile table {table_data.display_name} from file {table_data.full_path}: {e}",
+                )
+                return
+            profile = table_profiler.get_profile()
+
+            time_taken = timer.elapsed_seconds()
+            logger.info(
+                f"Finished profiling {table_data.full_path}; took {time_taken:.3f} seconds"
+            )
+            self.profiling_times_taken.append(time_taken)
+
+        yield MetadataChangeProposalWrapper(
+            entityUrn=dataset_urn,
+            aspect=profile,
+        ).as_workunit()
+
     def _create_table_operation_aspect(self, table_data: TableData) -> OperationClass:
         reported_time = int(time.time() * 1000)
 
@@ -605,12 +787,47 @@ class S3Source(StatefulIngestionSourceBase):
             maxPartition=max_partition_summary, minPartition=min_partition_summary
         )
 
-    def ingest_table(
+    def get_schema_metadata(
         self, table_data: TableData, path_spec: PathSpec
+    ) -> Optional[SchemaMetadata]:
+        if table_data.size_in_bytes <= 0:
+            logger.info(
+                f"Skipping schema extraction for empty file {table_data.full_path}"
+            )
+            return None
+
+        logger.info(f"Extracting table schema from file: {table_data.full_path}")
+        try:
+            fields = self.get_fields(table_data, path_spec)
+        except Exception as e:
+            logger.error(
+                f"Failed to extract schema from file {table_data.full_path}. The error was:{e}"
+            )
+            return None
+
+        return SchemaMetadata(
+            schemaName=table_data.display_name,
+            platform=make_data_platform_urn(self.source_config.platform),
+            version=0,
+            hash="",
+            fields=fields,
+            platformSchema=OtherSchemaClass(rawSchema=""),
+        )
+
+    def ingest_table(
+        self,
+        table_data: TableData,
+        path_spec: PathSpec,
+        schema_metadata: Optional[SchemaMetadata],
     ) -> Iterable[MetadataWorkUnit]:
+        """Generates the workunits of a table.
+
+        The schema is inferred beforehand by `get_schema_metadata`, so that the schemas
+        of several tables can be inferred concurrently.
+        """
+
         aspects: List[Optional[_Aspect]] = []
 
-        logger.info(f"Extracting table schema from file: {table_data.full_path}")
         browse_path: str = (
             strip_s3_prefix(table_data.table_path)
             if self.is_s3_platform()
@@ -676,26 +893,8 @@ class S3Source(StatefulIngestionSourceBase):
             ),
         )
         aspects.append(dataset_properties)
-        if table_data.size_in_bytes > 0:
-            try:
-                fields = self.get_fields(table_data, path_spec)
-                schema_metadata = SchemaMetadata(
-                    schemaName=table_data.display_name,
-                    platform=data_platform_urn,
-                    version=0,
-                    hash="",
-                    fields=fields,
-                    platformSchema=OtherSchemaClass(rawSchema=""),
-                )
-                aspects.append(schema_metadata)
-            except Exception as e:
-                logger.error(
-                    f"Failed to extract schema from file {table_data.full_path}. The error was:{e}"
-                )
-        else:
-            logger.info(
-                f"Skipping schema extraction for empty file {table_data.full_path}"
-            )
+        if schema_metadata:
+            aspects.append(schema_metadata)
 
         if (
             self.source_config.use_s3_bucket_tags
@@ -786,19 +985,40 @@ class S3Source(StatefulIngestionSourceBase):
         )
 
     def resolve_templated_folders(self, bucket_name: str, prefix: str) -> Iterable[str]:
+        # The first * of every prefix is resolved at each step, so that all the
+        # folders of the same level are listed concurrently.
+        prefixes = [prefix]
+        while any("*" in prefix for prefix in prefixes):
+            prefixes = list(
+                itertools.chain.from_iterable(
+                    self._map_concurrently(
+                        self._resolve_first_wildcard,
+                        ((bucket_name, prefix) for prefix in prefixes),
+                    )
+                )
+            )
+        return prefixes
+
+    def _resolve_first_wildcard(self, bucket_name: str, prefix: str) -> List[str]:
         folder_split: List[str] = prefix.split("*", 1)
         # If the len of split is 1 it means we don't have * in the prefix
         if len(folder_split) == 1:
-            yield prefix
-            return
+            return [prefix]
 
-        folders: Iterable[str] = list_folders(
-            bucket_name, folder_split[0], self.source_config.aws_config
-        )
-        for folder in folders:
-            yield from self.resolve_templated_folders(
-                bucket_name, f"{folder}{folder_split[1]}"
+        return [
+            f"{folder}{folder_split[1]}"
+            for folder in self._list_folders(bucket_name, folder_split[0])
+        ]
+
+    def _list_folders(self, bucket_name: str, prefix: str) -> List[str]:
+        return list(
+            list_folders(
+                bucket_name,
+                prefix,
+                self.source_config.aws_config,
+                s3_client=self._get_s3_client(),
             )
+        )
 
     def get_dir_to_process(
         self,
@@ -815,6 +1035,7 @@ class S3Source(StatefulIngestionSourceBase):
             bucket_name=bucket_name,
             prefix=folder,
             aws_config=self.source_config.aws_config,
+            s3_client=self._get_s3_client(),
         )
         iterator = peekable(iterator)
         if iterator:
@@ -901,15 +1122,220 @@ class S3Source(StatefulIngestionSourceBase):
                 size=sum(obj.size for obj in group),
             )
 
+    def _browse_table_folder(
+        self, path_spec: PathSpec, bucket_name: str, table_folder: str
+    ) -> Optional[BrowsePath]:
+        table_path = self.create_s3_path(bucket_name, table_folder)
+        table_name, _ = path_spec.extract_table_name_and_path(table_path)
+        if not path_spec.tables_filter_pattern.allowed(table_name):
+            logger.debug(f"Table '{table_name}' not allowed and skipping")
+            self.report.report_file_dropped(table_path)
+            return None
+
+        dirs_to_process = []
+        logger.info(f"Processing folder: {table_folder}")
+        if path_spec.traversal_method == FolderTraversalMethod.ALL:
+            dirs_to_process.append(table_folder)
+        else:
+            if (
+                path_spec.traversal_method == FolderTraversalMethod.MIN_MAX
+                or path_spec.traversal_method == FolderTraversalMethod.MAX
+            ):
+                protocol = ContainerWUCreator.get_protocol(path_spec.include)
+                dirs_to_process_max = self.get_dir_to_process(
+                    bucket_name=bucket_name,
+                    folder=table_folder + "/",
+                    path_spec=path_spec,
+                    protocol=protocol,
+                )
+                dirs_to_process.append(dirs_to_process_max[0])
+
+            if path_spec.traversal_method == FolderTraversalMethod.MIN_MAX:
+                dirs_to_process_min = self.get_dir_to_process(
+                    bucket_name=bucket_name,
+                    folder=table_folder + "/",
+                    path_spec=path_spec,
+                    protocol=protocol,
+                    min=True,
+                )
+                dirs_to_process.append(dirs_to_process_min[0])
+        bucket = self._get_s3_bucket(bucket_name)
+        folders: List[Folder] = []
+        for dir in dirs_to_process:
+            logger.info(f"Getting files from folder: {dir}")
+            prefix_to_process = urlparse(dir).path.lstrip("/")
+
+            folders.extend(self.get_folder_info(path_spec, bucket, prefix_to_process))
+        max_folder = None
+        if folders:
+            max_folder = max(folders, key=lambda x: x.modification_time)
+        if not max_folder:
+            logger.warning(f"Unable to find any files in the folder {dir}. Skipping...")
+            return None
+
+        partitions = list(filter(lambda x: x.is_partition, folders))
+        return BrowsePath(
+            file=max_folder.sample_file,
+            timestamp=max_folder.modification_time,
+            size=max_folder.size,
+            partitions=partitions,
+            # TODO: Support content type inference for partitions
+        )
+
+    def _browse_objects(self, bucket_name: str, prefix: str) -> Iterable[BrowsePath]:
+        """Lists all the objects under the prefix.
+
+        The prefix is split into shards along its folders, and the shards are listed
+        concurrently. The objects are yielded in the same order as a single listing of
+        the prefix would return them.
+        """
+
+        # Objects found while splitting the prefix, keyed by their S3 key.
+        objects: List[Tuple[str, BrowsePath]] = []
+        shards = [prefix]
+        for _ in range(MAX_SHARDING_DEPTH):
+            if not shards or len(shards) >= self.source_config.max_workers:
+                break
+            sub_shards: List[str] = []
+            for shard_objects, shard_folders in self._map_concurrently(
+                self._list_objects_and_folders,
+                ((bucket_name, shard) for shard in shards),
+            ):
+                objects.extend(shard_objects)
+                sub_shards.extend(shard_folders)
+            shards = sub_shards
+        logger.debug(f"Listing {len(shards)} folder(s) of prefix {prefix}")
+
+        # Listing thousands of small folders one by one would take many more requests
+        # than listing the prefix at once, so adjacent folders are merged into at most
+        # one key range per thread.
+        shards.sort()
+        num_ranges = min(len(shards), self.source_config.max_workers)
+        ranges = [
+            shards[len(shards) * i // num_ranges : len(shards) * (i + 1) // num_ranges]
+            for i in range(num_ranges)
+        ]
+
+        # S3 lists keys in lexicographic order, and the keys of the ranges are disjoint,
+        # so merging both lists preserves that order.
+        listed_objects = itertools.chain.from_iterable(
+            self._map_concurrently(
+                self._list_folder_range,
+                (
+                    (
+                        bucket_name,
+                        prefix,
+                        folders,
+                        ranges[i + 1][0] if i + 1 < len(ranges) else None,
+                    )
+                    for i, folders in enumerate(ranges)
+                ),
+            )
+        )
+        for _, browse_path in heapq.merge(
+            sorted(objects, key=lambda o: o[0]), listed_objects, key=lambda o: o[0]
+        ):
+            yield browse_path
+
+    def _list_objects_and_folders(
+        self, bucket_name: str, prefix: str
+    ) -> Tuple[List[Tuple[str, BrowsePath]], List[str]]:
+        """Lists the objects and the folders directly under the prefix."""
+
+        objects: List[Tuple[str, BrowsePath]] = []
+        folders: List[str] = []
+        paginator = self._get_s3_client().get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=bucket_name,
+            Prefix=prefix,
+            Delimiter="/",
+            PaginationConfig={"PageSize": PAGE_SIZE},
+        ):
+            objects.extend(
+                self._to_browse_path(bucket_name, obj)
+                for obj in page.get("Contents", [])
+            )
+            folders.extend(str(o["Prefix"]) for o in page.get("CommonPrefixes", []))
+        return objects, folders
+
+    def _list_folder_range(
+        self,
+        bucket_name: str,
+        prefix: str,
+        folders: List[str],
+        end_key: Optional[str],
+    ) -> List[Tuple[str, BrowsePath]]:
+        """Lists the objects in adjacent folders under the prefix, in a single listing.
+
+        The listing starts at the first folder and stops at `end_key`. The objects in
+        between that are not in any of the folders were already found when the prefix
+        was split, and are skipped.
+        """
+
+        if len(folders) == 1:
+            return self._list_objects(bucket_name, folders[0])
+
+        objects: List[Tuple[str, BrowsePath]] = []
+        paginator = self._get_s3_client().get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=bucket_name,
+            Prefix=prefix,
+            # Folders end with the delimiter, so this is just before the first folder.
+            StartAfter=folders[0][:-1],
+            PaginationConfig={"PageSize": PAGE_SIZE},
+        ):
+            for obj in page.get("Contents", []):
+                key = obj["Key"]
+                if end_key is not None and key >= end_key:
+                    return objects
+                # The folders are all as deep, so a key can only be in the last folder
+                # that sorts before it.
+                i = bisect.bisect_right(folders, key) - 1
+                if i >= 0 and key.startswith(folders[i]):
+                    objects.append(self._to_browse_path(bucket_name, obj))
+        return objects
+
+    def _list_objects(
+        self, bucket_name: str, prefix: str
+    ) -> List[Tuple[str, BrowsePath]]:
+        paginator = self._get_s3_client().get_paginator("list_objects_v2")
+        return [
+            self._to_browse_path(bucket_name, obj)
+            for page in paginator.paginate(
+                Bucket=bucket_name,
+                Prefix=prefix,
+                PaginationConfig={"PageSize": PAGE_SIZE},
+            )
+            for obj in page.get("Contents", [])
+        ]
+
+    def _to_browse_path(
+        self, bucket_name: str, obj: "ObjectTypeDef"
+    ) -> Tuple[str, BrowsePath]:
+        s3_path = self.create_s3_path(bucket_name, obj["Key"])
+        logger.debug(f"Path: {s3_path}")
+
+        content_type = None
+        if self.source_config.use_s3_content_type:
+            content_type = (
+                self._get_s3_client()
+                .head_object(Bucket=bucket_name, Key=obj["Key"])
+                .get("ContentType")
+            )
+
+        return obj["Key"], BrowsePath(
+            file=s3_path,
+            timestamp=obj["LastModified"],
+            size=obj["Size"],
+            partitions=[],
+            content_type=content_type,
+        )
+
     def s3_browser(self, path_spec: PathSpec, sample_size: int) -> Iterable[BrowsePath]:
         if self.source_config.aws_config is None:
             raise ValueError("aws_config not set. Cannot browse s3")
-        s3 = self.source_config.aws_config.get_s3_resource(
-            self.source_config.verify_ssl
-        )
         bucket_name = get_bucket_name(path_spec.include)
         logger.debug(f"Scanning bucket: {bucket_name}")
-        bucket = s3.Bucket(bucket_name)
         prefix = self.get_prefix(get_bucket_relative_path(path_spec.include))
         logger.debug(f"Scanning objects with prefix:{prefix}")
         matches = re.finditer(r"{\s*\w+\s*}", path_spec.include, re.MULTILINE)
@@ -938,116 +1364,46 @@ class S3Source(StatefulIngestionSourceBase):
                         break
 
             table_index = include.find(max_match)
-            for folder in self.resolve_templated_folders(
-                bucket_name, get_bucket_relative_path(include[:table_index])
-            ):
-                try:
-                    for f in list_folders(
-                        bucket_name, f"{folder}", self.source_config.aws_config
-                    ):
-                        table_path = self.create_s3_path(bucket_name, f)
-                        table_name, _ = path_spec.extract_table_name_and_path(
-                            table_path
-                        )
-                        if not path_spec.tables_filter_pattern.allowed(table_name):
-                            logger.debug(
-                                f"Table '{table_name}' not allowed and skipping"
-                            )
-                            self.report.report_file_dropped(table_path)
-                            continue
-
-                        dirs_to_process = []
-                        logger.info(f"Processing folder: {f}")
-                        if path_spec.traversal_method == FolderTraversalMethod.ALL:
-                            dirs_to_process.append(f)
-                        else:
-                            if (
-                                path_spec.traversal_method
-                                == FolderTraversalMethod.MIN_MAX
-                                or path_spec.traversal_method
-                                == FolderTraversalMethod.MAX
-                            ):
-                                protocol = ContainerWUCreator.get_protocol(
-                                    path_spec.include
-                                )
-                                dirs_to_process_max = self.get_dir_to_process(
-                                    bucket_name=bucket_name,
-                                    folder=f + "/",
-                                    path_spec=path_spec,
-                                    protocol=protocol,
-                                )
-                                dirs_to_process.append(dirs_to_process_max[0])
-
-                            if (
-                                path_spec.traversal_method
-                                == FolderTraversalMethod.MIN_MAX
-                            ):
-                                dirs_to_process_min = self.get_dir_to_process(
-                                    bucket_name=bucket_name,
-                                    folder=f + "/",
-                                    path_spec=path_spec,
-                                    protocol=protocol,
-                                    min=True,
-                                )
-                                dirs_to_process.append(dirs_to_process_min[0])
-                        folders: List[Folder] = []
-                        for dir in dirs_to_process:
-                            logger.info(f"Getting files from folder: {dir}")
-                            prefix_to_process = urlparse(dir).path.lstrip("/")
-
-                            folders.extend(
-                                self.get_folder_info(
-                                    path_spec, bucket, prefix_to_process
-                                )
-                            )
-                        max_folder = None
-                        if folders:
-                            max_folder = max(folders, key=lambda x: x.modification_time)
-                        if not max_folder:
-                            logger.warning(
-                                f"Unable to find any files in the folder {dir}. Skipping..."
-                            )
-                            continue
-
-                        partitions = list(filter(lambda x: x.is_partition, folders))
-                        yield BrowsePath(
-                            file=max_folder.sample_file,
-                            timestamp=max_folder.modification_time,
-                            size=max_folder.size,
-                            partitions=partitions,
-                            # TODO: Support content type inference for partitions
-                        )
-                except Exception as e:
-                    # This odd check if being done because boto does not have a proper exception to catch
-                    # The exception that appears in stacktrace cannot actually be caught without a lot more work
-                    # https://github.com/boto/boto3/issues/1195
-                    if "NoSuchBucket" in repr(e):
-                        logger.debug(f"Got NoSuchBucket exception for {bucket_name}", e)
-                        self.get_report().report_warning(
-                            "Missing bucket", f"No bucket found {bucket_name}"
+            try:
+                # The folders, and then the tables in each folder, are listed
+                # concurrently, and so are the files of the tables.
+                folders = self.resolve_templated_folders(
+                    bucket_name, get_bucket_relative_path(include[:table_index])
+                )
+                table_folders = list(
+                    itertools.chain.from_iterable(
+                        self._map_concurrently(
+                            self._list_folders,
+                            ((bucket_name, folder) for folder in folders),
                         )
-                    else:
-                        raise e
+                    )
+                )
+                for browse_path in self._map_concurrently(
+                    self._browse_table_folder,
+                    (
+                        (path_spec, bucket_name, table_folder)
+                        for table_folder in table_folders
+                    ),
+                ):
+                    if browse_path:
+                        yield browse_path
+            except Exception as e:
+                # This odd check if being done because boto does not have a proper exception to catch
+                # The exception that appears in stacktrace cannot actually be caught without a lot more work
+                # https://github.com/boto/boto3/issues/1195
+                if "NoSuchBucket" in repr(e):
+                    logger.debug(f"Got NoSuchBucket exception for {bucket_name}", e)
+                    self.get_report().report_warning(
+                        "Missing bucket", f"No bucket found {bucket_name}"
+                    )
+                else:
+                    raise e
         else:
             logger.debug(
                 "No template in the pathspec can't do sampling, fallbacking to do full scan"
             )
             path_spec.sample_files = False
-            for obj in bucket.objects.filter(Prefix=prefix).page_size(PAGE_SIZE):
-                s3_path = self.create_s3_path(obj.bucket_name, obj.key)
-                logger.debug(f"Path: {s3_path}")
-
-                content_type = None
-                if self.source_config.use_s3_content_type:
-                    content_type = s3.Object(obj.bucket_name, obj.key).content_type
-
-                yield BrowsePath(
-                    file=s3_path,
-                    timestamp=obj.last_modified,
-                    size=obj.size,
-                    partitions=[],
-                    content_type=content_type,
-                )
+            yield from self._browse_objects(bucket_name, prefix)
 
     def create_s3_path(self, bucket_name: str, key: str) -> str:
         return f"s3://{bucket_name}/{key}"
@@ -1127,8 +1483,17 @@ class S3Source(StatefulIngestionSourceBase):
                                 table_data.table_path
                             ].timestamp = table_data.timestamp
 
-                for _, table_data in table_dict.items():
-                    yield from self.ingest_table(table_data, path_spec)
+                # Inferring the schemas is mostly waiting on reads, so it's done
+                # concurrently for several tables.
+                tables = list(table_dict.values())
+                for table_data, schema_metadata in zip(
+                    tables,
+                    self._map_concurrently(
+                        self.get_schema_metadata,
+                        ((table_data, path_spec) for table_data in tables),
+                    ),
+                ):
+                    yield from self.ingest_table(table_data, path_spec, schema_metadata)
 
             if not self.source_config.is_profiling_enabled():
                 return
@@ -1,5 +1,5 @@
 import logging
-from typing import Callable, Dict, Iterable, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Union
 
 from snowflake.sqlalchemy import snowdialect
 from sqlalchemy import create_engine, inspect
@@ -17,6 +17,10 @@ from datahub.ingestion.source.snowflake.snowflake_schema import (
 from datahub.ingestion.source.snowflake.snowflake_utils import SnowflakeCommonMixin
 from datahub.ingestion.source.sql.sql_generic import BaseTable
 from datahub.ingestion.source.sql.sql_generic_profiler import GenericProfiler
+from datahub.ingestion.source.sql_data_profiler import (
+    DatahubSQLProfiler,
+    create_profiler,
+)
 from datahub.ingestion.source.state.profiling_state_handler import ProfilingHandler
 
 snowdialect.ischema_names["GEOGRAPHY"] = sqltypes.NullType
@@ -132,7 +136,7 @@ class SnowflakeProfiler(GenericProfiler, SnowflakeCommonMixin):
 
     def get_profiler_instance(
         self, db_name: Optional[str] = None
-    ) -> "DatahubGEProfiler":
+    ) -> Union[DatahubGEProfiler, DatahubSQLProfiler]:
         assert db_name
 
         url = self.config.get_sql_alchemy_url(
@@ -152,7 +156,7 @@ class SnowflakeProfiler(GenericProfiler, SnowflakeCommonMixin):
         conn = engine.connect()
         inspector = inspect(conn)
 
-        return DatahubGEProfiler(
+        return create_profiler(
             conn=inspector.bind,
             report=self.report,
             config=self.config.profiling,
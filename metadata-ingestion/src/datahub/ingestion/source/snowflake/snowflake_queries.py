@@ -104,6 +104,13 @@ class SnowflakeQueriesExtractorConfig(ConfigModel):
         hidden_from_docs=True,
     )
 
+    sql_parsing_workers: int = pydantic.Field(
+        default=1,
+        description="[Advanced] Number of worker processes to use for parsing queries. "
+        "Parsing is CPU-bound, so large query logs benefit from using multiple cores. "
+        "By default, queries are parsed in the main process.",
+    )
+
     include_lineage: bool = True
     include_queries: bool = True
     include_usage_statistics: bool = True
@@ -184,6 +191,7 @@ class SnowflakeQueriesExtractor(SnowflakeStructuredReportMixin, Closeable):
                 is_temp_table=self.is_temp_table,
                 is_allowed_table=self.is_allowed_table,
                 format_queries=False,
+                sql_parsing_workers=self.config.sql_parsing_workers,
             )
         )
         self.report.sql_aggregator = self.aggregator.report
@@ -0,0 +1,434 @@
+"""Bulk reflection of table metadata for SQLAlchemy-based sources.
+
+SQLAlchemy's inspector reflects columns, constraints and comments one table at a
+time, which costs several catalog round-trips per table. For schemas with many
+tables, that latency dominates the ingestion time. The reflectors in this module
+instead fetch that metadata for a whole schema in a handful of catalog queries.
+BulkReflectionInspector then serves the per-table inspector calls from that
+snapshot, so that the rest of the source doesn't need to know about it.
+
+Column types are built with the dialect's own type parsing, so that the snapshot
+matches what the per-table inspector methods return.
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from sqlalchemy import sql
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine.reflection import Inspector
+
+if TYPE_CHECKING:
+    from datahub.ingestion.source.sql.sql_report import SQLSourceReport
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SchemaReflection:
+    """Table metadata for all tables and views in a schema, keyed by table name.
+
+    The values have the same structure as the results of the corresponding
+    Inspector methods.
+    """
+
+    columns: Dict[str, List[dict]] = field(default_factory=dict)
+    pk_constraints: Dict[str, dict] = field(default_factory=dict)
+    foreign_keys: Dict[str, List[dict]] = field(default_factory=dict)
+    table_comments: Dict[str, Optional[str]] = field(default_factory=dict)
+
+
+def _group_pk_constraints(
+    rows: Iterable[Tuple[str, Optional[str], str]],
+) -> Dict[str, dict]:
+    # Rows are (table, constraint name, column), ordered by table and key position.
+    pk_constraints: Dict[str, dict] = {}
+    for table, name, column in rows:
+        pk = pk_constraints.setdefault(table, {"constrained_columns": [], "name": name})
+        pk["constrained_columns"].append(column)
+    return pk_constraints
+
+
+def _group_foreign_keys(
+    rows: Iterable[Tuple[str, str, str, str, str, str]],
+) -> Dict[str, List[dict]]:
+    # Rows are (table, constraint name, column, referred schema, referred table,
+    # referred column), ordered by table, constraint name and key position.
+    foreign_keys: Dict[str, List[dict]] = {}
+    fks_by_name: Dict[Tuple[str, str], dict] = {}
+    for table, name, column, referred_schema, referred_table, referred_column in rows:
+        fk = fks_by_name.get((table, name))
+        if fk is None:
+            fk = {
+                "name": name,
+                "constrained_columns": [],
+                "referred_schema": referred_schema,
+                "referred_table": referred_table,
+                "referred_columns": [],
+                "options": {},
+            }
+            fks_by_name[(table, name)] = fk
+            foreign_keys.setdefault(table, []).append(fk)
+        fk["constrained_columns"].append(column)
+        fk["referred_columns"].append(referred_column)
+    return foreign_keys
+
+
+class BulkReflector(ABC):
+    @abstractmethod
+    def reflect_schema(
+        self, connection: Connection, inspector: Inspector, schema: str
+    ) -> SchemaReflection:
+        pass
+
+
+class PostgresBulkReflector(BulkReflector):
+    # Mirrors the per-table queries of SQLAlchemy's PostgreSQL dialect. One
+    # difference is that foreign keys always report the referred table's schema,
+    # whereas SQLAlchemy omits it for schemas on the search path.
+    _RELKINDS = "('r', 'p', 'v', 'm', 'f')"
+
+    def _columns_query(self, server_version_info: Tuple[int, ...]) -> str:
+        generated = (
+            "a.attgenerated AS generated"
+            if server_version_info >= (12,)
+            else "NULL AS generated"
+        )
+        if server_version_info >= (10,):
+            identity = """(
+                SELECT json_build_object(
+                    'always', a.attidentity = 'a',
+                    'start', s.seqstart,
+                    'increment', s.seqincrement,
+                    'minvalue', s.seqmin,
+                    'maxvalue', s.seqmax,
+                    'cache', s.seqcache,
+                    'cycle', s.seqcycle)
+                FROM pg_catalog.pg_sequence s
+                JOIN pg_catalog.pg_class sc ON s.seqrelid = sc.oid
+                WHERE sc.relkind = 'S'
+                AND a.attidentity != ''
+                AND s.seqrelid = pg_catalog.pg_get_serial_sequence(
+                    a.attrelid::regclass::text, a.attname
+                )::regclass::oid
+            ) AS identity_options"""
+        else:
+            identity = "NULL AS identity_options"
+
+        return f"""
+            SELECT c.relname,
+              a.attname,
+              pg_catalog.format_type(a.atttypid, a.atttypmod),
+              (
+                SELECT pg_catalog.pg_get_expr(d.adbin, d.adrelid)
+                FROM pg_catalog.pg_attrdef d
+                WHERE d.adrelid = a.attrelid AND d.adnum = a.attnum
+                AND a.atthasdef
+              ) AS column_default,
+              a.attnotnull,
+              pgd.description AS comment,
+              {generated},
+              {identity}
+            FROM pg_catalog.pg_attribute a
+            JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            LEFT JOIN pg_catalog.pg_description pgd ON (
+                pgd.objoid = a.attrelid AND pgd.objsubid = a.attnum)
+            WHERE n.nspname = :schema
+            AND c.relkind IN {self._RELKINDS}
+            AND a.attnum > 0 AND NOT a.attisdropped
+            ORDER BY c.relname, a.attnum
+        """
+
+    _PK_QUERY = """
+        SELECT c.relname, con.conname, a.attname
+        FROM pg_catalog.pg_constraint con
+        JOIN pg_catalog.pg_class c ON c.oid = con.conrelid
+        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+        CROSS JOIN LATERAL unnest(con.conkey) WITH ORDINALITY AS k(attnum, ord)
+        JOIN pg_catalog.pg_attribute a
+            ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+        WHERE n.nspname = :schema AND con.contype = 'p'
+        ORDER BY c.relname, k.ord
+    """
+
+    _FK_QUERY = """
+        SELECT c.relname, con.conname, a.attname, rn.nspname, rc.relname, ra.attname
+        FROM pg_catalog.pg_constraint con
+        JOIN pg_catalog.pg_class c ON c.oid = con.conrelid
+        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+        JOIN pg_catalog.pg_class rc ON rc.oid = con.confrelid
+        JOIN pg_catalog.pg_namespace rn ON rn.oid = rc.relnamespace
+        CROSS JOIN LATERAL unnest(con.conkey, con.confkey)
+            WITH ORDINALITY AS k(attnum, refattnum, ord)
+        JOIN pg_catalog.pg_attribute a
+            ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+        JOIN pg_catalog.pg_attribute ra
+            ON ra.attrelid = con.confrelid AND ra.attnum = k.refattnum
+        WHERE n.nspname = :schema AND con.contype = 'f'
+        ORDER BY c.relname, con.conname, k.ord
+    """
+
+    _TABLE_COMMENTS_QUERY = f"""
+        SELECT c.relname, pgd.description
+        FROM pg_catalog.pg_class c
+        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+        JOIN pg_catalog.pg_description pgd
+            ON pgd.objoid = c.oid AND pgd.objsubid = 0
+            AND pgd.classoid = 'pg_catalog.pg_class'::regclass
+        WHERE n.nspname = :schema AND c.relkind IN {_RELKINDS}
+    """
+
+    def reflect_schema(
+        self, connection: Connection, inspector: Inspector, schema: str
+    ) -> SchemaReflection:
+        dialect: Any = inspector.dialect
+        params = {"schema": schema}
+
+        domains = dialect._load_domains(connection)
+        enums = {
+            ((rec["name"],) if rec["visible"] else (rec["schema"], rec["name"])): rec
+            for rec in dialect._load_enums(connection, schema="*")
+        }
+
+        reflection = SchemaReflection()
+        for (
+            table,
+            name,
+            format_type,
+            default,
+            notnull,
+            comment,
+            generated,
+            identity,
+        ) in connection.execute(
+            sql.text(self._columns_query(dialect.server_version_info)), params
+        ):
+            reflection.columns.setdefault(table, []).append(
+                dialect._get_column_info(
+                    name,
+                    format_type,
+                    default,
+                    notnull,
+                    domains,
+                    enums,
+                    schema,
+                    comment,
+                    generated,
+                    identity,
+                )
+            )
+
+        reflection.pk_constraints = _group_pk_constraints(
+            connection.execute(sql.text(self._PK_QUERY), params)
+        )
+        reflection.foreign_keys = _group_foreign_keys(
+            connection.execute(sql.text(self._FK_QUERY), params)
+        )
+        reflection.table_comments = dict(
+            connection.execute(sql.text(self._TABLE_COMMENTS_QUERY), params)
+        )
+        return reflection
+
+
+class MySQLBulkReflector(BulkReflector):
+    # SQLAlchemy's MySQL dialect parses the output of SHOW CREATE TABLE. We instead
+    # build an equivalent column definition from information_schema and run it
+    # through the same parser. Column defaults are not reflected.
+    _COLUMNS_QUERY = """
+        SELECT c.TABLE_NAME, c.COLUMN_NAME, c.COLUMN_TYPE, c.IS_NULLABLE, c.EXTRA,
+            c.COLUMN_COMMENT, c.CHARACTER_SET_NAME, c.COLLATION_NAME, t.TABLE_COLLATION
+        FROM information_schema.COLUMNS c
+        JOIN information_schema.TABLES t
+            ON t.TABLE_SCHEMA = c.TABLE_SCHEMA AND t.TABLE_NAME = c.TABLE_NAME
+        WHERE c.TABLE_SCHEMA = :schema
+        ORDER BY c.TABLE_NAME, c.ORDINAL_POSITION
+    """
+
+    _PK_QUERY = """
+        SELECT TABLE_NAME, NULL, COLUMN_NAME
+        FROM information_schema.KEY_COLUMN_USAGE
+        WHERE TABLE_SCHEMA = :schema AND CONSTRAINT_NAME = 'PRIMARY'
+        ORDER BY TABLE_NAME, ORDINAL_POSITION
+    """
+
+    _FK_QUERY = """
+        SELECT TABLE_NAME, CONSTRAINT_NAME, COLUMN_NAME, REFERENCED_TABLE_SCHEMA,
+            REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME
+        FROM information_schema.KEY_COLUMN_USAGE
+        WHERE TABLE_SCHEMA = :schema AND REFERENCED_TABLE_NAME IS NOT NULL
+        ORDER BY TABLE_NAME, CONSTRAINT_NAME, ORDINAL_POSITION
+    """
+
+    # For views, TABLE_COMMENT is always "VIEW".
+    _TABLE_COMMENTS_QUERY = """
+        SELECT TABLE_NAME, TABLE_COMMENT
+        FROM information_schema.TABLES
+        WHERE TABLE_SCHEMA = :schema AND TABLE_TYPE != 'VIEW'
+    """
+
+    @staticmethod
+    def make_column(
+        dialect: Any,
+        name: str,
+        column_type: str,
+        is_nullable: str,
+        extra: Optional[str],
+        comment: Optional[str],
+        charset: Optional[str],
+        collation: Optional[str],
+        table_collation: Optional[str],
+    ) -> dict:
+        from sqlalchemy.dialects.mysql.reflection import ReflectedState
+
+        line = f"  {dialect.identifier_preparer.quote_identifier(name)} {column_type}"
+        # SHOW CREATE TABLE only includes the character set and collation if the
+        # column's collation differs from the table default. Views don't have one.
+        if table_collation and collation and collation != table_collation:
+            line += f" CHARACTER SET {charset} COLLATE {collation}"
+        if is_nullable == "NO":
+            line += " NOT NULL"
+        if extra and "auto_increment" in extra.lower():
+            line += " AUTO_INCREMENT"
+
+        state = ReflectedState()
+        dialect._tabledef_parser._parse_column(line, state)
+        (column,) = state.columns
+        column["comment"] = comment or None
+        return column
+
+    def reflect_schema(
+        self, connection: Connection, inspector: Inspector, schema: str
+    ) -> SchemaReflection:
+        dialect: Any = inspector.dialect
+        params = {"schema": schema}
+
+        reflection = SchemaReflection()
+        for table, *column_info in connection.execute(
+            sql.text(self._COLUMNS_QUERY), params
+        ):
+            reflection.columns.setdefault(table, []).append(
+                self.make_column(dialect, *column_info)
+            )
+
+        reflection.pk_constraints = _group_pk_constraints(
+            connection.execute(sql.text(self._PK_QUERY), params)
+        )
+        reflection.foreign_keys = _group_foreign_keys(
+            connection.execute(sql.text(self._FK_QUERY), params)
+        )
+        reflection.table_comments = {
+            table: comment or None
+            for table, comment in connection.execute(
+                sql.text(self._TABLE_COMMENTS_QUERY), params
+            )
+        }
+        return reflection
+
+
+_BULK_REFLECTORS: Dict[str, Type[BulkReflector]] = {
+    "postgresql": PostgresBulkReflector,
+    "mysql": MySQLBulkReflector,
+    "mariadb": MySQLBulkReflector,
+}
+
+
+def get_bulk_reflector(dialect_name: str) -> Optional[BulkReflector]:
+    """Returns a bulk reflector for the dialect, or None if it isn't supported."""
+    reflector_class = _BULK_REFLECTORS.get(dialect_name)
+    return reflector_class() if reflector_class else None
+
+
+class BulkReflectionInspector:
+    """Inspector wrapper that serves table metadata from per-schema snapshots.
+
+    Each schema is reflected on first use. If that fails, or a table is missing
+    from the snapshot, calls fall back to the wrapped inspector.
+    """
+
+    def __init__(
+        self,
+        inspector: Inspector,
+        reflector: BulkReflector,
+        report: "SQLSourceReport",
+    ):
+        self._inspector = inspector
+        self._reflector = reflector
+        self._report = report
+        self._reflections: Dict[str, Optional[SchemaReflection]] = {}
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self._inspector, item)
+
+    def _reflect_schema(self, schema: str) -> Optional[SchemaReflection]:
+        try:
+            # Use a separate connection, so that a failure here doesn't leave the
+            # inspector's connection in an aborted transaction.
+            with self._inspector.engine.connect() as connection:
+                reflection = self._reflector.reflect_schema(
+                    connection, self._inspector, schema
+                )
+        except Exception as e:
+            self._report.warning(
+                title="Failed to bulk reflect schema",
+                message="Falling back to reflecting tables one at a time.",
+                context=schema,
+                exc=e,
+            )
+            return None
+
+        logger.debug(
+            f"Bulk reflected {len(reflection.columns)} tables in schema {schema}"
+        )
+        self._report.num_schemas_bulk_reflected += 1
+        return reflection
+
+    def _get_reflection(
+        self, table_name: str, schema: Optional[str]
+    ) -> Optional[SchemaReflection]:
+        if schema is None:
+            return None
+        if schema not in self._reflections:
+            self._reflections[schema] = self._reflect_schema(schema)
+
+        reflection = self._reflections[schema]
+        if reflection is None or table_name not in reflection.columns:
+            return None
+        return reflection
+
+    def get_columns(
+        self, table_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> List[dict]:
+        reflection = self._get_reflection(table_name, schema)
+        if reflection is None:
+            return self._inspector.get_columns(table_name, schema, **kw)
+        return [dict(column) for column in reflection.columns[table_name]]
+
+    def get_pk_constraint(
+        self, table_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> dict:
+        reflection = self._get_reflection(table_name, schema)
+        if reflection is None:
+            return self._inspector.get_pk_constraint(table_name, schema, **kw)
+        return reflection.pk_constraints.get(
+            table_name, {"constrained_columns": [], "name": None}
+        )
+
+    def get_foreign_keys(
+        self, table_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> List[dict]:
+        reflection = self._get_reflection(table_name, schema)
+        if reflection is None:
+            return self._inspector.get_foreign_keys(table_name, schema, **kw)
+        return reflection.foreign_keys.get(table_name, [])
+
+    def get_table_comment(
+        self, table_name: str, schema: Optional[str] = None, **kw: Any
+    ) -> dict:
+        reflection = self._get_reflection(table_name, schema)
+        if reflection is None:
+            # SQLAlchemy stubs are incomplete and missing this method.
+            return self._inspector.get_table_comment(table_name, schema, **kw)  # type: ignore
+        return {"text": reflection.table_comments.get(table_name)}
@@ -2,6 +2,7 @@ import contextlib
 import datetime
 import functools
 import logging
+import threading
 import traceback
 from dataclasses import dataclass, field
 from functools import partial
@@ -9,7 +10,9 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Generator,
     Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -20,7 +23,8 @@ from typing import (
 )
 
 import sqlalchemy.dialects.postgresql.base
-from sqlalchemy import create_engine, inspect, log as sqlalchemy_log
+from sqlalchemy import create_engine, event, inspect, log as sqlalchemy_log
+from sqlalchemy.engine import Engine
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.row import LegacyRow
 from sqlalchemy.exc import ProgrammingError
@@ -55,6 +59,10 @@ from datahub.ingestion.source.common.subtypes import (
     DatasetContainerSubTypes,
     DatasetSubTypes,
 )
+from datahub.ingestion.source.sql.sql_bulk_reflection import (
+    BulkReflectionInspector,
+    get_bulk_reflector,
+)
 from datahub.ingestion.source.sql.sql_config import SQLCommonConfig
 from datahub.ingestion.source.sql.sql_report import SQLSourceReport
 from datahub.ingestion.source.sql.sql_utils import (
@@ -108,16 +116,19 @@ from datahub.metadata.schema_classes import (
 from datahub.sql_parsing.schema_resolver import SchemaResolver
 from datahub.sql_parsing.sql_parsing_aggregator import SqlParsingAggregator
 from datahub.telemetry import telemetry
+from datahub.utilities.perf_timer import PerfTimer
 from datahub.utilities.registries.domain_registry import DomainRegistry
 from datahub.utilities.sqlalchemy_type_converter import (
     get_native_data_type_for_sqlalchemy_type,
 )
+from datahub.utilities.threaded_iterator_executor import ThreadedIteratorExecutor
 
 if TYPE_CHECKING:
     from datahub.ingestion.source.ge_data_profiler import (
         DatahubGEProfiler,
         GEProfilerRequest,
     )
+    from datahub.ingestion.source.sql_data_profiler import DatahubSQLProfiler
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -273,6 +284,55 @@ class ProfileMetadata:
     dataset_name_to_storage_bytes: Dict[str, int] = field(default_factory=dict)
 
 
+class _SharedStateLock:
+    """Serializes the schema workers, except while their queries run.
+
+    The state of a source, e.g. its report and aggregator, isn't thread-safe. Schema
+    workers, and the consumer of their work units, only run while holding this lock.
+    Workers release it while their queries run on the database, which is what
+    processing schemas in parallel speeds up.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def __enter__(self) -> None:
+        self._lock.acquire()
+        self._local.held = True
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._local.held = False
+        self._lock.release()
+
+    @contextlib.contextmanager
+    def released_during_queries(self, engine: Engine) -> Iterator[None]:
+        listeners = [
+            ("before_cursor_execute", self._release),
+            ("after_cursor_execute", self._reacquire),
+            ("handle_error", self._reacquire),
+        ]
+        for identifier, fn in listeners:
+            event.listen(engine, identifier, fn)
+        try:
+            yield
+        finally:
+            for identifier, fn in listeners:
+                event.remove(engine, identifier, fn)
+
+    def _release(self, *args: Any) -> None:
+        if getattr(self._local, "held", False):
+            self._local.held = False
+            self._local.released = True
+            self._lock.release()
+
+    def _reacquire(self, *args: Any) -> None:
+        if getattr(self._local, "released", False):
+            self._lock.acquire()
+            self._local.released = False
+            self._local.held = True
+
+
 @capability(
     SourceCapability.CLASSIFICATION,
     "Optionally enabled via `classification.enabled`",
@@ -340,6 +400,9 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
         self.views_failed_parsing: Set[str] = set()
 
         self.discovered_datasets: Set[str] = set()
+        # Schemas may be processed in parallel, but the source's state is not
+        # thread-safe.
+        self._shared_state_lock = _SharedStateLock()
         self.aggregator = SqlParsingAggregator(
             platform=self.platform,
             platform_instance=self.config.platform_instance,
@@ -356,10 +419,14 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
         """Add default SQLAlchemy options. Can be overridden by subclasses to add additional defaults."""
         # Extra default SQLAlchemy option for better connection pooling and threading.
         # https://docs.sqlalchemy.org/en/14/core/pooling.html#sqlalchemy.pool.QueuePool.params.max_overflow
+        max_overflow = 0
         if sql_config.is_profiling_enabled():
-            sql_config.options.setdefault(
-                "max_overflow", sql_config.profiling.max_workers
-            )
+            max_overflow += sql_config.profiling.max_workers
+        if sql_config.schema_parallelism > 1:
+            # Each schema worker holds a connection, plus one for bulk reflection.
+            max_overflow += 2 * sql_config.schema_parallelism
+        if max_overflow:
+            sql_config.options.setdefault("max_overflow", max_overflow)
 
     @classmethod
     def test_connection(cls, config_dict: dict) -> TestConnectionReport:
@@ -502,12 +569,33 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
     ) -> Iterable[Union[MetadataWorkUnit, SqlWorkUnit]]:
         yield from self.gen_schema_containers(schema=schema, database=database)
 
+        inspector = self.get_schema_inspector(inspector)
+
         if self.config.include_tables:
             yield from self.loop_tables(inspector, schema, self.config)
 
         if self.config.include_views:
             yield from self.loop_views(inspector, schema, self.config)
 
+    def get_schema_inspector(self, inspector: Inspector) -> Inspector:
+        """Returns the inspector to use for reflecting the tables and views of a schema.
+
+        If bulk reflection is enabled and supported by the dialect, this wraps the
+        inspector so that it serves per-table metadata from a schema-level snapshot.
+        """
+        if not self.config.use_bulk_reflection:
+            return inspector
+
+        reflector = get_bulk_reflector(inspector.dialect.name)
+        if reflector is None:
+            logger.debug(
+                f"Bulk reflection is not supported for dialect {inspector.dialect.name}"
+            )
+            return inspector
+        return cast(
+            Inspector, BulkReflectionInspector(inspector, reflector, self.report)
+        )
+
     def get_workunit_processors(self) -> List[Optional[MetadataWorkUnitProcessor]]:
         return [
             *super().get_workunit_processors(),
@@ -550,19 +638,40 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
                 database=db_name,
             )
 
-            for schema in self.get_allowed_schemas(inspector, db_name):
-                self.add_information_for_schema(inspector, schema)
-
-                yield from self.get_schema_level_workunits(
-                    inspector=inspector,
-                    schema=schema,
-                    database=db_name,
-                )
-
-                if profiler:
-                    profile_requests += list(
-                        self.loop_profiler_requests(inspector, schema, sql_config)
+            # Profile requests are collected per schema, so that their order doesn't
+            # depend on the order in which schemas finish processing.
+            schema_profile_requests: Optional[List[List["GEProfilerRequest"]]] = (
+                [] if profiler else None
+            )
+            schema_args = self._gen_schema_args(
+                inspector, db_name, schema_profile_requests
+            )
+            if sql_config.schema_parallelism > 1 and isinstance(inspector, Inspector):
+                # The schemas are listed before the workers start, as this uses the
+                # connection of this thread.
+                schema_args = list(schema_args)
+                with self._shared_state_lock.released_during_queries(inspector.engine):
+                    for workunit in ThreadedIteratorExecutor.process_ordered(
+                        worker_func=self._process_schema_in_worker,
+                        args_list=schema_args,
+                        max_workers=sql_config.schema_parallelism,
+                    ):
+                        # Work units are processed downstream under the lock too.
+                        with self._shared_state_lock:
+                            yield workunit
+            else:
+                if sql_config.schema_parallelism > 1:
+                    self.report.info(
+                        title="Schemas processed sequentially",
+                        message="Parallel schema processing is not supported by this source, "
+                        "so schemas are processed one at a time.",
+                        context=db_name,
                     )
+                for args in schema_args:
+                    yield from self._process_schema(*args)
+
+            for requests in schema_profile_requests or []:
+                profile_requests += requests
 
             if profiler and profile_requests:
                 yield from self.loop_profiler(
@@ -573,6 +682,70 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
         for mcp in self.aggregator.gen_metadata():
             yield mcp.as_workunit()
 
+    def _gen_schema_args(
+        self,
+        inspector: Inspector,
+        database: str,
+        schema_profile_requests: Optional[List[List["GEProfilerRequest"]]],
+    ) -> Iterable[Tuple[Inspector, str, str, Optional[List["GEProfilerRequest"]]]]:
+        for schema in self.get_allowed_schemas(inspector, database):
+            self.add_information_for_schema(inspector, schema)
+
+            profile_requests: Optional[List["GEProfilerRequest"]] = None
+            if schema_profile_requests is not None:
+                profile_requests = []
+                schema_profile_requests.append(profile_requests)
+            yield inspector, schema, database, profile_requests
+
+    def _process_schema(
+        self,
+        inspector: Inspector,
+        schema: str,
+        database: str,
+        profile_requests: Optional[List["GEProfilerRequest"]],
+    ) -> Generator[Union[MetadataWorkUnit, SqlWorkUnit], None, None]:
+        with PerfTimer() as timer:
+            yield from self.get_schema_level_workunits(
+                inspector=inspector,
+                schema=schema,
+                database=database,
+            )
+
+            if profile_requests is not None:
+                profile_requests.extend(
+                    self.loop_profiler_requests(inspector, schema, self.config)
+                )
+
+        self.report.schema_processing_sec[f"{database}.{schema}"] = (
+            timer.elapsed_seconds(digits=2)
+        )
+
+    def _process_schema_in_worker(
+        self,
+        inspector: Inspector,
+        schema: str,
+        database: str,
+        profile_requests: Optional[List["GEProfilerRequest"]],
+    ) -> Iterable[Union[MetadataWorkUnit, SqlWorkUnit]]:
+        # Connections and inspectors can't be shared across threads, so each worker
+        # checks out its own connection from the engine's pool.
+        with inspector.engine.connect() as conn:
+            workunits = self._process_schema(
+                inspect(conn), schema, database, profile_requests
+            )
+            try:
+                while True:
+                    # The lock is released while waiting for the queries, and for
+                    # the consumer.
+                    with self._shared_state_lock:
+                        workunit = next(workunits, None)
+                    if workunit is None:
+                        return
+                    yield workunit
+            finally:
+                with self._shared_state_lock:
+                    workunits.close()
+
     def get_identifier(
         self, *, schema: str, entity: str, inspector: Inspector, **kwargs: Any
     ) -> str:
@@ -1150,10 +1323,12 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
         database, schema, _view = dataset_identifier.split(".", 2)
         return database, schema
 
-    def get_profiler_instance(self, inspector: Inspector) -> "DatahubGEProfiler":
-        from datahub.ingestion.source.ge_data_profiler import DatahubGEProfiler
+    def get_profiler_instance(
+        self, inspector: Inspector
+    ) -> Union["DatahubGEProfiler", "DatahubSQLProfiler"]:
+        from datahub.ingestion.source.sql_data_profiler import create_profiler
 
-        return DatahubGEProfiler(
+        return create_profiler(
             conn=inspector.bind,
             report=self.report,
             config=self.config.profiling,
@@ -1301,7 +1476,7 @@ class SQLAlchemySource(StatefulIngestionSourceBase, TestableSource):
     def loop_profiler(
         self,
         profile_requests: List["GEProfilerRequest"],
-        profiler: "DatahubGEProfiler",
+        profiler: Union["DatahubGEProfiler", "DatahubSQLProfiler"],
         platform: Optional[str] = None,
     ) -> Iterable[MetadataWorkUnit]:
         for request, profile in profiler.generate_profiles(
@@ -111,6 +111,21 @@ class SQLCommonConfig(
         description="Whether to use a file backed cache for the view definitions.",
     )
 
+    use_bulk_reflection: bool = Field(
+        default=False,
+        description="Whether to fetch columns, constraints and comments for a whole schema at once, "
+        "instead of once per table. This greatly reduces the number of catalog queries for schemas with many tables. "
+        "Currently supported for PostgreSQL and MySQL; other sources fall back to per-table reflection.",
+    )
+
+    schema_parallelism: int = Field(
+        default=1,
+        ge=1,
+        description="Number of schemas to process in parallel. Each worker uses its own connection from the pool. "
+        "The output is the same as with sequential processing, but the work units of a schema are kept in memory "
+        "until all earlier schemas are done.",
+    )
+
     profiling: GEProfilingConfig = GEProfilingConfig()
     # Custom Stateful Ingestion settings
     stateful_ingestion: Optional[StatefulStaleMetadataRemovalConfig] = None
@@ -9,6 +9,7 @@ from sqlalchemy.engine.reflection import Inspector
 
 from datahub.emitter.mce_builder import (
     make_dataset_urn_with_platform_instance,
+    make_ts_millis,
     parse_ts_millis,
 )
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
@@ -21,9 +22,20 @@ from datahub.ingestion.source.sql.sql_config import SQLCommonConfig
 from datahub.ingestion.source.sql.sql_generic import BaseTable, BaseView
 from datahub.ingestion.source.sql.sql_report import SQLSourceReport
 from datahub.ingestion.source.sql.sql_utils import check_table_with_profile_pattern
+from datahub.ingestion.source.sql_data_profiler import (
+    DatahubSQLProfiler,
+    create_profiler,
+)
+from datahub.ingestion.source.state.profiling_state import (
+    ProfiledPartitionStats,
+    ProfiledTableState,
+)
 from datahub.ingestion.source.state.profiling_state_handler import ProfilingHandler
 from datahub.metadata.com.linkedin.pegasus2avro.dataset import DatasetProfile
-from datahub.metadata.com.linkedin.pegasus2avro.timeseries import PartitionType
+from datahub.metadata.com.linkedin.pegasus2avro.timeseries import (
+    PartitionSpec,
+    PartitionType,
+)
 
 
 @dataclass
@@ -86,6 +98,15 @@ class GenericProfiler:
                     entityUrn=dataset_urn, aspect=table_level_profile
                 ).as_workunit()
 
+        if self.config.profiling.incremental and self.state_handler:
+            ge_profile_requests = [
+                request
+                for request in ge_profile_requests
+                if not self._is_unchanged_since_last_profiled(
+                    cast(TableProfilerRequest, request)
+                )
+            ]
+
         if not ge_profile_requests:
             return
 
@@ -100,6 +121,14 @@ class GenericProfiler:
 
             request = cast(TableProfilerRequest, ge_profiler_request)
             profile.sizeInBytes = request.table.size_in_bytes
+            dataset_urn = self.dataset_urn_builder(request.pretty_name)
+
+            table_state: Optional[ProfiledTableState] = None
+            if self.config.profiling.incremental and self.state_handler:
+                table_state = self._get_table_state(request)
+                # This relies on the row count of the profiled partition, so it has
+                # to happen before the row count is replaced below.
+                self._merge_with_previous_partitions(dataset_urn, table_state, profile)
 
             # If table is partitioned we profile only one partition (if nothing set then the last one)
             # but for table level we can use the rows_count from the table metadata
@@ -111,17 +140,112 @@ class GenericProfiler:
             ):
                 profile.rowCount = request.table.rows_count
 
-            dataset_urn = self.dataset_urn_builder(request.pretty_name)
-
             # We don't add to the profiler state if we only do table level profiling as it always happens
             if self.state_handler:
                 self.state_handler.add_to_state(
                     dataset_urn, int(datetime.now().timestamp() * 1000)
                 )
+                if table_state:
+                    self.state_handler.add_table_state(dataset_urn, table_state)
             yield MetadataChangeProposalWrapper(
                 entityUrn=dataset_urn, aspect=profile
             ).as_workunit()
 
+    def _get_table_state(self, request: TableProfilerRequest) -> ProfiledTableState:
+        return ProfiledTableState(
+            rows_count=request.table.rows_count,
+            last_altered=make_ts_millis(request.table.last_altered),
+            partition=request.batch_kwargs.get("partition"),
+        )
+
+    def _is_unchanged_since_last_profiled(self, request: TableProfilerRequest) -> bool:
+        assert self.state_handler
+        dataset_urn = self.dataset_urn_builder(request.pretty_name)
+        last_table_state = self.state_handler.get_last_table_state(dataset_urn)
+        if last_table_state is None or not self._get_table_state(
+            request
+        ).is_unchanged_since(last_table_state):
+            return False
+
+        # The state of the previous profile was already carried over to the new
+        # state by is_dataset_eligible_for_profiling.
+        self.report.profiling_skipped_unchanged[
+            request.pretty_name.rsplit(".", 1)[0]
+        ] += 1
+        logger.debug(
+            f"Table {request.pretty_name} was skipped because it hasn't changed since it was last profiled"
+        )
+        return True
+
+    def _merge_with_previous_partitions(
+        self,
+        dataset_urn: str,
+        table_state: ProfiledTableState,
+        profile: DatasetProfile,
+    ) -> None:
+        # Sampled partitions can't be merged, since their null counts don't add up
+        # to the row count of the partition.
+        if (
+            not profile.partitionSpec
+            or profile.partitionSpec.type != PartitionType.PARTITION
+            or profile.partitionSpec.partition != table_state.partition
+        ):
+            return
+        partition_stats = ProfiledPartitionStats.from_profile(profile)
+        if partition_stats is None:
+            return
+        table_state.partition_stats = partition_stats
+
+        assert self.state_handler
+        last_table_state = self.state_handler.get_last_table_state(dataset_urn)
+        if (
+            last_table_state is None
+            or last_table_state.partition is None
+            or last_table_state.partition_stats is None
+            or table_state.partition is None
+            or table_state.partition < last_table_state.partition
+            or (
+                table_state.rows_count is not None
+                and last_table_state.rows_count is not None
+                and table_state.rows_count < last_table_state.rows_count
+            )
+        ):
+            # If rows were removed, or the table was recreated, the statistics of
+            # the previous partitions are no longer accurate.
+            return
+
+        if table_state.partition == last_table_state.partition:
+            # The partition was profiled again as it changed, so its previous
+            # statistics are replaced.
+            previous_partitions_stats = last_table_state.previous_partitions_stats
+        elif last_table_state.previous_partitions_stats is not None:
+            previous_partitions_stats = (
+                last_table_state.previous_partitions_stats.merge(
+                    last_table_state.partition_stats
+                )
+            )
+        else:
+            previous_partitions_stats = last_table_state.partition_stats
+        if (
+            previous_partitions_stats is None
+            or previous_partitions_stats.row_count + partition_stats.row_count
+            != table_state.rows_count
+        ):
+            # Some partitions were never profiled, e.g. because they existed before
+            # incremental profiling was enabled, so the merged statistics wouldn't
+            # describe the table. The merge starts over from this partition.
+            return
+
+        table_state.previous_partitions_stats = previous_partitions_stats
+        merged_stats = previous_partitions_stats.merge(partition_stats)
+        merged_stats.apply_to(profile)
+        # The merged statistics cover all the partitions, i.e. the whole table.
+        profile.rowCount = merged_stats.row_count
+        profile.partitionSpec = PartitionSpec(
+            partition="FULL_TABLE_SNAPSHOT", type=PartitionType.FULL_TABLE
+        )
+        self.report.num_incremental_profiles_merged += 1
+
     def dataset_urn_builder(self, dataset_name: str) -> str:
         return make_dataset_urn_with_platform_instance(
             self.platform,
@@ -202,7 +326,7 @@ class GenericProfiler:
 
     def get_profiler_instance(
         self, db_name: Optional[str] = None
-    ) -> "DatahubGEProfiler":
+    ) -> Union[DatahubGEProfiler, DatahubSQLProfiler]:
         logger.debug(f"Getting profiler instance from {self.platform}")
         url = self.config.get_sql_alchemy_url()
 
@@ -212,7 +336,7 @@ class GenericProfiler:
         with engine.connect() as conn:
             inspector = inspect(conn)
 
-        return DatahubGEProfiler(
+        return create_profiler(
             conn=inspector.bind,
             report=self.report,
             config=self.config.profiling,
@@ -247,6 +371,9 @@ class GenericProfiler:
             if last_profiled:
                 # If profiling state exists we have to carry over to the new state
                 self.state_handler.add_to_state(dataset_urn, last_profiled)
+                last_table_state = self.state_handler.get_last_table_state(dataset_urn)
+                if last_table_state:
+                    self.state_handler.add_table_state(dataset_urn, last_table_state)
 
         threshold_time: Optional[datetime] = parse_ts_millis(last_profiled)
         if (
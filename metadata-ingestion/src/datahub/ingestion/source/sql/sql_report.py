@@ -16,6 +16,9 @@ class DetailedProfilerReportMixin:
     profiling_skipped_not_updated: TopKDict[str, int] = field(
         default_factory=int_top_k_dict
     )
+    profiling_skipped_unchanged: TopKDict[str, int] = field(
+        default_factory=int_top_k_dict
+    )
     profiling_skipped_size_limit: TopKDict[str, int] = field(
         default_factory=int_top_k_dict
     )
@@ -34,6 +37,8 @@ class DetailedProfilerReportMixin:
         default_factory=int_top_k_dict
     )
 
+    num_incremental_profiles_merged: int = 0
+
 
 @dataclass
 class SQLSourceReport(
@@ -47,6 +52,8 @@ class SQLSourceReport(
     filtered: LossyList[str] = field(default_factory=LossyList)
 
     query_combiner: Optional[SQLAlchemyQueryCombinerReport] = None
+    num_schemas_bulk_reflected: int = 0
+    schema_processing_sec: TopKDict[str, float] = field(default_factory=TopKDict)
 
     num_view_definitions_parsed: int = 0
     num_view_definitions_view_urn_mismatch: int = 0
@@ -0,0 +1,1047 @@
+"""Profiles SQL tables with a few aggregate queries, without Great Expectations.
+
+The Great Expectations based profiler computes every metric of every column with a
+separate expectation, and relies on the query combiner to merge the resulting queries.
+This profiler instead compiles the metrics of all columns of a table into a single
+aggregate SELECT, using the approximate aggregate functions of the dialect where they
+are available. Metrics that depend on the results of that first pass, like quantiles,
+histograms and value frequencies, are computed by a second, much smaller, set of
+queries. The profiles have the same shape as those of the Great Expectations profiler.
+"""
+
+import collections
+import concurrent.futures
+import dataclasses
+import json
+import logging
+import math
+import re
+import threading
+from enum import Enum
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import sqlalchemy as sa
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.sql.elements import ColumnElement, TextClause
+from sqlalchemy.sql.selectable import FromClause
+
+from datahub.emitter.mce_builder import get_sys_time
+from datahub.ingestion.source.ge_profiling_config import (
+    GEProfilingConfig,
+    ProfilingEngine,
+)
+from datahub.ingestion.source.profiling.common import (
+    NORMALIZE_TYPE_PATTERN,
+    Cardinality,
+    convert_to_cardinality,
+    get_column_types_to_ignore,
+    get_columns_to_ignore_sampling,
+)
+from datahub.ingestion.source.sql.sql_report import SQLSourceReport
+from datahub.ingestion.source.sql.sql_types import resolve_sql_type
+from datahub.metadata.com.linkedin.pegasus2avro.schema import NumberType
+from datahub.metadata.schema_classes import (
+    DatasetFieldProfileClass,
+    DatasetProfileClass,
+    HistogramClass,
+    PartitionSpecClass,
+    PartitionTypeClass,
+    QuantileClass,
+    ValueFrequencyClass,
+)
+from datahub.telemetry import stats, telemetry
+from datahub.utilities.perf_timer import PerfTimer
+
+if TYPE_CHECKING:
+    from datahub.ingestion.source.ge_data_profiler import (
+        DatahubGEProfiler,
+        GEProfilerRequest,
+    )
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+POSTGRESQL = "postgresql"
+MYSQL = "mysql"
+SNOWFLAKE = "snowflake"
+BIGQUERY = "bigquery"
+REDSHIFT = "redshift"
+DATABRICKS = "databricks"
+TRINO = "trino"
+PRESTO = "presto"
+ATHENA = "awsathena"
+MSSQL = "mssql"
+ORACLE = "oracle"
+
+_QUANTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
+_HISTOGRAM_BINS = 10
+
+_LOW_CARDINALITIES = {
+    Cardinality.ONE,
+    Cardinality.TWO,
+    Cardinality.VERY_FEW,
+    Cardinality.FEW,
+}
+_NUMERIC_LOW_CARDINALITIES = {Cardinality.ONE, Cardinality.TWO, Cardinality.VERY_FEW}
+_NUMERIC_HIGH_CARDINALITIES = {Cardinality.FEW, Cardinality.MANY, Cardinality.VERY_MANY}
+
+
+class _ColumnKind(Enum):
+    NUMERIC = "NUMERIC"
+    STRING = "STRING"
+    DATETIME = "DATETIME"
+    OTHER = "OTHER"
+
+
+def _get_column_kind(column_type: Any, dialect_name: str) -> _ColumnKind:
+    if isinstance(column_type, sa.types.Boolean):
+        return _ColumnKind.OTHER
+    if isinstance(column_type, (sa.types.Integer, sa.types.Numeric)):
+        return _ColumnKind.NUMERIC
+    if isinstance(
+        column_type,
+        (sa.types.Date, sa.types.DateTime, sa.types.Time, sa.types.Interval),
+    ):
+        return _ColumnKind.DATETIME
+    if isinstance(column_type, sa.types.String):
+        return _ColumnKind.STRING
+
+    # Dialect-specific types that SQLAlchemy doesn't know about may still be numbers.
+    try:
+        datahub_field_type = resolve_sql_type(str(column_type), dialect_name)
+    except Exception as e:
+        logger.debug(f"Error resolving sql type {column_type}: {e}")
+        datahub_field_type = None
+    if isinstance(datahub_field_type, NumberType):
+        return _ColumnKind.NUMERIC
+    return _ColumnKind.OTHER
+
+
+def _approx_count_distinct(
+    dialect_name: str, column: ColumnElement, quoted_column: str
+) -> ColumnElement:
+    if dialect_name in {SNOWFLAKE, BIGQUERY, DATABRICKS}:
+        return sa.func.approx_count_distinct(column)
+    elif dialect_name in {TRINO, PRESTO, ATHENA}:
+        return sa.func.approx_distinct(column)
+    elif dialect_name == REDSHIFT:
+        # We use coalesce here to force SQL Alchemy to see this as a column expression.
+        return sa.func.coalesce(
+            sa.literal_column(f"APPROXIMATE count(distinct {quoted_column})")
+        )
+    return sa.func.count(sa.distinct(column))
+
+
+def _stddev(dialect_name: str, column: ColumnElement) -> ColumnElement:
+    if dialect_name == MSSQL:
+        return sa.func.stdev(column)
+    return sa.func.stddev_samp(column)
+
+
+def _percentile(
+    dialect_name: str, column: ColumnElement, quoted_column: str, quantile: float
+) -> Optional[ColumnElement]:
+    """Returns an aggregate that computes a quantile of a column, if the dialect has one."""
+
+    if dialect_name in {SNOWFLAKE, DATABRICKS, TRINO, PRESTO, ATHENA}:
+        return sa.func.approx_percentile(column, sa.literal_column(repr(quantile)))
+    elif dialect_name == BIGQUERY:
+        return sa.literal_column(
+            f"approx_quantiles({quoted_column}, 100)[OFFSET({round(quantile * 100)})]"
+        )
+    elif dialect_name in {POSTGRESQL, REDSHIFT, ORACLE}:
+        return sa.func.percentile_cont(sa.literal_column(repr(quantile))).within_group(
+            column
+        )
+    return None
+
+
+# On these dialects, sort-based aggregates with different ORDER BYs cannot be
+# combined in a single query, so percentiles are computed with one query per column.
+_PERCENTILES_PER_COLUMN_DIALECTS = {REDSHIFT}
+
+
+@dataclasses.dataclass
+class _ColumnSpec:
+    name: str
+    kind: _ColumnKind
+    profile: DatasetFieldProfileClass
+    quoted_name: str
+    # Whether the values of the column may be read, or only counted.
+    sample: bool
+
+    nonnull_count: Optional[int] = None
+    unique_count: Optional[int] = None
+    cardinality: Optional[Cardinality] = None
+    min: Any = None
+    max: Any = None
+
+    @property
+    def column(self) -> ColumnElement:
+        return sa.column(self.name)
+
+
+_MetricKey = Tuple[Optional[str], str]
+
+
+class _SingleTableProfiler:
+    def __init__(
+        self,
+        conn: Connection,
+        pretty_name: str,
+        schema: Optional[str],
+        table: str,
+        partition: Optional[str],
+        custom_sql: Optional[str],
+        use_quoted_name: bool,
+        config: GEProfilingConfig,
+        report: SQLSourceReport,
+        platform: str,
+        env: str,
+    ):
+        self.conn = conn
+        self.dataset_name = pretty_name
+        self.schema = schema
+        self.table_name = table
+        self.partition = partition
+        self.custom_sql = custom_sql
+        self.config = config
+        self.report = report
+        self.platform = platform
+        self.env = env
+
+        self.dialect_name = conn.dialect.name.lower()
+        self.preparer = conn.dialect.identifier_preparer
+
+        self.table: Union[FromClause, TextClause]
+        if self.dialect_name == BIGQUERY:
+            # Like the Great Expectations profiler, refer to tables as
+            # <project>.<dataset>.<table>, to support multi-project setups.
+            self.table = sa.text(f"`{schema}.{table}`" if schema else f"`{table}`")
+        else:
+            self.table = sa.table(
+                sa.sql.quoted_name(table, True if use_quoted_name else None),
+                schema=schema,
+            )
+        self.source = self._get_source()
+
+    def _get_source(self) -> Union[FromClause, TextClause]:
+        if self.custom_sql:
+            return sa.text(self.custom_sql).columns().subquery("profiled")
+        elif self.config.limit or self.config.offset:
+            query = sa.select([sa.text("*")]).select_from(self.table)
+            if self.config.limit:
+                query = query.limit(self.config.limit)
+            if self.config.offset:
+                query = query.offset(self.config.offset)
+            return query.subquery("profiled")
+        return self.table
+
+    def _quote(self, column: str) -> str:
+        if self.dialect_name in {BIGQUERY, DATABRICKS}:
+            return f"`{column}`"
+        return self.preparer.quote(column)
+
+    def _execute_aggregates(
+        self, metrics: Dict[_MetricKey, ColumnElement]
+    ) -> Dict[_MetricKey, Any]:
+        if not metrics:
+            return {}
+        keys = list(metrics.keys())
+        query = sa.select(
+            [metrics[key].label(f"m{i}") for i, key in enumerate(keys)]
+        ).select_from(self.source)
+        row = self.conn.execute(query).fetchone()
+        assert row is not None
+        return dict(zip(keys, row))
+
+    def _execute_aggregates_by_column(
+        self, metrics: Dict[_MetricKey, ColumnElement], title: str
+    ) -> Dict[_MetricKey, Any]:
+        """Runs all metrics in one query, falling back to one query per column.
+
+        Without the fallback, a single column that the database fails to aggregate
+        would prevent the whole table from being profiled.
+        """
+
+        try:
+            return self._execute_aggregates(metrics)
+        except Exception as e:
+            if not self.config.catch_exceptions:
+                raise e
+            logger.debug(
+                f"Combined profiling query failed for {self.dataset_name}, retrying column by column: {e}"
+            )
+
+        results: Dict[_MetricKey, Any] = {}
+        for column, column_metrics in _group_by_column(metrics).items():
+            try:
+                results.update(self._execute_aggregates(column_metrics))
+            except Exception as e:
+                if column is None:
+                    # Table-level metrics, like the row count, are required.
+                    raise e
+                logger.debug(
+                    f"Caught exception while profiling column {column} of {self.dataset_name}. {e}"
+                )
+                self.report.report_warning(
+                    title=title,
+                    message="The statistics for the column will not be accessible",
+                    context=f"{self.dataset_name}.{column}",
+                    exc=e,
+                )
+        return results
+
+    def _get_columns_to_profile(
+        self, columns: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        if not self.config.any_field_level_metrics_enabled():
+            return []
+
+        columns_to_profile: List[Dict[str, Any]] = []
+        ignored_columns_by_pattern: List[str] = []
+        ignored_columns_by_type: List[str] = []
+
+        for col_dict in columns:
+            col = col_dict["name"]
+            # We expect the allow/deny patterns to specify '<table_pattern>.<column_pattern>'
+            if (
+                not self.config._allow_deny_patterns.allowed(
+                    f"{self.dataset_name}.{col}"
+                )
+                or not self.config.profile_nested_fields
+                and "." in col
+            ):
+                ignored_columns_by_pattern.append(col)
+            elif col_dict.get("type") is not None and self._should_ignore_column(
+                col_dict["type"]
+            ):
+                ignored_columns_by_type.append(col)
+            else:
+                columns_to_profile.append(col_dict)
+
+        if ignored_columns_by_pattern:
+            self.report.report_dropped(
+                f"The profile of columns by pattern {self.dataset_name}({', '.join(sorted(ignored_columns_by_pattern))})"
+            )
+        if ignored_columns_by_type:
+            self.report.report_dropped(
+                f"The profile of columns by type {self.dataset_name}({', '.join(sorted(ignored_columns_by_type))})"
+            )
+
+        max_fields = self.config.max_number_of_fields_to_profile
+        if max_fields is not None and len(columns_to_profile) > max_fields:
+            columns_being_dropped = [col["name"] for col in columns_to_profile][
+                max_fields:
+            ]
+            columns_to_profile = columns_to_profile[:max_fields]
+            if self.config.report_dropped_profiles:
+                self.report.report_dropped(
+                    f"The max_number_of_fields_to_profile={max_fields} reached. Profile of columns {self.dataset_name}({', '.join(sorted(columns_being_dropped))})"
+                )
+        return columns_to_profile
+
+    def _should_ignore_column(self, sqlalchemy_type: sa.types.TypeEngine) -> bool:
+        # We don't profiles columns with None types
+        sql_type = str(sqlalchemy_type)
+        if sql_type == "NULL":
+            return True
+
+        match = re.match(NORMALIZE_TYPE_PATTERN, sql_type)
+        if match:
+            sql_type = match.group(1)
+
+        return sql_type in get_column_types_to_ignore(self.dialect_name)
+
+    def _get_estimated_row_count(self) -> Optional[int]:
+        if self.dialect_name == POSTGRESQL:
+            schema_name = self.dataset_name.split(".")[1]
+            table_name = self.dataset_name.split(".")[2]
+            query = sa.text(
+                "SELECT c.reltuples AS estimate FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE c.relname = :table_name AND n.nspname = :schema_name"
+            )
+        elif self.dialect_name == MYSQL:
+            schema_name = self.dataset_name.split(".")[0]
+            table_name = self.dataset_name.split(".")[1]
+            query = sa.text(
+                "SELECT table_rows AS estimate FROM information_schema.tables "
+                "WHERE table_schema = :schema_name AND table_name = :table_name"
+            )
+        else:
+            logger.debug(
+                f"Dialect {self.dialect_name} not supported for feature "
+                f"profile_table_row_count_estimate_only. Proceeding with full row count."
+            )
+            return None
+        return int(
+            self.conn.execute(
+                query, {"schema_name": schema_name, "table_name": table_name}
+            ).scalar()
+        )
+
+    def _get_table_row_count(self) -> int:
+        return int(
+            self.conn.execute(
+                sa.select([sa.func.count()]).select_from(self.table)
+            ).scalar()
+        )
+
+    def _use_bigquery_sampling(
+        self, profile: DatasetProfileClass, table_row_count: int
+    ) -> None:
+        # Unlike the Great Expectations profiler, no temporary table is needed to
+        # query a sample; it is profiled as a subquery.
+        sample_pc = 100 * self.config.sample_size / table_row_count
+        self.source = (
+            sa.text(
+                f"SELECT * FROM {self.table} TABLESAMPLE SYSTEM ({sample_pc:.8f} percent)"
+            )
+            .columns()
+            .subquery("profiled")
+        )
+
+        if (
+            profile.partitionSpec is None
+            or profile.partitionSpec.type == PartitionTypeClass.FULL_TABLE
+        ):
+            profile.partitionSpec = PartitionSpecClass(
+                type=PartitionTypeClass.QUERY, partition="SAMPLE"
+            )
+        elif profile.partitionSpec.type == PartitionTypeClass.PARTITION:
+            profile.partitionSpec.partition += " SAMPLE"
+
+    def _init_profile(self) -> DatasetProfileClass:
+        profile = DatasetProfileClass(timestampMillis=get_sys_time())
+        if self.partition:
+            profile.partitionSpec = PartitionSpecClass(partition=self.partition)
+        elif self.config.limit:
+            profile.partitionSpec = PartitionSpecClass(
+                type=PartitionTypeClass.QUERY,
+                partition=json.dumps(
+                    dict(limit=self.config.limit, offset=self.config.offset)
+                ),
+            )
+        elif self.custom_sql:
+            profile.partitionSpec = PartitionSpecClass(
+                type=PartitionTypeClass.QUERY, partition="SAMPLE"
+            )
+        return profile
+
+    def generate_dataset_profile(self) -> DatasetProfileClass:
+        profile = self._init_profile()
+        profile.fieldProfiles = []
+
+        all_columns = sa.inspect(self.conn).get_columns(
+            self.table_name, schema=self.schema
+        )
+        profile.columnCount = len(all_columns)
+        columns_to_profile = self._get_columns_to_profile(all_columns)
+
+        (
+            ignore_table_sampling,
+            columns_list_to_ignore_sampling,
+        ) = get_columns_to_ignore_sampling(
+            self.dataset_name,
+            self.config.tags_to_ignore_sampling,
+            self.platform,
+            self.env,
+        )
+
+        full_row_count: Optional[int] = None
+        if self.config.profile_table_row_count_estimate_only:
+            full_row_count = self._get_estimated_row_count()
+        elif (self.config.limit or self.config.offset) and not self.custom_sql:
+            # The limit and offset must not be applied to the row count.
+            full_row_count = self._get_table_row_count()
+        elif (
+            self.dialect_name == BIGQUERY
+            and self.config.use_sampling
+            and not self.config.limit
+            and not self.custom_sql
+        ):
+            full_row_count = self._get_table_row_count()
+            if full_row_count > self.config.sample_size:
+                self._use_bigquery_sampling(profile, full_row_count)
+
+        specs: List[_ColumnSpec] = []
+        if columns_to_profile:
+            names_to_profile = {col["name"] for col in columns_to_profile}
+            types = {col["name"]: col.get("type") for col in columns_to_profile}
+            for col_dict in all_columns:
+                column = col_dict["name"]
+                column_profile = DatasetFieldProfileClass(fieldPath=column)
+                profile.fieldProfiles.append(column_profile)
+                if column in names_to_profile:
+                    specs.append(
+                        _ColumnSpec(
+                            name=column,
+                            kind=_get_column_kind(types[column], self.dialect_name),
+                            profile=column_profile,
+                            quoted_name=self._quote(column),
+                            sample=not ignore_table_sampling
+                            and column not in columns_list_to_ignore_sampling,
+                        )
+                    )
+
+        logger.debug(f"profiling {self.dataset_name}: running aggregate query")
+        results = self._execute_aggregates_by_column(
+            self._get_first_pass_metrics(specs),
+            title="Profiling: Unable to Calculate Column Statistics",
+        )
+
+        # Note that this row count may be different from the full_row_count if we
+        # are profiling a sample or a limited number of rows.
+        row_count = int(results[(None, "row_count")])
+        if full_row_count is None:
+            full_row_count = row_count
+        if profile.partitionSpec and "SAMPLE" in profile.partitionSpec.partition:
+            profile.partitionSpec.partition += f" (sample rows {row_count})"
+
+        for spec in specs:
+            self._apply_first_pass_results(spec, results, row_count)
+
+        if row_count:
+            sampled_specs = [spec for spec in specs if spec.sample]
+            logger.debug(f"profiling {self.dataset_name}: running follow-up queries")
+            self._get_medians(
+                [
+                    spec
+                    for spec in sampled_specs
+                    if spec.kind == _ColumnKind.NUMERIC
+                    and (spec.name, "median") not in results
+                ]
+            )
+            self._get_distributions(
+                [
+                    spec
+                    for spec in sampled_specs
+                    if spec.kind == _ColumnKind.NUMERIC
+                    and spec.cardinality in _NUMERIC_HIGH_CARDINALITIES
+                ]
+            )
+            for spec in sampled_specs:
+                if self._has_low_cardinality(spec):
+                    self._get_distinct_value_frequencies(spec)
+            self._get_sample_values(sampled_specs)
+
+        profile.rowCount = full_row_count
+        return profile
+
+    def _get_first_pass_metrics(
+        self, specs: List[_ColumnSpec]
+    ) -> Dict[_MetricKey, ColumnElement]:
+        config = self.config
+        metrics: Dict[_MetricKey, ColumnElement] = {
+            (None, "row_count"): sa.func.count()
+        }
+        for spec in specs:
+            column = spec.column
+            name = spec.name
+
+            # The cardinality of every column is needed to pick its other metrics.
+            metrics[(name, "nonnull_count")] = sa.func.count(column)
+            metrics[(name, "unique_count")] = _approx_count_distinct(
+                self.dialect_name, column, spec.quoted_name
+            )
+            if not spec.sample:
+                continue
+
+            if spec.kind in {_ColumnKind.NUMERIC, _ColumnKind.DATETIME}:
+                # The histogram is computed from the range of the column.
+                if config.include_field_min_value or (
+                    config.include_field_histogram and spec.kind == _ColumnKind.NUMERIC
+                ):
+                    metrics[(name, "min")] = sa.func.min(column)
+                if config.include_field_max_value or (
+                    config.include_field_histogram and spec.kind == _ColumnKind.NUMERIC
+                ):
+                    metrics[(name, "max")] = sa.func.max(column)
+
+            if spec.kind == _ColumnKind.NUMERIC:
+                if config.include_field_mean_value:
+                    metrics[(name, "mean")] = sa.func.avg(column)
+                if config.include_field_stddev_value:
+                    metrics[(name, "stdev")] = _stddev(self.dialect_name, column)
+                if (
+                    config.include_field_median_value
+                    and self.dialect_name not in _PERCENTILES_PER_COLUMN_DIALECTS
+                ):
+                    median = _percentile(
+                        self.dialect_name, column, spec.quoted_name, 0.5
+                    )
+                    if median is not None:
+                        metrics[(name, "median")] = median
+        return metrics
+
+    def _apply_first_pass_results(
+        self, spec: _ColumnSpec, results: Dict[_MetricKey, Any], row_count: int
+    ) -> None:
+        config = self.config
+        column_profile = spec.profile
+        name = spec.name
+        if (name, "nonnull_count") not in results:
+            # The column could not be profiled.
+            return
+
+        spec.nonnull_count = int(results[(name, "nonnull_count")])
+        spec.unique_count = int(results[(name, "unique_count")] or 0)
+        pct_unique = (
+            float(spec.unique_count) / spec.nonnull_count
+            if spec.nonnull_count > 0
+            else None
+        )
+        spec.cardinality = convert_to_cardinality(spec.unique_count, pct_unique)
+        spec.min = results.get((name, "min"))
+        spec.max = results.get((name, "max"))
+
+        null_count = max(0, row_count - spec.nonnull_count)
+        if config.include_field_null_count:
+            column_profile.nullCount = null_count
+            if row_count > 0:
+                column_profile.nullProportion = min(1, null_count / row_count)
+        if config.include_field_distinct_count:
+            column_profile.uniqueCount = spec.unique_count
+            if spec.nonnull_count > 0:
+                # Sometimes this value is bigger than 1 because of the approx queries
+                column_profile.uniqueProportion = min(
+                    1, spec.unique_count / spec.nonnull_count
+                )
+
+        if not row_count or not spec.sample:
+            return
+        if spec.kind in {_ColumnKind.NUMERIC, _ColumnKind.DATETIME}:
+            if config.include_field_min_value:
+                column_profile.min = str(spec.min)
+            if config.include_field_max_value:
+                column_profile.max = str(spec.max)
+        if spec.kind == _ColumnKind.NUMERIC:
+            if (name, "mean") in results:
+                column_profile.mean = str(results[(name, "mean")])
+            if (name, "stdev") in results:
+                stdev = results[(name, "stdev")]
+                column_profile.stdev = str(None if stdev is None else float(stdev))
+            if (name, "median") in results:
+                column_profile.median = str(results[(name, "median")])
+
+    def _has_low_cardinality(self, spec: _ColumnSpec) -> bool:
+        if spec.kind == _ColumnKind.NUMERIC:
+            return spec.cardinality in _NUMERIC_LOW_CARDINALITIES
+        return spec.cardinality in _LOW_CARDINALITIES
+
+    def _get_values_at_offsets(
+        self, spec: _ColumnSpec, offsets: List[int]
+    ) -> Dict[int, Any]:
+        # Used for percentiles on dialects without a percentile aggregate.
+        values: Dict[int, Any] = {}
+        for offset in sorted(set(offsets)):
+            values[offset] = self.conn.execute(
+                sa.select([spec.column])
+                .select_from(self.source)
+                .where(spec.column.isnot(None))
+                .order_by(spec.column)
+                .limit(1)
+                .offset(offset)
+            ).scalar()
+        return values
+
+    def _get_medians(self, specs: List[_ColumnSpec]) -> None:
+        if not self.config.include_field_median_value:
+            return
+        for spec in specs:
+            if not spec.nonnull_count:
+                continue
+            try:
+                median = _percentile(
+                    self.dialect_name, spec.column, spec.quoted_name, 0.5
+                )
+                if median is not None:
+                    value = self._execute_aggregates({(spec.name, "median"): median})[
+                        (spec.name, "median")
+                    ]
+                else:
+                    n = spec.nonnull_count
+                    offsets = [(n - 1) // 2, n // 2]
+                    values = self._get_values_at_offsets(spec, offsets)
+                    low, high = values[offsets[0]], values[offsets[1]]
+                    value = low if low == high else (low + high) / 2
+                spec.profile.median = str(value)
+            except Exception as e:
+                if not self.config.catch_exceptions:
+                    raise e
+                logger.debug(
+                    f"Caught exception while attempting to get column median for column {spec.name}. {e}"
+                )
+                self.report.report_warning(
+                    title="Profiling: Unable to Calculate Medians",
+                    message="The medians for the column will not be accessible",
+                    context=f"{self.dataset_name}.{spec.name}",
+                    exc=e,
+                )
+
+    def _get_histogram_bins(self, spec: _ColumnSpec) -> Optional[List[float]]:
+        if spec.min is None or spec.max is None:
+            return None
+        low, high = float(spec.min), float(spec.max)
+        if not (math.isfinite(low) and math.isfinite(high)) or low >= high:
+            return None
+        width = (high - low) / _HISTOGRAM_BINS
+        return [low + i * width for i in range(_HISTOGRAM_BINS)] + [high]
+
+    def _get_distributions(self, specs: List[_ColumnSpec]) -> None:
+        """Computes the quantiles and histograms of the high cardinality numeric columns."""
+
+        metrics: Dict[_MetricKey, ColumnElement] = {}
+        per_column_metrics: Dict[_MetricKey, ColumnElement] = {}
+        offset_specs: List[_ColumnSpec] = []
+        bins_by_column: Dict[str, List[float]] = {}
+        for spec in specs:
+            if self.config.include_field_quantiles:
+                for quantile in _QUANTILES:
+                    percentile = _percentile(
+                        self.dialect_name, spec.column, spec.quoted_name, quantile
+                    )
+                    if percentile is None:
+                        offset_specs.append(spec)
+                        break
+                    elif self.dialect_name in _PERCENTILES_PER_COLUMN_DIALECTS:
+                        per_column_metrics[(spec.name, f"q{quantile}")] = percentile
+                    else:
+                        metrics[(spec.name, f"q{quantile}")] = percentile
+
+            bins = (
+                self._get_histogram_bins(spec)
+                if self.config.include_field_histogram
+                else None
+            )
+            if bins is not None:
+                bins_by_column[spec.name] = bins
+                for i in range(_HISTOGRAM_BINS):
+                    low = sa.literal_column(repr(bins[i]))
+                    high = sa.literal_column(repr(bins[i + 1]))
+                    in_bin = sa.and_(
+                        spec.column >= low,
+                        spec.column <= high
+                        if i == _HISTOGRAM_BINS - 1
+                        else spec.column < high,
+                    )
+                    metrics[(spec.name, f"bin{i}")] = sa.func.sum(
+                        sa.case((in_bin, 1), else_=0)
+                    )
+
+        results = self._execute_aggregates_by_column(
+            metrics, title="Profiling: Unable to Calculate Quantiles and Histograms"
+        )
+        per_column_metrics_by_column = _group_by_column(per_column_metrics)
+        for spec in specs:
+            if spec.name in per_column_metrics_by_column:
+                results.update(
+                    self._execute_aggregates_by_column(
+                        per_column_metrics_by_column[spec.name],
+                        title="Profiling: Unable to Calculate Quantiles",
+                    )
+                )
+            elif spec in offset_specs and spec.nonnull_count:
+                n = spec.nonnull_count
+                offsets = [round(quantile * (n - 1)) for quantile in _QUANTILES]
+                try:
+                    values = self._get_values_at_offsets(spec, offsets)
+                except Exception as e:
+                    if not self.config.catch_exceptions:
+                        raise e
+                    self.report.report_warning(
+                        title="Profiling: Unable to Calculate Quantiles",
+                        message="The quantiles for the column will not be accessible",
+                        context=f"{self.dataset_name}.{spec.name}",
+                        exc=e,
+                    )
+                else:
+                    for quantile, offset in zip(_QUANTILES, offsets):
+                        results[(spec.name, f"q{quantile}")] = values[offset]
+
+            if all((spec.name, f"q{quantile}") in results for quantile in _QUANTILES):
+                spec.profile.quantiles = [
+                    QuantileClass(
+                        quantile=str(quantile),
+                        value=str(results[(spec.name, f"q{quantile}")]),
+                    )
+                    for quantile in _QUANTILES
+                ]
+
+            bins = bins_by_column.get(spec.name)
+            if (
+                bins is not None
+                and spec.nonnull_count
+                and (spec.name, "bin0") in results
+            ):
+                # Like the Great Expectations profiler, the heights start and end
+                # with the (empty) weights of the tails below and above the range.
+                spec.profile.histogram = HistogramClass(
+                    [str(edge) for edge in bins],
+                    [
+                        0.0,
+                        *(
+                            int(results[(spec.name, f"bin{i}")] or 0)
+                            / spec.nonnull_count
+                            for i in range(_HISTOGRAM_BINS)
+                        ),
+                        0.0,
+                    ],
+                )
+
+    def _get_distinct_value_frequencies(self, spec: _ColumnSpec) -> None:
+        if not self.config.include_field_distinct_value_frequencies:
+            return
+        try:
+            rows = self.conn.execute(
+                sa.select([spec.column, sa.func.count()])
+                .select_from(self.source)
+                .where(spec.column.isnot(None))
+                .group_by(spec.column)
+                .order_by(spec.column)
+            ).fetchall()
+        except Exception as e:
+            if not self.config.catch_exceptions:
+                raise e
+            self.report.report_warning(
+                title="Profiling: Unable to Calculate Distinct Value Frequencies",
+                message="The distinct value frequencies for the column will not be accessible",
+                context=f"{self.dataset_name}.{spec.name}",
+                exc=e,
+            )
+            return
+        spec.profile.distinctValueFrequencies = [
+            ValueFrequencyClass(value=str(value), frequency=int(count))
+            for value, count in rows
+        ]
+
+    def _get_sample_values(self, specs: List[_ColumnSpec]) -> None:
+        if not self.config.include_field_sample_values or not specs:
+            return
+        limit = self.config.field_sample_values_limit
+
+        # The first rows of the table usually have enough non-null values for every
+        # column. Columns with many nulls are then topped up with a query of their own.
+        samples: Dict[str, List[Any]] = {spec.name: [] for spec in specs}
+        try:
+            rows = self.conn.execute(
+                sa.select([spec.column for spec in specs])
+                .select_from(self.source)
+                .limit(limit)
+            ).fetchall()
+            for row in rows:
+                for spec, value in zip(specs, row):
+                    if value is not None:
+                        samples[spec.name].append(value)
+        except Exception as e:
+            logger.debug(
+                f"Caught exception while sampling rows of {self.dataset_name}, sampling column by column. {e}"
+            )
+
+        for spec in specs:
+            column_samples = samples[spec.name]
+            if len(column_samples) < limit and len(column_samples) < (
+                spec.nonnull_count or 0
+            ):
+                try:
+                    column_samples = [
+                        value
+                        for (value,) in self.conn.execute(
+                            sa.select([spec.column])
+                            .select_from(self.source)
+                            .where(spec.column.isnot(None))
+                            .limit(limit)
+                        )
+                    ]
+                except Exception as e:
+                    if not self.config.catch_exceptions:
+                        raise e
+                    self.report.report_warning(
+                        title="Profiling: Unable to Calculate Sample Values",
+                        message="The sample values for the column will not be accessible",
+                        context=f"{self.dataset_name}.{spec.name}",
+                        exc=e,
+                    )
+                    continue
+            spec.profile.sampleValues = [str(value) for value in column_samples]
+
+
+def _group_by_column(
+    metrics: Dict[_MetricKey, ColumnElement],
+) -> Dict[Optional[str], Dict[_MetricKey, ColumnElement]]:
+    grouped: Dict[Optional[str], Dict[_MetricKey, ColumnElement]] = (
+        collections.defaultdict(dict)
+    )
+    for key, metric in metrics.items():
+        grouped[key[0]][key] = metric
+    return grouped
+
+
+class DatahubSQLProfiler:
+    """Profiles tables with a few aggregate queries per table.
+
+    This is a drop-in replacement for DatahubGEProfiler, which is used when the
+    profiling engine is set to `sql`. It accepts the same profiling requests and
+    produces the same profiles, but doesn't depend on Great Expectations.
+    """
+
+    def __init__(
+        self,
+        conn: Union[Engine, Connection],
+        report: SQLSourceReport,
+        config: GEProfilingConfig,
+        platform: str,
+        env: str = "PROD",
+    ):
+        self.report = report
+        self.config = config
+        self.platform = platform
+        self.env = env
+        self.times_taken: List[float] = []
+        self.total_row_count = 0
+        self._stats_lock = threading.Lock()
+
+        # As in DatahubGEProfiler, we need an engine so that every worker thread
+        # gets a connection of its own.
+        self.base_engine: Engine = conn.engine
+
+    def generate_profiles(
+        self,
+        requests: List["GEProfilerRequest"],
+        max_workers: int,
+        platform: Optional[str] = None,
+        profiler_args: Optional[Dict] = None,
+    ) -> Iterable[Tuple["GEProfilerRequest", Optional[DatasetProfileClass]]]:
+        max_workers = min(max_workers, len(requests))
+        logger.info(
+            f"Will profile {len(requests)} table(s) with {max_workers} worker(s) - this may take a while"
+        )
+
+        with PerfTimer() as timer, concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(max_workers, 1)
+        ) as async_executor:
+            async_profiles = collections.deque(
+                async_executor.submit(self._generate_profile_from_request, request)
+                for request in requests
+            )
+
+            # Avoid using as_completed so that the results are yielded in the
+            # same order as the requests.
+            while len(async_profiles) > 0:
+                async_profile = async_profiles.popleft()
+                yield async_profile.result()
+
+        total_time_taken = timer.elapsed_seconds()
+        logger.info(
+            f"Profiling {len(requests)} table(s) finished in {total_time_taken:.3f} seconds"
+        )
+
+        telemetry.telemetry_instance.ping(
+            "sql_profiling_summary",
+            {
+                "total_time_taken": stats.discretize(total_time_taken),
+                "count": stats.discretize(len(self.times_taken)),
+                "total_row_count": stats.discretize(self.total_row_count),
+                "platform": self.platform,
+                "engine": ProfilingEngine.SQL.value,
+            },
+        )
+
+    def _generate_profile_from_request(
+        self, request: "GEProfilerRequest"
+    ) -> Tuple["GEProfilerRequest", Optional[DatasetProfileClass]]:
+        return request, self._generate_single_profile(
+            pretty_name=request.pretty_name, **request.batch_kwargs
+        )
+
+    def _generate_single_profile(
+        self,
+        pretty_name: str,
+        schema: Optional[str] = None,
+        table: Optional[str] = None,
+        partition: Optional[str] = None,
+        custom_sql: Optional[str] = None,
+        use_quoted_name: bool = False,
+        **kwargs: Any,
+    ) -> Optional[DatasetProfileClass]:
+        logger.debug(
+            f"Received single profile request for {pretty_name} for {schema}, {table}, {custom_sql}"
+        )
+        assert table is not None
+
+        with self.base_engine.connect() as conn, PerfTimer() as timer:
+            try:
+                logger.info(f"Profiling {pretty_name}")
+                profile = _SingleTableProfiler(
+                    conn,
+                    pretty_name,
+                    schema=schema,
+                    table=table,
+                    partition=partition,
+                    custom_sql=custom_sql,
+                    use_quoted_name=use_quoted_name,
+                    config=self.config,
+                    report=self.report,
+                    platform=self.platform,
+                    env=self.env,
+                ).generate_dataset_profile()
+
+                time_taken = timer.elapsed_seconds()
+                logger.info(
+                    f"Finished profiling {pretty_name}; took {time_taken:.3f} seconds"
+                )
+                with self._stats_lock:
+                    self.times_taken.append(time_taken)
+                    if profile.rowCount is not None:
+                        self.total_row_count += profile.rowCount
+
+                return profile
+            except Exception as e:
+                if not self.config.catch_exceptions:
+                    raise e
+
+                error_message = str(e).lower()
+                if "permission denied" in error_message:
+                    self.report.warning(
+                        title="Unauthorized to extract data profile statistics",
+                        message="We were denied access while attempting to generate profiling statistics for some assets. Please ensure the provided user has permission to query these tables and views.",
+                        context=f"Asset: {pretty_name}",
+                        exc=e,
+                    )
+                else:
+                    self.report.warning(
+                        title="Failed to extract statistics for some assets",
+                        message="Caught unexpected exception while attempting to extract profiling statistics for some assets.",
+                        context=f"Asset: {pretty_name}",
+                        exc=e,
+                    )
+                return None
+
+
+def create_profiler(
+    conn: Union[Engine, Connection],
+    report: SQLSourceReport,
+    config: GEProfilingConfig,
+    platform: str,
+    env: str = "PROD",
+) -> Union["DatahubGEProfiler", DatahubSQLProfiler]:
+    """Creates the profiler for the engine that is selected in the profiling config."""
+
+    if config.engine == ProfilingEngine.SQL:
+        return DatahubSQLProfiler(
+            conn=conn, report=report, config=config, platform=platform, env=env
+        )
+
+    from datahub.ingestion.source.ge_data_profiler import DatahubGEProfiler
+
+    return DatahubGEProfiler(
+        conn=conn, report=report, config=config, platform=platform, env=env
+    )
@@ -5,9 +5,10 @@ import functools
 import json
 import logging
 import pickle
+import zlib
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Callable, Generic, Optional, Type, TypeVar
+from typing import Any, Callable, Dict, Generic, List, Optional, Type, TypeVar
 
 import pydantic
 
@@ -22,6 +23,118 @@ logger: logging.Logger = logging.getLogger(__name__)
 
 DEFAULT_MAX_STATE_SIZE = 2**22  # 4MB
 
+_FRONT_CODED_KEY = "__front_coded__"
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ValueError(
+            "The zstd checkpoint serdes require the zstandard package. Install it with `pip install zstandard`."
+        ) from e
+    return zstandard.ZstdCompressor(level=3).compress(data)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ValueError(
+            "The zstd checkpoint serdes require the zstandard package. Install it with `pip install zstandard`."
+        ) from e
+    return zstandard.ZstdDecompressor().decompress(data)
+
+
+@dataclass(frozen=True)
+class _Base85JsonSerde:
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+    # If set, top-level lists of strings are front-coded before compression.
+    front_coded: bool = False
+
+
+# These are much faster to encode and decode than base85-bz2-json, at the cost of a
+# somewhat larger payload. Front-coding stores each string of a list as the length of
+# the prefix that it shares with the previous string, plus the rest of the string.
+# Since urns mostly share long prefixes, this shrinks the input to the compressor.
+_BASE85_JSON_SERDES: Dict[str, _Base85JsonSerde] = {
+    "base85-zlib-json": _Base85JsonSerde(
+        compress=functools.partial(zlib.compress, level=6),
+        decompress=zlib.decompress,
+    ),
+    "base85-zlib-fc-json": _Base85JsonSerde(
+        compress=functools.partial(zlib.compress, level=6),
+        decompress=zlib.decompress,
+        front_coded=True,
+    ),
+    "base85-zstd-json": _Base85JsonSerde(
+        compress=_zstd_compress, decompress=_zstd_decompress
+    ),
+    "base85-zstd-fc-json": _Base85JsonSerde(
+        compress=_zstd_compress, decompress=_zstd_decompress, front_coded=True
+    ),
+}
+
+SUPPORTED_CHECKPOINT_SERDES = ["utf-8", "base85-bz2-json", *_BASE85_JSON_SERDES]
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    # Binary search with slice comparisons, which is much faster than comparing
+    # the strings one character at a time in Python.
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[:mid] == b[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _front_code(values: List[str]) -> Dict[str, List[Any]]:
+    encoded: List[Any] = []
+    previous = ""
+    for value in values:
+        prefix_length = _common_prefix_length(previous, value)
+        encoded.append(prefix_length)
+        encoded.append(value[prefix_length:])
+        previous = value
+    return {_FRONT_CODED_KEY: encoded}
+
+
+def _front_decode(encoded: List[Any]) -> List[str]:
+    values: List[str] = []
+    previous = ""
+    for i in range(0, len(encoded), 2):
+        previous = previous[: encoded[i]] + encoded[i + 1]
+        values.append(previous)
+    return values
+
+
+def _front_code_string_lists(state_as_dict: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: (
+            _front_code(value)
+            if isinstance(value, list)
+            and value
+            and all(isinstance(item, str) for item in value)
+            else value
+        )
+        for key, value in state_as_dict.items()
+    }
+
+
+def _front_decode_string_lists(state_as_dict: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: (
+            _front_decode(value[_FRONT_CODED_KEY])
+            if isinstance(value, dict) and _FRONT_CODED_KEY in value
+            else value
+        )
+        for key, value in state_as_dict.items()
+    }
+
 
 class CheckpointStateBase(ConfigModel):
     """
@@ -58,6 +171,21 @@ class CheckpointStateBase(ConfigModel):
             )
         elif self.serde == "base85-bz2-json":
             encoded_bytes = CheckpointStateBase._to_bytes_base85_json(self, compressor)
+        elif self.serde in _BASE85_JSON_SERDES:
+            serde = _BASE85_JSON_SERDES[self.serde]
+            if serde.front_coded:
+                state_as_dict = _front_code_string_lists(
+                    json.loads(CheckpointStateBase._to_bytes_utf8(self))
+                )
+                encoded_bytes = base64.b85encode(
+                    serde.compress(
+                        json.dumps(state_as_dict, separators=(",", ":")).encode("utf-8")
+                    )
+                )
+            else:
+                encoded_bytes = CheckpointStateBase._to_bytes_base85_json(
+                    self, serde.compress
+                )
         else:
             raise ValueError(f"Unknown serde: {self.serde}")
 
@@ -128,6 +256,14 @@ class Checkpoint(Generic[StateType]):
                         functools.partial(bz2.decompress),
                         state_class,
                     )
+                elif checkpoint_aspect.state.serde in _BASE85_JSON_SERDES:
+                    serde = _BASE85_JSON_SERDES[checkpoint_aspect.state.serde]
+                    state_obj = Checkpoint._from_base85_json_bytes(
+                        checkpoint_aspect,
+                        serde.decompress,
+                        state_class,
+                        front_coded=serde.front_coded,
+                    )
                 else:
                     raise ValueError(f"Unknown serde: {checkpoint_aspect.state.serde}")
             except Exception as e:
@@ -191,6 +327,7 @@ class Checkpoint(Generic[StateType]):
         checkpoint_aspect: DatahubIngestionCheckpointClass,
         decompressor: Callable[[bytes], bytes],
         state_class: Type[StateType],
+        front_coded: bool = False,
     ) -> StateType:
         state_uncompressed = decompressor(
             base64.b85decode(checkpoint_aspect.state.payload)
@@ -198,6 +335,8 @@ class Checkpoint(Generic[StateType]):
             else b"{}"
         )
         state_as_dict = json.loads(state_uncompressed.decode("utf-8"))
+        if front_coded:
+            state_as_dict = _front_decode_string_lists(state_as_dict)
         state_as_dict["version"] = checkpoint_aspect.state.formatVersion
         state_as_dict["serde"] = checkpoint_aspect.state.serde
         return state_class.parse_obj(state_as_dict)
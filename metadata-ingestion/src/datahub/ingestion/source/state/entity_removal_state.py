@@ -5,7 +5,7 @@ import pydantic
 from datahub.emitter.mce_builder import make_assertion_urn, make_container_urn
 from datahub.ingestion.source.state.checkpoint import CheckpointStateBase
 from datahub.utilities.checkpoint_state_util import CheckpointStateUtil
-from datahub.utilities.dedup_list import deduplicate_list
+from datahub.utilities.urn_set import UrnSet
 from datahub.utilities.urns.urn import guess_entity_type
 
 STATEFUL_INGESTION_IGNORED_ENTITY_TYPES = {
@@ -66,7 +66,9 @@ class GenericCheckpointState(CheckpointStateBase):
     # However, we still want `urns` to be a list so that it maintains its order.
     # We can't used OrderedSet here because pydantic doesn't recognize it and
     # it isn't JSON serializable.
-    _urns_set: set = pydantic.PrivateAttr(default_factory=set)
+    # The UrnSet interns the urns, so it shares the strings with the list, and
+    # moves to disk for very large states.
+    _urns_set: UrnSet = pydantic.PrivateAttr(default_factory=UrnSet)
 
     _migration = pydantic_state_migrator(
         {
@@ -85,8 +87,11 @@ class GenericCheckpointState(CheckpointStateBase):
 
     def __init__(self, **data: Any):  # type: ignore
         super().__init__(**data)
-        self.urns = deduplicate_list(self.urns)
-        self._urns_set = set(self.urns)
+        urns = self.urns
+        self.urns = []
+        self._urns_set = UrnSet()
+        for urn in urns:
+            self.add_checkpoint_urn(type="*", urn=urn)
 
     def add_checkpoint_urn(self, type: str, urn: str) -> None:
         """
@@ -98,8 +103,8 @@ class GenericCheckpointState(CheckpointStateBase):
 
         # TODO: Deprecate the `type` parameter and remove it.
         if urn not in self._urns_set:
-            self.urns.append(urn)
             self._urns_set.add(urn)
+            self.urns.append(urn)
 
     def get_urns_not_in(
         self, type: str, other_checkpoint_state: "GenericCheckpointState"
@@ -112,7 +117,7 @@ class GenericCheckpointState(CheckpointStateBase):
         :return: an iterable to the set of urns present in this checkpoint state but not in the other_checkpoint.
         """
 
-        diff = set(self.urns) - set(other_checkpoint_state.urns)
+        diff = self._urns_set.difference(other_checkpoint_state._urns_set)
 
         # To maintain backwards compatibility, we provide this filtering mechanism.
         # TODO: Deprecate the `type` parameter and remove it.
@@ -133,11 +138,14 @@ class GenericCheckpointState(CheckpointStateBase):
         :return: (1-|intersection(self, old_checkpoint_state)| / |old_checkpoint_state|) * 100.0
         """
 
+        # The old urns are already deduplicated, so we can count them without
+        # building sets of both states.
         old_urns_filtered = filter_ignored_entity_types(old_checkpoint_state.urns)
+        if not old_urns_filtered:
+            return 0.0
 
-        return compute_percent_entities_changed(
-            new_entities=self.urns, old_entities=old_urns_filtered
-        )
+        overlap_count = self._urns_set.count_contained(old_urns_filtered)
+        return (1 - overlap_count / len(old_urns_filtered)) * 100.0
 
     def urn_count(self) -> int:
         return len(self.urns)
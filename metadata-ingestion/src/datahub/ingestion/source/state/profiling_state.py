@@ -1,8 +1,166 @@
-from typing import Dict
+from typing import Dict, Optional
 
 import pydantic
 
+from datahub.configuration.common import ConfigModel
 from datahub.ingestion.source.state.checkpoint import CheckpointStateBase
+from datahub.metadata.schema_classes import DatasetProfileClass
+
+
+def _parse_number(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _merge_min_max(a: Optional[str], b: Optional[str], pick_max: bool) -> Optional[str]:
+    if a is None or b is None:
+        return a if b is None else b
+
+    # Numbers are compared by value, anything else (e.g. ISO dates) as strings.
+    a_number, b_number = _parse_number(a), _parse_number(b)
+    if a_number is not None and b_number is not None:
+        a_wins = a_number >= b_number if pick_max else a_number <= b_number
+    else:
+        a_wins = a >= b if pick_max else a <= b
+    return a if a_wins else b
+
+
+class ProfiledFieldStats(ConfigModel):
+    """The column statistics of a profile that can be merged across partitions."""
+
+    null_count: Optional[int] = None
+    min: Optional[str] = None
+    max: Optional[str] = None
+    mean: Optional[str] = None
+
+
+class ProfiledPartitionStats(ConfigModel):
+    """The mergeable statistics of one or more partitions of a table."""
+
+    row_count: int
+    fields: Dict[str, ProfiledFieldStats] = pydantic.Field(default_factory=dict)
+
+    @classmethod
+    def from_profile(
+        cls, profile: DatasetProfileClass
+    ) -> Optional["ProfiledPartitionStats"]:
+        if profile.rowCount is None:
+            return None
+        return cls(
+            row_count=profile.rowCount,
+            fields={
+                field.fieldPath: ProfiledFieldStats(
+                    null_count=field.nullCount,
+                    min=field.min,
+                    max=field.max,
+                    mean=field.mean,
+                )
+                for field in profile.fieldProfiles or []
+            },
+        )
+
+    def merge(self, other: "ProfiledPartitionStats") -> "ProfiledPartitionStats":
+        """Returns the statistics of the union of both sets of partitions.
+
+        Columns that are missing from either side, e.g. because they were added to the
+        table later on, keep the statistics of the side that has them, except for the
+        null count, which becomes unknown.
+        """
+
+        fields: Dict[str, ProfiledFieldStats] = {}
+        for field_path in {**self.fields, **other.fields}:
+            a = self.fields.get(field_path)
+            b = other.fields.get(field_path)
+            if a is None or b is None:
+                stats = a or b
+                assert stats is not None
+                fields[field_path] = ProfiledFieldStats(
+                    min=stats.min, max=stats.max, mean=stats.mean
+                )
+                continue
+
+            null_count: Optional[int] = None
+            mean: Optional[str] = None
+            if a.null_count is not None and b.null_count is not None:
+                null_count = a.null_count + b.null_count
+
+                # The mean of the union is the mean of both, weighted by the number of
+                # non-null values that each was computed over.
+                a_mean, b_mean = _parse_number(a.mean), _parse_number(b.mean)
+                a_weight = self.row_count - a.null_count
+                b_weight = other.row_count - b.null_count
+                if a_weight == 0 or b_weight == 0:
+                    mean = a.mean if b_weight == 0 else b.mean
+                elif a_mean is not None and b_mean is not None:
+                    mean = str(
+                        (a_mean * a_weight + b_mean * b_weight) / (a_weight + b_weight)
+                    )
+
+            fields[field_path] = ProfiledFieldStats(
+                null_count=null_count,
+                min=_merge_min_max(a.min, b.min, pick_max=False),
+                max=_merge_min_max(a.max, b.max, pick_max=True),
+                mean=mean,
+            )
+
+        return ProfiledPartitionStats(
+            row_count=self.row_count + other.row_count, fields=fields
+        )
+
+    def apply_to(self, profile: DatasetProfileClass) -> None:
+        """Replaces the column statistics of the profile with these statistics.
+
+        Statistics that can't be derived from the statistics of the individual
+        partitions, like distinct counts, medians or histograms, are removed.
+        """
+
+        for field in profile.fieldProfiles or []:
+            stats = self.fields.get(field.fieldPath, ProfiledFieldStats())
+            field.nullCount = stats.null_count
+            field.nullProportion = (
+                stats.null_count / self.row_count
+                if stats.null_count is not None and self.row_count > 0
+                else None
+            )
+            field.min = stats.min
+            field.max = stats.max
+            field.mean = stats.mean
+            field.uniqueCount = None
+            field.uniqueProportion = None
+            field.median = None
+            field.stdev = None
+            field.quantiles = None
+            field.histogram = None
+            field.distinctValueFrequencies = None
+
+
+class ProfiledTableState(ConfigModel):
+    """What a table looked like when it was last profiled."""
+
+    rows_count: Optional[int] = None
+    # Last modification time, in millis.
+    last_altered: Optional[int] = None
+    # The partition that was profiled, for partitioned tables.
+    partition: Optional[str] = None
+
+    # For partitioned tables, the statistics of the profiled partition, and those of
+    # all the partitions that were profiled in earlier runs.
+    partition_stats: Optional[ProfiledPartitionStats] = None
+    previous_partitions_stats: Optional[ProfiledPartitionStats] = None
+
+    def is_unchanged_since(self, previous: "ProfiledTableState") -> bool:
+        if self.rows_count is None and self.last_altered is None:
+            # Without any of these, we can't tell whether the table has changed.
+            return False
+        return (self.rows_count, self.last_altered, self.partition) == (
+            previous.rows_count,
+            previous.last_altered,
+            previous.partition,
+        )
 
 
 class ProfilingCheckpointState(CheckpointStateBase):
@@ -14,3 +172,6 @@ class ProfilingCheckpointState(CheckpointStateBase):
 
     # Last profiled stores urn, last_profiled timestamp millis in a dict
     last_profiled: Dict[str, pydantic.PositiveInt]
+
+    # Only populated with incremental profiling.
+    table_states: Dict[str, ProfiledTableState] = pydantic.Field(default_factory=dict)
@@ -6,7 +6,10 @@ import pydantic
 
 from datahub.ingestion.api.ingestion_job_checkpointing_provider_base import JobId
 from datahub.ingestion.source.state.checkpoint import Checkpoint
-from datahub.ingestion.source.state.profiling_state import ProfilingCheckpointState
+from datahub.ingestion.source.state.profiling_state import (
+    ProfiledTableState,
+    ProfilingCheckpointState,
+)
 from datahub.ingestion.source.state.stateful_ingestion_base import (
     StatefulIngestionConfig,
     StatefulIngestionConfigBase,
@@ -124,3 +127,15 @@ class ProfilingHandler(StatefulIngestionUsecaseHandlerBase[ProfilingCheckpointSt
             return state.last_profiled.get(urn)
 
         return None
+
+    def add_table_state(self, urn: str, table_state: ProfiledTableState) -> None:
+        cur_state = self.get_current_state()
+        if cur_state:
+            cur_state.table_states[urn] = table_state
+
+    def get_last_table_state(self, urn: str) -> Optional[ProfiledTableState]:
+        state = self.get_last_state()
+        if state:
+            return state.table_states.get(urn)
+
+        return None
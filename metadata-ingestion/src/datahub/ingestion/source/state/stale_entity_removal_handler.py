@@ -1,7 +1,7 @@
 import logging
 from dataclasses import dataclass, field
 from functools import partial
-from typing import Dict, Iterable, Optional, Set, Type, cast
+from typing import Dict, Iterable, Optional, Type, cast
 
 import pydantic
 
@@ -26,6 +26,7 @@ from datahub.ingestion.source.state.use_case_handler import (
 )
 from datahub.metadata.schema_classes import StatusClass
 from datahub.utilities.lossy_collections import LossyList
+from datahub.utilities.urn_set import UrnSet
 from datahub.utilities.urns.urn import guess_entity_type
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -119,7 +120,7 @@ class StaleEntityRemovalHandler(
             and self.stateful_ingestion_config.remove_stale_metadata
         )
         self._job_id = self._init_job_id()
-        self._urns_to_skip: Set[str] = set()
+        self._urns_to_skip = UrnSet()
         self.state_provider.register_stateful_ingestion_usecase_handler(self)
 
     @classmethod
@@ -21,7 +21,11 @@ from datahub.ingestion.api.ingestion_job_checkpointing_provider_base import (
     JobId,
 )
 from datahub.ingestion.api.source import Source, SourceCapability, SourceReport
-from datahub.ingestion.source.state.checkpoint import Checkpoint, StateType
+from datahub.ingestion.source.state.checkpoint import (
+    SUPPORTED_CHECKPOINT_SERDES,
+    Checkpoint,
+    StateType,
+)
 from datahub.ingestion.source.state.use_case_handler import (
     StatefulIngestionUsecaseHandlerBase,
 )
@@ -75,6 +79,23 @@ class StatefulIngestionConfig(ConfigModel):
         description="If set to True, ignores the current checkpoint state.",
         hidden_from_docs=True,
     )
+    checkpoint_serde: Optional[str] = Field(
+        default=None,
+        description="The encoding used to commit the checkpoint state. "
+        f"One of {SUPPORTED_CHECKPOINT_SERDES}. The zlib and zstd encodings are much "
+        "faster than the default base85-bz2-json for large states, and the -fc variants "
+        "additionally front-code the urns. The zstd encodings require the zstandard package. "
+        "Default: the encoding of each state, which is base85-bz2-json for new states.",
+        hidden_from_docs=True,
+    )
+
+    @pydantic.validator("checkpoint_serde")
+    def validate_checkpoint_serde(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None and v not in SUPPORTED_CHECKPOINT_SERDES:
+            raise ValueError(
+                f"Unsupported checkpoint_serde {v}. Must be one of {SUPPORTED_CHECKPOINT_SERDES}"
+            )
+        return v
 
     @pydantic.root_validator(skip_on_failure=True)
     def validate_config(cls, values: Dict[str, Any]) -> Dict[str, Any]:
@@ -407,6 +428,10 @@ class StateProviderWrapper:
             if job_checkpoint is None:
                 continue
             job_checkpoint.prepare_for_commit()
+            if self.stateful_ingestion_config.checkpoint_serde:
+                job_checkpoint.state.serde = (
+                    self.stateful_ingestion_config.checkpoint_serde
+                )
             try:
                 checkpoint_aspect = job_checkpoint.to_checkpoint_aspect(
                     self.stateful_ingestion_config.max_checkpoint_state_size
@@ -1,4 +1,4 @@
-from typing import List, Optional, cast
+from typing import List, Optional, Type, cast
 
 from datahub.configuration.common import (
     TransformerSemantics,
@@ -10,7 +10,7 @@ from datahub.ingestion.graph.client import DataHubGraph
 from datahub.ingestion.transformer.dataset_transformer import (
     DatasetBrowsePathsTransformer,
 )
-from datahub.metadata.schema_classes import BrowsePathsClass
+from datahub.metadata.schema_classes import BrowsePathsClass, _Aspect
 
 
 class AddDatasetBrowsePathConfig(TransformerSemanticsConfigModel):
@@ -35,6 +35,11 @@ class AddDatasetBrowsePathTransformer(DatasetBrowsePathsTransformer):
         config = AddDatasetBrowsePathConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def server_aspects(self) -> List[Type[_Aspect]]:
+        if self.config.semantics == TransformerSemantics.PATCH:
+            return [BrowsePathsClass]
+        return []
+
     @staticmethod
     def _merge_with_server_browse_paths(
         graph: DataHubGraph, urn: str, mce_browse_paths: Optional[BrowsePathsClass]
@@ -85,7 +90,7 @@ class AddDatasetBrowsePathTransformer(DatasetBrowsePathsTransformer):
             return cast(
                 Optional[Aspect],
                 AddDatasetBrowsePathTransformer._merge_with_server_browse_paths(
-                    self.ctx.graph, entity_urn, browse_paths
+                    self._server_graph(self.ctx.graph), entity_urn, browse_paths
                 ),
             )
         else:
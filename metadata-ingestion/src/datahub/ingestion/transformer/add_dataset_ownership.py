@@ -1,5 +1,5 @@
 import logging
-from typing import Callable, Dict, List, Optional, Union, cast
+from typing import Callable, Dict, List, Optional, Type, Union, cast
 
 import datahub.emitter.mce_builder as builder
 from datahub.configuration.common import (
@@ -20,6 +20,7 @@ from datahub.metadata.schema_classes import (
     OwnerClass,
     OwnershipClass,
     OwnershipTypeClass,
+    _Aspect,
 )
 from datahub.specific.dashboard import DashboardPatchBuilder
 
@@ -58,6 +59,11 @@ class AddDatasetOwnership(OwnershipTransformer):
         config = AddDatasetOwnershipConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def server_aspects(self) -> List[Type[_Aspect]]:
+        if self.config.semantics == TransformerSemantics.PATCH:
+            return [OwnershipClass]
+        return []
+
     @staticmethod
     def _merge_with_server_ownership(
         graph: DataHubGraph, urn: str, mce_ownership: Optional[OwnershipClass]
@@ -149,7 +155,9 @@ class AddDatasetOwnership(OwnershipTransformer):
             return cast(
                 Optional[Aspect],
                 self._merge_with_server_ownership(
-                    self.ctx.graph, entity_urn, out_ownership_aspect
+                    self._server_graph(self.ctx.graph),
+                    entity_urn,
+                    out_ownership_aspect,
                 ),
             )
         else:
@@ -1,6 +1,6 @@
 import copy
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Type, cast
+from typing import Any, Dict, List, Optional, Type, cast
 
 from datahub.configuration.common import (
     TransformerSemantics,
@@ -13,7 +13,7 @@ from datahub.ingestion.graph.client import DataHubGraph
 from datahub.ingestion.transformer.dataset_transformer import (
     DatasetPropertiesTransformer,
 )
-from datahub.metadata.schema_classes import DatasetPropertiesClass
+from datahub.metadata.schema_classes import DatasetPropertiesClass, _Aspect
 
 
 class AddDatasetPropertiesResolverBase(ABC):
@@ -53,6 +53,11 @@ class AddDatasetProperties(DatasetPropertiesTransformer):
         config = AddDatasetPropertiesConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def server_aspects(self) -> List[Type[_Aspect]]:
+        if self.config.semantics == TransformerSemantics.PATCH:
+            return [DatasetPropertiesClass]
+        return []
+
     @staticmethod
     def _merge_with_server_properties(
         graph: DataHubGraph,
@@ -108,7 +113,9 @@ class AddDatasetProperties(DatasetPropertiesTransformer):
             assert self.ctx.graph
             patch_dataset_properties_aspect = (
                 AddDatasetProperties._merge_with_server_properties(
-                    self.ctx.graph, entity_urn, out_dataset_properties_aspect
+                    self._server_graph(self.ctx.graph),
+                    entity_urn,
+                    out_dataset_properties_aspect,
                 )
             )
             return cast(Optional[Aspect], patch_dataset_properties_aspect)
@@ -1,4 +1,4 @@
-from typing import Callable, List, Optional, cast
+from typing import Callable, List, Optional, Type, cast
 
 import datahub.emitter.mce_builder as builder
 from datahub.configuration.common import (
@@ -16,6 +16,7 @@ from datahub.metadata.schema_classes import (
     SchemaFieldClass,
     SchemaMetadataClass,
     TagAssociationClass,
+    _Aspect,
 )
 
 
@@ -41,6 +42,11 @@ class AddDatasetSchemaTags(DatasetSchemaMetadataTransformer):
         config = AddDatasetSchemaTagsConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def server_aspects(self) -> List[Type[_Aspect]]:
+        if self.config.semantics == TransformerSemantics.PATCH:
+            return [SchemaMetadataClass]
+        return []
+
     def extend_field(
         self, schema_field: SchemaFieldClass, server_field: Optional[SchemaFieldClass]
     ) -> SchemaFieldClass:
@@ -90,7 +96,9 @@ class AddDatasetSchemaTags(DatasetSchemaMetadataTransformer):
         if self.config.semantics == TransformerSemantics.PATCH:
             assert self.ctx.graph
             server_schema_metadata_aspect: Optional[SchemaMetadataClass] = (
-                self.ctx.graph.get_schema_metadata(entity_urn=entity_urn)
+                self._server_graph(self.ctx.graph).get_schema_metadata(
+                    entity_urn=entity_urn
+                )
             )
             if server_schema_metadata_aspect is not None:
                 if not schema_metadata_aspect:
@@ -1,4 +1,4 @@
-from typing import Callable, Dict, List, Optional, cast
+from typing import Callable, Dict, List, Optional, Type, cast
 
 import datahub.emitter.mce_builder as builder
 from datahub.configuration.common import (
@@ -17,6 +17,7 @@ from datahub.metadata.schema_classes import (
     GlossaryTermsClass,
     SchemaFieldClass,
     SchemaMetadataClass,
+    _Aspect,
 )
 
 
@@ -42,6 +43,11 @@ class AddDatasetSchemaTerms(DatasetSchemaMetadataTransformer):
         config = AddDatasetSchemaTermsConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def server_aspects(self) -> List[Type[_Aspect]]:
+        if self.config.semantics == TransformerSemantics.PATCH:
+            return [SchemaMetadataClass]
+        return []
+
     def extend_field(
         self, schema_field: SchemaFieldClass, server_field: Optional[SchemaFieldClass]
     ) -> SchemaFieldClass:
@@ -109,7 +115,9 @@ class AddDatasetSchemaTerms(DatasetSchemaMetadataTransformer):
         if self.config.semantics == TransformerSemantics.PATCH:
             assert self.ctx.graph
             server_schema_metadata_aspect: Optional[SchemaMetadataClass] = (
-                self.ctx.graph.get_schema_metadata(entity_urn=entity_urn)
+                self._server_graph(self.ctx.graph).get_schema_metadata(
+                    entity_urn=entity_urn
+                )
             )
             if server_schema_metadata_aspect is not None:
                 if not schema_metadata_aspect:
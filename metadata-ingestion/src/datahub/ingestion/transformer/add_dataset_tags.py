@@ -1,8 +1,9 @@
 import logging
-from typing import Callable, Dict, List, Optional, Union, cast
+from typing import Callable, Dict, List, Optional, Type, Union, cast
 
 from datahub.configuration.common import (
     KeyValuePattern,
+    TransformerSemantics,
     TransformerSemanticsConfigModel,
 )
 from datahub.configuration.import_resolver import pydantic_resolve_key
@@ -14,6 +15,7 @@ from datahub.metadata.schema_classes import (
     GlobalTagsClass,
     MetadataChangeProposalClass,
     TagAssociationClass,
+    _Aspect,
 )
 from datahub.utilities.urns.tag_urn import TagUrn
 
@@ -44,6 +46,11 @@ class AddDatasetTags(DatasetTagsTransformer):
         config = AddDatasetTagsConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def server_aspects(self) -> List[Type[_Aspect]]:
+        if self.config.semantics == TransformerSemantics.PATCH:
+            return [GlobalTagsClass]
+        return []
+
     def transform_aspect(
         self, entity_urn: str, aspect_name: str, aspect: Optional[Aspect]
     ) -> Optional[Aspect]:
@@ -61,7 +68,10 @@ class AddDatasetTags(DatasetTagsTransformer):
                 self.processed_tags.setdefault(tag.tag, tag)
 
         return self.get_result_semantics(
-            self.config, self.ctx.graph, entity_urn, out_global_tags_aspect
+            self.config,
+            self._server_graph(self.ctx.graph) if self.ctx.graph else None,
+            entity_urn,
+            out_global_tags_aspect,
         )
 
     def handle_end_of_stream(
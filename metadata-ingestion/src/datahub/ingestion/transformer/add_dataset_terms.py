@@ -1,5 +1,5 @@
 import logging
-from typing import Callable, List, Optional, cast
+from typing import Callable, List, Optional, Type, cast
 
 import datahub.emitter.mce_builder as builder
 from datahub.configuration.common import (
@@ -16,6 +16,7 @@ from datahub.metadata.schema_classes import (
     AuditStampClass,
     GlossaryTermAssociationClass,
     GlossaryTermsClass,
+    _Aspect,
 )
 
 
@@ -42,6 +43,11 @@ class AddDatasetTerms(DatasetTermsTransformer):
         config = AddDatasetTermsConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def server_aspects(self) -> List[Type[_Aspect]]:
+        if self.config.semantics == TransformerSemantics.PATCH:
+            return [GlossaryTermsClass]
+        return []
+
     @staticmethod
     def _merge_with_server_glossary_terms(
         graph: DataHubGraph,
@@ -94,7 +100,7 @@ class AddDatasetTerms(DatasetTermsTransformer):
         if self.config.semantics == TransformerSemantics.PATCH:
             assert self.ctx.graph
             patch_glossary_terms = AddDatasetTerms._merge_with_server_glossary_terms(
-                self.ctx.graph, entity_urn, out_glossary_terms
+                self._server_graph(self.ctx.graph), entity_urn, out_glossary_terms
             )
             return cast(Optional[Aspect], patch_glossary_terms)
         else:
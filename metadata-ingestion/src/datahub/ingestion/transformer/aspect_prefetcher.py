@@ -0,0 +1,238 @@
+"""Batch-fetches the server-side aspects that transformers merge with.
+
+With PATCH semantics, many transformers read the current value of an aspect from
+DataHub for every entity that they transform. Doing that with one blocking request
+per entity is slow. Instead, the pipeline looks ahead at the upcoming work units and
+fetches the aspects of many entities at once. Transformers then read the aspects
+through a graph wrapper that serves them from a bounded cache, and falls back to the
+underlying graph for anything that was not prefetched.
+"""
+
+import collections
+import copy
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Type
+
+from datahub.emitter.mce_builder import Aspect
+from datahub.ingestion.api.workunit import MetadataWorkUnit
+from datahub.ingestion.graph.client import DataHubGraph
+from datahub.metadata.schema_classes import (
+    BrowsePathsClass,
+    DatasetPropertiesClass,
+    DomainsClass,
+    GlobalTagsClass,
+    GlossaryTermsClass,
+    OwnershipClass,
+    SchemaMetadataClass,
+    _Aspect,
+)
+from datahub.utilities.urns.urn import guess_entity_type
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PREFETCH_BATCH_SIZE = 100
+DEFAULT_PREFETCH_MAX_CACHED_ENTITIES = 10_000
+DEFAULT_PREFETCH_MAX_PENDING_WORKUNITS = 1_000
+
+
+class ServerAspectPrefetcher:
+    """Prefetches aspects from DataHub and serves them like a DataHubGraph.
+
+    Transformers register the entity types and aspects that they read from the
+    server. Wrapping the source's work units with prefetch() then fetches those
+    aspects for batches of upcoming entities using a single batch request per
+    entity type.
+
+    Aspects are returned as copies, since some transformers modify them. If a batch
+    request fails, e.g. because the server doesn't support it, prefetching is
+    disabled and all reads go to the underlying graph.
+    """
+
+    def __init__(
+        self,
+        graph: DataHubGraph,
+        batch_size: int = DEFAULT_PREFETCH_BATCH_SIZE,
+        max_cached_entities: int = DEFAULT_PREFETCH_MAX_CACHED_ENTITIES,
+        max_pending_workunits: int = DEFAULT_PREFETCH_MAX_PENDING_WORKUNITS,
+    ):
+        self._graph = graph
+        self._batch_size = batch_size
+        self._max_cached_entities = max_cached_entities
+        self._max_pending_workunits = max_pending_workunits
+
+        self._aspects_by_entity_type: Dict[str, Set[str]] = {}
+        self._cache: "collections.OrderedDict[str, Dict[str, Optional[_Aspect]]]" = (
+            collections.OrderedDict()
+        )
+        self._disabled = False
+
+        self.num_batch_requests = 0
+        self.num_hits = 0
+        self.num_misses = 0
+
+    def register(
+        self, entity_types: List[str], aspect_types: List[Type[_Aspect]]
+    ) -> None:
+        for entity_type in entity_types:
+            self._aspects_by_entity_type.setdefault(entity_type, set()).update(
+                aspect_type.ASPECT_NAME for aspect_type in aspect_types
+            )
+
+    def _get_aspect_names(self, entity_type: str) -> Set[str]:
+        return self._aspects_by_entity_type.get(
+            entity_type, set()
+        ) | self._aspects_by_entity_type.get("*", set())
+
+    def prefetch(
+        self, workunits: Iterable[MetadataWorkUnit]
+    ) -> Iterable[MetadataWorkUnit]:
+        """Yields the work units unchanged, prefetching aspects for batches of them.
+
+        Work units are only held back while there are aspects to prefetch for them
+        or for earlier work units, and at most `max_pending_workunits` of them.
+        """
+
+        pending_workunits: List[MetadataWorkUnit] = []
+        pending_urns: Dict[str, None] = {}
+        for wu in workunits:
+            if self._disabled:
+                yield wu
+                continue
+
+            urn = wu.get_urn()
+            if urn not in self._cache and self._get_aspect_names(
+                guess_entity_type(urn)
+            ):
+                pending_urns[urn] = None
+            if not pending_urns:
+                yield wu
+                continue
+
+            pending_workunits.append(wu)
+            if (
+                len(pending_urns) >= self._batch_size
+                or len(pending_workunits) >= self._max_pending_workunits
+            ):
+                self._fetch(list(pending_urns))
+                yield from pending_workunits
+                pending_workunits = []
+                pending_urns = {}
+
+        if pending_urns:
+            self._fetch(list(pending_urns))
+        yield from pending_workunits
+
+    def _fetch(self, urns: List[str]) -> None:
+        if self._disabled:
+            return
+
+        urns_by_entity_type: Dict[str, List[str]] = collections.defaultdict(list)
+        for urn in urns:
+            urns_by_entity_type[guess_entity_type(urn)].append(urn)
+
+        for entity_type, entity_urns in urns_by_entity_type.items():
+            aspect_names = sorted(self._get_aspect_names(entity_type))
+            try:
+                entities = self._graph.get_entities(
+                    entity_type, entity_urns, aspect_names
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Failed to prefetch aspects from DataHub, falling back to fetching them one entity at a time: {e}"
+                )
+                self._disabled = True
+                return
+            self.num_batch_requests += 1
+
+            for urn in entity_urns:
+                entity = entities.get(urn, {})
+                self._cache[urn] = {
+                    aspect_name: (
+                        entity[aspect_name][0] if aspect_name in entity else None
+                    )
+                    for aspect_name in aspect_names
+                }
+                self._cache.move_to_end(urn)
+        while len(self._cache) > self._max_cached_entities:
+            self._cache.popitem(last=False)
+
+    def _get(
+        self,
+        entity_urn: str,
+        aspect_type: Type[Aspect],
+        fallback: Callable[[], Optional[Aspect]],
+    ) -> Optional[Aspect]:
+        cached = self._cache.get(entity_urn)
+        if cached is None or aspect_type.ASPECT_NAME not in cached:
+            self.num_misses += 1
+            return fallback()
+
+        self.num_hits += 1
+        aspect = cached[aspect_type.ASPECT_NAME]
+        assert aspect is None or isinstance(aspect, aspect_type)
+        return copy.deepcopy(aspect)
+
+    def get_aspect(
+        self, entity_urn: str, aspect_type: Type[Aspect], version: int = 0
+    ) -> Optional[Aspect]:
+        if version != 0:
+            return self._graph.get_aspect(entity_urn, aspect_type, version)
+        return self._get(
+            entity_urn,
+            aspect_type,
+            lambda: self._graph.get_aspect(entity_urn, aspect_type),
+        )
+
+    def get_ownership(self, entity_urn: str) -> Optional[OwnershipClass]:
+        return self._get(
+            entity_urn,
+            OwnershipClass,
+            lambda: self._graph.get_ownership(entity_urn=entity_urn),
+        )
+
+    def get_schema_metadata(self, entity_urn: str) -> Optional[SchemaMetadataClass]:
+        return self._get(
+            entity_urn,
+            SchemaMetadataClass,
+            lambda: self._graph.get_schema_metadata(entity_urn=entity_urn),
+        )
+
+    def get_dataset_properties(
+        self, entity_urn: str
+    ) -> Optional[DatasetPropertiesClass]:
+        return self._get(
+            entity_urn,
+            DatasetPropertiesClass,
+            lambda: self._graph.get_dataset_properties(entity_urn),
+        )
+
+    def get_tags(self, entity_urn: str) -> Optional[GlobalTagsClass]:
+        return self._get(
+            entity_urn,
+            GlobalTagsClass,
+            lambda: self._graph.get_tags(entity_urn=entity_urn),
+        )
+
+    def get_glossary_terms(self, entity_urn: str) -> Optional[GlossaryTermsClass]:
+        return self._get(
+            entity_urn,
+            GlossaryTermsClass,
+            lambda: self._graph.get_glossary_terms(entity_urn=entity_urn),
+        )
+
+    def get_domain(self, entity_urn: str) -> Optional[DomainsClass]:
+        return self._get(
+            entity_urn,
+            DomainsClass,
+            lambda: self._graph.get_domain(entity_urn=entity_urn),
+        )
+
+    def get_browse_path(self, entity_urn: str) -> Optional[BrowsePathsClass]:
+        return self._get(
+            entity_urn,
+            BrowsePathsClass,
+            lambda: self._graph.get_browse_path(entity_urn=entity_urn),
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._graph, name)
@@ -1,6 +1,6 @@
 import logging
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Type, Union, cast
 
 import datahub.emitter.mce_builder as builder
 from datahub.emitter.aspect import ASPECT_MAP
@@ -8,9 +8,12 @@ from datahub.emitter.mce_builder import Aspect
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import ControlRecord, EndOfStream, RecordEnvelope
 from datahub.ingestion.api.transform import Transformer
+from datahub.ingestion.graph.client import DataHubGraph
+from datahub.ingestion.transformer.aspect_prefetcher import ServerAspectPrefetcher
 from datahub.metadata.schema_classes import (
     MetadataChangeEventClass,
     MetadataChangeProposalClass,
+    _Aspect,
 )
 from datahub.utilities.urns.urn import Urn, guess_entity_type
 
@@ -72,6 +75,7 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
 
     def __init__(self):
         self.entity_map: Dict[str, Dict[str, Any]] = {}
+        self.aspect_prefetcher: Optional[ServerAspectPrefetcher] = None
         mixedin = False
         for mixin in [LegacyMCETransformer, SingleAspectTransformer]:
             mixedin = mixedin or isinstance(self, mixin)
@@ -80,6 +84,16 @@ class BaseTransformer(Transformer, metaclass=ABCMeta):
                 f"Class does not implement one of required traits {self.allowed_mixins}"
             )
 
+    def server_aspects(self) -> List[Type[_Aspect]]:
+        """Implement this method to specify the aspects that the transformer reads from DataHub for each entity it transforms, so that they can be prefetched in batches. Defaults to none."""
+        return []
+
+    def _server_graph(self, graph: DataHubGraph) -> DataHubGraph:
+        """Returns the graph to read server-side aspects from, which serves prefetched aspects if available."""
+        if self.aspect_prefetcher is None:
+            return graph
+        return cast(DataHubGraph, self.aspect_prefetcher)
+
     def _should_process(
         self,
         record: Union[
@@ -1,6 +1,6 @@
 import logging
 from enum import auto
-from typing import Callable, Dict, List, Optional, Sequence, Union, cast
+from typing import Callable, Dict, List, Optional, Sequence, Type, Union, cast
 
 from datahub.configuration._config_enum import ConfigEnum
 from datahub.configuration.common import (
@@ -19,6 +19,7 @@ from datahub.metadata.schema_classes import (
     BrowsePathsV2Class,
     DomainsClass,
     MetadataChangeProposalClass,
+    _Aspect,
 )
 from datahub.utilities.registries.domain_registry import DomainRegistry
 
@@ -89,6 +90,14 @@ class AddDatasetDomain(DatasetDomainTransformer):
         )
         return domain_class
 
+    def server_aspects(self) -> List[Type[_Aspect]]:
+        if (
+            self.config.semantics == TransformerSemantics.PATCH
+            or self.config.on_conflict == TransformerOnConflict.DO_NOTHING
+        ):
+            return [DomainsClass]
+        return []
+
     @staticmethod
     def _merge_with_server_domains(
         graph: Optional[DataHubGraph], urn: str, mce_domain: Optional[DomainsClass]
@@ -180,12 +189,16 @@ class AddDatasetDomain(DatasetDomainTransformer):
         if domain_aspect.domains:
             if self.config.on_conflict == TransformerOnConflict.DO_NOTHING:
                 assert self.ctx.graph
-                server_domain = self.ctx.graph.get_domain(entity_urn)
+                server_domain = self._server_graph(self.ctx.graph).get_domain(
+                    entity_urn
+                )
                 if server_domain and server_domain.domains:
                     return None
             if self.config.semantics == TransformerSemantics.PATCH:
                 final_aspect = AddDatasetDomain._merge_with_server_domains(
-                    self.ctx.graph, entity_urn, domain_aspect
+                    self._server_graph(self.ctx.graph) if self.ctx.graph else None,
+                    entity_urn,
+                    domain_aspect,
                 )
         return cast(Optional[Aspect], final_aspect)
 
@@ -1,6 +1,6 @@
 import logging
 import re
-from typing import List, Optional, Set, cast
+from typing import List, Optional, Set, Type, cast
 
 import datahub.emitter.mce_builder as builder
 from datahub.configuration.common import ConfigModel
@@ -10,6 +10,7 @@ from datahub.metadata.schema_classes import (
     OwnerClass,
     OwnershipClass,
     OwnershipTypeClass,
+    _Aspect,
 )
 from datahub.metadata.urns import CorpGroupUrn, CorpUserUrn
 from datahub.utilities.urns._urn_base import Urn
@@ -40,9 +41,14 @@ class PatternCleanUpOwnership(OwnershipTransformer):
         config = PatternCleanUpOwnershipConfig.parse_obj(config_dict)
         return cls(config, ctx)
 
+    def server_aspects(self) -> List[Type[_Aspect]]:
+        return [OwnershipClass]
+
     def _get_current_owner_urns(self, entity_urn: str) -> Set[str]:
         if self.ctx.graph is not None:
-            current_ownership = self.ctx.graph.get_ownership(entity_urn=entity_urn)
+            current_ownership = self._server_graph(self.ctx.graph).get_ownership(
+                entity_urn=entity_urn
+            )
             if current_ownership is not None:
                 current_owner_urns: Set[str] = {
                     owner.owner for owner in current_ownership.owners
@@ -1,8 +1,22 @@
+import contextlib
+import dataclasses
 import json
 import logging
 import pathlib
+import re
 import time
-from typing import Any, Dict, Iterable, List, Optional, Type, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 import duckdb
 
@@ -38,6 +52,100 @@ from datahub.utilities.urns.urn import Urn
 
 logger = logging.getLogger(__name__)
 
+# Bulk inserts ship each chunk of rows as a single JSON document parameter, since
+# binding every value as a separate parameter has a large per-value overhead.
+_BULK_INSERT_ROWS_PER_STATEMENT = 10000
+
+_AspectKey = Tuple[str, str]
+_EdgeKey = Tuple[str, str, str]
+
+# The free text search index stores one row per (token, urn, aspect) with a weight
+# that reflects which field the token came from. Tokens of the urn itself are
+# stored under a pseudo aspect named "urn".
+_URN_SEARCH_ASPECT = "urn"
+_URN_SEARCH_WEIGHT = 1.0
+_ASPECT_SEARCH_FIELD_WEIGHTS = {
+    "name": 4.0,
+    "title": 4.0,
+    "displayName": 4.0,
+    "qualifiedName": 2.0,
+    "description": 1.0,
+}
+_SCHEMA_FIELD_SEARCH_FIELD_WEIGHTS = {
+    "fieldPath": 2.0,
+    "description": 0.5,
+}
+# Tokens that only match a prefix of the indexed token are ranked lower.
+_PREFIX_MATCH_PENALTY = 0.5
+_MAX_SEARCH_TERMS = 16
+_MAX_SEARCH_TOKEN_LENGTH = 128
+_SEARCH_REINDEX_BATCH_SIZE = 10000
+
+_SEARCH_TOKEN_RE = re.compile(r"[^\W_]+")
+_FIELD_PATH_ANNOTATION_RE = re.compile(r"\[[^\]]*\]")
+
+
+def _tokenize(text: str) -> List[str]:
+    return [
+        token
+        for token in _SEARCH_TOKEN_RE.findall(text.lower())
+        if len(token) <= _MAX_SEARCH_TOKEN_LENGTH
+    ]
+
+
+def _get_search_terms_for_urn(urn: str) -> Dict[str, float]:
+    return {token: _URN_SEARCH_WEIGHT for token in _tokenize(urn)}
+
+
+def _get_search_terms_for_aspect(aspect: Any) -> Dict[str, float]:
+    """Extracts weighted tokens from the names, descriptions and field paths of an aspect."""
+    terms: Dict[str, float] = {}
+
+    def add_terms(text: Any, weight: float) -> None:
+        if not isinstance(text, str):
+            return
+        for token in _tokenize(text):
+            if terms.get(token, 0.0) < weight:
+                terms[token] = weight
+
+    if not isinstance(aspect, dict):
+        return terms
+    for field_name, weight in _ASPECT_SEARCH_FIELD_WEIGHTS.items():
+        add_terms(aspect.get(field_name), weight)
+    schema_fields = aspect.get("fields")
+    if isinstance(schema_fields, list):
+        for schema_field in schema_fields:
+            if not isinstance(schema_field, dict):
+                continue
+            field_path = schema_field.get("fieldPath")
+            if isinstance(field_path, str):
+                # Strip the [version=2.0].[type=...] annotations of v2 field paths.
+                field_path = _FIELD_PATH_ANNOTATION_RE.sub("", field_path)
+            add_terms(field_path, _SCHEMA_FIELD_SEARCH_FIELD_WEIGHTS["fieldPath"])
+            add_terms(
+                schema_field.get("description"),
+                _SCHEMA_FIELD_SEARCH_FIELD_WEIGHTS["description"],
+            )
+    return terms
+
+
+def _get_prefix_upper_bound(prefix: str) -> str:
+    # The smallest string that is larger than every string starting with prefix.
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+@dataclasses.dataclass
+class _AspectState:
+    """The state of the version 0 row for an aspect, as seen while writing a batch."""
+
+    metadata_json: str
+    metadata: dict
+    system_metadata: dict
+    max_version: int
+    # Whether the version 0 row already existed before the batch started.
+    in_db: bool
+    createdon: int
+
 
 class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
     @classmethod
@@ -52,6 +160,11 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         self.duckdb_client = duckdb.connect(
             str(fpath), read_only=config.read_only, config=config.options
         )
+        # When set, add_edge calls are buffered here and applied in bulk.
+        self._pending_edges: Optional[
+            List[Tuple[str, str, str, Optional[str], bool]]
+        ] = None
+        self._bulk_insert_structures: Dict[str, Dict[str, str]] = {}
         if not config.read_only:
             self._init_db()
 
@@ -85,6 +198,48 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
             "edge_idx", "metadata_edge_v2", ["src_id", "relnship", "dst_id"]
         )
 
+        # The search index is deliberately not backed by an ART index. Instead,
+        # reindex() rewrites it sorted by token, which lets duckdb skip almost all
+        # row groups for the prefix range scans issued by search().
+        search_index_exists = self._search_index_exists()
+        self.duckdb_client.execute(
+            "CREATE TABLE IF NOT EXISTS metadata_search_v2 "
+            "(token VARCHAR, urn VARCHAR, aspect_name VARCHAR, weight DOUBLE)"
+        )
+
+        # Staging tables for bulk writes.
+        self.duckdb_client.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS staged_aspect_keys "
+            "(urn VARCHAR, aspect_name VARCHAR)"
+        )
+        self.duckdb_client.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS staged_aspect_updates "
+            "(urn VARCHAR, aspect_name VARCHAR, metadata JSON, system_metadata JSON)"
+        )
+        self.duckdb_client.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS staged_edges "
+            "(src_id VARCHAR, relnship VARCHAR, dst_id VARCHAR, dst_label VARCHAR, replace_existing BOOLEAN)"
+        )
+        self.duckdb_client.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS staged_urns (urn VARCHAR)"
+        )
+        self.duckdb_client.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS staged_search_terms "
+            "(token VARCHAR, urn VARCHAR, aspect_name VARCHAR, weight DOUBLE)"
+        )
+
+        if not search_index_exists:
+            # Databases created by older versions need a one-off backfill.
+            self._rebuild_search_index()
+
+    def _search_index_exists(self) -> bool:
+        row = self.duckdb_client.execute(
+            "SELECT count(*) FROM duckdb_tables() "
+            "WHERE database_name = current_database() AND NOT temporary "
+            "AND table_name = 'metadata_search_v2'"
+        ).fetchone()
+        return bool(row and row[0])
+
     def location(self) -> str:
         return self.config.file
 
@@ -114,9 +269,30 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
 
         # TODO use `with` for transaction
         self.duckdb_client.begin()
+        new_urns = self._find_new_urns(
+            list(dict.fromkeys(str(writeable.entityUrn) for writeable in writeables))
+        )
+        search_updates: Dict[_AspectKey, Any] = {}
+        replaced_search_keys: Dict[_AspectKey, None] = {}
         for writeable in writeables:
             needs_write = False
             try:
+                current_time = int(time.time() * 1000.0)
+                created_on = current_time
+                if (
+                    writeable.systemMetadata is not None
+                    and writeable.systemMetadata.lastObserved
+                ):
+                    created_on = writeable.systemMetadata.lastObserved
+
+                # Defaulted before serializing, so that the row always has it.
+                if writeable.systemMetadata is None:
+                    writeable.systemMetadata = SystemMetadataClass(
+                        lastObserved=created_on, properties={}
+                    )
+                elif writeable.systemMetadata.lastObserved is None:
+                    writeable.systemMetadata.lastObserved = created_on
+
                 writeable_dict = writeable.to_obj(simplified_structure=True)
                 exists = self.duckdb_client.execute(
                     "SELECT metadata, system_metadata FROM metadata_aspect_v2 WHERE urn = ? AND aspect_name = ? AND version = 0",
@@ -146,21 +322,6 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
                         needs_write = True
                         new_version = real_version + 1
 
-                current_time = int(time.time() * 1000.0)
-                created_on = current_time
-                if (
-                    writeable.systemMetadata is not None
-                    and writeable.systemMetadata.lastObserved
-                ):
-                    created_on = writeable.systemMetadata.lastObserved
-
-                if writeable.systemMetadata is None:
-                    writeable.systemMetadata = SystemMetadataClass(
-                        lastObserved=created_on, properties={}
-                    )
-                elif writeable.systemMetadata.lastObserved is None:
-                    writeable.systemMetadata.lastObserved = created_on
-
                 if "properties" not in writeable_dict["systemMetadata"]:
                     writeable_dict["systemMetadata"]["properties"] = {}
                 writeable_dict["systemMetadata"]["properties"]["sysVersion"] = (
@@ -220,7 +381,7 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
                         ],
                     )
             except Exception as e:
-                logger.error(f"Failed to write {writeable}", e)
+                logger.error(f"Failed to write {writeable}: {e}", exc_info=True)
             else:
                 if needs_write:
                     assert (
@@ -231,9 +392,415 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
                     self.post_update_hook(
                         writeable.entityUrn, writeable.aspectName, writeable.aspect
                     )
+                    key = (writeable.entityUrn, writeable.aspectName)
+                    search_updates[key] = writeable_dict["aspect"]["json"]
+                    if max_row is not None:
+                        replaced_search_keys[key] = None
+
+        self._update_search_index(search_updates, replaced_search_keys, new_urns)
+        self.duckdb_client.commit()
+
+    def write_batch(
+        self,
+        records: Iterable[
+            Union[
+                MetadataChangeEventClass,
+                MetadataChangeProposalWrapper,
+            ]
+        ],
+    ) -> None:
+        writeables: List[MetadataChangeProposalWrapper] = []
+        for record in records:
+            if isinstance(record, MetadataChangeProposalWrapper):
+                writeables.append(record)
+            elif isinstance(record, MetadataChangeEventClass):
+                writeables.extend(mcps_from_mce(record))
+            else:
+                raise ValueError(
+                    f"DuckDBCatalog only supports MCEs and MCPs, not {type(record)}"
+                )
+
+        if not writeables:
+            return
+
+        self.duckdb_client.begin()
+        try:
+            with self._buffered_edges():
+                self._write_aspects_in_bulk(writeables)
+        except Exception:
+            self.duckdb_client.rollback()
+            raise
+        self.duckdb_client.commit()
+
+    def _write_aspects_in_bulk(
+        self, writeables: List[MetadataChangeProposalWrapper]
+    ) -> None:
+        # This mirrors the logic in `write`, but reads all of the existing version 0
+        # rows up front and resolves versions in memory. Later writes to the same
+        # aspect within the batch see the results of earlier ones, exactly as if
+        # the records had been written one at a time.
+        keys = list(
+            dict.fromkeys(
+                (str(writeable.entityUrn), str(writeable.aspectName))
+                for writeable in writeables
+            )
+        )
+        states = self._read_aspect_states(keys)
+
+        new_urns = self._find_new_urns(list(dict.fromkeys(key[0] for key in keys)))
+
+        versioned_rows: List[Tuple[str, str, int, str, str, int]] = []
+        dirty_keys: Dict[_AspectKey, None] = {}
+        written: List[MetadataChangeProposalWrapper] = []
+        for writeable in writeables:
+            key = (str(writeable.entityUrn), str(writeable.aspectName))
+            try:
+                current_time = int(time.time() * 1000.0)
+                created_on = current_time
+                if (
+                    writeable.systemMetadata is not None
+                    and writeable.systemMetadata.lastObserved
+                ):
+                    created_on = writeable.systemMetadata.lastObserved
+
+                # Defaulted before serializing, so that the row always has it.
+                if writeable.systemMetadata is None:
+                    writeable.systemMetadata = SystemMetadataClass(
+                        lastObserved=created_on, properties={}
+                    )
+                elif writeable.systemMetadata.lastObserved is None:
+                    writeable.systemMetadata.lastObserved = created_on
+
+                writeable_dict = writeable.to_obj(simplified_structure=True)
+                state = states.get(key)
+                if state is None:
+                    new_version = 1
+                    needs_write = True
+                else:
+                    real_version = state.system_metadata.get("properties", {}).get(
+                        "sysVersion"
+                    )
+                    if real_version is None:
+                        real_version = state.max_version
+
+                    if writeable_dict["aspect"]["json"] == state.metadata:
+                        needs_write = False
+                        new_version = real_version
+                    else:
+                        needs_write = True
+                        new_version = real_version + 1
 
+                if "properties" not in writeable_dict["systemMetadata"]:
+                    writeable_dict["systemMetadata"]["properties"] = {}
+                writeable_dict["systemMetadata"]["properties"]["sysVersion"] = (
+                    new_version
+                )
+
+                if needs_write:
+                    metadata_json = json.dumps(writeable_dict["aspect"]["json"])
+                    system_metadata_json = json.dumps(writeable_dict["systemMetadata"])
+                    versioned_rows.append(
+                        (
+                            key[0],
+                            key[1],
+                            new_version,
+                            metadata_json,
+                            system_metadata_json,
+                            created_on,
+                        )
+                    )
+                    if state is None:
+                        state = _AspectState(
+                            metadata_json=metadata_json,
+                            metadata={},
+                            system_metadata={},
+                            max_version=0,
+                            in_db=False,
+                            createdon=created_on,
+                        )
+                        states[key] = state
+                    state.metadata_json = metadata_json
+                    state.metadata = json.loads(metadata_json)
+                    state.system_metadata = json.loads(system_metadata_json)
+                    state.max_version = max(state.max_version, new_version)
+                else:
+                    assert state is not None
+                    # this is a dup, we still want to update the lastObserved timestamp
+                    system_metadata = state.system_metadata
+                    if not system_metadata:
+                        system_metadata = {
+                            "lastObserved": writeable.systemMetadata.lastObserved
+                        }
+                    else:
+                        system_metadata["lastObserved"] = (
+                            writeable.systemMetadata.lastObserved
+                        )
+                    state.system_metadata = json.loads(json.dumps(system_metadata))
+                dirty_keys[key] = None
+            except Exception as e:
+                logger.error(f"Failed to write {writeable}: {e}", exc_info=True)
+            else:
+                if needs_write:
+                    written.append(writeable)
+
+        inserted_rows = list(versioned_rows)
+        updated_rows: List[Tuple[str, str, str, str]] = []
+        for key in dirty_keys:
+            state = states[key]
+            system_metadata_json = json.dumps(state.system_metadata)
+            if state.in_db:
+                updated_rows.append(
+                    (key[0], key[1], state.metadata_json, system_metadata_json)
+                )
+            else:
+                inserted_rows.append(
+                    (
+                        key[0],
+                        key[1],
+                        0,
+                        state.metadata_json,
+                        system_metadata_json,
+                        state.createdon,
+                    )
+                )
+
+        self._bulk_insert("metadata_aspect_v2", inserted_rows)
+        if updated_rows:
+            self._bulk_insert("staged_aspect_updates", updated_rows)
+            self.duckdb_client.execute(
+                "UPDATE metadata_aspect_v2 SET metadata = s.metadata, system_metadata = s.system_metadata "
+                "FROM staged_aspect_updates s "
+                "WHERE metadata_aspect_v2.urn = s.urn AND metadata_aspect_v2.aspect_name = s.aspect_name "
+                "AND metadata_aspect_v2.version = 0"
+            )
+            self.duckdb_client.execute("DELETE FROM staged_aspect_updates")
+
+        for writeable in written:
+            assert writeable.entityUrn and writeable.aspectName and writeable.aspect
+            self.post_update_hook(
+                writeable.entityUrn, writeable.aspectName, writeable.aspect
+            )
+
+        written_keys = dict.fromkeys(
+            (str(writeable.entityUrn), str(writeable.aspectName))
+            for writeable in written
+        )
+        self._update_search_index(
+            {key: states[key].metadata for key in written_keys},
+            [key for key in written_keys if states[key].in_db],
+            new_urns,
+        )
+
+    def _read_aspect_states(
+        self, keys: List[_AspectKey]
+    ) -> Dict[_AspectKey, _AspectState]:
+        self._bulk_insert("staged_aspect_keys", keys)
+        rows = self.duckdb_client.execute(
+            "SELECT m.urn, m.aspect_name, m.metadata, m.system_metadata, m.createdon, v.max_version "
+            "FROM metadata_aspect_v2 m "
+            "JOIN ("
+            "  SELECT a.urn, a.aspect_name, max(a.version) AS max_version "
+            "  FROM metadata_aspect_v2 a "
+            "  JOIN staged_aspect_keys k ON a.urn = k.urn AND a.aspect_name = k.aspect_name "
+            "  GROUP BY a.urn, a.aspect_name"
+            ") v ON m.urn = v.urn AND m.aspect_name = v.aspect_name "
+            "WHERE m.version = 0"
+        ).fetchall()
+        self.duckdb_client.execute("DELETE FROM staged_aspect_keys")
+
+        return {
+            (row[0], row[1]): _AspectState(
+                metadata_json=row[2],
+                metadata=json.loads(row[2]),
+                system_metadata=json.loads(row[3]),
+                max_version=row[5],
+                in_db=True,
+                createdon=row[4],
+            )
+            for row in rows
+        }
+
+    def _find_new_urns(self, urns: List[str]) -> Set[str]:
+        """Returns the urns that do not have any aspects in the database yet."""
+        self._bulk_insert("staged_urns", [(urn,) for urn in urns])
+        rows = self.duckdb_client.execute(
+            "SELECT DISTINCT a.urn FROM metadata_aspect_v2 a "
+            "JOIN staged_urns s ON a.urn = s.urn"
+        ).fetchall()
+        self.duckdb_client.execute("DELETE FROM staged_urns")
+        return set(urns) - {row[0] for row in rows}
+
+    def _update_search_index(
+        self,
+        aspects: Dict[_AspectKey, Any],
+        replaced_keys: Iterable[_AspectKey],
+        new_urns: Set[str],
+    ) -> None:
+        replaced_keys = list(replaced_keys)
+        if replaced_keys:
+            self._bulk_insert("staged_aspect_keys", replaced_keys)
+            self.duckdb_client.execute(
+                "DELETE FROM metadata_search_v2 USING staged_aspect_keys k "
+                "WHERE metadata_search_v2.urn = k.urn "
+                "AND metadata_search_v2.aspect_name = k.aspect_name"
+            )
+            self.duckdb_client.execute("DELETE FROM staged_aspect_keys")
+
+        rows: List[Tuple[str, str, str, float]] = []
+        for urn in dict.fromkeys(urn for urn, _ in aspects):
+            if urn in new_urns:
+                rows.extend(
+                    (token, urn, _URN_SEARCH_ASPECT, weight)
+                    for token, weight in _get_search_terms_for_urn(urn).items()
+                )
+        for (urn, aspect_name), aspect in aspects.items():
+            rows.extend(
+                (token, urn, aspect_name, weight)
+                for token, weight in _get_search_terms_for_aspect(aspect).items()
+            )
+        self._bulk_insert("metadata_search_v2", rows)
+
+    def _rebuild_search_index(self) -> None:
+        # Read through a separate cursor so that we can write to the staging table
+        # while streaming the aspects.
+        self.duckdb_client.execute("DELETE FROM staged_search_terms")
+        reader = self.duckdb_client.cursor()
+        try:
+            reader.execute(
+                "SELECT urn, aspect_name, metadata FROM metadata_aspect_v2 "
+                "WHERE version = 0"
+            )
+            seen_urns: Set[str] = set()
+            while True:
+                batch = reader.fetchmany(_SEARCH_REINDEX_BATCH_SIZE)
+                if not batch:
+                    break
+                rows: List[Tuple[str, str, str, float]] = []
+                for urn, aspect_name, metadata in batch:
+                    if urn not in seen_urns:
+                        seen_urns.add(urn)
+                        rows.extend(
+                            (token, urn, _URN_SEARCH_ASPECT, weight)
+                            for token, weight in _get_search_terms_for_urn(urn).items()
+                        )
+                    rows.extend(
+                        (token, urn, aspect_name, weight)
+                        for token, weight in _get_search_terms_for_aspect(
+                            json.loads(metadata)
+                        ).items()
+                    )
+                self._bulk_insert("staged_search_terms", rows)
+        finally:
+            reader.close()
+
+        self.duckdb_client.begin()
+        try:
+            self.duckdb_client.execute("DELETE FROM metadata_search_v2")
+            self.duckdb_client.execute(
+                "INSERT INTO metadata_search_v2 "
+                "SELECT * FROM staged_search_terms ORDER BY token, urn, aspect_name"
+            )
+            self.duckdb_client.execute("DELETE FROM staged_search_terms")
+        except Exception:
+            self.duckdb_client.rollback()
+            raise
         self.duckdb_client.commit()
 
+    def _bulk_insert(self, table_name: str, rows: List[Tuple[Any, ...]]) -> None:
+        if not rows:
+            return
+        column_names = list(self._get_bulk_insert_structure(table_name))
+        structure = json.dumps([self._get_bulk_insert_structure(table_name)])
+        for i in range(0, len(rows), _BULK_INSERT_ROWS_PER_STATEMENT):
+            chunk = rows[i : i + _BULK_INSERT_ROWS_PER_STATEMENT]
+            self.duckdb_client.execute(
+                f"INSERT INTO {table_name} "
+                f"SELECT unnest(from_json(?, '{structure}'), recursive := true)",
+                [json.dumps([dict(zip(column_names, row)) for row in chunk])],
+            )
+
+    def _get_bulk_insert_structure(self, table_name: str) -> Dict[str, str]:
+        if table_name not in self._bulk_insert_structures:
+            self._bulk_insert_structures[table_name] = {
+                # JSON columns are shipped as strings holding the serialized JSON.
+                column_name: "VARCHAR" if column_type == "JSON" else column_type
+                for column_name, column_type, *_ in self.duckdb_client.execute(
+                    f"DESCRIBE {table_name}"
+                ).fetchall()
+            }
+        return self._bulk_insert_structures[table_name]
+
+    @contextlib.contextmanager
+    def _buffered_edges(self) -> Iterator[None]:
+        assert self._pending_edges is None, "Edge buffering is not reentrant"
+        self._pending_edges = []
+        try:
+            yield
+            pending_edges = self._pending_edges
+            self._pending_edges = None
+            self._add_edges_in_bulk(pending_edges)
+        finally:
+            self._pending_edges = None
+
+    def _add_edges_in_bulk(
+        self, edges: List[Tuple[str, str, str, Optional[str], bool]]
+    ) -> None:
+        # Collapse the sequence of add_edge calls into the final state that they
+        # would have produced, and then apply that state with set-based SQL.
+        final_edges: Dict[_EdgeKey, Tuple[Optional[str], bool]] = {}
+        dsts_by_pair: Dict[Tuple[str, str], Set[str]] = {}
+        for src_id, relnship, dst_id, dst_label, remove_existing in edges:
+            pair = (src_id, relnship)
+            key = (src_id, relnship, dst_id)
+            if remove_existing:
+                for existing_dst_id in dsts_by_pair.pop(pair, set()):
+                    final_edges.pop((src_id, relnship, existing_dst_id))
+                final_edges[key] = (dst_label, True)
+            else:
+                replace_existing = final_edges.get(key, (None, False))[1]
+                final_edges[key] = (dst_label, replace_existing)
+            dsts_by_pair.setdefault(pair, set()).add(dst_id)
+
+        if not final_edges:
+            return
+
+        self._bulk_insert(
+            "staged_edges",
+            [
+                (src_id, relnship, dst_id, dst_label, replace_existing)
+                for (src_id, relnship, dst_id), (
+                    dst_label,
+                    replace_existing,
+                ) in final_edges.items()
+            ],
+        )
+        # Edges added with remove_existing=True replace any other edges with the
+        # same source and relationship.
+        self.duckdb_client.execute(
+            "DELETE FROM metadata_edge_v2 USING staged_edges s "
+            "WHERE s.replace_existing AND metadata_edge_v2.src_id = s.src_id "
+            "AND metadata_edge_v2.relnship = s.relnship "
+            "AND NOT EXISTS ("
+            "  SELECT 1 FROM staged_edges s2 WHERE s2.src_id = metadata_edge_v2.src_id "
+            "  AND s2.relnship = metadata_edge_v2.relnship AND s2.dst_id = metadata_edge_v2.dst_id"
+            ")"
+        )
+        self.duckdb_client.execute(
+            "UPDATE metadata_edge_v2 SET dst_label = s.dst_label FROM staged_edges s "
+            "WHERE metadata_edge_v2.src_id = s.src_id AND metadata_edge_v2.relnship = s.relnship "
+            "AND metadata_edge_v2.dst_id = s.dst_id "
+            "AND metadata_edge_v2.dst_label IS DISTINCT FROM s.dst_label"
+        )
+        self.duckdb_client.execute(
+            "INSERT INTO metadata_edge_v2 "
+            "SELECT s.src_id, s.relnship, s.dst_id, s.dst_label FROM staged_edges s "
+            "WHERE NOT EXISTS ("
+            "  SELECT 1 FROM metadata_edge_v2 e WHERE e.src_id = s.src_id "
+            "  AND e.relnship = s.relnship AND e.dst_id = s.dst_id"
+            ")"
+        )
+        self.duckdb_client.execute("DELETE FROM staged_edges")
+
     def list_ids(self) -> Iterable[str]:
         self.duckdb_client.execute("SELECT distinct(urn) from metadata_aspect_v2")
         for row in self.duckdb_client.fetchall():
@@ -289,11 +856,12 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
     ) -> Iterable[Searchable]:
         aspects = aspects or []
         if flavor == SearchFlavor.FREE_TEXT:
-            base_query = f"SELECT distinct(urn), 'urn', NULL from metadata_aspect_v2 where urn ILIKE '%{query}%' UNION SELECT urn, aspect_name, metadata from metadata_aspect_v2 where metadata->>'$.name' ILIKE '%{query}%'"
-            for r in self.duckdb_client.execute(base_query).fetchall():
-                yield Searchable(
-                    id=r[0], aspect=r[1], snippet=r[2] if snippet else None
-                )
+            if self.config.read_only and not self._search_index_exists():
+                # Read-only connections cannot backfill the index for databases
+                # created by older versions, so fall back to scanning.
+                yield from self._search_without_index(query, snippet)
+                return
+            yield from self._search_with_index(query, aspects, snippet)
         elif flavor == SearchFlavor.EXACT:
             base_query = f"SELECT urn, aspect_name, metadata from metadata_aspect_v2 where version = 0 AND ({query})"
             for r in self.duckdb_client.execute(base_query).fetchall():
@@ -303,6 +871,95 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         else:
             raise Exception(f"Unhandled search flavor {flavor}")
 
+    def _search_with_index(
+        self, query: str, aspects: List[str], snippet: bool
+    ) -> Iterable[Searchable]:
+        terms = list(dict.fromkeys(_tokenize(query)))[:_MAX_SEARCH_TERMS]
+        if not terms:
+            return
+
+        # Every query term is matched as a prefix of the indexed tokens, with exact
+        # matches ranked higher. An entity matches if each term matches some token
+        # of the entity, and entities are ranked by the sum of their best match
+        # for each term. Each term is a separate range scan so that duckdb can prune
+        # row groups, and terms are evaluated from the most to the least selective
+        # one, with each scan restricted to the entities that matched so far.
+        aspect_filter = ""
+        if aspects:
+            aspect_filter = (
+                " AND aspect_name IN (" + ", ".join(["?"] * len(aspects)) + ")"
+            )
+        if len(terms) > 1:
+            terms.sort(key=self._count_search_token_matches)
+        term_queries = []
+        params: List[Any] = []
+        for position, term in enumerate(terms):
+            entity_filter = (
+                f" AND urn IN (SELECT urn FROM term_{position - 1})" if position else ""
+            )
+            term_queries.append(
+                f"term_{position} AS ("
+                f"SELECT {position} AS position, urn, aspect_name, "
+                f"max(weight * CASE WHEN token = ? THEN 1.0 ELSE {_PREFIX_MATCH_PENALTY} END) AS score "
+                "FROM metadata_search_v2 WHERE token >= ? AND token < ?"
+                f"{aspect_filter}{entity_filter} GROUP BY urn, aspect_name)"
+            )
+            params += [term, term, _get_prefix_upper_bound(term), *aspects]
+        params.append(len(terms))
+
+        results = self.duckdb_client.execute(
+            "WITH "
+            + ", ".join(term_queries)
+            + ", matches AS ("
+            + " UNION ALL ".join(
+                f"SELECT * FROM term_{position}" for position in range(len(terms))
+            )
+            + "), "
+            "entities AS ("
+            "  SELECT urn, sum(score) AS score FROM ("
+            "    SELECT urn, position, max(score) AS score FROM matches GROUP BY urn, position"
+            "  ) GROUP BY urn HAVING count(*) = ?"
+            ") "
+            "SELECT m.urn, m.aspect_name, e.score AS entity_score, sum(m.score) AS aspect_score "
+            "FROM matches m JOIN entities e ON m.urn = e.urn "
+            "GROUP BY m.urn, m.aspect_name, e.score "
+            "ORDER BY entity_score DESC, m.urn, aspect_score DESC, m.aspect_name",
+            params,
+        ).fetchall()
+
+        snippets: Dict[_AspectKey, str] = {}
+        if snippet:
+            snippet_keys = [(r[0], r[1]) for r in results if r[1] != _URN_SEARCH_ASPECT]
+            if snippet_keys:
+                # Search may run on a read-only connection, so the keys are passed
+                # as a JSON parameter rather than through a staging table.
+                snippets = {
+                    (r[0], r[1]): r[2]
+                    for r in self.duckdb_client.execute(
+                        "SELECT a.urn, a.aspect_name, a.metadata FROM metadata_aspect_v2 a "
+                        "JOIN (SELECT unnest(from_json(?, '[[\"VARCHAR\"]]')) AS k) "
+                        "ON a.urn = k[1] AND a.aspect_name = k[2] "
+                        "WHERE a.version = 0",
+                        [json.dumps(snippet_keys)],
+                    ).fetchall()
+                }
+
+        for r in results:
+            yield Searchable(id=r[0], aspect=r[1], snippet=snippets.get((r[0], r[1])))
+
+    def _count_search_token_matches(self, term: str) -> int:
+        row = self.duckdb_client.execute(
+            "SELECT count(*) FROM metadata_search_v2 WHERE token >= ? AND token < ?",
+            [term, _get_prefix_upper_bound(term)],
+        ).fetchone()
+        return row[0] if row else 0
+
+    def _search_without_index(self, query: str, snippet: bool) -> Iterable[Searchable]:
+        pattern = f"%{query}%"
+        base_query = "SELECT distinct(urn), 'urn', NULL from metadata_aspect_v2 where urn ILIKE ? UNION SELECT urn, aspect_name, metadata from metadata_aspect_v2 where metadata->>'$.name' ILIKE ?"
+        for r in self.duckdb_client.execute(base_query, [pattern, pattern]).fetchall():
+            yield Searchable(id=r[0], aspect=r[1], snippet=r[2] if snippet else None)
+
     def remove_edge(self, src: str, relnship: str) -> None:
         try:
             self.duckdb_client.execute(
@@ -325,6 +982,11 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
         src_id = str(src)
         dst_id = str(dst)
         logger.debug(f"Add edge {src_id},{dst_id},{relnship},{dst_label}")
+        if self._pending_edges is not None:
+            self._pending_edges.append(
+                (src_id, relnship, dst_id, dst_label, remove_existing)
+            )
+            return
         try:
             query = "SELECT * FROM metadata_edge_v2 WHERE src_id = ? AND relnship = ?"
             params = [src_id, relnship]
@@ -477,14 +1139,20 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
             ]
 
     def reindex(self) -> None:
+        self._rebuild_edges()
+        self._rebuild_search_index()
+
+    def _rebuild_edges(self) -> None:
         self.duckdb_client.execute("DELETE FROM metadata_edge_v2")
         self.duckdb_client.commit()
-        for urn_aspect_dict in self.get_all_entities(typed=True):
-            for urn, aspect_map in urn_aspect_dict.items():
-                for aspect_name, aspect_value in aspect_map.items():
-                    assert isinstance(aspect_value, _Aspect)
-                    self.post_update_hook(urn, aspect_name, aspect_value)
-                self.global_post_update_hook(urn, aspect_map)  # type: ignore
+        with self._buffered_edges():
+            for urn_aspect_dict in self.get_all_entities(typed=True):
+                for urn, aspect_map in urn_aspect_dict.items():
+                    for aspect_name, aspect_value in aspect_map.items():
+                        assert isinstance(aspect_value, _Aspect)
+                        self.post_update_hook(urn, aspect_name, aspect_value)
+                    self.global_post_update_hook(urn, aspect_map)  # type: ignore
+        self.duckdb_client.commit()
 
     def get_all_entities(
         self, typed: bool = False
@@ -545,7 +1213,9 @@ class DuckDBLite(DataHubLiteLocal[DuckDBLiteConfig]):
             yield mcp
 
     def close(self) -> None:
-        self.reindex()
+        # The search index is maintained incrementally on write, so only the
+        # edges need to be recomputed here.
+        self._rebuild_edges()
         self.duckdb_client.close()
 
     def get_category_from_platform(self, data_platform_urn: DataPlatformUrn) -> Urn:
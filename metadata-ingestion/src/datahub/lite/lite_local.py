@@ -70,6 +70,21 @@ class DataHubLiteLocal(Generic[LiteConfig], Closeable, metaclass=ABCMeta):
     ) -> None:
         pass
 
+    def write_batch(
+        self,
+        records: Iterable[
+            Union[
+                MetadataChangeEventClass,
+                MetadataChangeProposalWrapper,
+            ]
+        ],
+    ) -> None:
+        """Writes a batch of records. Implementations may override this with a
+        more efficient bulk implementation, but the results must be identical to
+        calling write on each record in order."""
+        for record in records:
+            self.write(record)
+
     @abstractmethod
     def list_ids(self) -> Iterable[str]:
         pass
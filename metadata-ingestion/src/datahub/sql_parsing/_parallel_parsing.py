@@ -0,0 +1,268 @@
+"""Fans SQL parsing out to a pool of worker processes.
+
+Each worker holds a snapshot of the schema resolver's schemas, taken when the pool
+is started. That snapshot can fall behind the main process, e.g. when schemas are
+lazily fetched from DataHub or registered after the pool was started. To detect
+this, workers report every urn that they failed to resolve. If the main process
+does know the schema for any of those urns, the result is discarded so that the
+caller can re-parse the query itself. The newly learned schemas are also shipped
+to the workers along with subsequent batches.
+"""
+
+import concurrent.futures
+import dataclasses
+import logging
+import multiprocessing
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from datahub.ingestion.api.closeable import Closeable
+from datahub.sql_parsing.schema_resolver import SchemaInfo, SchemaResolver
+from datahub.sql_parsing.sql_parsing_cache import (
+    SqlParsingCache,
+    TableDependency,
+    parse_with_table_dependencies,
+)
+from datahub.sql_parsing.sqlglot_lineage import SqlParsingResult
+
+logger = logging.getLogger(__name__)
+
+# The number of chunks we split each batch into, per worker. Using a few chunks
+# per worker helps to even out the load when some queries are much slower to
+# parse than others.
+_CHUNKS_PER_WORKER = 4
+
+# Once the main process has learned this many schemas that the workers don't
+# know about, we restart the pool with a fresh snapshot instead of shipping
+# them along with every batch.
+_MAX_EXTRA_SCHEMAS = 10_000
+
+
+@dataclasses.dataclass(frozen=True)
+class SqlParsingTask:
+    query: str
+    default_db: Optional[str]
+    default_schema: Optional[str]
+
+
+class _SnapshotSchemaResolver(SchemaResolver):
+    """A schema resolver that never hits the graph and records failed lookups."""
+
+    def __init__(
+        self,
+        *,
+        platform: str,
+        platform_instance: Optional[str],
+        env: str,
+        schemas: Dict[str, SchemaInfo],
+    ):
+        super().__init__(
+            platform=platform, platform_instance=platform_instance, env=env
+        )
+        for urn, schema_info in schemas.items():
+            self.add_raw_schema_info(urn, schema_info)
+        self.unresolved_urns: Set[str] = set()
+
+    def _resolve_schema_info(self, urn: str) -> Optional[SchemaInfo]:
+        schema_info = super()._resolve_schema_info(urn)
+        if schema_info is None:
+            self.unresolved_urns.add(urn)
+        return schema_info
+
+
+_worker_schema_resolver: Optional[_SnapshotSchemaResolver] = None
+
+
+def _init_worker(
+    platform: str,
+    platform_instance: Optional[str],
+    env: str,
+    schemas: Dict[str, SchemaInfo],
+) -> None:
+    global _worker_schema_resolver
+    _worker_schema_resolver = _SnapshotSchemaResolver(
+        platform=platform,
+        platform_instance=platform_instance,
+        env=env,
+        schemas=schemas,
+    )
+
+
+def _parse_in_worker(
+    tasks: List[SqlParsingTask], extra_schemas: Dict[str, SchemaInfo]
+) -> List[Tuple[SqlParsingResult, List[TableDependency], List[str]]]:
+    schema_resolver = _worker_schema_resolver
+    assert schema_resolver is not None, "worker was not initialized"
+
+    for urn, schema_info in extra_schemas.items():
+        schema_resolver.add_raw_schema_info(urn, schema_info)
+
+    results = []
+    for task in tasks:
+        schema_resolver.unresolved_urns = set()
+        # This deliberately skips the in-memory parse result cache, since a cached
+        # result wouldn't tell us which urns were looked up.
+        parsed, tables = parse_with_table_dependencies(
+            task.query,
+            schema_resolver=schema_resolver,
+            default_db=task.default_db,
+            default_schema=task.default_schema,
+        )
+        results.append((parsed, tables, sorted(schema_resolver.unresolved_urns)))
+    return results
+
+
+class ParallelSqlParser(Closeable):
+    """Parses batches of queries in worker processes.
+
+    The pool is started lazily on the first call to parse(), so that schemas
+    registered up to that point are included in the workers' snapshot.
+
+    If a persistent parse cache is provided, cache hits are not sent to the
+    workers, and the workers' results are added to the cache.
+    """
+
+    def __init__(
+        self,
+        schema_resolver: SchemaResolver,
+        max_workers: int,
+        parse_cache: Optional[SqlParsingCache] = None,
+    ):
+        assert max_workers > 1, "parallel parsing requires more than one worker"
+        self._schema_resolver = schema_resolver
+        self._max_workers = max_workers
+        self._parse_cache = parse_cache
+
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._extra_schemas: Dict[str, SchemaInfo] = {}
+        self._broken = False
+
+    def _get_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        if self._executor is not None and len(self._extra_schemas) > _MAX_EXTRA_SCHEMAS:
+            self._shutdown()
+
+        if self._executor is None:
+            schemas = {
+                urn: schema_info
+                for urn, schema_info in self._schema_resolver._schema_cache.items_snapshot()
+                if schema_info is not None
+            }
+            logger.debug(
+                f"Starting {self._max_workers} SQL parsing workers with {len(schemas)} schemas"
+            )
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                # The fork start method is not safe when the main process uses threads.
+                # See the equivalent comment in the classification mixin.
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(
+                    self._schema_resolver.platform,
+                    self._schema_resolver.platform_instance,
+                    self._schema_resolver.env,
+                    schemas,
+                ),
+            )
+            self._extra_schemas = {}
+        return self._executor
+
+    def parse(
+        self, tasks: Sequence[SqlParsingTask]
+    ) -> List[Optional[SqlParsingResult]]:
+        """Parses the tasks, returning results in the same order.
+
+        A result is None if the query could not be parsed by a worker or if the
+        worker's schemas were out of date. Callers should parse those queries
+        themselves.
+        """
+
+        results: List[Optional[SqlParsingResult]] = [None] * len(tasks)
+        if self._broken or not tasks:
+            return results
+
+        # Identical queries only need to be parsed once per batch.
+        unique_tasks: Dict[SqlParsingTask, List[int]] = {}
+        for i, task in enumerate(tasks):
+            unique_tasks.setdefault(task, []).append(i)
+
+        task_list = []
+        for task, indexes in unique_tasks.items():
+            cached = (
+                self._parse_cache.get(
+                    task.query,
+                    self._schema_resolver,
+                    task.default_db,
+                    task.default_schema,
+                )
+                if self._parse_cache is not None
+                else None
+            )
+            if cached is not None:
+                for i in indexes:
+                    results[i] = cached
+            else:
+                task_list.append(task)
+        if not task_list:
+            return results
+
+        num_chunks = self._max_workers * _CHUNKS_PER_WORKER
+        chunk_size = max(1, -(-len(task_list) // num_chunks))
+        chunks = [
+            task_list[i : i + chunk_size] for i in range(0, len(task_list), chunk_size)
+        ]
+
+        try:
+            executor = self._get_executor()
+            futures = [
+                executor.submit(_parse_in_worker, chunk, self._extra_schemas)
+                for chunk in chunks
+            ]
+        except concurrent.futures.BrokenExecutor as e:
+            logger.warning(
+                f"SQL parsing worker pool is broken, falling back to serial parsing: {e}"
+            )
+            self._broken = True
+            return results
+
+        for chunk, future in zip(chunks, futures):
+            try:
+                chunk_results = future.result()
+            except Exception as e:
+                logger.debug(
+                    f"Failed to parse {len(chunk)} queries in a worker: {e}",
+                    exc_info=e,
+                )
+                continue
+
+            for task, (parsed, tables, unresolved_urns) in zip(chunk, chunk_results):
+                if self._learn_missing_schemas(unresolved_urns):
+                    continue
+                for i in unique_tasks[task]:
+                    results[i] = parsed
+                if self._parse_cache is not None:
+                    self._parse_cache.put(
+                        task.query,
+                        self._schema_resolver.platform,
+                        task.default_db,
+                        task.default_schema,
+                        parsed,
+                        tables,
+                    )
+
+        return results
+
+    def _learn_missing_schemas(self, unresolved_urns: List[str]) -> bool:
+        found_any = False
+        for urn in unresolved_urns:
+            schema_info = self._schema_resolver._resolve_schema_info(urn)
+            if schema_info is not None:
+                self._extra_schemas[urn] = schema_info
+                found_any = True
+        return found_any
+
+    def _shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def close(self) -> None:
+        self._shutdown()
@@ -1,7 +1,9 @@
+import collections
 import contextlib
 import dataclasses
 import enum
 import functools
+import itertools
 import json
 import logging
 import os
@@ -10,7 +12,18 @@ import tempfile
 import uuid
 from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Callable, Dict, Iterable, List, Optional, Set, Union, cast
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    OrderedDict,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import datahub.emitter.mce_builder as builder
 import datahub.metadata.schema_classes as models
@@ -32,11 +45,17 @@ from datahub.metadata.urns import (
     SchemaFieldUrn,
     Urn,
 )
+from datahub.sql_parsing._parallel_parsing import ParallelSqlParser, SqlParsingTask
 from datahub.sql_parsing.schema_resolver import (
     SchemaResolver,
     SchemaResolverInterface,
     _SchemaResolverWithExtras,
 )
+from datahub.sql_parsing.sql_parsing_cache import (
+    DEFAULT_SQL_PARSING_CACHE_MAX_ENTRIES,
+    SqlParsingCache,
+    SqlParsingCacheReport,
+)
 from datahub.sql_parsing.sql_parsing_common import QueryType, QueryTypeProps
 from datahub.sql_parsing.sqlglot_lineage import (
     ColumnLineageInfo,
@@ -61,6 +80,7 @@ from datahub.utilities.cooperative_timeout import CooperativeTimeoutError
 from datahub.utilities.file_backed_collections import (
     ConnectionWrapper,
     FileBackedDict,
+    FileBackedDictEvictionPolicy,
     FileBackedList,
 )
 from datahub.utilities.groupby import groupby_unsorted
@@ -84,7 +104,26 @@ _MISSING_SESSION_ID = "__MISSING_SESSION_ID"
 _DEFAULT_QUERY_LOG_SETTING = QueryLogSetting[
     os.getenv("DATAHUB_SQL_AGG_QUERY_LOG") or QueryLogSetting.DISABLED.name
 ]
+# If set, parsing results are cached in this directory across ingestion runs.
+_DEFAULT_PARSE_CACHE_DIR: Optional[pathlib.Path] = (
+    pathlib.Path(os.environ["DATAHUB_SQL_AGG_PARSE_CACHE_DIR"])
+    if os.getenv("DATAHUB_SQL_AGG_PARSE_CACHE_DIR")
+    else None
+)
+_PARSE_CACHE_MAX_ENTRIES = int(
+    os.getenv("DATAHUB_SQL_AGG_PARSE_CACHE_MAX_ENTRIES")
+    or DEFAULT_SQL_PARSING_CACHE_MAX_ENTRIES
+)
 MAX_UPSTREAM_TABLES_COUNT = 300
+# When parsing in parallel, observed queries are buffered and handed to the worker
+# pool in batches of this size.
+_PARALLEL_SQL_PARSING_BATCH_SIZE = 5000
+# Queries that only differ in their literals have the same lineage, so we only
+# parse one of them. This bounds the number of parsing results we keep around
+# for that. Set to 0 to disable this deduplication.
+_PARSE_DEDUP_CACHE_SIZE = int(
+    os.getenv("DATAHUB_SQL_AGG_PARSE_DEDUP_CACHE_SIZE") or 10_000
+)
 MAX_FINEGRAINEDLINEAGE_COUNT = 2000
 
 
@@ -113,6 +152,16 @@ class ObservedQuery:
     extra_info: Optional[dict] = None
 
 
+_ParseDedupKey = Tuple[str, Optional[str], Optional[str]]
+
+
+@dataclasses.dataclass
+class _PendingObservedQuery:
+    observed: ObservedQuery
+    is_known_temp_table: bool
+    require_out_table_schema: bool
+
+
 @dataclasses.dataclass
 class ViewDefinition:
     view_definition: str
@@ -252,12 +301,16 @@ class SqlAggregatorReport(Report):
 
     # SQL parsing (over all invocations).
     num_sql_parsed: int = 0
+    num_sql_parsed_in_workers: int = 0
+    num_sql_parsed_deduplicated: int = 0
     sql_parsing_timer: PerfTimer = dataclasses.field(default_factory=PerfTimer)
     sql_fingerprinting_timer: PerfTimer = dataclasses.field(default_factory=PerfTimer)
     sql_formatting_timer: PerfTimer = dataclasses.field(default_factory=PerfTimer)
     sql_parsing_cache_stats: Optional[dict] = dataclasses.field(default=None)
     parse_statement_cache_stats: Optional[dict] = dataclasses.field(default=None)
     format_query_cache_stats: Optional[dict] = dataclasses.field(default=None)
+    sql_parsing_persistent_cache: Optional[SqlParsingCacheReport] = None
+    file_backed_cache_stats: Optional[Dict[str, dict]] = dataclasses.field(default=None)
 
     # Other lineage loading metrics.
     num_known_query_lineage: int = 0
@@ -316,6 +369,16 @@ class SqlAggregatorReport(Report):
         self.sql_parsing_cache_stats = _sqlglot_lineage_cached.cache_info()._asdict()
         self.parse_statement_cache_stats = _parse_statement.cache_info()._asdict()
         self.format_query_cache_stats = try_format_query.cache_info()._asdict()
+        file_backed_dicts: List[FileBackedDict] = [
+            self._aggregator._query_map,
+            self._aggregator._lineage_map,
+            self._aggregator._view_definitions,
+            self._aggregator._temp_lineage_map,
+        ]
+        self.file_backed_cache_stats = {
+            file_backed_dict.tablename: dataclasses.asdict(file_backed_dict.cache_stats)
+            for file_backed_dict in file_backed_dicts
+        }
 
         return super().compute_stats()
 
@@ -341,6 +404,8 @@ class SqlParsingAggregator(Closeable):
         is_allowed_table: Optional[Callable[[str], bool]] = None,
         format_queries: bool = True,
         query_log: QueryLogSetting = _DEFAULT_QUERY_LOG_SETTING,
+        sql_parsing_workers: int = 1,
+        parse_cache_dir: Optional[pathlib.Path] = _DEFAULT_PARSE_CACHE_DIR,
     ) -> None:
         self.platform = DataPlatformUrn(platform)
         self.platform_instance = platform_instance
@@ -409,6 +474,36 @@ class SqlParsingAggregator(Closeable):
             base_resolver=self._schema_resolver, extra_schemas={}
         )
 
+        # Optionally, reuse parsing results from previous runs.
+        self._parse_cache: Optional[SqlParsingCache] = None
+        if parse_cache_dir is not None:
+            self._parse_cache = SqlParsingCache.open(
+                parse_cache_dir / f"sql_parse_cache_{self.platform.platform_name}.db",
+                max_entries=_PARSE_CACHE_MAX_ENTRIES,
+            )
+            if self._parse_cache is not None:
+                self._exit_stack.push(self._parse_cache)
+                self.report.sql_parsing_persistent_cache = self._parse_cache.report
+
+        # Optionally, parse queries in a pool of worker processes. Observed queries
+        # are buffered so that they can be parsed in batches, but their results are
+        # still applied in the order that the queries were added.
+        self._parallel_parser: Optional[ParallelSqlParser] = None
+        self._pending_observed_queries: List[_PendingObservedQuery] = []
+        if sql_parsing_workers > 1:
+            self._parallel_parser = self._exit_stack.enter_context(
+                ParallelSqlParser(
+                    self._schema_resolver,
+                    max_workers=sql_parsing_workers,
+                    parse_cache=self._parse_cache,
+                )
+            )
+
+        # Maps (tokenized fingerprint, default db, default schema) to parsing results.
+        self._parse_results_by_fingerprint: OrderedDict[
+            _ParseDedupKey, SqlParsingResult
+        ] = collections.OrderedDict()
+
         # Initialize internal data structures.
         # This leans pretty heavily on the our query fingerprinting capabilities.
         # In particular, it must be true that if two queries have the same fingerprint,
@@ -433,14 +528,20 @@ class SqlParsingAggregator(Closeable):
         self._exit_stack.push(self._logged_queries)
 
         # Map of query_id -> QueryMetadata
+        # The lineage generation passes sweep over the query and lineage maps while
+        # repeatedly looking up a few hot entries, so they use a scan-resistant cache.
         self._query_map = FileBackedDict[QueryMetadata](
-            shared_connection=self._shared_connection, tablename="query_map"
+            shared_connection=self._shared_connection,
+            tablename="query_map",
+            cache_eviction_policy=FileBackedDictEvictionPolicy.SEGMENTED_LRU,
         )
         self._exit_stack.push(self._query_map)
 
         # Map of downstream urn -> { query ids }
         self._lineage_map = FileBackedDict[OrderedSet[QueryId]](
-            shared_connection=self._shared_connection, tablename="lineage_map"
+            shared_connection=self._shared_connection,
+            tablename="lineage_map",
+            cache_eviction_policy=FileBackedDictEvictionPolicy.SEGMENTED_LRU,
         )
         self._exit_stack.push(self._lineage_map)
 
@@ -500,6 +601,8 @@ class SqlParsingAggregator(Closeable):
         self.report.tool_meta_report = self._tool_meta_extractor.report
 
     def close(self) -> None:
+        self._flush_pending_observed_queries()
+
         # Compute stats once before closing connections
         self.report.compute_stats()
         self._closed = True
@@ -524,7 +627,10 @@ class SqlParsingAggregator(Closeable):
         # logic that we previously needed in each source
 
         if self._need_schemas:
+            # Pending queries must not see schemas registered after they were added.
+            self._flush_pending_observed_queries()
             self._schema_resolver.add_schema_metadata(str(urn), schema)
+            self._parse_results_by_fingerprint.clear()
 
     def register_schemas_from_stream(
         self, stream: Iterable[MetadataWorkUnit]
@@ -621,6 +727,7 @@ class SqlParsingAggregator(Closeable):
                 for the query ID.
         """
 
+        self._flush_pending_observed_queries()
         self.report.num_known_query_lineage += 1
 
         # Generate a fingerprint for the query.
@@ -680,6 +787,7 @@ class SqlParsingAggregator(Closeable):
         logger.debug(
             f"Adding lineage to the map, downstream: {downstream_urn}, upstream: {upstream_urn}"
         )
+        self._flush_pending_observed_queries()
         self.report.num_known_mapping_lineage += 1
 
         # We generate a fake "query" object to hold the lineage.
@@ -771,6 +879,90 @@ class SqlParsingAggregator(Closeable):
         """
         self.report.num_observed_queries += 1
 
+        if self._parallel_parser is not None:
+            self._pending_observed_queries.append(
+                _PendingObservedQuery(
+                    observed=observed,
+                    is_known_temp_table=is_known_temp_table,
+                    require_out_table_schema=require_out_table_schema,
+                )
+            )
+            if len(self._pending_observed_queries) >= _PARALLEL_SQL_PARSING_BATCH_SIZE:
+                self._flush_pending_observed_queries()
+            return
+
+        self._add_observed_query(
+            observed,
+            is_known_temp_table=is_known_temp_table,
+            require_out_table_schema=require_out_table_schema,
+        )
+
+    def _flush_pending_observed_queries(self) -> None:
+        if not self._pending_observed_queries:
+            return
+        assert self._parallel_parser is not None
+
+        pending = self._pending_observed_queries
+        self._pending_observed_queries = []
+
+        # Only send one query per fingerprint to the workers. Queries with an
+        # already known fingerprint are handled by _run_sql_parser instead.
+        keys = [
+            self._parse_dedup_key(
+                item.observed.query,
+                item.observed.default_db,
+                item.observed.default_schema,
+            )
+            for item in pending
+        ]
+        tasks: List[SqlParsingTask] = []
+        task_indexes: List[Optional[int]] = []
+        task_index_by_key: Dict[_ParseDedupKey, int] = {}
+        for key, item in zip(keys, pending):
+            if key is not None and key in self._parse_results_by_fingerprint:
+                task_indexes.append(None)
+            elif key is not None and key in task_index_by_key:
+                task_indexes.append(task_index_by_key[key])
+            else:
+                if key is not None:
+                    task_index_by_key[key] = len(tasks)
+                task_indexes.append(len(tasks))
+                tasks.append(
+                    SqlParsingTask(
+                        query=item.observed.query,
+                        default_db=item.observed.default_db,
+                        default_schema=item.observed.default_schema,
+                    )
+                )
+        worker_results = self._parse_in_workers(tasks)
+
+        for key, item, task_index in zip(keys, pending, task_indexes):
+            worker_result = (
+                worker_results[task_index] if task_index is not None else None
+            )
+            self._add_observed_query(
+                item.observed,
+                is_known_temp_table=item.is_known_temp_table,
+                require_out_table_schema=item.require_out_table_schema,
+                worker_result=worker_result,
+                dedup_key=key,
+            )
+
+    def _parse_in_workers(
+        self, tasks: List[SqlParsingTask]
+    ) -> List[Optional[SqlParsingResult]]:
+        assert self._parallel_parser is not None
+        with self.report.sql_parsing_timer:
+            return self._parallel_parser.parse(tasks)
+
+    def _add_observed_query(
+        self,
+        observed: ObservedQuery,
+        is_known_temp_table: bool,
+        require_out_table_schema: bool,
+        worker_result: Optional[SqlParsingResult] = None,
+        dedup_key: Optional[_ParseDedupKey] = None,
+    ) -> None:
         # All queries with no session ID are assumed to be part of the same session.
         session_id = observed.session_id or _MISSING_SESSION_ID
 
@@ -781,6 +973,12 @@ class SqlParsingAggregator(Closeable):
             )
             session_has_temp_tables = schema_resolver.includes_temp_tables()
 
+        if worker_result is not None and not self._is_base_schema_resolver(
+            schema_resolver
+        ):
+            # The workers don't know about this session's temp tables.
+            worker_result = None
+
         # Run the SQL parser.
         parsed = self._run_sql_parser(
             observed.query,
@@ -790,6 +988,8 @@ class SqlParsingAggregator(Closeable):
             session_id=session_id,
             timestamp=observed.timestamp,
             user=observed.user,
+            worker_result=worker_result,
+            dedup_key=dedup_key,
         )
         if parsed.debug_info.error:
             self.report.observed_query_parse_failures.append(
@@ -843,6 +1043,7 @@ class SqlParsingAggregator(Closeable):
         self._tool_meta_extractor.extract_bi_metadata(parsed)
 
         if not _is_internal:
+            self._flush_pending_observed_queries()
             self.report.num_preparsed_queries += 1
 
         if parsed.timestamp:
@@ -1063,8 +1264,21 @@ class SqlParsingAggregator(Closeable):
 
         return schema_resolver
 
+    def _is_base_schema_resolver(
+        self, schema_resolver: SchemaResolverInterface
+    ) -> bool:
+        # Whether resolving tables with this resolver is equivalent to using the
+        # base schema resolver, which is what the parsing workers use.
+        return schema_resolver is self._schema_resolver or (
+            schema_resolver is self._missing_session_schema_resolver
+            and not self._missing_session_schema_resolver._extra_schemas
+        )
+
     def _process_view_definition(
-        self, view_urn: UrnStr, view_definition: ViewDefinition
+        self,
+        view_urn: UrnStr,
+        view_definition: ViewDefinition,
+        worker_result: Optional[SqlParsingResult] = None,
     ) -> None:
         # Note that in some cases, the view definition will be a SELECT statement
         # instead of a CREATE VIEW ... AS SELECT statement. In those cases, we can't
@@ -1076,6 +1290,7 @@ class SqlParsingAggregator(Closeable):
             default_db=view_definition.default_db,
             default_schema=view_definition.default_schema,
             schema_resolver=self._schema_resolver,
+            worker_result=worker_result,
         )
         if parsed.debug_info.error:
             self.report.views_parse_failures[view_urn] = (
@@ -1114,6 +1329,19 @@ class SqlParsingAggregator(Closeable):
         # Register the query's lineage.
         self._lineage_map.for_mutation(view_urn, OrderedSet()).add(query_fingerprint)
 
+    def _parse_dedup_key(
+        self, query: str, default_db: Optional[str], default_schema: Optional[str]
+    ) -> Optional[_ParseDedupKey]:
+        if _PARSE_DEDUP_CACHE_SIZE <= 0:
+            return None
+        # The tokenized fingerprint is cheap to compute, and queries that share it
+        # are guaranteed to also share their regular fingerprint and lineage.
+        with self.report.sql_fingerprinting_timer:
+            fingerprint = get_query_fingerprint(
+                query, platform=self.platform.platform_name, tokenized=True
+            )
+        return (fingerprint, default_db, default_schema)
+
     def _run_sql_parser(
         self,
         query: str,
@@ -1123,16 +1351,54 @@ class SqlParsingAggregator(Closeable):
         session_id: str = _MISSING_SESSION_ID,
         timestamp: Optional[datetime] = None,
         user: Optional[Union[CorpUserUrn, CorpGroupUrn]] = None,
+        worker_result: Optional[SqlParsingResult] = None,
+        dedup_key: Optional[_ParseDedupKey] = None,
     ) -> SqlParsingResult:
-        with self.report.sql_parsing_timer:
-            parsed = sqlglot_lineage(
-                query,
-                schema_resolver=schema_resolver,
-                default_db=default_db,
-                default_schema=default_schema,
-            )
+        # Results can only be shared between queries that resolve tables the same way.
+        if not self._is_base_schema_resolver(schema_resolver):
+            dedup_key = None
+        elif dedup_key is None:
+            dedup_key = self._parse_dedup_key(query, default_db, default_schema)
+        deduplicated = (
+            self._parse_results_by_fingerprint.get(dedup_key)
+            if dedup_key is not None
+            else None
+        )
+
+        if worker_result is not None:
+            # Already parsed by the worker pool.
+            parsed = worker_result
+            self.report.num_sql_parsed_in_workers += 1
+        elif deduplicated is not None:
+            # A query with the same fingerprint was already parsed.
+            parsed = deduplicated
+            self.report.num_sql_parsed_deduplicated += 1
+        else:
+            with self.report.sql_parsing_timer:
+                if self._parse_cache is not None:
+                    parsed = self._parse_cache.parse(
+                        query,
+                        schema_resolver=schema_resolver,
+                        default_db=default_db,
+                        default_schema=default_schema,
+                    )
+                else:
+                    parsed = sqlglot_lineage(
+                        query,
+                        schema_resolver=schema_resolver,
+                        default_db=default_db,
+                        default_schema=default_schema,
+                    )
         self.report.num_sql_parsed += 1
 
+        if dedup_key is not None:
+            if deduplicated is None:
+                self._parse_results_by_fingerprint[dedup_key] = parsed
+                if len(self._parse_results_by_fingerprint) > _PARSE_DEDUP_CACHE_SIZE:
+                    self._parse_results_by_fingerprint.popitem(last=False)
+            else:
+                self._parse_results_by_fingerprint.move_to_end(dedup_key)
+
         # Conditionally log the query.
         if self.query_log == QueryLogSetting.STORE_ALL or (
             self.query_log == QueryLogSetting.STORE_FAILED and parsed.debug_info.error
@@ -1203,6 +1469,7 @@ class SqlParsingAggregator(Closeable):
             self._query_map[query_fingerprint] = new
 
     def gen_metadata(self) -> Iterable[MetadataChangeProposalWrapper]:
+        self._flush_pending_observed_queries()
         queries_generated: Set[QueryId] = set()
 
         yield from self._gen_lineage_mcps(queries_generated)
@@ -1220,8 +1487,7 @@ class SqlParsingAggregator(Closeable):
         # Process all views and inject them into the lineage map.
         # The parsing of view definitions is deferred until this point
         # to ensure the availability of all schema metadata.
-        for view_urn, view_definition in self._view_definitions.items():
-            self._process_view_definition(view_urn, view_definition)
+        self._process_view_definitions()
         self._view_definitions.clear()
 
         # Generate lineage and queries.
@@ -1230,6 +1496,37 @@ class SqlParsingAggregator(Closeable):
                 downstream_urn, queries_generated=queries_generated
             )
 
+    def _process_view_definitions(self) -> None:
+        if self._parallel_parser is None:
+            for view_urn, view_definition in self._view_definitions.items():
+                self._process_view_definition(view_urn, view_definition)
+            return
+
+        view_definitions = iter(self._view_definitions.items())
+        while True:
+            batch = list(
+                itertools.islice(view_definitions, _PARALLEL_SQL_PARSING_BATCH_SIZE)
+            )
+            if not batch:
+                break
+
+            worker_results = self._parse_in_workers(
+                [
+                    SqlParsingTask(
+                        query=view_definition.view_definition,
+                        default_db=view_definition.default_db,
+                        default_schema=view_definition.default_schema,
+                    )
+                    for _, view_definition in batch
+                ]
+            )
+            for (view_urn, view_definition), worker_result in zip(
+                batch, worker_results
+            ):
+                self._process_view_definition(
+                    view_urn, view_definition, worker_result=worker_result
+                )
+
     @classmethod
     def _query_type_precedence(cls, query_type: str) -> int:
         query_precedence = [
@@ -0,0 +1,265 @@
+"""A persistent cache of SQL parsing results, which can be reused across ingestion runs.
+
+Entries are keyed by the query text, platform, and default db/schema. Since the
+parsed lineage also depends on the schemas of the referenced tables, each entry
+records how every table was resolved while parsing. An entry is only reused if
+all of those tables still resolve to the same urns and schemas.
+"""
+
+import dataclasses
+import json
+import logging
+import pathlib
+import sqlite3
+import time
+from typing import Dict, List, Optional, Tuple
+
+import sqlglot
+
+from datahub._version import __version__
+from datahub.ingestion.api.closeable import Closeable
+from datahub.ingestion.api.report import Report
+from datahub.sql_parsing._models import _TableName
+from datahub.sql_parsing.schema_resolver import SchemaInfo, SchemaResolverInterface
+from datahub.sql_parsing.sqlglot_lineage import (
+    SqlParsingResult,
+    _sqlglot_lineage_nocache,
+)
+from datahub.sql_parsing.sqlglot_utils import generate_hash
+from datahub.utilities.file_backed_collections import ConnectionWrapper, FileBackedDict
+
+logger = logging.getLogger(__name__)
+
+# Bump this when the structure of cache entries changes.
+_CACHE_FORMAT_VERSION = 1
+_CACHE_TABLE_NAME = "sql_parse_cache"
+DEFAULT_SQL_PARSING_CACHE_MAX_ENTRIES = 250_000
+
+# (table name, resolved urn, hash of the resolved schema)
+TableDependency = Tuple[_TableName, str, Optional[str]]
+
+
+@dataclasses.dataclass
+class SqlParsingCacheReport(Report):
+    num_hits: int = 0
+    num_misses: int = 0
+    num_invalidated: int = 0
+    num_writes: int = 0
+    num_evicted: int = 0
+
+
+@dataclasses.dataclass
+class _CachedParse:
+    result: SqlParsingResult
+    tables: List[TableDependency]
+    last_used: int
+
+
+def _hash_schema_info(schema_info: Optional[SchemaInfo]) -> Optional[str]:
+    if schema_info is None:
+        return None
+    # Column order matters, e.g. for expanding `SELECT *`.
+    return generate_hash(json.dumps(list(schema_info.items())))
+
+
+class _RecordingSchemaResolver(SchemaResolverInterface):
+    def __init__(self, base_resolver: SchemaResolverInterface):
+        self._base_resolver = base_resolver
+        self.tables: Dict[_TableName, Tuple[str, Optional[str]]] = {}
+
+    @property
+    def platform(self) -> str:
+        return self._base_resolver.platform
+
+    def includes_temp_tables(self) -> bool:
+        return self._base_resolver.includes_temp_tables()
+
+    def resolve_table(self, table: _TableName) -> Tuple[str, Optional[SchemaInfo]]:
+        urn, schema_info = self._base_resolver.resolve_table(table)
+        self.tables[table] = (urn, _hash_schema_info(schema_info))
+        return urn, schema_info
+
+
+def parse_with_table_dependencies(
+    query: str,
+    schema_resolver: SchemaResolverInterface,
+    default_db: Optional[str],
+    default_schema: Optional[str],
+) -> Tuple[SqlParsingResult, List[TableDependency]]:
+    """Parses a query, also returning how each referenced table was resolved."""
+
+    recorder = _RecordingSchemaResolver(schema_resolver)
+    parsed = _sqlglot_lineage_nocache(
+        query,
+        schema_resolver=recorder,
+        default_db=default_db,
+        default_schema=default_schema,
+    )
+    return parsed, [
+        (table, urn, schema_hash)
+        for table, (urn, schema_hash) in recorder.tables.items()
+    ]
+
+
+class SqlParsingCache(Closeable):
+    """A sqlite-backed cache of parsing results.
+
+    The cache is bounded by max_entries. When closed, the least recently used
+    entries beyond that bound are evicted.
+
+    Like other FileBackedDict-based files, the cache can only be opened by a
+    single connection at a time. Use open() to gracefully handle that case.
+    """
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        max_entries: int = DEFAULT_SQL_PARSING_CACHE_MAX_ENTRIES,
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.report = SqlParsingCacheReport()
+
+        self._run_timestamp = int(time.time())
+        self._conn = ConnectionWrapper(filename=path)
+        try:
+            self._entries = FileBackedDict[_CachedParse](
+                shared_connection=self._conn,
+                tablename=_CACHE_TABLE_NAME,
+                extra_columns={"last_used": lambda entry: entry.last_used},
+            )
+        except Exception:
+            self._conn.close()
+            raise
+
+    @classmethod
+    def open(
+        cls,
+        path: pathlib.Path,
+        max_entries: int = DEFAULT_SQL_PARSING_CACHE_MAX_ENTRIES,
+    ) -> Optional["SqlParsingCache"]:
+        """Opens the cache, or returns None if it's locked or unreadable."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            return cls(path, max_entries=max_entries)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(
+                f"Unable to open the SQL parsing cache at {path}, so it will not be used: {e}"
+            )
+            return None
+
+    @classmethod
+    def _make_key(
+        cls,
+        query: str,
+        platform: str,
+        default_db: Optional[str],
+        default_schema: Optional[str],
+    ) -> str:
+        return generate_hash(
+            json.dumps(
+                [
+                    _CACHE_FORMAT_VERSION,
+                    # Parsing behavior can change across versions.
+                    __version__,
+                    sqlglot.__version__,
+                    platform,
+                    default_db,
+                    default_schema,
+                    query,
+                ]
+            )
+        )
+
+    def get(
+        self,
+        query: str,
+        schema_resolver: SchemaResolverInterface,
+        default_db: Optional[str],
+        default_schema: Optional[str],
+    ) -> Optional[SqlParsingResult]:
+        key = self._make_key(
+            query, schema_resolver.platform, default_db, default_schema
+        )
+        try:
+            entry = self._entries.get(key)
+        except Exception as e:
+            # e.g. entries that were pickled with incompatible classes.
+            logger.debug(f"Failed to load SQL parsing cache entry: {e}", exc_info=e)
+            entry = None
+        if entry is None:
+            self.report.num_misses += 1
+            return None
+
+        for table, urn, schema_hash in entry.tables:
+            current_urn, schema_info = schema_resolver.resolve_table(table)
+            if current_urn != urn or _hash_schema_info(schema_info) != schema_hash:
+                self.report.num_misses += 1
+                self.report.num_invalidated += 1
+                return None
+
+        self.report.num_hits += 1
+        if entry.last_used != self._run_timestamp:
+            entry.last_used = self._run_timestamp
+            self._entries.mark_dirty(key)
+        return entry.result
+
+    def put(
+        self,
+        query: str,
+        platform: str,
+        default_db: Optional[str],
+        default_schema: Optional[str],
+        result: SqlParsingResult,
+        tables: List[TableDependency],
+    ) -> None:
+        if result.debug_info.error:
+            # Errors include timeouts, which aren't deterministic. They also
+            # aren't guaranteed to survive a round-trip through pickle.
+            return
+
+        key = self._make_key(query, platform, default_db, default_schema)
+        self._entries[key] = _CachedParse(
+            result=result, tables=tables, last_used=self._run_timestamp
+        )
+        self.report.num_writes += 1
+
+    def parse(
+        self,
+        query: str,
+        schema_resolver: SchemaResolverInterface,
+        default_db: Optional[str],
+        default_schema: Optional[str],
+    ) -> SqlParsingResult:
+        """Returns the cached result for the query, parsing it on a cache miss."""
+        parsed = self.get(query, schema_resolver, default_db, default_schema)
+        if parsed is None:
+            parsed, tables = parse_with_table_dependencies(
+                query, schema_resolver, default_db, default_schema
+            )
+            self.put(
+                query,
+                schema_resolver.platform,
+                default_db,
+                default_schema,
+                parsed,
+                tables,
+            )
+        return parsed
+
+    def close(self) -> None:
+        if self._conn is None:
+            return
+
+        self._entries.flush()
+        cursor = self._conn.execute(
+            f"""DELETE FROM {_CACHE_TABLE_NAME} WHERE key IN (
+                SELECT key FROM {_CACHE_TABLE_NAME}
+                ORDER BY last_used DESC, rowid DESC
+                LIMIT -1 OFFSET ?
+            )""",
+            (self.max_entries,),
+        )
+        self.report.num_evicted += cursor.rowcount
+        self._conn.close()
+        self._conn = None  # type: ignore
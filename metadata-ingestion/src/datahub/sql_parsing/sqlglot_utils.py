@@ -4,11 +4,12 @@ import functools
 import hashlib
 import logging
 import re
-from typing import Dict, Iterable, Optional, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 import sqlglot
 import sqlglot.errors
 import sqlglot.optimizer.eliminate_ctes
+from sqlglot.tokens import Token, TokenType
 
 assert SQLGLOT_PATCHED
 
@@ -251,20 +252,197 @@ def generalize_query(expression: sqlglot.exp.ExpOrStr, dialect: DialectOrStr) ->
     return expression.transform(_strip_expression, copy=True).sql(dialect=dialect)
 
 
+_LITERAL_TOKEN_TYPES = {
+    TokenType.NUMBER,
+    TokenType.STRING,
+    TokenType.NATIONAL_STRING,
+    TokenType.BIT_STRING,
+    TokenType.HEX_STRING,
+    TokenType.BYTE_STRING,
+    TokenType.RAW_STRING,
+    TokenType.UNICODE_STRING,
+}
+# Keywords that can't be used as unquoted identifiers, so normalizing their
+# casing can't merge queries that reference different columns.
+_RESERVED_KEYWORD_TOKEN_TYPES = {
+    TokenType.ALIAS,
+    TokenType.ALL,
+    TokenType.AND,
+    TokenType.BETWEEN,
+    TokenType.CASE,
+    TokenType.CREATE,
+    TokenType.CROSS,
+    TokenType.DELETE,
+    TokenType.DISTINCT,
+    TokenType.ELSE,
+    TokenType.END,
+    TokenType.EXCEPT,
+    TokenType.FALSE,
+    TokenType.FROM,
+    TokenType.FULL,
+    TokenType.GROUP_BY,
+    TokenType.HAVING,
+    TokenType.ILIKE,
+    TokenType.IN,
+    TokenType.INNER,
+    TokenType.INSERT,
+    TokenType.INTERSECT,
+    TokenType.INTO,
+    TokenType.IS,
+    TokenType.JOIN,
+    TokenType.LIKE,
+    TokenType.LIMIT,
+    TokenType.MERGE,
+    TokenType.NOT,
+    TokenType.NULL,
+    TokenType.ON,
+    TokenType.OR,
+    TokenType.ORDER_BY,
+    TokenType.OUTER,
+    TokenType.SELECT,
+    TokenType.SET,
+    TokenType.THEN,
+    TokenType.TRUE,
+    TokenType.UNION,
+    TokenType.UPDATE,
+    TokenType.USING,
+    TokenType.VALUES,
+    TokenType.WHEN,
+    TokenType.WHERE,
+    TokenType.WITH,
+}
+_NO_SPACE_BEFORE_TOKEN_TYPES = {
+    TokenType.R_PAREN,
+    TokenType.COMMA,
+    TokenType.DOT,
+    TokenType.SEMICOLON,
+}
+_NO_SPACE_AFTER_TOKEN_TYPES = {TokenType.L_PAREN, TokenType.DOT}
+
+
+def _collapse_literal_tuple(tokens: List[Token], start: int) -> Optional[int]:
+    """If tokens[start] opens a tuple that only contains literals, returns the
+    index just past its closing paren."""
+
+    i = start + 1
+    expect_literal = True
+    while i < len(tokens):
+        token_type = tokens[i].token_type
+        if expect_literal and token_type in _LITERAL_TOKEN_TYPES:
+            expect_literal = False
+        elif not expect_literal and token_type == TokenType.COMMA:
+            expect_literal = True
+        elif not expect_literal and token_type == TokenType.R_PAREN:
+            return i + 1
+        else:
+            return None
+        i += 1
+    return None
+
+
+def generalize_query_tokenized(
+    expression: sqlglot.exp.ExpOrStr, dialect: DialectOrStr
+) -> str:
+    """Variant of `generalize_query` that works on the token stream.
+
+    This avoids building and regenerating an AST, which makes it much cheaper than
+    `generalize_query` while being more precise than `generalize_query_fast`.
+    It strips comments, normalizes whitespace and the casing of reserved keywords,
+    replaces literals with placeholders, and collapses IN lists and VALUES tuples
+    that only contain literals.
+
+    The output is not identical to `generalize_query`, but it is at least as
+    specific: two queries with the same tokenized generalization will also have the
+    same `generalize_query` output. That makes it suitable for deduplicating queries
+    before parsing them.
+
+    Args:
+        expression: The SQL query to generalize.
+        dialect: The SQL dialect to use.
+
+    Returns:
+        The generalized SQL query.
+    """
+
+    dialect = get_dialect(dialect)
+    if isinstance(expression, sqlglot.exp.Expression):
+        expression = expression.sql(dialect=dialect)
+    tokens = dialect.tokenize(expression)
+    while tokens and tokens[-1].token_type == TokenType.SEMICOLON:
+        tokens.pop()
+
+    parts: List[str] = []
+    prev: Optional[Token] = None
+    # Whether we're in a comma-separated list of collapsed VALUES tuples.
+    in_values = False
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        token_type = token.token_type
+
+        collapse_end = None
+        if token_type == TokenType.L_PAREN and prev is not None:
+            if prev.token_type in {TokenType.IN, TokenType.VALUES} or (
+                prev.token_type == TokenType.COMMA and in_values
+            ):
+                collapse_end = _collapse_literal_tuple(tokens, i)
+
+        if collapse_end is not None:
+            text = "(?)"
+            in_values = prev is not None and prev.token_type != TokenType.IN
+            token = tokens[collapse_end - 1]
+            i = collapse_end
+        else:
+            in_values = in_values and token_type == TokenType.COMMA
+            if token_type in _LITERAL_TOKEN_TYPES and not (
+                # Some dialects allow aliases to be quoted like strings, and interval
+                # strings like '1 day' are parsed into a value and a unit.
+                prev is not None
+                and prev.token_type in {TokenType.ALIAS, TokenType.INTERVAL}
+            ):
+                text = "?"
+            elif token_type == TokenType.IDENTIFIER:
+                text = '"' + token.text.replace('"', '""') + '"'
+            elif token_type in _LITERAL_TOKEN_TYPES:
+                text = "'" + token.text.replace("'", "''") + "'"
+            elif token_type in _RESERVED_KEYWORD_TOKEN_TYPES:
+                # Multi-word keywords like GROUP BY are a single token.
+                text = " ".join(token.text.upper().split())
+            else:
+                text = token.text
+            i += 1
+
+        if parts and (
+            token_type in _NO_SPACE_BEFORE_TOKEN_TYPES
+            or (prev is not None and prev.token_type in _NO_SPACE_AFTER_TOKEN_TYPES)
+        ):
+            parts[-1] += text
+        else:
+            parts.append(text)
+        prev = token
+
+    return " ".join(parts)
+
+
 def generate_hash(text: str) -> str:
     # Once we move to Python 3.9+, we can set `usedforsecurity=False`.
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
 def get_query_fingerprint_debug(
-    expression: sqlglot.exp.ExpOrStr, platform: DialectOrStr, fast: bool = False
+    expression: sqlglot.exp.ExpOrStr,
+    platform: DialectOrStr,
+    fast: bool = False,
+    tokenized: bool = False,
 ) -> Tuple[str, Optional[str]]:
     try:
-        if not fast:
+        if fast:
+            expression_sql = generalize_query_fast(expression, dialect=platform)
+        elif tokenized:
+            expression_sql = generalize_query_tokenized(expression, dialect=platform)
+        else:
             dialect = get_dialect(platform)
             expression_sql = generalize_query(expression, dialect=dialect)
-        else:
-            expression_sql = generalize_query_fast(expression, dialect=platform)
     except (ValueError, sqlglot.errors.SqlglotError) as e:
         if not isinstance(expression, str):
             raise
@@ -281,7 +459,10 @@ def get_query_fingerprint_debug(
 
 
 def get_query_fingerprint(
-    expression: sqlglot.exp.ExpOrStr, platform: DialectOrStr, fast: bool = False
+    expression: sqlglot.exp.ExpOrStr,
+    platform: DialectOrStr,
+    fast: bool = False,
+    tokenized: bool = False,
 ) -> str:
     """Get a fingerprint for a SQL query.
 
@@ -298,12 +479,18 @@ def get_query_fingerprint(
     Args:
         expression: The SQL query to fingerprint.
         platform: The SQL dialect to use.
+        fast: If True, use the regex-based `generalize_query_fast`.
+        tokenized: If True, use the token-based `generalize_query_tokenized`.
+            These fingerprints are cheaper to compute but differ from the default
+            ones, so they should not be mixed with them.
 
     Returns:
         The fingerprint for the SQL query.
     """
 
-    return get_query_fingerprint_debug(expression, platform, fast=fast)[0]
+    return get_query_fingerprint_debug(
+        expression, platform, fast=fast, tokenized=tokenized
+    )[0]
 
 
 @functools.lru_cache(maxsize=FORMAT_QUERY_CACHE_SIZE)
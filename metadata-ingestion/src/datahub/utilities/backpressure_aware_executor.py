@@ -1,8 +1,19 @@
 from __future__ import annotations
 
+import collections
 import concurrent.futures
 from concurrent.futures import Future, ThreadPoolExecutor
-from typing import Any, Callable, Iterable, Iterator, Optional, Set, Tuple, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 _R = TypeVar("_R")
 
@@ -76,3 +87,43 @@ class BackpressureAwareExecutor:
                 yield future
 
             assert not pending_futures
+
+    @classmethod
+    def map_ordered(
+        cls,
+        fn: Callable[..., _R],
+        args_list: Iterable[Tuple[Any, ...]],
+        max_workers: int,
+        max_pending: Optional[int] = None,
+    ) -> Iterator[Future[_R]]:
+        """Like `map`, but yields the futures in the order of `args_list`.
+
+        Each future is yielded once it is done. Because results are yielded in order,
+        a slow task holds back the tasks that were submitted after it, and at most
+        `max_pending` tasks are submitted ahead of the one the consumer is waiting for.
+        """
+
+        if max_pending is None:
+            max_pending = 2 * max_workers
+        assert max_pending >= max_workers
+
+        pending_futures: Deque[Future] = collections.deque()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                for args in args_list:
+                    if len(pending_futures) >= max_pending:
+                        future = pending_futures.popleft()
+                        concurrent.futures.wait([future])
+                        yield future
+
+                    pending_futures.append(executor.submit(fn, *args))
+
+                while pending_futures:
+                    future = pending_futures.popleft()
+                    concurrent.futures.wait([future])
+                    yield future
+            finally:
+                # Don't run the remaining tasks if the consumer stopped early.
+                for future in pending_futures:
+                    future.cancel()
@@ -0,0 +1,99 @@
+"""A thin JSON serialization layer that can use orjson instead of the stdlib.
+
+The stdlib json module remains the default and the reference implementation:
+unless orjson is requested with DATAHUB_JSON_BACKEND=orjson, every function here
+produces exactly the same output as the corresponding json call.
+
+When orjson is used, the output is not necessarily byte-identical. Non-ASCII
+characters are written as UTF-8 instead of being escaped, floats may use a
+slightly different textual representation, and NaN / Infinity floats are written
+as null instead of as non-standard literals. Anything orjson refuses to handle
+(e.g. integers larger than 64 bits, lone surrogates, NaN / Infinity literals when
+decoding) falls back to the stdlib.
+"""
+
+import json
+import logging
+import os
+import re
+from typing import IO, Any, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+_JSON_BACKEND_ENV_VARIABLE = "DATAHUB_JSON_BACKEND"
+_STDLIB_BACKEND = "stdlib"
+_ORJSON_BACKEND = "orjson"
+
+_LEADING_INDENT_RE = re.compile(r"^( +)", re.MULTILINE)
+
+
+def _load_orjson() -> Optional[Any]:
+    requested = os.getenv(_JSON_BACKEND_ENV_VARIABLE, _STDLIB_BACKEND).lower()
+    if requested != _ORJSON_BACKEND:
+        return None
+
+    try:
+        import orjson
+
+        return orjson
+    except ImportError:
+        logger.warning(
+            f"{_JSON_BACKEND_ENV_VARIABLE}={_ORJSON_BACKEND} was requested, but orjson "
+            "is not installed. Falling back to the stdlib json module."
+        )
+        return None
+
+
+_orjson = _load_orjson()
+
+
+def get_json_backend() -> str:
+    """Returns the name of the JSON backend that is currently in use."""
+    return _ORJSON_BACKEND if _orjson is not None else _STDLIB_BACKEND
+
+
+def dumps(obj: Any, indent: Optional[int] = None) -> str:
+    """Serializes obj to a JSON string. Equivalent to json.dumps(obj, indent=indent)."""
+    if _orjson is not None:
+        try:
+            if not indent:
+                return _orjson.dumps(obj).decode()
+
+            # orjson only supports two-space indentation. Since newlines within
+            # strings are always escaped, every leading run of spaces is structural
+            # and can be safely rescaled to the requested indent.
+            serialized = _orjson.dumps(obj, option=_orjson.OPT_INDENT_2).decode()
+            if indent != 2:
+                serialized = _LEADING_INDENT_RE.sub(
+                    lambda m: " " * (len(m.group(1)) // 2 * indent), serialized
+                )
+            return serialized
+        except _orjson.JSONEncodeError:
+            # Fall through to the stdlib, which either handles the object or raises
+            # the same error that callers would have seen without orjson.
+            pass
+
+    return json.dumps(obj, indent=indent)
+
+
+def dump(obj: Any, fp: IO[str], indent: Optional[int] = None) -> None:
+    """Serializes obj to a file. Equivalent to json.dump(obj, fp, indent=indent)."""
+    fp.write(dumps(obj, indent=indent))
+
+
+def loads(s: Union[str, bytes]) -> Any:
+    """Deserializes a JSON document. Equivalent to json.loads(s)."""
+    if _orjson is not None:
+        try:
+            return _orjson.loads(s)
+        except _orjson.JSONDecodeError:
+            # The stdlib accepts some non-standard inputs (e.g. NaN) that orjson
+            # rejects. If the document is truly invalid, this raises as before.
+            pass
+
+    return json.loads(s)
+
+
+def load(fp: IO[Any]) -> Any:
+    """Deserializes a JSON document from a file. Equivalent to json.load(fp)."""
+    return loads(fp.read())
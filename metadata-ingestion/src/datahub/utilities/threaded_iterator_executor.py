@@ -1,9 +1,12 @@
+import collections
 import concurrent.futures
 import contextlib
 import queue
+import threading
 from typing import (
     Any,
     Callable,
+    Deque,
     Iterable,
     Iterator,
     Optional,
@@ -61,3 +64,81 @@ class ThreadedIteratorExecutor:
         # Yield the remaining work units. This theoretically should not happen, but adding it just in case.
         while not out_q.empty():
             yield out_q.get_nowait()
+
+    @classmethod
+    def process_ordered(
+        cls,
+        worker_func: Callable[..., Iterable[T]],
+        args_list: Iterable[Tuple[Any, ...]],
+        max_workers: int,
+        max_backpressure: Optional[int] = None,
+    ) -> Iterator[T]:
+        """
+        Like `process`, but yields the items in the order of `args_list`, so that the
+        output is the same as calling `worker_func` sequentially.
+
+        The items of each task are yielded as soon as all earlier tasks are done.
+        Until then, they are buffered in memory, up to `max_backpressure` items per
+        task, after which the task waits. At most `max_workers` tasks are started
+        ahead of the one being yielded. Exceptions raised by a worker are re-raised
+        once the items it produced before failing have been yielded.
+        """
+
+        if max_backpressure is None:
+            max_backpressure = 10 * max_workers
+
+        done = object()
+        stopped = threading.Event()
+
+        def _put(out_q: "queue.Queue[Any]", item: Any) -> bool:
+            # Waits for the consumer to catch up, unless it stopped.
+            while not stopped.is_set():
+                with contextlib.suppress(queue.Full):
+                    out_q.put(item, timeout=0.2)
+                    return True
+            return False
+
+        def _worker_wrapper(
+            out_q: "queue.Queue[Any]",
+            worker_func: Callable[..., Iterable[T]],
+            *args: Any,
+        ) -> None:
+            try:
+                for item in worker_func(*args):
+                    if not _put(out_q, item):
+                        return
+            finally:
+                _put(out_q, done)
+
+        def _get_items(
+            task: Tuple["queue.Queue[Any]", concurrent.futures.Future],
+        ) -> Iterator[T]:
+            out_q, future = task
+            while True:
+                item = out_q.get()
+                if item is done:
+                    break
+                yield item
+            future.result()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            tasks: Deque[Tuple["queue.Queue[Any]", concurrent.futures.Future]] = (
+                collections.deque()
+            )
+            try:
+                for args in args_list:
+                    if len(tasks) >= max_workers:
+                        yield from _get_items(tasks.popleft())
+
+                    out_q: "queue.Queue[Any]" = queue.Queue(maxsize=max_backpressure)
+                    future = executor.submit(_worker_wrapper, out_q, worker_func, *args)
+                    tasks.append((out_q, future))
+
+                while tasks:
+                    yield from _get_items(tasks.popleft())
+            finally:
+                # If the consumer stopped early, the running tasks stop at their next
+                # item, and the remaining ones don't start.
+                stopped.set()
+                for _, future in tasks:
+                    future.cancel()
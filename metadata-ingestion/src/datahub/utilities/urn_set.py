@@ -0,0 +1,171 @@
+import itertools
+import os
+import sys
+import weakref
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from datahub.ingestion.api.closeable import Closeable
+from datahub.utilities.file_backed_collections import ConnectionWrapper
+
+# Beyond this many urns, a UrnSet moves its contents to a sqlite database on disk.
+DEFAULT_MAX_IN_MEMORY_URNS = int(
+    os.environ.get("DATAHUB_URN_SET_MAX_IN_MEMORY_URNS") or 1_000_000
+)
+
+# SQLite versions before 3.32 limit a statement to 999 parameters.
+_BATCH_SIZE = 500
+_WRITE_BATCH_SIZE = 10_000
+
+
+class UrnSet(Closeable):
+    """An insertion-ordered set of urns that spills to disk when it gets large.
+
+    While small, urns are kept in a dict. They are interned, so that tracking the same
+    urn in several sets, or alongside the work units that mention it, doesn't store
+    multiple copies of the string. Once the set holds more than max_in_memory_urns urns,
+    they are moved to a temporary sqlite database, and further urns are written there
+    in batches.
+
+    Set differences are computed in a streaming fashion, by looking up batches of urns
+    in the other set, so neither side needs to be loaded into memory.
+    """
+
+    def __init__(
+        self,
+        urns: Optional[Iterable[str]] = None,
+        max_in_memory_urns: int = DEFAULT_MAX_IN_MEMORY_URNS,
+    ):
+        self.max_in_memory_urns = max_in_memory_urns
+
+        # Before spilling, this holds all urns. Afterwards, it buffers the urns that
+        # haven't been written to the database yet.
+        self._urns: Dict[str, None] = {}
+        self._conn: Optional[ConnectionWrapper] = None
+        self._finalizer: Optional[weakref.finalize] = None
+        self._num_spilled = 0
+
+        if urns is not None:
+            self.update(urns)
+
+    @property
+    def is_spilled(self) -> bool:
+        return self._conn is not None
+
+    def add(self, urn: str) -> None:
+        if self._conn is None:
+            self._urns[sys.intern(urn)] = None
+            if len(self._urns) > self.max_in_memory_urns:
+                self._spill()
+        else:
+            self._urns[urn] = None
+            if len(self._urns) >= _WRITE_BATCH_SIZE:
+                self._flush()
+
+    def update(self, urns: Iterable[str]) -> None:
+        for urn in urns:
+            self.add(urn)
+
+    def _spill(self) -> None:
+        self._conn = ConnectionWrapper()
+        # Sets are often dropped without being closed, e.g. along with a checkpoint
+        # state, so the database is also removed once the set is garbage collected,
+        # or when the interpreter exits.
+        self._finalizer = weakref.finalize(self, self._conn.close)
+        # The id column keeps the insertion order.
+        self._conn.execute(
+            "CREATE TABLE urns (id INTEGER PRIMARY KEY, urn TEXT UNIQUE)"
+        )
+        self._flush()
+
+    def _flush(self) -> None:
+        if self._conn is None or not self._urns:
+            return
+        # Urns that were already written are ignored, so they keep their position.
+        cursor = self._conn.executemany(
+            "INSERT OR IGNORE INTO urns (urn) VALUES (?)",
+            [(urn,) for urn in self._urns],
+        )
+        self._num_spilled += cursor.rowcount
+        self._urns = {}
+
+    def __contains__(self, urn: object) -> bool:
+        if urn in self._urns:
+            return True
+        if self._conn is None:
+            return False
+        return (
+            self._conn.fetchone("SELECT 1 FROM urns WHERE urn = ?", (urn,)) is not None
+        )
+
+    def __len__(self) -> int:
+        self._flush()
+        return self._num_spilled + len(self._urns)
+
+    def _query(self, sql: str, parameters: Iterable[str] = ()) -> Iterator[str]:
+        assert self._conn is not None
+        self._flush()
+        for row in self._conn.execute(sql, tuple(parameters)):
+            yield row[0]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterates over the urns in insertion order."""
+        if self._conn is None:
+            return iter(self._urns)
+        return self._query("SELECT urn FROM urns ORDER BY id")
+
+    def iter_sorted(self) -> Iterator[str]:
+        if self._conn is None:
+            return iter(sorted(self._urns))
+        # SQLite compares text by its UTF-8 bytes, which matches Python's ordering.
+        return self._query("SELECT urn FROM urns ORDER BY urn")
+
+    def _find_existing(self, urns: List[str]) -> Set[str]:
+        if self._conn is None:
+            return {urn for urn in urns if urn in self._urns}
+        placeholders = ",".join("?" * len(urns))
+        return set(
+            self._query(f"SELECT urn FROM urns WHERE urn IN ({placeholders})", urns)
+        )
+
+    def difference(self, other: "UrnSet", sort: bool = False) -> Iterator[str]:
+        """Yields the urns in this set that are not in other.
+
+        The urns are yielded in insertion order, or sorted if sort is set.
+        """
+
+        urns = self.iter_sorted() if sort else iter(self)
+        while True:
+            batch = list(itertools.islice(urns, _BATCH_SIZE))
+            if not batch:
+                break
+            existing = other._find_existing(batch)
+            yield from (urn for urn in batch if urn not in existing)
+
+    def count_contained(self, urns: Iterable[str]) -> int:
+        """Returns how many of the given urns are in this set."""
+
+        urns = iter(urns)
+        count = 0
+        while True:
+            batch = list(itertools.islice(urns, _BATCH_SIZE))
+            if not batch:
+                break
+            count += len(self._find_existing(batch))
+        return count
+
+    def __eq__(self, other: object) -> bool:
+        # Like sets, UrnSets are equal if they contain the same urns, in any order.
+        if not isinstance(other, UrnSet):
+            return NotImplemented
+        return len(self) == len(other) and other.count_contained(self) == len(self)
+
+    def close(self) -> None:
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
+        self._conn = None
+        self._urns = {}
+        self._num_spilled = 0
+
+    def __repr__(self) -> str:
+        return f"UrnSet(len={len(self)}, spilled={self.is_spilled})"
@@ -1,7 +1,8 @@
 import functools
+import os
 import urllib.parse
 from abc import abstractmethod
-from typing import ClassVar, Dict, List, Optional, Type, Union
+from typing import Any, ClassVar, Dict, List, Optional, Type, Union
 
 from deprecated import deprecated
 from typing_extensions import Self
@@ -11,6 +12,9 @@ from datahub.utilities.urns.error import InvalidUrnError
 
 URN_TYPES: Dict[str, Type["_SpecificUrn"]] = {}
 
+# The number of parsed urns that Urn.from_string keeps around for reuse.
+_URN_PARSE_CACHE_SIZE = int(os.environ.get("DATAHUB_URN_PARSE_CACHE_SIZE") or 2**15)
+
 
 def _split_entity_id(entity_id: str) -> List[str]:
     if not (entity_id.startswith("(") and entity_id.endswith(")")):
@@ -111,6 +115,9 @@ class Urn:
 
         Raises:
             InvalidUrnError: If the string representation is in invalid format.
+
+        Recently parsed urns are cached, so parsing the same string again returns
+        the same Urn object. Urn objects must not be modified.
         """
 
         if isinstance(urn_str, Urn):
@@ -124,43 +131,20 @@ class Urn:
             # Fall through, so that we can convert a generic Urn to a specific Urn type.
             urn_str = urn_str.urn()
 
-        # TODO: Add handling for url encoded urns e.g. urn%3A ...
+        urn = _parse_urn(urn_str)
+        if isinstance(urn, cls):
+            return urn
 
-        if not urn_str.startswith("urn:li:"):
+        if type(urn) is Urn:
             raise InvalidUrnError(
-                f"Invalid urn string: {urn_str}. Urns should start with 'urn:li:'"
+                f"Unknown urn type {urn.entity_type} for urn {urn_str} of type {cls}"
             )
-
-        parts: List[str] = urn_str.split(":", maxsplit=3)
-        if len(parts) != 4:
-            raise InvalidUrnError(
-                f"Invalid urn string: {urn_str}. Expect 4 parts from urn string but found {len(parts)}"
-            )
-        if "" in parts:
-            raise InvalidUrnError(
-                f"Invalid urn string: {urn_str}. There should not be empty parts in urn string."
-            )
-
-        _urn, _li, entity_type, entity_ids_str = parts
-        entity_ids = _split_entity_id(entity_ids_str)
-
-        UrnCls: Optional[Type["_SpecificUrn"]] = URN_TYPES.get(entity_type)
-        if UrnCls:
-            if not issubclass(UrnCls, cls):
-                # We want to return a specific subtype of Urn. If we're called
-                # with Urn.from_string(), that's fine. However, if we're called as
-                # DatasetUrn.from_string('urn:li:corpuser:foo'), that should throw an error.
-                raise InvalidUrnError(
-                    f"Passed an urn of type {entity_type} to the from_string method of {cls.__name__}. Use Urn.from_string() or {UrnCls.__name__}.from_string() instead."
-                )
-            return UrnCls._parse_ids(entity_ids)  # type: ignore
-
-        # Fallback for unknown types.
-        if cls != Urn:
-            raise InvalidUrnError(
-                f"Unknown urn type {entity_type} for urn {urn_str} of type {cls}"
-            )
-        return cls(entity_type, entity_ids)
+        # We want to return a specific subtype of Urn. If we're called
+        # with Urn.from_string(), that's fine. However, if we're called as
+        # DatasetUrn.from_string('urn:li:corpuser:foo'), that should throw an error.
+        raise InvalidUrnError(
+            f"Passed an urn of type {urn.entity_type} to the from_string method of {cls.__name__}. Use Urn.from_string() or {type(urn).__name__}.from_string() instead."
+        )
 
     def urn(self) -> str:
         """Get the string representation of the urn."""
@@ -270,6 +254,52 @@ class Urn:
         return form
 
 
+@functools.lru_cache(maxsize=_URN_PARSE_CACHE_SIZE)
+def _parse_urn(urn_str: str) -> Urn:
+    # Parses the urn into the most specific Urn type available.
+
+    # TODO: Add handling for url encoded urns e.g. urn%3A ...
+
+    if not urn_str.startswith("urn:li:"):
+        raise InvalidUrnError(
+            f"Invalid urn string: {urn_str}. Urns should start with 'urn:li:'"
+        )
+
+    parts: List[str] = urn_str.split(":", maxsplit=3)
+    if len(parts) != 4:
+        raise InvalidUrnError(
+            f"Invalid urn string: {urn_str}. Expect 4 parts from urn string but found {len(parts)}"
+        )
+    if "" in parts:
+        raise InvalidUrnError(
+            f"Invalid urn string: {urn_str}. There should not be empty parts in urn string."
+        )
+
+    _urn, _li, entity_type, entity_ids_str = parts
+    entity_ids = _split_entity_id(entity_ids_str)
+
+    UrnCls: Optional[Type["_SpecificUrn"]] = URN_TYPES.get(entity_type)
+    if UrnCls:
+        return UrnCls._parse_ids(entity_ids)
+
+    # Fallback for unknown types.
+    return Urn(entity_type, entity_ids)
+
+
+def get_urn_parse_cache_info() -> Dict[str, Any]:
+    """Returns statistics about the cache used by Urn.from_string."""
+
+    info = _parse_urn.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_rate": round(info.hits / lookups, 3) if lookups else None,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+    }
+
+
 class _SpecificUrn(Urn):
     ENTITY_TYPE: ClassVar[str] = ""
 
@@ -152,8 +152,12 @@ def lowercase_dataset_urns(
             return lowercase_dataset_urn(urn)
         elif guess_entity_type(urn) == "schemaField":
             cur_urn = Urn.from_string(urn)
-            cur_urn._entity_ids[0] = lowercase_dataset_urn(cur_urn._entity_ids[0])
-            return str(cur_urn)
+            # Parsed urns are shared, so we build a new one instead of modifying it.
+            new_urn = Urn(
+                cur_urn.entity_type,
+                [lowercase_dataset_urn(cur_urn.entity_ids[0]), *cur_urn.entity_ids[1:]],
+            )
+            return str(new_urn)
         return urn
 
     transform_urns(model, modify_urn)
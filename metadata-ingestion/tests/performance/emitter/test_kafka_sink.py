@@ -0,0 +1,120 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, List, Optional
+from unittest import mock
+
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.api.common import PipelineContext, RecordEnvelope
+from datahub.ingestion.api.sink import NoopWriteCallback
+from datahub.ingestion.sink.datahub_kafka import DatahubKafkaSink
+from datahub.metadata.schema_classes import StatusClass
+from datahub.utilities.perf_timer import PerfTimer
+
+# The simulated time for a request to the broker.
+_ROUND_TRIP_SECONDS = 0.002
+
+
+class _StubMessage:
+    def __init__(self, value: bytes, produced_at: float):
+        self._value = value
+        self._produced_at = produced_at
+
+    def value(self) -> bytes:
+        return self._value
+
+    def latency(self) -> float:
+        return time.perf_counter() - self._produced_at
+
+
+class _StubProducer:
+    """Stands in for a SerializingProducer talking to a remote broker.
+
+    Every request to the broker costs a round trip. Messages are sent in one request
+    when the producer is flushed, or when it's polled after linger.ms has passed.
+    """
+
+    def __init__(self, config: dict):
+        self._linger_seconds = config.get("linger.ms", 5) / 1000
+        self._lock = threading.Lock()
+        self._pending: List[Callable[[], None]] = []
+        self._first_pending_at: Optional[float] = None
+
+    def produce(self, topic: str, key: str, value: Any, on_delivery: Callable) -> None:
+        message = _StubMessage(f"{key}:{topic}".encode(), time.perf_counter())
+        with self._lock:
+            if self._first_pending_at is None:
+                self._first_pending_at = time.perf_counter()
+            self._pending.append(lambda: on_delivery(None, message))
+
+    def _send(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._first_pending_at = None
+        if pending:
+            time.sleep(_ROUND_TRIP_SECONDS)
+        for deliver in pending:
+            deliver()
+
+    def poll(self, timeout: float) -> int:
+        first_pending_at = self._first_pending_at
+        if (
+            first_pending_at is not None
+            and time.perf_counter() - first_pending_at >= self._linger_seconds
+        ):
+            self._send()
+        return 0
+
+    def flush(self) -> int:
+        self._send()
+        return 0
+
+
+def _run_sink(mcps: List[MetadataChangeProposalWrapper], high_throughput: bool) -> None:
+    with mock.patch(
+        "datahub.emitter.kafka_emitter.SerializingProducer", _StubProducer
+    ), mock.patch("datahub.emitter.kafka_emitter.SchemaRegistryClient"), mock.patch(
+        "datahub.emitter.kafka_emitter.AvroSerializer"
+    ):
+        sink = DatahubKafkaSink.create(
+            {
+                "connection": {"bootstrap": "localhost:9092"},
+                "high_throughput": high_throughput,
+            },
+            PipelineContext(run_id="kafka-sink-benchmark"),
+        )
+
+        with PerfTimer() as timer:
+            for mcp in mcps:
+                sink.write_record_async(
+                    RecordEnvelope(record=mcp, metadata={}), NoopWriteCallback()
+                )
+                sink.handle_work_unit_end(mock.Mock())
+            sink.close()
+
+    report = sink.get_report()
+    assert report.messages_delivered == len(mcps)
+    report.compute_stats()
+    logging.info(
+        f"high_throughput={high_throughput}: "
+        f"{len(mcps) / timer.elapsed_seconds():.0f} MCPs/second, "
+        f"max delivery latency {report.max_delivery_latency_seconds} seconds"
+    )
+
+
+def run_test() -> None:
+    N = 2000
+    mcps = [
+        MetadataChangeProposalWrapper(
+            entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:snowflake,db.schema.table_{i},PROD)",
+            aspect=StatusClass(removed=False),
+        )
+        for i in range(N)
+    ]
+    _run_sink(mcps, high_throughput=False)
+    _run_sink(mcps, high_throughput=True)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run_test()
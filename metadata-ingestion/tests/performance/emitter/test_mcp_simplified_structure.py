@@ -0,0 +1,39 @@
+import json
+import logging
+from typing import List
+
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.sink.file import _to_obj_for_file
+from datahub.utilities.perf_timer import PerfTimer
+from tests.performance.emitter.test_rest_emitter_serialization import _make_mcps
+
+
+def _legacy_to_obj(mcp: MetadataChangeProposalWrapper) -> dict:
+    # The previous implementation, which encoded the aspect into a JSON string
+    # and decoded it again.
+    obj = mcp.make_mcp().to_obj()
+    obj["aspect"] = {"json": json.loads(obj["aspect"]["value"])}
+    return obj
+
+
+def run_test() -> None:
+    N = 10000
+    mcps: List[MetadataChangeProposalWrapper] = _make_mcps(N // 2)
+
+    with PerfTimer() as legacy_timer:
+        legacy_output = [json.dumps(_legacy_to_obj(mcp)) for mcp in mcps]
+    legacy_rate = len(mcps) / legacy_timer.elapsed_seconds()
+
+    with PerfTimer() as timer:
+        output = [json.dumps(_to_obj_for_file(mcp)) for mcp in mcps]
+    rate = len(mcps) / timer.elapsed_seconds()
+
+    assert output == legacy_output
+    logging.info(f"Legacy JSON string round trip: {legacy_rate:.0f} MCPs/second")
+    logging.info(f"Direct serialization: {rate:.0f} MCPs/second")
+    logging.info(f"Speedup: {rate / legacy_rate:.2f}x")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run_test()
@@ -0,0 +1,93 @@
+import json
+import logging
+from typing import List
+from unittest import mock
+
+from datahub.cli.cli_utils import ensure_has_system_metadata
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.emitter.rest_emitter import DataHubRestEmitter
+from datahub.emitter.serialization_helper import pre_json_transform
+from datahub.metadata.schema_classes import (
+    DatasetPropertiesClass,
+    NumberTypeClass,
+    OtherSchemaClass,
+    SchemaFieldClass,
+    SchemaFieldDataTypeClass,
+    SchemaMetadataClass,
+)
+from datahub.utilities.perf_timer import PerfTimer
+
+
+def _make_mcps(n: int) -> List[MetadataChangeProposalWrapper]:
+    mcps: List[MetadataChangeProposalWrapper] = []
+    for i in range(n):
+        urn = f"urn:li:dataset:(urn:li:dataPlatform:snowflake,db.schema.table_{i},PROD)"
+        mcps.append(
+            MetadataChangeProposalWrapper(
+                entityUrn=urn,
+                aspect=DatasetPropertiesClass(
+                    name=f"table_{i}",
+                    description="A table used for benchmarking " * 5,
+                    customProperties={f"key_{j}": f"value_{j}" for j in range(10)},
+                ),
+            )
+        )
+        mcps.append(
+            MetadataChangeProposalWrapper(
+                entityUrn=urn,
+                aspect=SchemaMetadataClass(
+                    schemaName=f"table_{i}",
+                    platform="urn:li:dataPlatform:snowflake",
+                    version=0,
+                    hash="",
+                    platformSchema=OtherSchemaClass(rawSchema=""),
+                    fields=[
+                        SchemaFieldClass(
+                            fieldPath=f"column_{j}",
+                            type=SchemaFieldDataTypeClass(type=NumberTypeClass()),
+                            nativeDataType="NUMBER(38,0)",
+                        )
+                        for j in range(30)
+                    ],
+                ),
+            )
+        )
+    return mcps
+
+
+def _legacy_restli_payloads(mcps: List[MetadataChangeProposalWrapper]) -> int:
+    # The previous implementation, which serialized every MCP twice.
+    mcp_objs = [pre_json_transform(mcp.to_obj()) for mcp in mcps]
+    total_bytes = 0
+    for mcp_obj in mcp_objs:
+        total_bytes += len(json.dumps(mcp_obj))
+    payload = json.dumps({"proposals": mcp_objs})
+    return total_bytes + len(payload)
+
+
+def run_test() -> None:
+    N = 5000
+    mcps = _make_mcps(N // 2)
+    for mcp in mcps:
+        ensure_has_system_metadata(mcp)
+
+    emitter = DataHubRestEmitter("http://fakegmshost:8080", openapi_ingestion=False)
+
+    with PerfTimer() as legacy_timer:
+        for i in range(0, len(mcps), 100):
+            _legacy_restli_payloads(mcps[i : i + 100])
+    legacy_rate = len(mcps) / legacy_timer.elapsed_seconds()
+
+    with mock.patch.object(emitter, "_emit_generic"), PerfTimer() as timer:
+        for i in range(0, len(mcps), 100):
+            emitter.emit_mcps(mcps[i : i + 100])
+    rate = len(mcps) / timer.elapsed_seconds()
+
+    logging.info(f"Legacy double serialization: {legacy_rate:.0f} MCPs/second")
+    logging.info(f"Single serialization: {rate:.0f} MCPs/second")
+    logging.info(f"Speedup: {rate / legacy_rate:.2f}x")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run_test()
@@ -0,0 +1,113 @@
+import logging
+from typing import List
+
+from datahub.emitter.serialization_helper import (
+    post_json_transform,
+    pre_json_transform,
+)
+from datahub.metadata.schema_classes import (
+    DatasetFieldProfileClass,
+    DatasetProfileClass,
+    GlobalTagsClass,
+    NumberTypeClass,
+    OtherSchemaClass,
+    QuantileClass,
+    SchemaFieldClass,
+    SchemaFieldDataTypeClass,
+    SchemaMetadataClass,
+    StringTypeClass,
+    TagAssociationClass,
+    ValueFrequencyClass,
+    _Aspect,
+)
+from datahub.utilities.perf_timer import PerfTimer
+
+
+def _make_schema_metadata(num_fields: int) -> SchemaMetadataClass:
+    return SchemaMetadataClass(
+        schemaName="table",
+        platform="urn:li:dataPlatform:snowflake",
+        version=0,
+        hash="",
+        platformSchema=OtherSchemaClass(rawSchema=""),
+        fields=[
+            SchemaFieldClass(
+                fieldPath=f"column_{i}",
+                type=SchemaFieldDataTypeClass(
+                    type=NumberTypeClass() if i % 2 else StringTypeClass()
+                ),
+                nativeDataType="NUMBER(38,0)" if i % 2 else "VARCHAR",
+                description=f"Column number {i}" if i % 3 else None,
+                globalTags=GlobalTagsClass(
+                    tags=[TagAssociationClass(tag="urn:li:tag:pii")]
+                )
+                if i % 5 == 0
+                else None,
+            )
+            for i in range(num_fields)
+        ],
+    )
+
+
+def _make_dataset_profile(num_fields: int) -> DatasetProfileClass:
+    return DatasetProfileClass(
+        timestampMillis=0,
+        rowCount=1_000_000,
+        columnCount=num_fields,
+        fieldProfiles=[
+            DatasetFieldProfileClass(
+                fieldPath=f"column_{i}",
+                uniqueCount=100,
+                nullCount=0,
+                min="0",
+                max="100",
+                mean="50",
+                quantiles=[
+                    QuantileClass(quantile=str(q / 10), value=str(q * 10))
+                    for q in range(10)
+                ],
+                distinctValueFrequencies=[
+                    ValueFrequencyClass(value=str(v), frequency=v) for v in range(20)
+                ],
+                sampleValues=[str(v) for v in range(20)],
+            )
+            for i in range(num_fields)
+        ],
+    )
+
+
+def _run(name: str, aspects: List[_Aspect]) -> None:
+    objs = [aspect.to_obj() for aspect in aspects]
+
+    with PerfTimer() as generic_timer:
+        server_objs = [pre_json_transform(obj) for obj in objs]
+        for server_obj in server_objs:
+            post_json_transform(server_obj)
+
+    with PerfTimer() as compiled_timer:
+        compiled_server_objs = [
+            pre_json_transform(obj, schema=aspect.RECORD_SCHEMA)
+            for obj, aspect in zip(objs, aspects)
+        ]
+        for server_obj, aspect in zip(compiled_server_objs, aspects):
+            post_json_transform(server_obj, schema=aspect.RECORD_SCHEMA)
+
+    assert compiled_server_objs == server_objs
+    generic_rate = len(aspects) / generic_timer.elapsed_seconds()
+    compiled_rate = len(aspects) / compiled_timer.elapsed_seconds()
+    logging.info(
+        f"{name}: generic {generic_rate:.0f} aspects/second, "
+        f"schema-compiled {compiled_rate:.0f} aspects/second, "
+        f"speedup {compiled_rate / generic_rate:.2f}x"
+    )
+
+
+def run_test() -> None:
+    N = 200
+    _run("SchemaMetadata", [_make_schema_metadata(500) for _ in range(N)])
+    _run("DatasetProfile", [_make_dataset_profile(200) for _ in range(N)])
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run_test()
@@ -0,0 +1,105 @@
+import itertools
+import logging
+import time
+from typing import Any, Dict
+from unittest import mock
+
+from botocore.endpoint import Endpoint
+from moto import mock_s3
+from moto.core import DEFAULT_ACCOUNT_ID
+from moto.s3.models import s3_backends
+
+from datahub.ingestion.api.common import PipelineContext
+from datahub.ingestion.source.s3.source import S3Source
+from datahub.utilities.perf_timer import PerfTimer
+
+_BUCKET = "benchmark"
+_NUM_TABLES = 300
+_NUM_MONTHS = 12
+_FILES_PER_MONTH = 28  # 300 tables * 12 months * 28 files = 100,800 objects
+
+# The simulated round trip time of a request to S3.
+_ROUND_TRIP_SECONDS = 0.02
+
+_AWS_CONFIG = {
+    "aws_access_key_id": "test",
+    "aws_secret_access_key": "test",
+    "aws_region": "us-east-1",
+}
+
+
+def _populate_bucket() -> int:
+    backend = s3_backends[DEFAULT_ACCOUNT_ID]["global"]
+    backend.create_bucket(_BUCKET, "us-east-1")
+    num_objects = 0
+    for table in range(_NUM_TABLES):
+        for month in range(1, _NUM_MONTHS + 1):
+            for part in range(_FILES_PER_MONTH):
+                # Objects are added to the backend directly, which is a lot faster
+                # than uploading 100k objects through the API.
+                backend.put_object(
+                    _BUCKET,
+                    f"data/table_{table:03d}/year=2024/month={month:02d}/part-{part:03d}.csv",
+                    b"id,name,amount\n1,a,1.5\n2,b,2.5\n",
+                )
+                num_objects += 1
+    return num_objects
+
+
+def _run_source(path_spec: Dict[str, Any], max_workers: int) -> None:
+    source = S3Source.create(
+        config_dict={
+            "path_specs": [path_spec],
+            "aws_config": _AWS_CONFIG,
+            "max_workers": max_workers,
+        },
+        ctx=PipelineContext(run_id="s3-listing-benchmark"),
+    )
+
+    num_requests = itertools.count()
+    make_request = Endpoint.make_request
+
+    def _make_request_with_latency(self: Endpoint, *args: Any, **kwargs: Any) -> Any:
+        next(num_requests)
+        time.sleep(_ROUND_TRIP_SECONDS)
+        return make_request(self, *args, **kwargs)
+
+    with mock.patch.object(
+        Endpoint, "make_request", _make_request_with_latency
+    ), PerfTimer() as timer:
+        num_workunits = sum(1 for _ in source.get_workunits_internal())
+
+    logging.info(
+        f"max_workers={max_workers}: {num_workunits} workunits in "
+        f"{timer.elapsed_seconds(digits=2)} seconds with {next(num_requests)} requests"
+    )
+
+
+def run_test() -> None:
+    with mock_s3():
+        with PerfTimer() as timer:
+            num_objects = _populate_bucket()
+        logging.info(
+            f"Created {num_objects} objects in {timer.elapsed_seconds(digits=2)} seconds"
+        )
+
+        scenarios = {
+            "sampled partitions": {
+                "include": f"s3://{_BUCKET}/data/{{table}}/year={{year}}/month={{month}}/*.csv",
+            },
+            "full listing": {
+                "include": f"s3://{_BUCKET}/data/{{table}}/*/*/*.csv",
+                "sample_files": False,
+            },
+        }
+        for name, path_spec in scenarios.items():
+            logging.info(f"Scenario: {name}")
+            for max_workers in [1, 10]:
+                _run_source(path_spec, max_workers)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    # The source logs every table and folder at the info level.
+    logging.getLogger("datahub.ingestion.source.s3.source").setLevel(logging.WARNING)
+    run_test()
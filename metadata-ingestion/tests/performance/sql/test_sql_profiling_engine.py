@@ -0,0 +1,107 @@
+import logging
+import pathlib
+import random
+import statistics
+import tempfile
+from typing import List, Optional
+
+import sqlalchemy as sa
+
+from datahub.ingestion.source.ge_data_profiler import GEProfilerRequest
+from datahub.ingestion.source.ge_profiling_config import (
+    GEProfilingConfig,
+    ProfilingEngine,
+)
+from datahub.ingestion.source.sql.sql_report import SQLSourceReport
+from datahub.ingestion.source.sql_data_profiler import create_profiler
+from datahub.utilities.perf_timer import PerfTimer
+
+
+class _StdDevSamp:
+    def __init__(self) -> None:
+        self.values: List[float] = []
+
+    def step(self, value: Optional[float]) -> None:
+        if value is not None:
+            self.values.append(value)
+
+    def finalize(self) -> Optional[float]:
+        return statistics.stdev(self.values) if len(self.values) > 1 else None
+
+
+def _make_engine(
+    path: pathlib.Path, num_columns: int, num_rows: int
+) -> sa.engine.Engine:
+    engine = sa.create_engine(f"sqlite:///{path}")
+
+    @sa.event.listens_for(engine, "connect")
+    def _register_stddev(dbapi_connection, connection_record):
+        dbapi_connection.create_aggregate("stddev_samp", 1, _StdDevSamp)
+
+    rng = random.Random(0)
+    columns = [f"c{i}" for i in range(num_columns)]
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE wide ("
+            + ", ".join(
+                f"{column} {'INTEGER' if i % 2 else 'TEXT'}"
+                for i, column in enumerate(columns)
+            )
+            + ")"
+        )
+        conn.execute(
+            sa.text(
+                f"INSERT INTO wide VALUES ({', '.join(':' + column for column in columns)})"
+            ),
+            [
+                {
+                    column: rng.randrange(1000)
+                    if i % 2
+                    else f"value_{rng.randrange(10)}"
+                    for i, column in enumerate(columns)
+                }
+                for _ in range(num_rows)
+            ],
+        )
+    return engine
+
+
+def run_test() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = _make_engine(
+            pathlib.Path(tmp) / "profiling.db", num_columns=50, num_rows=100_000
+        )
+
+        num_queries = 0
+
+        @sa.event.listens_for(engine, "before_cursor_execute")
+        def _count_queries(*args, **kwargs):
+            nonlocal num_queries
+            num_queries += 1
+
+        for engine_name in [ProfilingEngine.SQL, ProfilingEngine.GREAT_EXPECTATIONS]:
+            config = GEProfilingConfig.parse_obj(
+                {"enabled": True, "engine": engine_name.value}
+            )
+            profiler = create_profiler(
+                engine, SQLSourceReport(), config, platform="sqlite"
+            )
+            request = GEProfilerRequest(
+                pretty_name="main.wide",
+                batch_kwargs={"schema": "main", "table": "wide"},
+            )
+
+            num_queries = 0
+            with PerfTimer() as timer:
+                [(_, profile)] = profiler.generate_profiles([request], max_workers=1)
+            assert profile is not None
+
+            logging.info(
+                f"{engine_name.value}: profiled {profile.columnCount} columns in "
+                f"{timer.elapsed_seconds(digits=2)} seconds with {num_queries} queries"
+            )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run_test()
@@ -0,0 +1,76 @@
+import logging
+import sys
+from typing import List
+
+from datahub.ingestion.source.state.checkpoint import (
+    SUPPORTED_CHECKPOINT_SERDES,
+    Checkpoint,
+)
+from datahub.ingestion.source.state.entity_removal_state import GenericCheckpointState
+from datahub.metadata.schema_classes import (
+    DatahubIngestionCheckpointClass,
+    IngestionCheckpointStateClass,
+)
+from datahub.utilities.perf_timer import PerfTimer
+
+DEFAULT_SIZES = [1_000_000, 5_000_000]
+
+
+def _make_state(num_urns: int) -> GenericCheckpointState:
+    state = GenericCheckpointState()
+    for i in range(num_urns):
+        state.add_checkpoint_urn(
+            type="dataset",
+            urn=f"urn:li:dataset:(urn:li:dataPlatform:snowflake,analytics_db_{i % 7}.schema_{i % 113}.table_{i},PROD)",
+        )
+    return state
+
+
+def _run_serde(state: GenericCheckpointState, serde: str) -> None:
+    state.serde = serde
+    with PerfTimer() as timer:
+        payload = state.to_bytes(max_allowed_state_size=2**40)
+    encode_seconds = timer.elapsed_seconds(digits=2)
+
+    checkpoint_aspect = DatahubIngestionCheckpointClass(
+        timestampMillis=0,
+        pipelineName="benchmark",
+        platformInstanceId="",
+        config="",
+        state=IngestionCheckpointStateClass(
+            formatVersion=state.version, serde=serde, payload=payload
+        ),
+        runId="benchmark",
+    )
+    with PerfTimer() as timer:
+        checkpoint = Checkpoint.create_from_checkpoint_aspect(
+            job_name="benchmark",
+            checkpoint_aspect=checkpoint_aspect,
+            state_class=GenericCheckpointState,
+        )
+    decode_seconds = timer.elapsed_seconds(digits=2)
+    assert checkpoint is not None
+    assert checkpoint.state.urns == state.urns
+
+    print(
+        f"{len(state.urns):>10,} urns, {serde:>20}: "
+        f"encode {encode_seconds:>7} s, decode {decode_seconds:>7} s, "
+        f"payload {len(payload) / 1024**2:>8.2f} MiB"
+    )
+
+
+def run_test(sizes: List[int], serdes: List[str]) -> None:
+    for num_urns in sizes:
+        state = _make_state(num_urns)
+        for serde in serdes:
+            _run_serde(state, serde)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    serdes = [serde for serde in SUPPORTED_CHECKPOINT_SERDES if serde != "utf-8"]
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        serdes = [serde for serde in serdes if "zstd" not in serde]
+    run_test([int(size) for size in sys.argv[1:]] or DEFAULT_SIZES, serdes)
@@ -0,0 +1,52 @@
+import logging
+import random
+import sys
+from typing import List
+
+from datahub.utilities.file_backed_collections import FileBackedDict
+from datahub.utilities.perf_timer import PerfTimer
+
+DEFAULT_SIZES = [1_000_000, 10_000_000, 50_000_000]
+NUM_LOOKUPS = 1_000_000
+
+
+def _run_size(num_keys: int) -> None:
+    cache = FileBackedDict[int]()
+    try:
+        with PerfTimer() as timer:
+            for i in range(num_keys):
+                cache[f"key-{i}"] = i
+            cache.flush()
+        set_seconds = timer.elapsed_seconds()
+
+        # Random keys are almost never in the in-memory cache, so every lookup
+        # goes through sqlite.
+        keys = [f"key-{random.randrange(num_keys)}" for _ in range(NUM_LOOKUPS)]
+        with PerfTimer() as timer:
+            for key in keys:
+                cache[key]
+        get_seconds = timer.elapsed_seconds()
+
+        with PerfTimer() as timer:
+            num_items = sum(1 for _ in cache.items_snapshot())
+        iterate_seconds = timer.elapsed_seconds()
+        assert num_items == num_keys
+
+        print(
+            f"{num_keys:>12,} keys: "
+            f"set {num_keys / set_seconds:>10,.0f}/s, "
+            f"get {NUM_LOOKUPS / get_seconds:>10,.0f}/s, "
+            f"iterate {num_items / iterate_seconds:>10,.0f}/s"
+        )
+    finally:
+        cache.close()
+
+
+def run_test(sizes: List[int]) -> None:
+    for num_keys in sizes:
+        _run_size(num_keys)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run_test([int(size) for size in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,54 @@
+import logging
+import random
+from typing import List
+
+from datahub.metadata.urns import Urn
+from datahub.utilities.perf_timer import PerfTimer
+from datahub.utilities.urns._urn_base import _parse_urn, get_urn_parse_cache_info
+
+
+def _make_urn_corpus(num_tables: int, num_lookups: int) -> List[str]:
+    # A lineage-heavy workload, where a small number of popular tables are
+    # referenced much more often than the rest.
+    dataset_urns = [
+        f"urn:li:dataset:(urn:li:dataPlatform:snowflake,analytics.schema_{i % 50}.table_{i},PROD)"
+        for i in range(num_tables)
+    ]
+    urns = dataset_urns + [
+        f"urn:li:schemaField:({dataset_urn},column_{j})"
+        for dataset_urn in dataset_urns[: num_tables // 10]
+        for j in range(10)
+    ]
+    urns += [
+        f"urn:li:dataJob:(urn:li:dataFlow:(airflow,dag_{i % 100},prod),task_{i})"
+        for i in range(num_tables // 10)
+    ]
+
+    rng = random.Random(0)
+    weights = [1 / (rank + 1) for rank in range(len(urns))]
+    return rng.choices(urns, weights=weights, k=num_lookups)
+
+
+def run_test() -> None:
+    corpus = _make_urn_corpus(num_tables=50_000, num_lookups=1_000_000)
+
+    with PerfTimer() as uncached_timer:
+        for urn in corpus:
+            _parse_urn.__wrapped__(urn)
+    uncached_rate = len(corpus) / uncached_timer.elapsed_seconds()
+
+    _parse_urn.cache_clear()
+    with PerfTimer() as cached_timer:
+        for urn in corpus:
+            Urn.from_string(urn)
+    cached_rate = len(corpus) / cached_timer.elapsed_seconds()
+
+    logging.info(f"Uncached: {uncached_rate:.0f} urns/second")
+    logging.info(f"Cached: {cached_rate:.0f} urns/second")
+    logging.info(f"Speedup: {cached_rate / uncached_rate:.2f}x")
+    logging.info(f"Cache stats: {get_urn_parse_cache_info()}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run_test()
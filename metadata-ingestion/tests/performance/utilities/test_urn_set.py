@@ -0,0 +1,68 @@
+import logging
+import sys
+import tracemalloc
+from typing import Callable, Iterable, List
+
+from datahub.utilities.perf_timer import PerfTimer
+from datahub.utilities.urn_set import UrnSet
+
+DEFAULT_SIZES = [1_000_000, 5_000_000, 10_000_000]
+MAX_IN_MEMORY_URNS = 1_000_000
+
+
+def _urns(num_urns: int) -> Iterable[str]:
+    for i in range(num_urns):
+        yield f"urn:li:dataset:(urn:li:dataPlatform:snowflake,db.schema.table_{i},PROD)"
+
+
+def _with_sets(num_urns: int) -> int:
+    # This mirrors how auto_status_aspect used to track urns.
+    all_urns = set()
+    status_urns = set()
+    for i, urn in enumerate(_urns(num_urns)):
+        all_urns.add(urn)
+        if i % 2 == 0:
+            status_urns.add(urn)
+    return sum(1 for _ in sorted(all_urns - status_urns))
+
+
+def _with_urn_sets(num_urns: int) -> int:
+    all_urns = UrnSet(max_in_memory_urns=MAX_IN_MEMORY_URNS)
+    status_urns = UrnSet(max_in_memory_urns=MAX_IN_MEMORY_URNS)
+    try:
+        for i, urn in enumerate(_urns(num_urns)):
+            all_urns.add(urn)
+            if i % 2 == 0:
+                status_urns.add(urn)
+        return sum(1 for _ in all_urns.difference(status_urns, sort=True))
+    finally:
+        all_urns.close()
+        status_urns.close()
+
+
+def _measure(name: str, num_urns: int, func: Callable[[int], int]) -> None:
+    tracemalloc.start()
+    try:
+        with PerfTimer() as timer:
+            num_missing = func(num_urns)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert num_missing == num_urns // 2
+    print(
+        f"{num_urns:>12,} urns, {name:>8}: "
+        f"{timer.elapsed_seconds(digits=2):>8} s, "
+        f"peak {peak_bytes / 1024**2:>10,.1f} MiB"
+    )
+
+
+def run_test(sizes: List[int]) -> None:
+    for num_urns in sizes:
+        _measure("set", num_urns, _with_sets)
+        _measure("UrnSet", num_urns, _with_urn_sets)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run_test([int(size) for size in sys.argv[1:]] or DEFAULT_SIZES)
@@ -7,13 +7,14 @@ from freezegun import freeze_time
 from typing_extensions import Self
 
 from datahub.configuration.common import DynamicTypedConfig
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.committable import CommitPolicy, Committable
-from datahub.ingestion.api.common import RecordEnvelope
+from datahub.ingestion.api.common import EndOfStream, RecordEnvelope
 from datahub.ingestion.api.source import Source, SourceReport
 from datahub.ingestion.api.transform import Transformer
 from datahub.ingestion.api.workunit import MetadataWorkUnit
 from datahub.ingestion.graph.config import DatahubClientConfig
-from datahub.ingestion.run.pipeline import Pipeline, PipelineContext
+from datahub.ingestion.run.pipeline import Pipeline, PipelineContext, PipelineStatus
 from datahub.ingestion.sink.datahub_rest import DatahubRestSink
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import SystemMetadata
 from datahub.metadata.schema_classes import (
@@ -273,6 +274,72 @@ class TestPipeline:
         )
         assert pipeline
 
+    @pytest.mark.parametrize("pipelined_execution", [False, True])
+    @freeze_time(FROZEN_TIME)
+    def test_run_pipelined_execution(self, pipelined_execution):
+        pipeline = Pipeline.create(
+            {
+                "source": {
+                    "type": "tests.unit.api.test_pipeline.FakeSourceWithManyWorkunits"
+                },
+                "transformers": [
+                    {
+                        "type": "tests.unit.api.test_pipeline.AddStatusRemovedTransformer"
+                    },
+                    {"type": "tests.unit.api.test_pipeline.EndOfStreamTransformer"},
+                ],
+                "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+                "run_id": "pipeline_test",
+                "flags": {
+                    "pipelined_execution": pipelined_execution,
+                    "pipelined_execution_queue_size": 2,
+                },
+            }
+        )
+        pipeline.run()
+        pipeline.raise_from_status()
+
+        sink_report = cast(RecordingSinkReport, pipeline.sink.get_report())
+        assert [
+            record_envelope.record.proposedSnapshot.urn
+            if isinstance(record_envelope.record, MetadataChangeEventClass)
+            else record_envelope.record.entityUrn
+            for record_envelope in sink_report.received_records
+        ] == [*FakeSourceWithManyWorkunits.URNS, EndOfStreamTransformer.URN]
+        assert all(
+            get_status_removed_aspect()
+            in record_envelope.record.proposedSnapshot.aspects
+            for record_envelope in sink_report.received_records[:-1]
+        )
+
+        if pipelined_execution:
+            assert pipeline.cli_report.pipeline_stages is not None
+            assert pipeline.cli_report.pipeline_stages["source"].items_processed == len(
+                FakeSourceWithManyWorkunits.URNS
+            )
+            assert pipeline.cli_report.pipeline_stages["sink"].items_processed == (
+                len(FakeSourceWithManyWorkunits.URNS) + 1
+            )
+        else:
+            assert pipeline.cli_report.pipeline_stages is None
+
+    @freeze_time(FROZEN_TIME)
+    def test_run_pipelined_execution_source_error(self):
+        pipeline = Pipeline.create(
+            {
+                "source": {"type": "tests.unit.api.test_pipeline.FakeSourceWithError"},
+                "sink": {"type": "tests.test_helpers.sink_helpers.RecordingSink"},
+                "run_id": "pipeline_test",
+                "flags": {"pipelined_execution": True},
+            }
+        )
+        pipeline.run()
+
+        assert pipeline.final_status == PipelineStatus.ERROR
+        assert pipeline.source.get_report().failures
+        sink_report = cast(RecordingSinkReport, pipeline.sink.get_report())
+        assert len(sink_report.received_records) == 1
+
     @pytest.mark.parametrize(
         "source,strict_warnings,exit_code",
         [
@@ -432,6 +499,27 @@ class AddStatusRemovedTransformer(Transformer):
             yield record_envelope
 
 
+class EndOfStreamTransformer(Transformer):
+    URN = "urn:li:dataset:(urn:li:dataPlatform:test_platform,end_of_stream,PROD)"
+
+    @classmethod
+    def create(cls, config_dict: dict, ctx: PipelineContext) -> "Transformer":
+        return cls()
+
+    def transform(
+        self, record_envelopes: Iterable[RecordEnvelope]
+    ) -> Iterable[RecordEnvelope]:
+        for record_envelope in record_envelopes:
+            if isinstance(record_envelope.record, EndOfStream):
+                yield RecordEnvelope(
+                    record=MetadataChangeProposalWrapper(
+                        entityUrn=self.URN, aspect=get_status_removed_aspect()
+                    ),
+                    metadata={"workunit_id": "end-of-stream"},
+                )
+            yield record_envelope
+
+
 class FakeSource(Source):
     def __init__(self, ctx: PipelineContext):
         super().__init__(ctx)
@@ -455,6 +543,27 @@ class FakeSource(Source):
         pass
 
 
+class FakeSourceWithManyWorkunits(FakeSource):
+    URNS = [
+        f"urn:li:dataset:(urn:li:dataPlatform:test_platform,test_{i},PROD)"
+        for i in range(20)
+    ]
+
+    def __init__(self, ctx: PipelineContext):
+        super().__init__(ctx)
+        self.work_units = []
+        for urn in self.URNS:
+            mce = get_initial_mce()
+            mce.proposedSnapshot.urn = urn
+            self.work_units.append(MetadataWorkUnit(id=urn, mce=mce))
+
+
+class FakeSourceWithError(FakeSource):
+    def get_workunits(self) -> Iterable[MetadataWorkUnit]:
+        yield from self.work_units
+        raise ValueError("source failed")
+
+
 class FakeSourceWithWarnings(FakeSource):
     def __init__(self, ctx: PipelineContext):
         super().__init__(ctx)
@@ -0,0 +1,73 @@
+import threading
+import time
+from typing import Iterable, List
+
+import pytest
+
+from datahub.ingestion.run.pipeline_stage import PipelineStage
+
+
+def test_pipeline_stages_preserve_order() -> None:
+    source = PipelineStage("source", range(100), queue_size=3)
+    doubled = PipelineStage(
+        "double", (i * 2 for i in source), queue_size=3, upstream=source
+    )
+    source.start()
+    doubled.start()
+
+    assert list(doubled) == [i * 2 for i in range(100)]
+    assert source.report.items_processed == 100
+    assert doubled.report.items_processed == 100
+    assert 0 < source.report.peak_queue_depth <= 3
+
+
+def test_pipeline_stage_backpressure() -> None:
+    produced: List[int] = []
+
+    def items() -> Iterable[int]:
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    stage = PipelineStage("source", items(), queue_size=2).start()
+    time.sleep(0.2)
+    # Two items fit into the queue, and the third one waits to be put.
+    assert len(produced) == 3
+
+    assert list(stage) == list(range(10))
+
+
+def test_pipeline_stage_error() -> None:
+    def items() -> Iterable[int]:
+        yield 1
+        yield 2
+        raise ValueError("source failed")
+
+    source = PipelineStage("source", items(), queue_size=10)
+    passthrough = PipelineStage(
+        "passthrough", iter(source), queue_size=10, upstream=source
+    )
+    source.start()
+    passthrough.start()
+
+    results = []
+    with pytest.raises(ValueError, match="source failed"):
+        for item in passthrough:
+            results.append(item)
+    assert results == [1, 2]
+
+
+def test_pipeline_stage_stop() -> None:
+    def items() -> Iterable[int]:
+        i = 0
+        while True:
+            yield i
+            i += 1
+
+    stage = PipelineStage("source", items(), queue_size=1).start()
+    assert next(iter(stage)) == 0
+    stage.stop()
+    assert not any(
+        thread.name == "pipeline-source" and thread.is_alive()
+        for thread in threading.enumerate()
+    )
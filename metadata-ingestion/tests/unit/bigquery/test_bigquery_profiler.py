@@ -1,4 +1,7 @@
 from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, cast
+
+import pydantic
 
 from datahub.ingestion.source.bigquery_v2.bigquery_config import BigQueryV2Config
 from datahub.ingestion.source.bigquery_v2.bigquery_report import BigQueryV2Report
@@ -8,6 +11,18 @@ from datahub.ingestion.source.bigquery_v2.bigquery_schema import (
     PartitionInfo,
 )
 from datahub.ingestion.source.bigquery_v2.profiler import BigqueryProfiler
+from datahub.ingestion.source.ge_data_profiler import GEProfilerRequest
+from datahub.ingestion.source.state.profiling_state import (
+    ProfiledTableState,
+    ProfilingCheckpointState,
+)
+from datahub.ingestion.source.state.profiling_state_handler import ProfilingHandler
+from datahub.metadata.schema_classes import (
+    DatasetFieldProfileClass,
+    DatasetProfileClass,
+    PartitionSpecClass,
+    PartitionTypeClass,
+)
 
 
 def test_not_generate_partition_profiler_query_if_not_partitioned_sharded_table():
@@ -210,3 +225,160 @@ def test_generate_sharded_table_profiler_query():
 
     assert query[0] == "20200101"
     assert query[1] is None
+
+
+class _FakeProfilingHandler:
+    def __init__(self) -> None:
+        self.last_state: Optional[ProfilingCheckpointState] = None
+        self.current_state = ProfilingCheckpointState(last_profiled={})
+
+    def next_run(self) -> None:
+        self.last_state = self.current_state
+        self.current_state = ProfilingCheckpointState(last_profiled={})
+
+    def add_to_state(self, urn: str, profile_time_millis: pydantic.PositiveInt) -> None:
+        self.current_state.last_profiled[urn] = profile_time_millis
+
+    def get_last_profiled(self, urn: str) -> Optional[pydantic.PositiveInt]:
+        return self.last_state.last_profiled.get(urn) if self.last_state else None
+
+    def add_table_state(self, urn: str, table_state: ProfiledTableState) -> None:
+        self.current_state.table_states[urn] = table_state
+
+    def get_last_table_state(self, urn: str) -> Optional[ProfiledTableState]:
+        return self.last_state.table_states.get(urn) if self.last_state else None
+
+
+class _FakeProfiler:
+    def __init__(self, profiles: Dict[str, DatasetProfileClass]) -> None:
+        # Profiles by partition.
+        self.profiles = profiles
+        self.profiled_partitions: List[str] = []
+
+    def generate_profiles(
+        self, requests: List[GEProfilerRequest], *args: object
+    ) -> Iterable[Tuple[GEProfilerRequest, Optional[DatasetProfileClass]]]:
+        for request in requests:
+            partition = request.batch_kwargs["partition"]
+            self.profiled_partitions.append(partition)
+            yield request, self.profiles[partition]
+
+
+def _partition_profile(
+    partition: str, row_count: int, null_count: int, min: str, max: str, mean: str
+) -> DatasetProfileClass:
+    return DatasetProfileClass(
+        timestampMillis=0,
+        rowCount=row_count,
+        partitionSpec=PartitionSpecClass(partition=partition),
+        fieldProfiles=[
+            DatasetFieldProfileClass(
+                fieldPath="amount",
+                nullCount=null_count,
+                min=min,
+                max=max,
+                mean=mean,
+                uniqueCount=row_count - null_count,
+            )
+        ],
+    )
+
+
+def _incremental_profiling_runner() -> Tuple[
+    Callable[[int, str], List[DatasetProfileClass]], BigQueryV2Report, _FakeProfiler
+]:
+    column = BigqueryColumn(
+        name="date",
+        field_path="date",
+        ordinal_position=1,
+        data_type="TIMESTAMP",
+        is_partition_column=True,
+        cluster_column_position=None,
+        comment=None,
+        is_nullable=False,
+    )
+    state_handler = _FakeProfilingHandler()
+    config = BigQueryV2Config.parse_obj(
+        {"profiling": {"enabled": True, "incremental": True}}
+    )
+    report = BigQueryV2Report()
+    profiler = BigqueryProfiler(
+        config=config,
+        report=report,
+        state_handler=cast(ProfilingHandler, state_handler),
+    )
+    fake_profiler = _FakeProfiler(
+        {
+            "20240101": _partition_profile("20240101", 10, 1, "1", "5", "3"),
+            "20240102": _partition_profile("20240102", 20, 0, "0", "4", "2"),
+        }
+    )
+    profiler.get_profiler_instance = lambda db_name=None: fake_profiler  # type: ignore
+
+    def run(rows_count: int, max_partition_id: str) -> List[DatasetProfileClass]:
+        table = BigqueryTable(
+            name="test_table",
+            comment=None,
+            rows_count=rows_count,
+            size_in_bytes=1,
+            # Without a modification time, only the row count and the partition
+            # tell whether the table changed.
+            last_altered=None,
+            created=datetime.now(timezone.utc),
+            partition_info=PartitionInfo(type="DAY", field="date", column=column),
+            max_partition_id=max_partition_id,
+        )
+        request = profiler.get_profile_request(table, "test_dataset", "test_project")
+        assert request is not None
+        profiles = [
+            wu.metadata.aspect
+            for wu in profiler.generate_profile_workunits(
+                [request], max_workers=1, platform="bigquery"
+            )
+        ]
+        state_handler.next_run()
+        return profiles  # type: ignore
+
+    return run, report, fake_profiler
+
+
+def test_incremental_partition_profiling():
+    run, report, fake_profiler = _incremental_profiling_runner()
+
+    [first] = run(rows_count=10, max_partition_id="20240101")
+    assert first.fieldProfiles[0].uniqueCount == 9
+
+    # The table hasn't changed.
+    assert run(rows_count=10, max_partition_id="20240101") == []
+    assert report.profiling_skipped_unchanged["test_project.test_dataset"] == 1
+
+    [merged] = run(rows_count=30, max_partition_id="20240102")
+    assert fake_profiler.profiled_partitions == ["20240101", "20240102"]
+    assert merged.rowCount == 30
+    assert merged.partitionSpec
+    assert merged.partitionSpec.type == PartitionTypeClass.FULL_TABLE
+    [field] = merged.fieldProfiles
+    assert (field.nullCount, field.min, field.max) == (1, "0", "5")
+    assert field.mean == str((3 * 9 + 2 * 20) / 29)
+    assert field.uniqueCount is None
+    assert report.num_incremental_profiles_merged == 1
+
+
+def test_incremental_partition_profiling_with_unprofiled_partitions():
+    run, report, fake_profiler = _incremental_profiling_runner()
+
+    # The table has a partition that was never profiled, besides the profiled ones.
+    [first] = run(rows_count=15, max_partition_id="20240101")
+    [second] = run(rows_count=35, max_partition_id="20240102")
+    assert fake_profiler.profiled_partitions == ["20240101", "20240102"]
+
+    # The statistics of the profiled partitions don't describe the whole table, so
+    # the profile only covers the latest partition.
+    assert second.rowCount == 35
+    assert second.partitionSpec
+    assert second.partitionSpec.type == PartitionTypeClass.PARTITION
+    assert second.partitionSpec.partition == "20240102"
+    [field] = second.fieldProfiles
+    assert (field.nullCount, field.min, field.max, field.mean) == (0, "0", "4", "2")
+    assert field.uniqueCount == 20
+    assert report.num_incremental_profiles_merged == 0
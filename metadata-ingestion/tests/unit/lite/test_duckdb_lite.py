@@ -0,0 +1,208 @@
+import pathlib
+from typing import Any, List, Tuple
+
+import pytest
+
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.lite.duckdb_lite import DuckDBLite
+from datahub.lite.duckdb_lite_config import DuckDBLiteConfig
+from datahub.lite.lite_local import SearchFlavor
+from datahub.metadata.schema_classes import (
+    ContainerClass,
+    ContainerPropertiesClass,
+    DataPlatformInstanceClass,
+    DatasetPropertiesClass,
+    NumberTypeClass,
+    OtherSchemaClass,
+    SchemaFieldClass,
+    SchemaFieldDataTypeClass,
+    SchemaMetadataClass,
+    StatusClass,
+    SubTypesClass,
+    SystemMetadataClass,
+)
+
+pytest.importorskip("duckdb")
+
+_DATASET_URN = "urn:li:dataset:(urn:li:dataPlatform:postgres,db.schema.table_{},PROD)"
+_CONTAINER_URN = "urn:li:container:1234"
+
+
+def _make_mcps() -> List[MetadataChangeProposalWrapper]:
+    mcps: List[MetadataChangeProposalWrapper] = [
+        MetadataChangeProposalWrapper(
+            entityUrn=_CONTAINER_URN,
+            aspect=ContainerPropertiesClass(name="schema"),
+        ),
+        MetadataChangeProposalWrapper(
+            entityUrn=_CONTAINER_URN,
+            aspect=DataPlatformInstanceClass(platform="urn:li:dataPlatform:postgres"),
+        ),
+    ]
+    for i in range(5):
+        urn = _DATASET_URN.format(i)
+        mcps += [
+            MetadataChangeProposalWrapper(
+                entityUrn=urn, aspect=DatasetPropertiesClass(name=f"table_{i}")
+            ),
+            MetadataChangeProposalWrapper(
+                entityUrn=urn, aspect=ContainerClass(container=_CONTAINER_URN)
+            ),
+            MetadataChangeProposalWrapper(
+                entityUrn=urn, aspect=SubTypesClass(typeNames=["Table"])
+            ),
+            MetadataChangeProposalWrapper(
+                entityUrn=urn, aspect=StatusClass(removed=False)
+            ),
+            # Same aspect again within the batch: a duplicate and then a change.
+            MetadataChangeProposalWrapper(
+                entityUrn=urn, aspect=StatusClass(removed=False)
+            ),
+            MetadataChangeProposalWrapper(
+                entityUrn=urn, aspect=DatasetPropertiesClass(name=f"renamed_{i}")
+            ),
+        ]
+    for i, mcp in enumerate(mcps):
+        mcp.systemMetadata = SystemMetadataClass(
+            lastObserved=1700000000000 + i, runId="test-run"
+        )
+    return mcps
+
+
+def _dump(lite: DuckDBLite) -> Tuple[list, list, list]:
+    aspects = lite.duckdb_client.execute(
+        "SELECT urn, aspect_name, version, metadata, system_metadata, createdon "
+        "FROM metadata_aspect_v2 ORDER BY ALL"
+    ).fetchall()
+    edges = lite.duckdb_client.execute(
+        "SELECT * FROM metadata_edge_v2 ORDER BY ALL"
+    ).fetchall()
+    search_index = lite.duckdb_client.execute(
+        "SELECT * FROM metadata_search_v2 ORDER BY ALL"
+    ).fetchall()
+    return aspects, edges, search_index
+
+
+def _make_lite(tmp_path: pathlib.Path, name: str) -> DuckDBLite:
+    return DuckDBLite(DuckDBLiteConfig(file=str(tmp_path / f"{name}.duckdb")))
+
+
+def test_write_batch_matches_write(tmp_path: pathlib.Path) -> None:
+    per_record = _make_lite(tmp_path, "per_record")
+    bulk = _make_lite(tmp_path, "bulk")
+
+    # Run twice so that the second pass exercises the dedup and version bump
+    # paths against rows that already exist.
+    for _ in range(2):
+        for mcp in _make_mcps():
+            per_record.write(mcp)
+        bulk.write_batch(_make_mcps())
+
+    assert _dump(bulk) == _dump(per_record)
+
+    per_record.reindex()
+    bulk.reindex()
+    assert _dump(bulk) == _dump(per_record)
+
+    per_record.close()
+    bulk.close()
+
+
+def test_write_batch_versions(tmp_path: pathlib.Path) -> None:
+    lite = _make_lite(tmp_path, "versions")
+    urn = _DATASET_URN.format(0)
+    lite.write_batch(
+        [
+            MetadataChangeProposalWrapper(
+                entityUrn=urn, aspect=DatasetPropertiesClass(name=name)
+            )
+            for name in ["a", "a", "b", "c", "c"]
+        ]
+    )
+
+    versions = lite.duckdb_client.execute(
+        "SELECT version, metadata->>'$.name' FROM metadata_aspect_v2 ORDER BY version"
+    ).fetchall()
+    assert versions == [(0, "c"), (1, "a"), (2, "b"), (3, "c")]
+
+    name_edges = lite.duckdb_client.execute(
+        "SELECT dst_id FROM metadata_edge_v2 WHERE src_id = ? AND relnship = 'name'",
+        [urn],
+    ).fetchall()
+    assert name_edges == [("c",)]
+    lite.close()
+
+
+def _search(lite: DuckDBLite, query: str, **kwargs: Any) -> List[Tuple[str, str]]:
+    return [
+        (searchable.id, str(searchable.aspect))
+        for searchable in lite.search(query, SearchFlavor.FREE_TEXT, **kwargs)
+    ]
+
+
+def test_search_free_text(tmp_path: pathlib.Path) -> None:
+    lite = _make_lite(tmp_path, "search")
+    lite.write_batch(_make_mcps())
+    lite.write(
+        MetadataChangeProposalWrapper(
+            entityUrn=_DATASET_URN.format(1),
+            aspect=SchemaMetadataClass(
+                schemaName="table_1",
+                platform="urn:li:dataPlatform:postgres",
+                version=0,
+                hash="",
+                platformSchema=OtherSchemaClass(rawSchema=""),
+                fields=[
+                    SchemaFieldClass(
+                        fieldPath="[version=2.0].[type=struct].customer_id",
+                        type=SchemaFieldDataTypeClass(type=NumberTypeClass()),
+                        nativeDataType="int",
+                        description="The customer",
+                    )
+                ],
+            ),
+        )
+    )
+
+    # Identifiers are split into tokens, so "table_3" matches the "3" of the new
+    # name too, but the earlier names were replaced within the batch.
+    assert _search(lite, "table_3") == [
+        (_DATASET_URN.format(3), "datasetProperties"),
+        (_DATASET_URN.format(3), "urn"),
+    ]
+    assert _search(lite, "table", aspects=["datasetProperties"]) == []
+    # Name matches rank above urn matches, and prefixes match too.
+    assert _search(lite, "renamed 2") == [
+        (_DATASET_URN.format(2), "datasetProperties"),
+        (_DATASET_URN.format(2), "urn"),
+    ]
+    assert _search(lite, "renam")[0] == (_DATASET_URN.format(0), "datasetProperties")
+    assert _search(lite, "customer", aspects=["schemaMetadata"]) == [
+        (_DATASET_URN.format(1), "schemaMetadata")
+    ]
+    assert _search(lite, "version") == []
+    assert _search(lite, "' OR 1=1 --") == []
+    assert _search(lite, "") == []
+
+    snippets = [
+        searchable.snippet
+        for searchable in lite.search("renamed_4", SearchFlavor.FREE_TEXT)
+    ]
+    assert snippets == [
+        '{"customProperties": {}, "name": "renamed_4", "tags": []}',
+        None,
+    ]
+
+    # Updates replace the indexed tokens of the aspect.
+    lite.write(
+        MetadataChangeProposalWrapper(
+            entityUrn=_DATASET_URN.format(2), aspect=DatasetPropertiesClass(name="pets")
+        )
+    )
+    assert _search(lite, "renamed 2") == []
+    assert _search(lite, "pet") == [(_DATASET_URN.format(2), "datasetProperties")]
+
+    index = _dump(lite)[2]
+    lite.reindex()
+    assert _dump(lite)[2] == index
+    lite.close()
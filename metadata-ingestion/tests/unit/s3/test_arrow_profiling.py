@@ -0,0 +1,205 @@
+import pathlib
+import statistics
+from typing import Dict, List
+
+import pyarrow
+import pyarrow.parquet
+import pytest
+
+from datahub.ingestion.api.common import PipelineContext
+from datahub.ingestion.source.s3 import arrow_profiling
+from datahub.ingestion.source.s3.arrow_profiling import ArrowTableProfiler
+from datahub.ingestion.source.s3.datalake_profiler_config import DataLakeProfilerConfig
+from datahub.ingestion.source.s3.report import DataLakeSourceReport
+from datahub.ingestion.source.s3.source import S3Source
+from datahub.metadata.schema_classes import (
+    DatasetFieldProfileClass,
+    DatasetProfileClass,
+)
+
+_NUM_ROWS = 1000
+
+
+def _write_parquet(path: pathlib.Path) -> None:
+    table = pyarrow.table(
+        {
+            "id": pyarrow.array(range(1, _NUM_ROWS + 1), pyarrow.int64()),
+            "category": [["a", "b", None][i % 3] for i in range(_NUM_ROWS)],
+            "amount": [float(i % 100) for i in range(_NUM_ROWS)],
+        }
+    )
+    # Several row groups, so that the footer statistics have to be combined.
+    pyarrow.parquet.write_table(table, path, row_group_size=300)
+
+
+def _fields(profile: DatasetProfileClass) -> Dict[str, DatasetFieldProfileClass]:
+    return {field.fieldPath: field for field in profile.fieldProfiles or []}
+
+
+def test_arrow_profiler_parquet(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "orders.parquet"
+    _write_parquet(path)
+
+    profiler = ArrowTableProfiler(
+        DataLakeProfilerConfig(enabled=True, engine="arrow"),
+        DataLakeSourceReport(),
+        str(path),
+    )
+    with open(path, "rb") as file:
+        profiler.add_file(file, ".parquet")
+    profile = profiler.get_profile()
+
+    assert profile.rowCount == _NUM_ROWS
+    assert profile.columnCount == 3
+    fields = _fields(profile)
+
+    id_field = fields["id"]
+    assert id_field.nullCount == 0
+    assert id_field.uniqueCount == _NUM_ROWS
+    assert (id_field.min, id_field.max) == ("1", str(_NUM_ROWS))
+    assert id_field.mean is not None
+    assert float(id_field.mean) == pytest.approx(500.5)
+    assert id_field.median == "500.5"
+    assert id_field.stdev is not None
+    assert float(id_field.stdev) == pytest.approx(
+        statistics.stdev(range(1, _NUM_ROWS + 1))
+    )
+    assert id_field.histogram is not None
+    assert sum(id_field.histogram.heights) == _NUM_ROWS
+    assert id_field.sampleValues == sorted(str(i) for i in range(1, 21))
+
+    category = fields["category"]
+    assert category.nullCount == 333
+    assert category.uniqueCount == 2
+    assert [
+        (f.value, f.frequency) for f in category.distinctValueFrequencies or []
+    ] == [("a", 334), ("b", 333)]
+    assert category.min is None
+
+    amount = fields["amount"]
+    assert amount.uniqueCount == 100
+    assert amount.uniqueProportion == pytest.approx(0.1)
+    assert (amount.min, amount.max) == ("0.0", "99.0")
+    # Each value appears 10 times, and the quantiles are interpolated.
+    assert [q.quantile for q in amount.quantiles or []] == [
+        "0.05",
+        "0.25",
+        "0.5",
+        "0.75",
+        "0.95",
+    ]
+    assert [float(q.value) for q in amount.quantiles or []] == pytest.approx(
+        [4.95, 24.75, 49.5, 74.25, 94.05]
+    )
+
+
+def test_arrow_profiler_table_level_only(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "orders.parquet"
+    _write_parquet(path)
+
+    profiler = ArrowTableProfiler(
+        DataLakeProfilerConfig(
+            enabled=True, engine="arrow", profile_table_level_only=True
+        ),
+        DataLakeSourceReport(),
+        str(path),
+    )
+    with open(path, "rb") as file:
+        profiler.add_file(file, ".parquet")
+    profile = profiler.get_profile()
+
+    assert (profile.rowCount, profile.columnCount) == (_NUM_ROWS, 3)
+    assert profile.fieldProfiles is None
+
+
+def test_arrow_profiler_csv_and_json(tmp_path: pathlib.Path) -> None:
+    csv_path = tmp_path / "people.csv"
+    csv_path.write_text("name,age\nalice,30\nbob,\ncarol,40\n")
+    json_path = tmp_path / "people.jsonl"
+    json_path.write_text('{"name": "dave", "age": 50}\n{"name": "erin"}\n')
+
+    profiler = ArrowTableProfiler(
+        DataLakeProfilerConfig(enabled=True, engine="arrow"),
+        DataLakeSourceReport(),
+        str(csv_path),
+    )
+    with open(csv_path, "rb") as file:
+        profiler.add_file(file, ".csv")
+    with open(json_path, "rb") as file:
+        profiler.add_file(file, ".jsonl")
+    profile = profiler.get_profile()
+
+    assert profile.rowCount == 5
+    fields = _fields(profile)
+    assert fields["name"].uniqueCount == 5
+    assert fields["age"].nullCount == 2
+    assert fields["age"].sampleValues == ["30", "40", "50"]
+
+
+def test_arrow_profiler_json_array(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "people.json"
+    path.write_text(
+        '[\n  {"name": "alice", "age": 30},\n  {"name": "bob", "city": "paris"}\n]\n'
+    )
+
+    profiler = ArrowTableProfiler(
+        DataLakeProfilerConfig(enabled=True, engine="arrow"),
+        DataLakeSourceReport(),
+        str(path),
+    )
+    with open(path, "rb") as file:
+        profiler.add_file(file, ".json")
+    profile = profiler.get_profile()
+
+    assert (profile.rowCount, profile.columnCount) == (2, 3)
+    fields = _fields(profile)
+    assert fields["age"].nullCount == 1
+    assert fields["city"].sampleValues == ["paris"]
+
+    # Larger arrays are not parsed in memory.
+    monkeypatch.setattr(arrow_profiling, "_MAX_JSON_ARRAY_SIZE", 16)
+    with open(path, "rb") as file, pytest.raises(ValueError, match="JSON Lines"):
+        profiler.add_file(file, ".json")
+
+
+def test_arrow_profiler_estimates_distinct_counts(tmp_path: pathlib.Path) -> None:
+    num_rows = 100_000
+    path = tmp_path / "big.parquet"
+    pyarrow.parquet.write_table(
+        pyarrow.table({"value": [f"value-{i // 2}" for i in range(num_rows)]}), path
+    )
+
+    profiler = ArrowTableProfiler(
+        DataLakeProfilerConfig(enabled=True, engine="arrow"),
+        DataLakeSourceReport(),
+        str(path),
+    )
+    with open(path, "rb") as file:
+        profiler.add_file(file, ".parquet")
+    [field] = profiler.get_profile().fieldProfiles or []
+
+    assert field.uniqueCount == pytest.approx(num_rows / 2, rel=0.1)
+
+
+def test_s3_source_arrow_profiling_local_files(tmp_path: pathlib.Path) -> None:
+    _write_parquet(tmp_path / "orders.parquet")
+
+    source = S3Source.create(
+        config_dict={
+            "path_specs": [{"include": f"{tmp_path}/*.parquet"}],
+            "profiling": {"enabled": True, "engine": "arrow"},
+        },
+        ctx=PipelineContext(run_id="test-s3-arrow-profiling"),
+    )
+    profiles: List[DatasetProfileClass] = [
+        wu.metadata.aspect
+        for wu in source.get_workunits_internal()
+        if isinstance(getattr(wu.metadata, "aspect", None), DatasetProfileClass)
+    ]
+
+    assert not hasattr(source, "spark")
+    [profile] = profiles
+    assert profile.rowCount == _NUM_ROWS
+    assert _fields(profile)["category"].nullCount == 333
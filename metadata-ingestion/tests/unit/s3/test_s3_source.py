@@ -1,7 +1,11 @@
+import io
+import re
 from datetime import datetime
-from typing import List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from unittest.mock import Mock, call
 
+import pyarrow
+import pyarrow.parquet
 import pytest
 
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
@@ -401,3 +405,172 @@ def test_get_folder_info_returns_expected_folder() -> None:
         size=150,
         sample_file="s3://my-bucket/my-folder/dir1/0002.csv",
     )
+
+
+class _FakeS3Client:
+    """A minimal, in-memory stand-in for the boto3 S3 client."""
+
+    def __init__(self, objects: Dict[str, bytes]) -> None:
+        self.objects = objects
+        self.calls: List[str] = []
+
+    def get_paginator(self, operation_name: str) -> "_FakeS3Client":
+        assert operation_name == "list_objects_v2"
+        return self
+
+    def paginate(
+        self,
+        Bucket: str,
+        Prefix: str,
+        Delimiter: Optional[str] = None,
+        StartAfter: str = "",
+        PaginationConfig: Optional[Dict] = None,
+    ) -> Iterable[Dict[str, Any]]:
+        self.calls.append(f"list {Prefix} {Delimiter}")
+        contents: List[Dict[str, Any]] = []
+        common_prefixes: List[str] = []
+        for key in sorted(self.objects):
+            if not key.startswith(Prefix) or key <= StartAfter:
+                continue
+            rest = key[len(Prefix) :]
+            if Delimiter and Delimiter in rest:
+                common_prefix = Prefix + rest.split(Delimiter, 1)[0] + Delimiter
+                if common_prefix not in common_prefixes:
+                    common_prefixes.append(common_prefix)
+            else:
+                contents.append(
+                    {
+                        "Key": key,
+                        "LastModified": datetime(2025, 1, 1),
+                        "Size": len(self.objects[key]),
+                    }
+                )
+        yield {
+            "Contents": contents,
+            "CommonPrefixes": [{"Prefix": p} for p in common_prefixes],
+        }
+
+    def get_object(self, Bucket: str, Key: str, Range: str) -> Dict[str, Any]:
+        self.calls.append(f"get {Key} {Range}")
+        data = self.objects[Key]
+        match = re.fullmatch(r"bytes=(\d*)-(\d*)", Range)
+        assert match
+        if not match.group(1):
+            start = max(0, len(data) - int(match.group(2)))
+            end = len(data) - 1
+        else:
+            start, end = int(match.group(1)), int(match.group(2))
+        return {
+            "Body": io.BytesIO(data[start : end + 1]),
+            "ContentRange": f"bytes {start}-{end}/{len(data)}",
+        }
+
+
+def _get_s3_source_with_client(
+    path_spec: PathSpec, s3_client: _FakeS3Client, max_workers: int
+) -> S3Source:
+    source = _get_s3_source(path_spec)
+    source.source_config.max_workers = max_workers
+    source._s3_client = s3_client  # type: ignore
+    return source
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_browse_objects_in_listing_order(max_workers: int) -> None:
+    keys = [
+        "data/a.csv",
+        "data/a/year=2024/1.csv",
+        "data/a/year=2025/1.csv",
+        "data/a/year=2025/2.csv",
+        "data/a0.csv",
+        "data/b/1.csv",
+        "data/b/c/d/e/1.csv",
+        "data/c.csv",
+        "other/1.csv",
+    ]
+    path_spec = PathSpec(include="s3://my-bucket/data/*.csv")
+    s3_client = _FakeS3Client({key: b"a,b" for key in keys})
+    source = _get_s3_source_with_client(path_spec, s3_client, max_workers)
+
+    browse_paths = list(source._browse_objects("my-bucket", "data/"))
+
+    # The same objects, in the same order, as a single listing of the prefix.
+    assert [browse_path.file for browse_path in browse_paths] == [
+        f"s3://my-bucket/{key}" for key in keys if key.startswith("data/")
+    ]
+    assert all(browse_path.size == 3 for browse_path in browse_paths)
+    if max_workers == 1:
+        assert s3_client.calls == ["list data/ None"]
+    else:
+        # The prefix was split along its folders.
+        assert "list data/ /" in s3_client.calls
+        assert "list data/a/ /" in s3_client.calls
+
+
+def test_browse_objects_with_many_folders() -> None:
+    keys = [f"data/events/dt={i:04}/1.csv" for i in range(500)]
+    keys += ["data/events/dt=", "data/events/dt=0100.csv", "data/events/dt=9999"]
+    path_spec = PathSpec(include="s3://my-bucket/data/events/dt=*/*.csv")
+    s3_client = _FakeS3Client({key: b"a,b" for key in keys})
+    source = _get_s3_source_with_client(path_spec, s3_client, max_workers=4)
+
+    browse_paths = list(source._browse_objects("my-bucket", "data/events/dt="))
+
+    assert [browse_path.file for browse_path in browse_paths] == [
+        f"s3://my-bucket/{key}" for key in sorted(keys)
+    ]
+    # The folders are listed in one range per thread, not one by one.
+    assert (
+        s3_client.calls
+        == ["list data/events/dt= /"] + ["list data/events/dt= None"] * 4
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_resolve_templated_folders(max_workers: int) -> None:
+    keys = [
+        "data/dept1/x/table1/1.csv",
+        "data/dept1/y/table2/1.csv",
+        "data/dept2/x/table3/1.csv",
+        "data/file.csv",
+    ]
+    path_spec = PathSpec(include="s3://my-bucket/data/*/*/{table}/*.csv")
+    s3_client = _FakeS3Client({key: b"" for key in keys})
+    source = _get_s3_source_with_client(path_spec, s3_client, max_workers)
+
+    assert list(source.resolve_templated_folders("my-bucket", "data/*/*/")) == [
+        "data/dept1/x/",
+        "data/dept1/y/",
+        "data/dept2/x/",
+    ]
+
+
+@pytest.mark.parametrize("num_columns", [2, 2000])
+def test_read_parquet_footer(num_columns: int) -> None:
+    table = pyarrow.table({f"column_{i}": list(range(10)) for i in range(num_columns)})
+    file = io.BytesIO()
+    pyarrow.parquet.write_table(table, file)
+
+    path_spec = PathSpec(include="s3://my-bucket/data/*.parquet")
+    s3_client = _FakeS3Client({"data/file.parquet": file.getvalue()})
+    source = _get_s3_source_with_client(path_spec, s3_client, max_workers=1)
+
+    footer = source._read_parquet_footer("s3://my-bucket/data/file.parquet")
+
+    assert pyarrow.parquet.read_schema(footer) == table.schema
+    # Only the end of the file is read, and a second request is only needed when the
+    # footer is larger than the first read.
+    assert s3_client.calls[0] == "get data/file.parquet bytes=-65536"
+    assert len(s3_client.calls) == (1 if num_columns == 2 else 2)
+
+
+def test_get_fields_reports_unreadable_parquet_file() -> None:
+    path_spec = PathSpec(include="s3://my-bucket/data/*.parquet")
+    s3_client = _FakeS3Client({"data/file.parquet": b"not a parquet file"})
+    source = _get_s3_source_with_client(path_spec, s3_client, max_workers=1)
+    table_data = Mock(
+        full_path="s3://my-bucket/data/file.parquet", content_type=None, partitions=None
+    )
+
+    assert source.get_fields(table_data, path_spec) == []
+    assert len(source.report.warnings) == 1
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 import datahub.metadata.schema_classes as models
@@ -33,3 +35,57 @@ def test_mcpw_from_obj():
 
     assert isinstance(mcpw2, MetadataChangeProposalWrapper)
     assert mcpw == mcpw2
+
+
+@pytest.mark.parametrize(
+    "mcpw",
+    [
+        MetadataChangeProposalWrapper(
+            entityUrn="urn:li:dataset:(urn:li:dataPlatform:bigquery,harshal-playground-306419.test_schema.excess_deaths_derived,PROD)",
+            aspect=models.SchemaMetadataClass(
+                schemaName="excess_deaths_derived",
+                platform="urn:li:dataPlatform:bigquery",
+                version=0,
+                hash="",
+                platformSchema=models.OtherSchemaClass(rawSchema=""),
+                fields=[
+                    models.SchemaFieldClass(
+                        fieldPath="deaths",
+                        type=models.SchemaFieldDataTypeClass(
+                            type=models.NumberTypeClass()
+                        ),
+                        nativeDataType="INT64",
+                    )
+                ],
+            ),
+            systemMetadata=models.SystemMetadataClass(runId="test-run"),
+        ),
+        MetadataChangeProposalWrapper(
+            entityUrn="urn:li:mlModel:(urn:li:dataPlatform:science,scienceModel,PROD)",
+            aspect=models.CostClass(
+                costType=models.CostTypeClass.ORG_COST_TYPE,
+                cost=models.CostCostClass(
+                    fieldDiscriminator=models.CostCostDiscriminatorClass.costCode,
+                    costCode="sampleCostCode",
+                ),
+            ),
+        ),
+        MetadataChangeProposalWrapper(
+            entityType="dataset",
+            entityKeyAspect=models.DatasetKeyClass(
+                platform="urn:li:dataPlatform:bigquery", name="table", origin="PROD"
+            ),
+            aspect=models.StatusClass(removed=False),
+        ),
+    ],
+)
+def test_mcpw_to_obj_simplified_structure(
+    mcpw: MetadataChangeProposalWrapper,
+) -> None:
+    # The simplified structure is the same as the nested JSON string structure,
+    # with the aspect's JSON string unpacked.
+    expected = mcpw.to_obj()
+    expected["aspect"] = {"json": json.loads(expected["aspect"]["value"])}
+
+    obj = mcpw.to_obj(simplified_structure=True)
+    assert json.dumps(obj) == json.dumps(expected)
@@ -750,3 +750,153 @@ def test_await_status_logging(openapi_emitter):
         with pytest.raises(TraceValidationError):
             openapi_emitter._await_status([trace], timedelta(seconds=10))
         mock_error.assert_called_once()
+
+
+def test_openapi_emitter_emit_mcps_concurrent_chunks():
+    emitter = DataHubRestEmitter(
+        MOCK_GMS_ENDPOINT, openapi_ingestion=True, max_concurrent_chunks=4
+    )
+    with patch(
+        "datahub.emitter.rest_emitter.DataHubRestEmitter._emit_generic"
+    ) as mock_emit:
+        dataset_items = [
+            MetadataChangeProposalWrapper(
+                entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:mysql,Dataset{i},PROD)",
+                aspect=DatasetProfile(
+                    rowCount=i,
+                    columnCount=15,
+                    timestampMillis=1626995099686,
+                ),
+            )
+            for i in range(BATCH_INGEST_MAX_PAYLOAD_LENGTH + 2)
+        ]
+        dashboard_items = [
+            MetadataChangeProposalWrapper(
+                entityUrn=f"urn:li:dashboard:(looker,dashboards.{i})",
+                aspect=Status(removed=False),
+            )
+            for i in range(2)
+        ]
+
+        result = emitter.emit_mcps(dataset_items + dashboard_items)
+
+        assert result == 3
+        assert mock_emit.call_count == 3
+        assert emitter.chunk_latency.chunks_emitted == 3
+
+        # Chunks for the same entity url must still be sent in order.
+        dataset_payloads = [
+            json.loads(call[1]["payload"])
+            for call in mock_emit.call_args_list
+            if call[0][0].endswith("dataset?async=true")
+        ]
+        assert [len(payload) for payload in dataset_payloads] == [
+            BATCH_INGEST_MAX_PAYLOAD_LENGTH,
+            2,
+        ]
+        assert dataset_payloads[0][0]["datasetProfile"]["value"]["rowCount"] == 0
+
+        # Concurrent chunks are sent with pooled sessions, not the main one.
+        for call in mock_emit.call_args_list:
+            assert call[1]["session"] is not emitter._session
+
+
+def test_openapi_emitter_concurrent_chunks_merge_trace_data():
+    emitter = DataHubRestEmitter(
+        MOCK_GMS_ENDPOINT, openapi_ingestion=True, max_concurrent_chunks=2
+    )
+    items = [
+        MetadataChangeProposalWrapper(
+            entityUrn="urn:li:dataset:(urn:li:dataPlatform:mysql,User.UserAccount,PROD)",
+            aspect=Status(removed=False),
+        ),
+        MetadataChangeProposalWrapper(
+            entityUrn="urn:li:dashboard:(looker,dashboards.1)",
+            aspect=Status(removed=False),
+        ),
+    ]
+
+    def make_response(urn: str) -> Mock:
+        mock_resp = Mock(spec=Response)
+        mock_resp.status_code = 200
+        mock_resp.headers = {"traceparent": "shared-trace"}
+        mock_resp.json.return_value = [{"urn": urn, "status": {"removed": False}}]
+        return mock_resp
+
+    with patch(
+        "datahub.emitter.rest_emitter.DataHubRestEmitter._emit_generic"
+    ) as mock_emit, patch(
+        "datahub.emitter.rest_emitter.DataHubRestEmitter._await_status"
+    ) as mock_await:
+        mock_emit.side_effect = lambda url, payload, session: make_response(
+            json.loads(payload)[0]["urn"]
+        )
+
+        emitter.emit_mcps(items, async_flag=True, trace_flag=True)
+
+        mock_await.assert_called_once()
+        trace_data = mock_await.call_args[0][0]
+        assert len(trace_data) == 1
+        assert trace_data[0].trace_id == "shared-trace"
+        assert trace_data[0].data == {
+            "urn:li:dataset:(urn:li:dataPlatform:mysql,User.UserAccount,PROD)": [
+                "status"
+            ],
+            "urn:li:dashboard:(looker,dashboards.1)": ["status"],
+        }
+
+
+@pytest.mark.parametrize("async_flag", [None, True, False])
+def test_restli_emitter_emit_mcps_payload(async_flag):
+    emitter = DataHubRestEmitter(MOCK_GMS_ENDPOINT, openapi_ingestion=False)
+    items = [
+        MetadataChangeProposalWrapper(
+            entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:mysql,Dataset{i},PROD)",
+            aspect=DatasetProperties(name=f"Dataset {i}", description="ünïcödé"),
+        )
+        for i in range(3)
+    ]
+
+    with patch(
+        "datahub.emitter.rest_emitter.DataHubRestEmitter._emit_generic"
+    ) as mock_emit:
+        result = emitter.emit_mcps(items, async_flag=async_flag)
+
+        assert result == 1
+        mock_emit.assert_called_once()
+        url, payload = mock_emit.call_args[0]
+        assert url == f"{MOCK_GMS_ENDPOINT}/aspects?action=ingestProposalBatch"
+
+        # The streamed payload must be byte-identical to serializing the full dict.
+        expected: dict = {
+            "proposals": [
+                rest_emitter.pre_json_transform(mcp.to_obj()) for mcp in items
+            ]
+        }
+        if async_flag is not None:
+            expected["async"] = "true" if async_flag else "false"
+        assert payload == json.dumps(expected)
+
+
+def test_restli_emitter_emit_mcps_max_items():
+    emitter = DataHubRestEmitter(MOCK_GMS_ENDPOINT, openapi_ingestion=False)
+    items = [
+        MetadataChangeProposalWrapper(
+            entityUrn=f"urn:li:dataset:(urn:li:dataPlatform:mysql,Item{i},PROD)",
+            aspect=Status(removed=False),
+        )
+        for i in range(BATCH_INGEST_MAX_PAYLOAD_LENGTH + 2)
+    ]
+
+    with patch(
+        "datahub.emitter.rest_emitter.DataHubRestEmitter._emit_generic"
+    ) as mock_emit:
+        result = emitter.emit_mcps(items)
+
+        assert result == 2
+        payloads = [json.loads(call[0][1]) for call in mock_emit.call_args_list]
+        assert [len(payload["proposals"]) for payload in payloads] == [
+            BATCH_INGEST_MAX_PAYLOAD_LENGTH,
+            2,
+        ]
+        assert emitter.chunk_latency.chunks_emitted == 2
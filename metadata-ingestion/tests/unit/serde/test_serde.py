@@ -7,6 +7,7 @@ from unittest.mock import patch
 import fastavro
 import pytest
 from avrogen import avrojson
+from avrogen.dict_wrapper import DictWrapper
 from freezegun import freeze_time
 
 import datahub.metadata.schema_classes as models
@@ -398,6 +399,41 @@ def test_json_transforms(model, ref_server_obj):
     recovered = type(model).from_obj(post_obj)
     assert recovered == model
 
+    assert pre_json_transform(model.to_obj(), schema=model.RECORD_SCHEMA) == server_obj
+    assert post_json_transform(server_obj, schema=model.RECORD_SCHEMA) == post_obj
+
+
+@pytest.mark.parametrize(
+    "json_filename",
+    [
+        "tests/unit/serde/test_serde_large.json",
+        "tests/unit/serde/test_serde_chart_snapshot.json",
+        "tests/unit/serde/test_serde_usage.json",
+        "tests/unit/serde/test_serde_profile.json",
+    ],
+)
+def test_json_transforms_with_schema(
+    pytestconfig: pytest.Config, json_filename: str
+) -> None:
+    # The schema-compiled transforms must match the generic ones.
+    for obj in read_metadata_file(pytestconfig.rootpath / json_filename):
+        model: DictWrapper
+        if isinstance(obj, MetadataChangeProposalWrapper):
+            assert obj.aspect is not None
+            model = obj.aspect
+        elif isinstance(obj, MetadataChangeEventClass):
+            model = obj
+        else:
+            continue
+
+        server_obj = pre_json_transform(model.to_obj())
+        assert pre_json_transform(model.to_obj(), schema=model.RECORD_SCHEMA) == (
+            server_obj
+        )
+        assert post_json_transform(server_obj, schema=model.RECORD_SCHEMA) == (
+            post_json_transform(server_obj)
+        )
+
 
 def test_unions_with_aliases_assumptions() -> None:
     # We have special handling for unions with aliases in our json serialization helpers.
@@ -0,0 +1,195 @@
+import json
+from typing import Any
+
+import avro.schema
+import pytest
+from avrogen.avrojson import AvroJsonConverter
+
+from datahub.emitter.serialization_helper import (
+    _json_transform,
+    post_json_transform,
+    pre_json_transform,
+)
+
+_TEST_SCHEMA = avro.schema.parse(
+    json.dumps(
+        {
+            "type": "record",
+            "name": "Root",
+            "namespace": "com.linkedin.pegasus2avro.test",
+            "fields": [
+                {"name": "name", "type": "string"},
+                {"name": "description", "type": ["null", "string"], "default": None},
+                {"name": "tags", "type": {"type": "array", "items": "string"}},
+                {"name": "blob", "type": ["null", "bytes"], "default": None},
+                {
+                    "name": "fieldType",
+                    "type": {
+                        "type": "record",
+                        "name": "FieldType",
+                        "fields": [
+                            {
+                                "name": "type",
+                                "type": [
+                                    {
+                                        "type": "record",
+                                        "name": "NumberType",
+                                        "fields": [],
+                                    },
+                                    {
+                                        "type": "record",
+                                        "name": "StringType",
+                                        "fields": [
+                                            {
+                                                "name": "maxLength",
+                                                "type": ["null", "int"],
+                                                "default": None,
+                                            }
+                                        ],
+                                    },
+                                ],
+                            }
+                        ],
+                    },
+                },
+                {
+                    "name": "properties",
+                    "type": {"type": "map", "values": "string"},
+                    "default": {},
+                },
+                {
+                    "name": "status",
+                    "type": [
+                        "null",
+                        {
+                            "type": "enum",
+                            "name": "Status",
+                            "symbols": ["ACTIVE", "DELETED"],
+                        },
+                    ],
+                    "default": None,
+                },
+                {
+                    "name": "values",
+                    "type": {
+                        "type": "array",
+                        "items": ["null", "string", "Status"],
+                    },
+                    "default": [],
+                },
+                {
+                    "name": "children",
+                    "type": ["null", {"type": "array", "items": "Root"}],
+                    "default": None,
+                },
+                {
+                    "name": "cost",
+                    "type": [
+                        "null",
+                        {
+                            "type": "record",
+                            "name": "Cost",
+                            "fields": [
+                                {"name": "costType", "type": "string"},
+                                {
+                                    "name": "cost",
+                                    "type": {
+                                        "type": "record",
+                                        "name": "CostCost",
+                                        "fields": [
+                                            {
+                                                "name": "costId",
+                                                "type": ["null", "double"],
+                                                "default": None,
+                                            },
+                                            {
+                                                "name": "costCode",
+                                                "type": ["null", "string"],
+                                                "default": None,
+                                            },
+                                            {
+                                                "name": "fieldDiscriminator",
+                                                "type": {
+                                                    "type": "enum",
+                                                    "name": "CostCostDiscriminator",
+                                                    "symbols": ["costId", "costCode"],
+                                                },
+                                            },
+                                        ],
+                                    },
+                                },
+                            ],
+                        },
+                    ],
+                    "default": None,
+                },
+            ],
+        }
+    )
+)
+
+
+def _make_root(depth: int = 0) -> dict:
+    return {
+        "name": f"root-{depth}",
+        "description": None if depth % 2 else "some description",
+        "tags": ["a", "b"],
+        "blob": b"bytes" if depth == 0 else None,
+        "fieldType": {
+            "type": {"maxLength": 10} if depth % 2 else {},
+        },
+        "properties": {"com.linkedin.pegasus2avro.key": "value", "other": "value"},
+        "status": "ACTIVE" if depth == 0 else None,
+        "values": ["x", None, "DELETED"],
+        "children": [_make_root(depth + 1), _make_root(depth + 2)]
+        if depth < 2
+        else None,
+        "cost": {
+            "costType": "ORG_COST_TYPE",
+            "cost": {"costCode": "sampleCostCode", "fieldDiscriminator": "costCode"},
+        }
+        if depth == 0
+        else None,
+    }
+
+
+def _generic_pre(obj: Any) -> Any:
+    return _json_transform(
+        obj,
+        from_pattern="com.linkedin.pegasus2avro.",
+        to_pattern="com.linkedin.",
+        pre=True,
+    )
+
+
+def test_schema_transform_matches_generic_transform() -> None:
+    obj = AvroJsonConverter().to_json_object(_make_root(), _TEST_SCHEMA)
+
+    server_obj = _generic_pre(obj)
+    assert pre_json_transform(obj, schema=_TEST_SCHEMA) == server_obj
+    assert list(server_obj["fieldType"]["type"]) == ["com.linkedin.test.StringType"]
+    assert server_obj["blob"] == "bytes"
+    assert "description" not in server_obj["children"][0]
+    assert server_obj["cost"] == {
+        "costType": "ORG_COST_TYPE",
+        "cost": {"costCode": "sampleCostCode"},
+    }
+
+    assert post_json_transform(server_obj, schema=_TEST_SCHEMA) == post_json_transform(
+        server_obj
+    )
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        # Fields that are not in the schema, e.g. from a newer server.
+        {"name": "x", "newField": {"com.linkedin.test.NumberType": {}}},
+        # Union branches that are not in the schema.
+        {"name": "x", "fieldType": {"type": {"com.linkedin.test.DateType": {}}}},
+        {"name": "x", "children": [None, {"com.linkedin.test.Root": {"name": None}}]},
+    ],
+)
+def test_schema_transform_with_unexpected_objects(obj: dict) -> None:
+    assert pre_json_transform(obj, schema=_TEST_SCHEMA) == pre_json_transform(obj)
+    assert post_json_transform(obj, schema=_TEST_SCHEMA) == post_json_transform(obj)
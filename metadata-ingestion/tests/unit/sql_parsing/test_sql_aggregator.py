@@ -2,6 +2,7 @@ import functools
 import os
 import pathlib
 from datetime import datetime, timezone
+from typing import Dict, List, Tuple
 from unittest.mock import patch
 
 import pytest
@@ -16,6 +17,7 @@ from datahub.sql_parsing.sql_parsing_aggregator import (
     ObservedQuery,
     PreparsedQuery,
     QueryLogSetting,
+    SqlAggregatorReport,
     SqlParsingAggregator,
     TableRename,
     TableSwap,
@@ -185,6 +187,49 @@ def test_temp_table() -> None:
     )
 
 
+@freeze_time(FROZEN_TIME)
+def test_temp_table_parallel_parsing() -> None:
+    aggregator = SqlParsingAggregator(
+        platform="redshift",
+        generate_lineage=True,
+        generate_usage_statistics=False,
+        generate_operations=False,
+        sql_parsing_workers=2,
+    )
+
+    aggregator._schema_resolver.add_raw_schema_info(
+        DatasetUrn("redshift", "dev.public.bar").urn(),
+        {"a": "int", "b": "int", "c": "int"},
+    )
+
+    for query, session_id in [
+        ("create table foo as select a, 2*b as b from bar", "session1"),
+        ("create temp table foo as select a, b+c as c from bar", "session2"),
+        ("create table foo_session2 as select * from foo", "session2"),
+        ("create table foo_session3 as select * from foo", "session3"),
+    ]:
+        aggregator.add_observed_query(
+            ObservedQuery(
+                query=query,
+                default_db="dev",
+                default_schema="public",
+                session_id=session_id,
+            )
+        )
+
+    mcps = list(aggregator.gen_metadata())
+
+    # The output must match serial parsing, including the query that depends on
+    # a temp table from its session, which is re-parsed in the main process.
+    assert aggregator.report.num_sql_parsed == 4
+    assert aggregator.report.num_sql_parsed_in_workers == 3
+    check_goldens_stream(
+        outputs=mcps,
+        golden_path=RESOURCE_DIR / "test_temp_table.json",
+    )
+    aggregator.close()
+
+
 @freeze_time(FROZEN_TIME)
 def test_multistep_temp_table() -> None:
     aggregator = SqlParsingAggregator(
@@ -1025,3 +1070,84 @@ def test_sql_aggreator_close_cleans_tmp(tmp_path):
         assert len(os.listdir(tmp_path)) > 0
         aggregator.close()
         assert len(os.listdir(tmp_path)) == 0
+
+
+@freeze_time(FROZEN_TIME)
+def test_persistent_parse_cache(tmp_path: pathlib.Path) -> None:
+    def _run(bar_schema: Dict[str, str]) -> Tuple[SqlAggregatorReport, List[dict]]:
+        aggregator = SqlParsingAggregator(
+            platform="redshift",
+            generate_lineage=True,
+            generate_usage_statistics=False,
+            generate_operations=False,
+            parse_cache_dir=tmp_path,
+        )
+        aggregator._schema_resolver.add_raw_schema_info(
+            DatasetUrn("redshift", "dev.public.bar").urn(), bar_schema
+        )
+        aggregator.add_observed_query(
+            ObservedQuery(
+                query="create table foo as select * from bar",
+                default_db="dev",
+                default_schema="public",
+            )
+        )
+        mcps = [mcp.to_obj() for mcp in aggregator.gen_metadata()]
+        aggregator.close()
+        return aggregator.report, mcps
+
+    report, first_mcps = _run({"a": "int", "b": "int"})
+    cache_report = report.sql_parsing_persistent_cache
+    assert cache_report is not None
+    assert (cache_report.num_hits, cache_report.num_misses) == (0, 1)
+    assert cache_report.num_writes == 1
+
+    # The second run reuses the parse result from the first one.
+    report, second_mcps = _run({"a": "int", "b": "int"})
+    cache_report = report.sql_parsing_persistent_cache
+    assert cache_report is not None
+    assert (cache_report.num_hits, cache_report.num_misses) == (1, 0)
+    assert second_mcps == first_mcps
+
+    # Changing the schema of a referenced table invalidates the cached result.
+    report, third_mcps = _run({"a": "int", "b": "int", "c": "int"})
+    cache_report = report.sql_parsing_persistent_cache
+    assert cache_report is not None
+    assert (cache_report.num_hits, cache_report.num_invalidated) == (0, 1)
+    assert cache_report.num_writes == 1
+    assert third_mcps != first_mcps
+
+
+@freeze_time(FROZEN_TIME)
+def test_parse_dedup_by_fingerprint() -> None:
+    def _run() -> Tuple[SqlAggregatorReport, List[dict]]:
+        aggregator = SqlParsingAggregator(
+            platform="redshift",
+            generate_lineage=True,
+            generate_usage_statistics=False,
+            generate_operations=False,
+        )
+        aggregator._schema_resolver.add_raw_schema_info(
+            DatasetUrn("redshift", "dev.public.bar").urn(), {"a": "int", "b": "int"}
+        )
+        for query in [
+            "insert into foo select a, b from bar where a = 1",
+            "INSERT INTO foo SELECT a, b FROM bar WHERE a = 2 -- retry",
+            "insert into foo select a, b from bar where b in (1, 2, 3)",
+        ]:
+            aggregator.add_observed_query(
+                ObservedQuery(query=query, default_db="dev", default_schema="public")
+            )
+        mcps = [mcp.to_obj() for mcp in aggregator.gen_metadata()]
+        aggregator.close()
+        return aggregator.report, mcps
+
+    report, mcps = _run()
+    assert report.num_sql_parsed == 3
+    assert report.num_sql_parsed_deduplicated == 1
+
+    # Reusing the parse result must not change the output.
+    with patch("datahub.sql_parsing.sql_parsing_aggregator._PARSE_DEDUP_CACHE_SIZE", 0):
+        report, mcps_without_dedup = _run()
+    assert report.num_sql_parsed_deduplicated == 0
+    assert mcps_without_dedup == mcps
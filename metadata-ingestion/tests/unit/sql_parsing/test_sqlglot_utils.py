@@ -1,5 +1,10 @@
+import collections
+import json
+import pathlib
+import re
 import textwrap
 from enum import Enum
+from typing import Dict, Set, Tuple
 
 import pytest
 import sqlglot
@@ -10,6 +15,7 @@ from datahub.sql_parsing.sqlglot_lineage import _UPDATE_ARGS_NOT_SUPPORTED_BY_SE
 from datahub.sql_parsing.sqlglot_utils import (
     generalize_query,
     generalize_query_fast,
+    generalize_query_tokenized,
     get_dialect,
     get_query_fingerprint,
     is_dialect_instance,
@@ -171,6 +177,7 @@ def test_query_generalization(
 ) -> None:
     if mode in {QueryGeneralizationTestMode.FULL, QueryGeneralizationTestMode.BOTH}:
         assert generalize_query(query, dialect=dialect) == expected
+        assert generalize_query_tokenized(query, dialect=dialect) == expected
     if mode in {QueryGeneralizationTestMode.FAST, QueryGeneralizationTestMode.BOTH}:
         assert (
             generalize_query_fast(query, dialect=dialect, change_table_names=True)
@@ -178,6 +185,64 @@ def test_query_generalization(
         )
 
 
+def test_query_generalization_tokenized_differential() -> None:
+    # The tokenized generalization must never merge queries that the AST-based
+    # generalization considers different. We check that on the generalized
+    # statements from the SQL parsing goldens, with different literals filled in.
+    ast_by_tokenized: Dict[Tuple[str, str], Set[str]] = collections.defaultdict(set)
+    for golden_file in sorted(
+        (pathlib.Path(__file__).parent / "goldens").glob("*.json")
+    ):
+        golden = json.loads(golden_file.read_text())
+        statement = golden.get("debug_info", {}).get("generalized_statement")
+        urns = golden["in_tables"] + golden["out_tables"]
+        if not statement or not urns:
+            continue
+        match = re.search(r"urn:li:dataPlatform:([^,]+),", urns[0])
+        assert match
+        platform = match.group(1)
+
+        variants = [
+            statement,
+            statement.replace("?", "42"),
+            statement.replace("?", "'abc'"),
+            f"/* comment */ {statement};\n",
+        ]
+        for variant in variants:
+            tokenized = generalize_query_tokenized(variant, dialect=platform)
+            ast_by_tokenized[(platform, tokenized)].add(
+                generalize_query(variant, dialect=platform)
+            )
+
+        # Comments, whitespace and trailing semicolons are always ignored.
+        assert generalize_query_tokenized(
+            variants[-1], dialect=platform
+        ) == generalize_query_tokenized(statement, dialect=platform)
+
+    assert len(ast_by_tokenized) > 50
+    for (_, tokenized), generalized in ast_by_tokenized.items():
+        assert len(generalized) == 1, (tokenized, generalized)
+
+
+def test_query_generalization_tokenized_literals() -> None:
+    # Aliases and intervals are not replaced, since their values matter.
+    assert (
+        generalize_query_tokenized(
+            "select 1 as 'one', ts - interval '1 day' from t where x in (1, -2)",
+            dialect="mysql",
+        )
+        == "SELECT ? AS 'one', ts - interval '1 day' FROM t WHERE x IN (?, - ?)"
+    )
+
+    # VALUES tuples with non-literals are kept as-is.
+    assert (
+        generalize_query_tokenized(
+            "insert into t values (1, 'a'), (2, b), (3, 'c')", dialect="postgres"
+        )
+        == "INSERT INTO t VALUES (?), (?, b), (?, ?)"
+    )
+
+
 def test_query_fingerprint():
     assert get_query_fingerprint(
         "select * /* everything */ from foo where ts = 34", platform="redshift"
@@ -198,3 +263,6 @@ def test_redshift_query_fingerprint():
     assert get_query_fingerprint(query1, "redshift", True) != get_query_fingerprint(
         query2, "redshift", True
     )
+    assert get_query_fingerprint(
+        query1, "redshift", tokenized=True
+    ) == get_query_fingerprint(query2, "redshift", tokenized=True)
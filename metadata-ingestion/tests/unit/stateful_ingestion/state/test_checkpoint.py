@@ -4,7 +4,12 @@ from typing import Dict, List
 import pydantic
 import pytest
 
-from datahub.ingestion.source.state.checkpoint import Checkpoint, CheckpointStateBase
+from datahub.ingestion.source.state.checkpoint import (
+    Checkpoint,
+    CheckpointStateBase,
+    _front_code,
+    _front_decode,
+)
 from datahub.ingestion.source.state.sql_common_state import (
     BaseSQLAlchemyCheckpointState,
 )
@@ -158,6 +163,42 @@ def test_supported_encodings():
     test_serde_idempotence(test_state)
 
 
+@pytest.mark.parametrize(
+    "serde",
+    [
+        "base85-zlib-json",
+        "base85-zlib-fc-json",
+        "base85-zstd-json",
+        "base85-zstd-fc-json",
+    ],
+)
+def test_fast_encodings(serde: str) -> None:
+    if "zstd" in serde:
+        pytest.importorskip("zstandard")
+
+    for state in _checkpoint_aspect_test_cases.values():
+        test_serde_idempotence(state.copy(update={"serde": serde}))
+
+    state = BaseSQLAlchemyCheckpointState(serde=serde)
+    for i in reversed(range(1000)):
+        state.add_checkpoint_urn(
+            type="table",
+            urn=f"urn:li:dataset:(urn:li:dataPlatform:mysql,db1.table_{i},PROD)",
+        )
+    state.add_checkpoint_urn(type="view", urn="urn:li:container:abc")
+    test_serde_idempotence(state)
+
+    utf8_state = state.copy(update={"serde": "utf-8"})
+    assert len(state.to_bytes()) < len(utf8_state.to_bytes()) / 5
+
+
+def test_front_coding() -> None:
+    values = ["urn:a:b", "urn:a:bc", "urn:x", "", "urn:x", "urn:xyz", "🙂a", "🙂b"]
+    encoded = _front_code(values)
+    assert encoded["__front_coded__"][:6] == [0, "urn:a:b", 7, "c", 4, "x"]
+    assert _front_decode(encoded["__front_coded__"]) == values
+
+
 def test_base85_upgrade_pickle_to_json():
     """Verify that base85 (pickle) encoding is transitioned to base85-bz2-json."""
 
@@ -175,7 +216,7 @@ def test_base85_upgrade_pickle_to_json():
 
 @pytest.mark.parametrize(
     "serde",
-    ["utf-8", "base85-bz2-json"],
+    ["utf-8", "base85-bz2-json", "base85-zlib-json", "base85-zlib-fc-json"],
 )
 def test_state_forward_compatibility(serde: str) -> None:
     class PrevState(CheckpointStateBase):
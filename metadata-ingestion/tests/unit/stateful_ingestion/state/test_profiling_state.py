@@ -0,0 +1,108 @@
+import pytest
+
+from datahub.ingestion.source.state.profiling_state import (
+    ProfiledFieldStats,
+    ProfiledPartitionStats,
+    ProfiledTableState,
+    ProfilingCheckpointState,
+)
+from datahub.metadata.schema_classes import (
+    DatasetFieldProfileClass,
+    DatasetProfileClass,
+)
+
+
+def test_merge_partition_stats() -> None:
+    first = ProfiledPartitionStats(
+        row_count=10,
+        fields={
+            "amount": ProfiledFieldStats(null_count=2, min="9", max="20", mean="10"),
+            "day": ProfiledFieldStats(null_count=0, min="2024-01-01", max="2024-01-01"),
+            "removed": ProfiledFieldStats(null_count=0, min="a", max="b"),
+        },
+    )
+    second = ProfiledPartitionStats(
+        row_count=30,
+        fields={
+            "amount": ProfiledFieldStats(null_count=4, min="10", max="100", mean="20"),
+            "day": ProfiledFieldStats(null_count=0, min="2024-01-02", max="2024-01-02"),
+        },
+    )
+
+    merged = first.merge(second)
+
+    assert merged.row_count == 40
+    # Numbers are compared as numbers, not as strings.
+    assert merged.fields["amount"] == ProfiledFieldStats(
+        null_count=6, min="9", max="100", mean=str((10 * 8 + 20 * 26) / 34)
+    )
+    assert merged.fields["day"] == ProfiledFieldStats(
+        null_count=0, min="2024-01-01", max="2024-01-02"
+    )
+    assert merged.fields["removed"] == ProfiledFieldStats(min="a", max="b")
+
+
+def test_merge_partition_stats_without_null_counts() -> None:
+    first = ProfiledPartitionStats(
+        row_count=10, fields={"a": ProfiledFieldStats(min="1", max="2", mean="1.5")}
+    )
+    second = ProfiledPartitionStats(
+        row_count=10,
+        fields={"a": ProfiledFieldStats(null_count=0, min="3", max="4", mean="3.5")},
+    )
+
+    # Without the number of non-null values, the mean can't be weighted.
+    assert first.merge(second).fields["a"] == ProfiledFieldStats(min="1", max="4")
+
+
+def test_apply_partition_stats_to_profile() -> None:
+    profile = DatasetProfileClass(
+        timestampMillis=0,
+        rowCount=5,
+        fieldProfiles=[
+            DatasetFieldProfileClass(
+                fieldPath="a",
+                uniqueCount=5,
+                nullCount=0,
+                min="1",
+                max="5",
+                median="3",
+                sampleValues=["1", "2"],
+            )
+        ],
+    )
+    stats = ProfiledPartitionStats(
+        row_count=20,
+        fields={"a": ProfiledFieldStats(null_count=5, min="0", max="5", mean="2")},
+    )
+
+    stats.apply_to(profile)
+
+    [field] = profile.fieldProfiles or []
+    assert (field.nullCount, field.min, field.max, field.mean) == (5, "0", "5", "2")
+    assert field.nullProportion == pytest.approx(0.25)
+    assert field.uniqueCount is None
+    assert field.median is None
+    assert field.sampleValues == ["1", "2"]
+
+
+def test_table_state_is_unchanged() -> None:
+    state = ProfiledTableState(rows_count=10, last_altered=1000, partition="20240101")
+
+    assert state.is_unchanged_since(state)
+    assert not state.is_unchanged_since(
+        ProfiledTableState(rows_count=10, last_altered=1000, partition="20231231")
+    )
+    assert not state.is_unchanged_since(
+        ProfiledTableState(rows_count=9, last_altered=1000, partition="20240101")
+    )
+
+    # Tables without a row count or modification time are always profiled.
+    unknown = ProfiledTableState()
+    assert not unknown.is_unchanged_since(unknown)
+
+
+def test_profiling_state_without_table_states() -> None:
+    # Checkpoints written before incremental profiling existed can still be read.
+    state = ProfilingCheckpointState.parse_obj({"last_profiled": {"urn:li:a": 1}})
+    assert state.table_states == {}
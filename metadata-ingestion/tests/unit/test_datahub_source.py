@@ -1,8 +1,42 @@
-from typing import Any, Dict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List
+from unittest.mock import MagicMock
 
 import pytest
 
-from datahub.ingestion.source.datahub.datahub_database_reader import VersionOrderer
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.ingestion.api.common import PipelineContext
+from datahub.ingestion.source.datahub.config import DataHubSourceConfig
+from datahub.ingestion.source.datahub.datahub_database_reader import (
+    CreatedonRange,
+    DataHubDatabaseReader,
+    VersionOrderer,
+)
+from datahub.ingestion.source.datahub.datahub_source import DataHubSource
+from datahub.ingestion.source.datahub.report import DataHubSourceReport
+from datahub.ingestion.source.datahub.state import (
+    DatabasePartitionState,
+    DataHubIngestionState,
+)
+from datahub.metadata.schema_classes import StatusClass
+
+_START = datetime(2024, 1, 1)
+_ROWS = [
+    {
+        "urn": f"urn:li:corpuser:{i}",
+        "aspect": "status",
+        "version": 0,
+        "createdon": _START + timedelta(seconds=i),
+    }
+    for i in range(20)
+]
+_RANGES = [
+    CreatedonRange(start=_START, end=_START + timedelta(seconds=5)),
+    CreatedonRange(
+        start=_START + timedelta(seconds=5), end=_START + timedelta(seconds=12)
+    ),
+    CreatedonRange(start=_START + timedelta(seconds=12), end=None),
+]
 
 
 @pytest.fixture
@@ -39,3 +73,236 @@ def test_version_orderer_disabled(rows):
     orderer = VersionOrderer[Dict[str, Any]](enabled=False)
     ordered_rows = list(orderer(rows))
     assert ordered_rows == rows
+
+
+def _make_reader(**config: Any) -> DataHubDatabaseReader:
+    source_config = DataHubSourceConfig.parse_obj(
+        {
+            "database_connection": {
+                "scheme": "sqlite",
+                "host_port": "",
+                "sqlalchemy_uri": "sqlite://",
+            },
+            **config,
+        }
+    )
+    assert source_config.database_connection is not None
+    return DataHubDatabaseReader(
+        source_config, source_config.database_connection, DataHubSourceReport()
+    )
+
+
+def _fake_range_rows(createdon_range: CreatedonRange) -> Iterable[Dict[str, Any]]:
+    for row in _ROWS:
+        if row["createdon"] >= createdon_range.start and (
+            createdon_range.end is None or row["createdon"] < createdon_range.end
+        ):
+            yield row
+
+
+@pytest.fixture
+def parallel_reader(monkeypatch: pytest.MonkeyPatch) -> DataHubDatabaseReader:
+    reader = _make_reader(database_export_parallelism=3, database_query_batch_size=2)
+    monkeypatch.setattr(reader, "_get_range_rows", _fake_range_rows)
+    monkeypatch.setattr(reader, "get_createdon_ranges", lambda _: _RANGES)
+    monkeypatch.setattr(reader, "_parse_row", lambda row: row["urn"])
+    return reader
+
+
+def test_get_createdon_ranges() -> None:
+    reader = _make_reader(database_export_parallelism=4)
+    reader.engine = MagicMock()
+    execute = reader.engine.connect.return_value.__enter__.return_value.execute
+    execute.return_value.fetchone.return_value = (
+        _START + timedelta(microseconds=300),
+        _START + timedelta(seconds=1, microseconds=300),
+    )
+
+    ranges = reader.get_createdon_ranges(datetime(2023, 1, 1, tzinfo=timezone.utc))
+
+    # Boundaries are truncated to millis, so that they can be checkpointed.
+    assert ranges == [
+        CreatedonRange(
+            start=datetime(2023, 1, 1), end=_START + timedelta(seconds=0.25)
+        ),
+        CreatedonRange(
+            start=_START + timedelta(seconds=0.25), end=_START + timedelta(seconds=0.5)
+        ),
+        CreatedonRange(
+            start=_START + timedelta(seconds=0.5), end=_START + timedelta(seconds=0.75)
+        ),
+        CreatedonRange(start=_START + timedelta(seconds=0.75), end=None),
+    ]
+    assert execute.call_args[0][1] == {"since_createdon": "2023-01-01 00:00:00.000000"}
+
+
+def test_get_createdon_ranges_without_aspects() -> None:
+    reader = _make_reader(database_export_parallelism=4)
+    reader.engine = MagicMock()
+    execute = reader.engine.connect.return_value.__enter__.return_value.execute
+    execute.return_value.fetchone.return_value = (None, None)
+
+    assert reader.get_createdon_ranges(_START) == [
+        CreatedonRange(start=_START, end=None)
+    ]
+
+
+def test_get_range_rows_pages() -> None:
+    reader = _make_reader(database_query_batch_size=2)
+    reader.engine = MagicMock()
+    execute = reader.engine.connect.return_value.__enter__.return_value.execute
+    execute.side_effect = [_ROWS[0:2], _ROWS[2:4], _ROWS[4:5]]
+
+    rows = list(reader._get_range_rows(CreatedonRange(start=_START, end=None)))
+
+    assert rows == _ROWS[0:5]
+    queries = [call[0][0] for call in execute.call_args_list]
+    assert all("LIMIT 2" in query for query in queries)
+    assert "after_urn" not in queries[0]
+    # Each page continues after the last row of the previous one.
+    assert execute.call_args_list[2][0][1]["since_createdon"] == (
+        "2024-01-01 00:00:03.000000"
+    )
+    assert execute.call_args_list[2][0][1]["after_urn"] == "urn:li:corpuser:3"
+
+
+def test_parallel_get_aspects_in_order(parallel_reader: DataHubDatabaseReader) -> None:
+    aspects = list(parallel_reader.get_aspects(_START, datetime.now(tz=timezone.utc)))
+
+    assert aspects == [(row["urn"], row["createdon"]) for row in _ROWS]
+
+
+def test_get_aspects_by_range(parallel_reader: DataHubDatabaseReader) -> None:
+    aspects = list(parallel_reader.get_aspects_by_range(_RANGES))
+
+    assert sorted(aspects, key=lambda aspect: aspect[1]) == [
+        (row["urn"], row["createdon"], 0 if i < 5 else 1 if i < 12 else 2)
+        for i, row in enumerate(_ROWS)
+    ]
+    # Within each range, aspects are still in createdon order.
+    for index in range(len(_RANGES)):
+        createdons = [createdon for _, createdon, i in aspects if i == index]
+        assert createdons == sorted(createdons)
+
+
+def test_get_aspects_by_range_errors(
+    parallel_reader: DataHubDatabaseReader, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def _failing_range_rows(createdon_range: CreatedonRange) -> List[Dict[str, Any]]:
+        if createdon_range.end is None:
+            raise ConnectionError("Lost connection")
+        return list(_fake_range_rows(createdon_range))
+
+    monkeypatch.setattr(parallel_reader, "_get_range_rows", _failing_range_rows)
+    with pytest.raises(ConnectionError):
+        list(parallel_reader.get_aspects_by_range(_RANGES))
+
+
+def test_get_aspects_by_range_stops_readers(
+    parallel_reader: DataHubDatabaseReader,
+) -> None:
+    aspects = parallel_reader.get_aspects_by_range(_RANGES)
+    next(iter(aspects))
+
+    # The readers that are blocked on the queue give up, instead of hanging.
+    aspects.close()  # type: ignore[attr-defined]
+
+
+def test_database_partition_state() -> None:
+    partition = DatabasePartitionState.from_range(
+        CreatedonRange(start=_START, end=_START + timedelta(seconds=5))
+    )
+    assert partition.remaining_range == CreatedonRange(
+        start=_START, end=_START + timedelta(seconds=5)
+    )
+
+    partition.last_createdon_ts = partition.start_createdon_ts + 1500
+    assert partition.last_createdon == _START + timedelta(seconds=1.5)
+    assert partition.remaining_range.start == _START + timedelta(seconds=1.5)
+
+    last = DatabasePartitionState.from_range(CreatedonRange(start=_START, end=None))
+    assert last.remaining_range.end is None
+
+    # Checkpoints from before partitioned exports can still be read.
+    state = DataHubIngestionState.parse_obj({"database_createdon_ts": 1000})
+    assert state.database_partitions == []
+
+
+def _make_source(
+    committed_states: List[DataHubIngestionState],
+) -> DataHubSource:
+    config = DataHubSourceConfig.parse_obj(
+        {
+            "database_connection": {
+                "scheme": "sqlite",
+                "host_port": "",
+                "sqlalchemy_uri": "sqlite://",
+            },
+            "database_export_parallelism": 3,
+            "database_export_preserve_order": False,
+            "commit_state_interval": 1,
+            "stateful_ingestion": {"enabled": False},
+        }
+    )
+    source = DataHubSource(config, PipelineContext(run_id="test"))
+
+    # Checkpoints are kept in memory, and a copy is saved on every commit.
+    handler = source.stateful_ingestion_handler
+    current_state = DataHubIngestionState()
+    handler.state_provider = MagicMock()
+    handler.state_provider.get_current_checkpoint.return_value.state = current_state
+    handler.commit_checkpoint = lambda: committed_states.append(  # type: ignore
+        DataHubIngestionState.parse_obj(current_state.dict())
+    )
+    return source
+
+
+def test_get_database_workunits_by_partition_resumes(
+    parallel_reader: DataHubDatabaseReader, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        parallel_reader,
+        "_parse_row",
+        lambda row: MetadataChangeProposalWrapper(
+            entityUrn=row["urn"], aspect=StatusClass(removed=False)
+        ),
+    )
+
+    # The first run is interrupted partway through.
+    first_run_states: List[DataHubIngestionState] = []
+    first_source = _make_source(first_run_states)
+    workunits = first_source._get_database_workunits_by_partition(
+        state=DataHubIngestionState(), reader=parallel_reader
+    )
+    first_run_urns = [workunit.get_urn() for _, workunit in zip(range(8), workunits)]
+    workunits.close()  # type: ignore[attr-defined]
+    last_state = first_run_states[-1]
+    assert len(last_state.database_partitions) == len(_RANGES)
+    assert any(p.last_createdon is not None for p in last_state.database_partitions)
+
+    # The second run resumes every partition from the last committed checkpoint.
+    second_run_states: List[DataHubIngestionState] = []
+    second_source = _make_source(second_run_states)
+    second_run_urns = [
+        workunit.get_urn()
+        for workunit in second_source._get_database_workunits_by_partition(
+            state=last_state, reader=parallel_reader
+        )
+    ]
+    second_source._commit_progress()
+
+    # No aspect is skipped, and only those after the checkpoint are read again.
+    assert set(first_run_urns) | set(second_run_urns) == {row["urn"] for row in _ROWS}
+    assert len(second_run_urns) < len(_ROWS)
+    for partition in last_state.database_partitions:
+        resumed_urns = {
+            row["urn"] for row in _fake_range_rows(partition.remaining_range)
+        }
+        assert resumed_urns <= set(second_run_urns)
+
+    # Once every partition is exported, the next run starts after the last aspect.
+    final_state = second_run_states[-1]
+    assert final_state.database_partitions == []
+    assert final_state.database_createdon_ts == int(
+        _ROWS[-1]["createdon"].timestamp() * 1000
+    )
@@ -1,3 +1,4 @@
+import threading
 import unittest
 from typing import Union
 from unittest.mock import MagicMock, call, patch
@@ -8,7 +9,11 @@ from datahub.emitter.kafka_emitter import MCE_KEY
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
 from datahub.ingestion.api.common import PipelineContext, RecordEnvelope
 from datahub.ingestion.api.sink import SinkReport, WriteCallback
-from datahub.ingestion.sink.datahub_kafka import DatahubKafkaSink, _KafkaCallback
+from datahub.ingestion.sink.datahub_kafka import (
+    DatahubKafkaSink,
+    KafkaSinkReport,
+    _KafkaCallback,
+)
 from datahub.metadata.com.linkedin.pegasus2avro.mxe import (
     MetadataChangeEvent,
     MetadataChangeProposal,
@@ -107,6 +112,106 @@ class KafkaSinkTest(unittest.TestCase):
         kafka_sink.close()
         mock_producer_instance.flush.assert_has_calls([call(), call()])
 
+    @patch("datahub.ingestion.api.sink.PipelineContext", autospec=True)
+    @patch("datahub.emitter.kafka_emitter.SerializingProducer", autospec=True)
+    def test_kafka_sink_high_throughput(self, mock_producer, mock_context):
+        mock_producer_instance = mock_producer.return_value
+        kafka_sink = DatahubKafkaSink.create(
+            {
+                "connection": {
+                    "bootstrap": "foobar:9092",
+                    "producer_config": {"compression.type": "zstd"},
+                },
+                "high_throughput": True,
+                "poll_interval_seconds": 0.01,
+            },
+            mock_context,
+        )
+
+        producer_config = mock_producer.call_args[0][0]
+        assert producer_config["linger.ms"] == 100
+        assert producer_config["batch.size"] == 1_000_000
+        # The producer config takes precedence.
+        assert producer_config["compression.type"] == "zstd"
+
+        mcp = MetadataChangeProposalWrapper(
+            entityUrn="urn:li:dataset:(urn:li:dataPlatform:mysql,User.UserAccount,PROD)",
+            aspect=models.StatusClass(removed=False),
+        )
+        kafka_sink.write_record_async(
+            RecordEnvelope(record=mcp, metadata={}), MagicMock(spec=WriteCallback)
+        )
+        kafka_sink.handle_work_unit_end(MagicMock())
+        mock_producer_instance.produce.assert_called_once()
+        mock_producer_instance.flush.assert_not_called()
+
+        kafka_sink.close()
+        mock_producer_instance.flush.assert_has_calls([call(), call()])
+        assert kafka_sink.emitter._poll_thread is None
+
+    @patch("datahub.ingestion.api.sink.PipelineContext", autospec=True)
+    @patch("datahub.emitter.kafka_emitter.SerializingProducer", autospec=True)
+    def test_kafka_sink_high_throughput_delivery_reports(
+        self, mock_producer, mock_context
+    ):
+        mock_producer_instance = mock_producer.return_value
+        kafka_sink = DatahubKafkaSink.create(
+            {"high_throughput": True, "poll_interval_seconds": 0.01}, mock_context
+        )
+        write_callback = MagicMock(spec=WriteCallback)
+        callback_threads = []
+        write_callback.on_success.side_effect = lambda *args: callback_threads.append(
+            threading.current_thread()
+        )
+        mcp = MetadataChangeProposalWrapper(
+            entityUrn="urn:li:dataset:(urn:li:dataPlatform:mysql,User.UserAccount,PROD)",
+            aspect=models.StatusClass(removed=False),
+        )
+        kafka_sink.write_record_async(
+            RecordEnvelope(record=mcp, metadata={}), write_callback
+        )
+
+        # The delivery report arrives on the poll thread, but is only handled on
+        # the thread that writes the records.
+        message = MagicMock()
+        message.value.return_value = b"payload"
+        message.latency.return_value = 0.5
+        on_delivery = mock_producer_instance.produce.call_args[1]["on_delivery"]
+        poll_thread = threading.Thread(target=on_delivery, args=(None, message))
+        poll_thread.start()
+        poll_thread.join()
+        write_callback.on_success.assert_not_called()
+        assert kafka_sink.report.total_records_written == 0
+
+        kafka_sink.handle_work_unit_end(MagicMock())
+        write_callback.on_success.assert_called_once()
+        assert callback_threads == [threading.current_thread()]
+        assert kafka_sink.report.total_records_written == 1
+        kafka_sink.close()
+
+    def test_kafka_sink_report_delivery(self):
+        report = KafkaSinkReport()
+        message = MagicMock()
+        message.value.return_value = b"payload"
+        message.latency.return_value = 0.5
+
+        callback = _KafkaCallback(
+            report,
+            record_envelope=MagicMock(),
+            write_callback=MagicMock(spec=WriteCallback),
+        )
+        callback.kafka_callback(None, message)
+        callback.kafka_callback(None, message)
+        callback.kafka_callback(MagicMock(), "Failed to write record")
+
+        assert report.messages_delivered == 2
+        assert report.messages_failed == 1
+        assert report.bytes_delivered == 14
+        assert report.max_delivery_latency_seconds == 0.5
+        assert report.total_delivery_latency_seconds == 1.0
+        assert report.total_records_written == 2
+        assert len(report.failures) == 1
+
     @patch("datahub.ingestion.sink.datahub_kafka.RecordEnvelope", autospec=True)
     @patch("datahub.ingestion.sink.datahub_kafka.WriteCallback", autospec=True)
     def test_kafka_callback_class(self, mock_w_callback, mock_re):
@@ -0,0 +1,344 @@
+from collections import namedtuple
+from typing import Any, Dict, List, Optional
+from unittest import mock
+
+import pytest
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.dialects.mysql.base import MySQLDialect
+from sqlalchemy.dialects.postgresql.base import PGDialect
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine.reflection import Inspector
+
+from datahub.ingestion.source.sql.sql_bulk_reflection import (
+    BulkReflectionInspector,
+    BulkReflector,
+    MySQLBulkReflector,
+    PostgresBulkReflector,
+    SchemaReflection,
+    _group_foreign_keys,
+    get_bulk_reflector,
+)
+from datahub.ingestion.source.sql.sql_report import SQLSourceReport
+
+
+class _FakeReflector(BulkReflector):
+    def __init__(self, reflection: SchemaReflection, fail: bool = False):
+        self.reflection = reflection
+        self.fail = fail
+        self.calls: List[str] = []
+
+    def reflect_schema(
+        self, connection: Connection, inspector: Inspector, schema: str
+    ) -> SchemaReflection:
+        self.calls.append(schema)
+        if self.fail:
+            raise RuntimeError("catalog query failed")
+        return self.reflection
+
+
+@pytest.fixture
+def sqlite_inspector() -> Inspector:
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE other (id INTEGER PRIMARY KEY, name TEXT)")
+    return inspect(engine)
+
+
+def test_bulk_reflection_inspector(sqlite_inspector: Inspector) -> None:
+    reflection = SchemaReflection(
+        columns={"t1": [{"name": "a", "type": None, "nullable": False}]},
+        pk_constraints={"t1": {"constrained_columns": ["a"], "name": "t1_pk"}},
+        foreign_keys={},
+        table_comments={"t1": "my table"},
+    )
+    reflector = _FakeReflector(reflection)
+    report = SQLSourceReport()
+    inspector = BulkReflectionInspector(sqlite_inspector, reflector, report)
+
+    assert inspector.get_columns("t1", "main") == reflection.columns["t1"]
+    assert inspector.get_pk_constraint("t1", "main") == {
+        "constrained_columns": ["a"],
+        "name": "t1_pk",
+    }
+    assert inspector.get_foreign_keys("t1", "main") == []
+    assert inspector.get_table_comment("t1", "main") == {"text": "my table"}
+    assert reflector.calls == ["main"]
+    assert report.num_schemas_bulk_reflected == 1
+
+    # Tables that are missing from the snapshot fall back to the wrapped inspector.
+    assert [c["name"] for c in inspector.get_columns("other", "main")] == [
+        "id",
+        "name",
+    ]
+    assert inspector.get_pk_constraint("other", "main")["constrained_columns"] == ["id"]
+    assert inspector.get_table_names("main") == ["other"]
+    assert reflector.calls == ["main"]
+
+
+def test_bulk_reflection_inspector_fallback(sqlite_inspector: Inspector) -> None:
+    reflector = _FakeReflector(SchemaReflection(), fail=True)
+    report = SQLSourceReport()
+    inspector = BulkReflectionInspector(sqlite_inspector, reflector, report)
+
+    assert [c["name"] for c in inspector.get_columns("other", "main")] == [
+        "id",
+        "name",
+    ]
+    assert inspector.get_foreign_keys("other", "main") == []
+
+    # The failed schema is not retried for every table.
+    assert reflector.calls == ["main"]
+    assert report.num_schemas_bulk_reflected == 0
+    assert len(report.warnings) == 1
+
+
+def test_get_bulk_reflector() -> None:
+    assert get_bulk_reflector("postgresql") is not None
+    assert get_bulk_reflector("mysql") is not None
+    assert get_bulk_reflector("sqlite") is None
+
+
+def test_group_foreign_keys() -> None:
+    assert _group_foreign_keys(
+        [
+            ("t1", "fk_a", "a1", "s", "other", "x1"),
+            ("t1", "fk_a", "a2", "s", "other", "x2"),
+            ("t1", "fk_b", "b", "s2", "third", "y"),
+            ("t2", "fk_c", "c", "s", "t1", "a1"),
+        ]
+    ) == {
+        "t1": [
+            {
+                "name": "fk_a",
+                "constrained_columns": ["a1", "a2"],
+                "referred_schema": "s",
+                "referred_table": "other",
+                "referred_columns": ["x1", "x2"],
+                "options": {},
+            },
+            {
+                "name": "fk_b",
+                "constrained_columns": ["b"],
+                "referred_schema": "s2",
+                "referred_table": "third",
+                "referred_columns": ["y"],
+                "options": {},
+            },
+        ],
+        "t2": [
+            {
+                "name": "fk_c",
+                "constrained_columns": ["c"],
+                "referred_schema": "s",
+                "referred_table": "t1",
+                "referred_columns": ["a1"],
+                "options": {},
+            }
+        ],
+    }
+
+
+def test_mysql_columns_match_show_create_table() -> None:
+    dialect = MySQLDialect()
+    show_create_table = """CREATE TABLE `orders` (
+  `id` bigint unsigned NOT NULL AUTO_INCREMENT,
+  `customer` varchar(255) NOT NULL COMMENT 'the customer''s name',
+  `legacy_code` char(3) CHARACTER SET latin1 COLLATE latin1_bin DEFAULT NULL,
+  `status` enum('new','shipped') DEFAULT 'new',
+  `amount` decimal(10,2) DEFAULT NULL,
+  `created_at` datetime(6) NOT NULL,
+  `payload` json DEFAULT NULL,
+  PRIMARY KEY (`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci"""
+    expected = dialect._tabledef_parser.parse(show_create_table, "utf8mb4").columns
+
+    table_collation = "utf8mb4_0900_ai_ci"
+    information_schema_rows = [
+        ("id", "bigint unsigned", "NO", "auto_increment", "", None, None),
+        (
+            "customer",
+            "varchar(255)",
+            "NO",
+            "",
+            "the customer's name",
+            "utf8mb4",
+            table_collation,
+        ),
+        ("legacy_code", "char(3)", "YES", "", "", "latin1", "latin1_bin"),
+        (
+            "status",
+            "enum('new','shipped')",
+            "YES",
+            "",
+            "",
+            "utf8mb4",
+            table_collation,
+        ),
+        ("amount", "decimal(10,2)", "YES", "", "", None, None),
+        ("created_at", "datetime(6)", "NO", "", "", None, None),
+        ("payload", "json", "YES", "", "", None, None),
+    ]
+    columns = [
+        MySQLBulkReflector.make_column(dialect, *row, table_collation)
+        for row in information_schema_rows
+    ]
+
+    # Column defaults are not reflected.
+    for column in expected:
+        column["default"] = None
+    assert [{**column, "type": repr(column["type"])} for column in columns] == [
+        {**column, "type": repr(column["type"])} for column in expected
+    ]
+
+
+_PgEnum = namedtuple("_PgEnum", ["name", "visible", "schema", "label"])
+
+_PG_ENUMS = [
+    _PgEnum("mood", True, "public", "new"),
+    _PgEnum("mood", True, "public", "shipped"),
+    _PgEnum("legacy_mood", False, "other", "old"),
+]
+
+_PG_DOMAINS = [
+    {
+        "name": "positive_amount",
+        "attype": "numeric(10,2)",
+        "nullable": True,
+        "default": None,
+        "visible": True,
+        "schema": "public",
+    },
+]
+
+# pg_attribute rows by table: name, type, default, not null, comment, generated
+# and identity options.
+_PG_ATTRIBUTES: Dict[str, List[tuple]] = {
+    "events": [
+        (
+            "event_id",
+            "bigint",
+            None,
+            True,
+            None,
+            "",
+            {
+                "always": True,
+                "start": 1,
+                "increment": 1,
+                "minvalue": 1,
+                "maxvalue": 9223372036854775807,
+                "cache": 1,
+                "cycle": False,
+            },
+        ),
+        ("payload", "jsonb", None, False, None, "", None),
+    ],
+    "orders": [
+        ("id", "integer", "nextval('orders_id_seq'::regclass)", True, None, "", None),
+        ("customer", "character varying(255)", None, True, "the name", "", None),
+        ("status", "mood", "'new'::mood", False, None, "", None),
+        ("legacy_status", "other.legacy_mood", None, False, None, "", None),
+        ("amount", "positive_amount", None, False, None, "", None),
+        ("total", "numeric(10,2)", "(amount * 2)", False, None, "s", None),
+        ("tags", "text[]", None, False, None, "", None),
+        ("created_at", "timestamp with time zone", "now()", True, None, "", None),
+    ],
+}
+
+
+class _FakeResult:
+    def __init__(self, rows: List[Any]):
+        self.rows = rows
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def fetchall(self) -> List[Any]:
+        return self.rows
+
+    def mappings(self) -> List[Any]:
+        return self.rows
+
+    def scalar(self) -> Any:
+        return self.rows[0][0] if self.rows else None
+
+
+class _FakePostgresConnection:
+    """Answers the catalog queries of the PostgreSQL dialect with canned rows."""
+
+    def __init__(self, dialect: PGDialect):
+        self.dialect = dialect
+        self.engine = mock.Mock(dialect=dialect)
+
+    def execution_options(self, **kwargs: Any) -> "_FakePostgresConnection":
+        return self
+
+    def execute(self, statement: Any, params: Optional[dict] = None) -> _FakeResult:
+        query = str(statement)
+        if "pg_catalog.pg_enum" in query:
+            return _FakeResult(_PG_ENUMS)
+        if "t.typtype = 'd'" in query:
+            return _FakeResult(_PG_DOMAINS)
+        if "SELECT c.oid" in query:
+            # The table name doubles as its oid.
+            assert params
+            return _FakeResult([(params["table_name"],)])
+        if "FROM pg_catalog.pg_attribute a" in query:
+            assert params
+            if "table_oid" in params:
+                # The per-table query returns the table oid after the not null flag.
+                return _FakeResult(
+                    [
+                        (*row[:4], params["table_oid"], *row[4:])
+                        for row in _PG_ATTRIBUTES[params["table_oid"]]
+                    ]
+                )
+            return _FakeResult(
+                [
+                    (table, *row)
+                    for table, rows in _PG_ATTRIBUTES.items()
+                    for row in rows
+                ]
+            )
+        return _FakeResult([])
+
+
+def test_postgres_columns_match_inspector() -> None:
+    # The bulk reflector relies on the dialect's private _load_domains,
+    # _load_enums and _get_column_info, so this checks that it still uses them the
+    # same way as the dialect's own get_columns.
+    dialect = PGDialect()
+    dialect.server_version_info = (14, 0)
+    dialect.default_schema_name = "public"
+    connection = _FakePostgresConnection(dialect)
+    inspector = Inspector._construct(Inspector._init_connection, connection)
+
+    reflection = PostgresBulkReflector().reflect_schema(
+        connection,  # type: ignore
+        inspector,
+        "public",
+    )
+
+    assert list(reflection.columns) == ["events", "orders"]
+    for table, columns in reflection.columns.items():
+        expected = inspector.get_columns(table, "public")
+        assert [{**column, "type": repr(column["type"])} for column in columns] == [
+            {**column, "type": repr(column["type"])} for column in expected
+        ]
+
+    orders = {column["name"]: column for column in reflection.columns["orders"]}
+    assert repr(orders["status"]["type"]) == "ENUM('new', 'shipped', name='mood')"
+    assert orders["legacy_status"]["type"].schema == "other"
+    # Domains are reflected as their base type, without its modifiers.
+    assert repr(orders["amount"]["type"]) == "NUMERIC()"
+    assert orders["total"]["computed"] == {"sqltext": "(amount * 2)", "persisted": True}
+    assert orders["customer"]["comment"] == "the name"
+    assert reflection.columns["events"][0]["identity"]["always"] is True
+
+
+def test_bulk_reflection_not_enabled_by_default() -> None:
+    from tests.unit.test_sql_common import get_test_sql_alchemy_source
+
+    source = get_test_sql_alchemy_source()
+    inspector = mock.Mock()
+    assert source.get_schema_inspector(inspector) is inspector
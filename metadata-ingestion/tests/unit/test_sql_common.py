@@ -1,8 +1,12 @@
-from typing import Dict
+from typing import Any, Dict, Iterable, List, Tuple, cast
 from unittest import mock
 
 import pytest
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine.reflection import Inspector
 
+from datahub.ingestion.source.sql.mssql.job_models import ProcedureLineageStream
+from datahub.ingestion.source.sql.mssql.source import SQLServerConfig, SQLServerSource
 from datahub.ingestion.source.sql.sql_common import PipelineContext, SQLAlchemySource
 from datahub.ingestion.source.sql.sql_config import SQLCommonConfig
 from datahub.ingestion.source.sql.sqlalchemy_uri_mapper import (
@@ -138,3 +142,143 @@ def test_test_connection_failure():
     assert not report.basic_connectivity.capable
     assert report.basic_connectivity.failure_reason
     assert "Connection refused" in report.basic_connectivity.failure_reason
+
+
+class _SQLiteConfig(SQLCommonConfig):
+    path: str
+
+    def get_sql_alchemy_url(self):
+        return f"sqlite:///{self.path}/main.db"
+
+
+_SQLITE_SCHEMAS = ["s1", "s2", "s3"]
+
+
+def _get_sqlite_inspectors(path: str) -> Iterable[Inspector]:
+    engine = create_engine(f"sqlite:///{path}/main.db")
+
+    @event.listens_for(engine, "connect")
+    def _attach_schemas(dbapi_connection, connection_record):
+        for schema in _SQLITE_SCHEMAS:
+            dbapi_connection.execute(
+                f"ATTACH DATABASE '{path}/{schema}.db' AS {schema}"
+            )
+
+    with engine.connect() as conn:
+        yield inspect(conn)
+
+
+def _create_sqlite_schemas(path: str) -> None:
+    engine = create_engine(f"sqlite:///{path}/main.db")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE base (id INTEGER PRIMARY KEY)")
+        for schema in _SQLITE_SCHEMAS:
+            conn.exec_driver_sql(f"ATTACH DATABASE '{path}/{schema}.db' AS {schema}")
+            for i in range(20):
+                conn.exec_driver_sql(
+                    f"CREATE TABLE {schema}.t{i} (id INTEGER PRIMARY KEY, name TEXT)"
+                )
+            conn.exec_driver_sql(f"CREATE VIEW {schema}.v AS SELECT id FROM t0")
+
+
+class _SQLiteSource(SQLAlchemySource):
+    def _add_default_options(self, sql_config: SQLCommonConfig) -> None:
+        # sqlite file databases use a NullPool, which doesn't accept pool options.
+        pass
+
+    def get_inspectors(self) -> Iterable[Inspector]:
+        return _get_sqlite_inspectors(cast(_SQLiteConfig, self.config).path)
+
+
+def _get_sqlite_workunits(path: str, schema_parallelism: int) -> List[str]:
+    config = _SQLiteConfig.parse_obj(
+        {"path": path, "schema_parallelism": schema_parallelism}
+    )
+    source = _SQLiteSource(config, PipelineContext(run_id="test_ctx"), "sqlite")
+    workunits = [wu.id for wu in source.get_workunits_internal()]
+    assert len(source.report.schema_processing_sec) == 4
+    return workunits
+
+
+def test_schema_parallelism_is_deterministic(tmp_path):
+    _create_sqlite_schemas(str(tmp_path))
+
+    sequential = _get_sqlite_workunits(str(tmp_path), schema_parallelism=1)
+    parallel = _get_sqlite_workunits(str(tmp_path), schema_parallelism=3)
+    assert parallel == sequential
+    assert any(wu.startswith("s3.t19") for wu in parallel)
+
+
+class _SQLiteSQLServerConfig(SQLServerConfig):
+    path: str
+
+    def get_sql_alchemy_url(self, *args: Any, **kwargs: Any) -> str:
+        return f"sqlite:///{self.path}/main.db"
+
+
+class _SQLiteSQLServerSource(SQLServerSource):
+    """Reads the tables from sqlite, and lists one stored procedure per table."""
+
+    def _add_default_options(self, sql_config: SQLCommonConfig) -> None:
+        pass
+
+    def get_inspectors(self) -> Iterable[Inspector]:
+        return _get_sqlite_inspectors(cast(_SQLiteSQLServerConfig, self.config).path)
+
+    @staticmethod
+    def _get_stored_procedures(conn, db_name, schema):
+        rows = conn.exec_driver_sql(
+            f"SELECT name FROM {schema}.sqlite_master WHERE type = 'table'"
+        )
+        return [dict(db=db_name, schema=schema, name=f"p_{row[0]}") for row in rows]
+
+    @staticmethod
+    def _get_procedure_upstream(conn, procedure):
+        return ProcedureLineageStream(dependencies=[])
+
+    _get_procedure_downstream = _get_procedure_upstream
+
+    @staticmethod
+    def _get_procedure_code(conn, procedure):
+        return None, None
+
+    @staticmethod
+    def _get_procedure_inputs(conn, procedure):
+        return []
+
+    @staticmethod
+    def _get_procedure_properties(conn, procedure):
+        return {}
+
+
+def _get_sql_server_results(
+    path: str, schema_parallelism: int
+) -> Tuple[List[str], List[str]]:
+    config = _SQLiteSQLServerConfig.parse_obj(
+        {
+            "path": path,
+            "schema_parallelism": schema_parallelism,
+            "include_descriptions": False,
+            "include_jobs": False,
+            "include_stored_procedures": True,
+            "include_lineage": True,
+        }
+    )
+    source = _SQLiteSQLServerSource(config, PipelineContext(run_id="test_ctx"))
+    workunits = [wu.id for wu in source.get_workunits_internal()]
+    procedures = [procedure.full_name for procedure in source.stored_procedures]
+    return workunits, procedures
+
+
+def test_schema_parallelism_with_stored_procedures(tmp_path):
+    _create_sqlite_schemas(str(tmp_path))
+
+    sequential = _get_sql_server_results(str(tmp_path), schema_parallelism=1)
+    parallel = _get_sql_server_results(str(tmp_path), schema_parallelism=3)
+    assert parallel == sequential
+    # The procedures collected by the workers are all kept, in schema order.
+    procedures = parallel[1]
+    assert len(procedures) == 1 + 3 * 20
+    assert [procedure.split(".")[1] for procedure in procedures] == sorted(
+        procedure.split(".")[1] for procedure in procedures
+    )
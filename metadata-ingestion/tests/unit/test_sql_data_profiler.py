@@ -0,0 +1,228 @@
+import pathlib
+import statistics
+from typing import List, Optional
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.engine import Engine
+
+from datahub.ingestion.source.ge_data_profiler import GEProfilerRequest
+from datahub.ingestion.source.ge_profiling_config import (
+    GEProfilingConfig,
+    ProfilingEngine,
+)
+from datahub.ingestion.source.sql.sql_report import SQLSourceReport
+from datahub.ingestion.source.sql_data_profiler import (
+    DatahubSQLProfiler,
+    _SingleTableProfiler,
+    create_profiler,
+)
+from datahub.metadata.schema_classes import (
+    DatasetProfileClass,
+    PartitionSpecClass,
+    PartitionTypeClass,
+)
+
+
+class _StdDevSamp:
+    def __init__(self) -> None:
+        self.values: List[float] = []
+
+    def step(self, value: Optional[float]) -> None:
+        if value is not None:
+            self.values.append(value)
+
+    def finalize(self) -> Optional[float]:
+        return statistics.stdev(self.values) if len(self.values) > 1 else None
+
+
+def _make_engine(tmp_path: pathlib.Path, with_stddev: bool = True) -> Engine:
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'profiling.db'}")
+    if with_stddev:
+        # SQLite has no stddev_samp aggregate, so we register one.
+        @sa.event.listens_for(engine, "connect")
+        def _register_stddev(dbapi_connection, connection_record):
+            dbapi_connection.create_aggregate("stddev_samp", 1, _StdDevSamp)
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE orders (id INTEGER, category TEXT, amount INTEGER, created DATE)"
+        )
+        conn.execute(
+            sa.text("INSERT INTO orders VALUES (:id, :category, :amount, :created)"),
+            [
+                {
+                    "id": i,
+                    "category": ["a", "b", None][i % 3],
+                    "amount": i % 50,
+                    "created": f"2024-01-{(i % 28) + 1:02d}",
+                }
+                for i in range(1, 101)
+            ],
+        )
+    return engine
+
+
+def _profile(
+    engine: Engine, config: GEProfilingConfig, report: SQLSourceReport
+) -> Optional[DatasetProfileClass]:
+    profiler = DatahubSQLProfiler(engine, report, config, platform="sqlite")
+    request = GEProfilerRequest(
+        pretty_name="main.orders", batch_kwargs={"schema": "main", "table": "orders"}
+    )
+    [(returned_request, profile)] = profiler.generate_profiles([request], 1)
+    assert returned_request is request
+    return profile
+
+
+def test_sql_profiler(tmp_path: pathlib.Path) -> None:
+    config = GEProfilingConfig.parse_obj(
+        {
+            "enabled": True,
+            "engine": "sql",
+            "include_field_quantiles": True,
+            "include_field_histogram": True,
+            "include_field_distinct_value_frequencies": True,
+        }
+    )
+    report = SQLSourceReport()
+    profile = _profile(_make_engine(tmp_path), config, report)
+
+    assert profile is not None
+    assert profile.rowCount == 100
+    assert profile.columnCount == 4
+    assert profile.partitionSpec is not None
+    assert profile.partitionSpec.type == PartitionTypeClass.FULL_TABLE
+    fields = {field.fieldPath: field for field in profile.fieldProfiles or []}
+    assert list(fields) == ["id", "category", "amount", "created"]
+
+    id_field = fields["id"]
+    assert id_field.nullCount == 0
+    assert id_field.uniqueCount == 100
+    assert id_field.uniqueProportion == 1
+    assert (id_field.min, id_field.max) == ("1", "100")
+    assert id_field.mean == "50.5"
+    assert id_field.median == "50.5"
+    assert id_field.stdev == str(statistics.stdev(range(1, 101)))
+    assert id_field.sampleValues == [str(i) for i in range(1, 21)]
+    # Unique columns have neither quantiles nor value frequencies.
+    assert id_field.quantiles is None
+    assert id_field.distinctValueFrequencies is None
+
+    category = fields["category"]
+    assert category.nullCount == 33
+    assert category.nullProportion == pytest.approx(0.33)
+    assert category.uniqueCount == 2
+    assert category.min is None
+    assert [
+        (f.value, f.frequency) for f in category.distinctValueFrequencies or []
+    ] == [
+        ("a", 33),
+        ("b", 34),
+    ]
+    # The first rows have too many nulls, so the column is sampled on its own.
+    assert category.sampleValues is not None
+    assert len(category.sampleValues) == 20
+    assert set(category.sampleValues) == {"a", "b"}
+
+    # 50 distinct values, each appearing twice.
+    amount = fields["amount"]
+    assert amount.uniqueCount == 50
+    assert amount.median == "24.5"
+    assert [(q.quantile, q.value) for q in amount.quantiles or []] == [
+        ("0.05", "2"),
+        ("0.25", "12"),
+        ("0.5", "25"),
+        ("0.75", "37"),
+        ("0.95", "47"),
+    ]
+    assert amount.histogram is not None
+    assert [float(b) for b in amount.histogram.boundaries] == pytest.approx(
+        [4.9 * i for i in range(11)]
+    )
+    assert amount.histogram.heights == pytest.approx([0.0] + [0.1] * 10 + [0.0])
+    assert amount.distinctValueFrequencies is None
+
+    created = fields["created"]
+    assert (created.min, created.max) == ("2024-01-01", "2024-01-28")
+    assert created.mean is None
+
+    assert not report.warnings
+
+
+def test_sql_profiler_falls_back_to_column_queries(tmp_path: pathlib.Path) -> None:
+    config = GEProfilingConfig.parse_obj({"enabled": True, "engine": "sql"})
+    report = SQLSourceReport()
+
+    # Without stddev_samp, the numeric columns can't be aggregated, but that
+    # shouldn't prevent the other columns from being profiled.
+    profile = _profile(_make_engine(tmp_path, with_stddev=False), config, report)
+
+    assert profile is not None
+    assert profile.rowCount == 100
+    fields = {field.fieldPath: field for field in profile.fieldProfiles or []}
+    assert fields["category"].uniqueCount == 2
+    assert fields["created"].min == "2024-01-01"
+    assert fields["id"].uniqueCount is None
+    assert fields["amount"].uniqueCount is None
+    assert len(report.warnings) == 1
+
+
+def test_sql_profiler_limit(tmp_path: pathlib.Path) -> None:
+    config = GEProfilingConfig.parse_obj(
+        {"enabled": True, "engine": "sql", "limit": 10, "offset": 5}
+    )
+    profile = _profile(_make_engine(tmp_path), config, SQLSourceReport())
+
+    assert profile is not None
+    # The row count is the one of the whole table.
+    assert profile.rowCount == 100
+    assert profile.partitionSpec is not None
+    assert profile.partitionSpec.type == PartitionTypeClass.QUERY
+    fields = {field.fieldPath: field for field in profile.fieldProfiles or []}
+    assert (fields["id"].min, fields["id"].max) == ("6", "15")
+
+
+@pytest.mark.parametrize(
+    "partition,expected",
+    [
+        (None, PartitionSpecClass(type=PartitionTypeClass.QUERY, partition="SAMPLE")),
+        (
+            "20240101",
+            PartitionSpecClass(
+                type=PartitionTypeClass.PARTITION, partition="20240101 SAMPLE"
+            ),
+        ),
+    ],
+)
+def test_bigquery_sampling_partition_spec(
+    tmp_path: pathlib.Path, partition: Optional[str], expected: PartitionSpecClass
+) -> None:
+    config = GEProfilingConfig.parse_obj({"enabled": True, "engine": "sql"})
+    with _make_engine(tmp_path).connect() as conn:
+        profiler = _SingleTableProfiler(
+            conn,
+            pretty_name="main.orders",
+            schema="main",
+            table="orders",
+            partition=partition,
+            custom_sql=None,
+            use_quoted_name=False,
+            config=config,
+            report=SQLSourceReport(),
+            platform="sqlite",
+            env="PROD",
+        )
+        profile = profiler._init_profile()
+        profiler._use_bigquery_sampling(profile, table_row_count=10_000_000)
+
+    # Sampled profiles must not keep the full table label.
+    assert profile.partitionSpec == expected
+
+
+def test_create_profiler() -> None:
+    engine = sa.create_engine("sqlite://")
+    config = GEProfilingConfig.parse_obj({"enabled": True, "engine": "SQL"})
+    assert config.engine == ProfilingEngine.SQL
+    profiler = create_profiler(engine, SQLSourceReport(), config, platform="sqlite")
+    assert isinstance(profiler, DatahubSQLProfiler)
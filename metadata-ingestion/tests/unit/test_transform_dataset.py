@@ -1,7 +1,17 @@
 import json
 import re
 from datetime import datetime, timezone
-from typing import Any, Dict, List, MutableSequence, Optional, Type, Union, cast
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    MutableSequence,
+    Optional,
+    Type,
+    Union,
+    cast,
+)
 from unittest import mock
 from uuid import uuid4
 
@@ -49,6 +59,7 @@ from datahub.ingestion.transformer.add_dataset_terms import (
     PatternAddDatasetTerms,
     SimpleAddDatasetTerms,
 )
+from datahub.ingestion.transformer.aspect_prefetcher import ServerAspectPrefetcher
 from datahub.ingestion.transformer.base_transformer import (
     BaseTransformer,
     SingleAspectTransformer,
@@ -1570,6 +1581,129 @@ def test_ownership_patching_with_different_types_2(mock_time):
     ]
 
 
+def test_server_aspect_prefetcher(mock_time):
+    urn_1 = builder.make_dataset_urn("bigquery", "example1")
+    urn_2 = builder.make_dataset_urn("bigquery", "example2")
+    urn_3 = builder.make_dataset_urn("bigquery", "example3")
+    server_ownership = gen_owners(["foo"])
+
+    mock_graph = mock.MagicMock()
+    mock_graph.get_entities.return_value = {
+        urn_1: {"ownership": (server_ownership, None)}
+    }
+    prefetcher = ServerAspectPrefetcher(mock_graph, batch_size=2)
+    prefetcher.register(["dataset"], [models.OwnershipClass])
+
+    workunits = [
+        make_generic_dataset_mcp(entity_urn=urn).as_workunit()
+        for urn in [urn_1, urn_1, urn_2]
+    ]
+    assert list(prefetcher.prefetch(workunits)) == workunits
+    mock_graph.get_entities.assert_called_once_with(
+        "dataset", [urn_1, urn_2], ["ownership"]
+    )
+
+    ownership = prefetcher.get_ownership(urn_1)
+    assert ownership == server_ownership
+    # Transformers may modify the aspects they get back.
+    assert ownership is not server_ownership
+    assert prefetcher.get_ownership(urn_2) is None
+    mock_graph.get_ownership.assert_not_called()
+
+    # Anything that wasn't prefetched is read from the graph.
+    mock_graph.get_ownership.return_value = server_ownership
+    assert prefetcher.get_ownership(urn_3) == server_ownership
+    mock_graph.get_ownership.assert_called_once_with(entity_urn=urn_3)
+
+
+def test_server_aspect_prefetcher_failure(mock_time):
+    urn_1 = builder.make_dataset_urn("bigquery", "example1")
+    mock_graph = mock.MagicMock()
+    mock_graph.get_entities.side_effect = Exception("batch endpoint not found")
+    mock_graph.get_tags.return_value = None
+    prefetcher = ServerAspectPrefetcher(mock_graph)
+    prefetcher.register(["*"], [models.GlobalTagsClass])
+
+    workunits = [make_generic_dataset_mcp(entity_urn=urn_1).as_workunit()]
+    assert list(prefetcher.prefetch(workunits)) == workunits
+    assert list(prefetcher.prefetch(workunits)) == workunits
+    assert mock_graph.get_entities.call_count == 1
+
+    assert prefetcher.get_tags(urn_1) is None
+    mock_graph.get_tags.assert_called_once_with(entity_urn=urn_1)
+
+
+def test_server_aspect_prefetcher_streams_workunits(mock_time):
+    urns = [builder.make_dataset_urn("bigquery", f"example{i}") for i in range(100)]
+    mock_graph = mock.MagicMock()
+    mock_graph.get_entities.return_value = {}
+    prefetcher = ServerAspectPrefetcher(
+        mock_graph, batch_size=10, max_pending_workunits=5
+    )
+    prefetcher.register(["dataset"], [models.OwnershipClass])
+
+    pulled = []
+
+    def _workunits(urns: List[str]) -> Iterable[workunit.MetadataWorkUnit]:
+        for urn in urns:
+            pulled.append(urn)
+            yield make_generic_dataset_mcp(entity_urn=urn).as_workunit()
+
+    # Work units are flushed once enough of them are pending, even without a full
+    # batch of urns.
+    workunits = iter(prefetcher.prefetch(_workunits(urns)))
+    next(workunits)
+    assert len(pulled) == 5
+
+    # Work units of entity types that nothing is prefetched for are not held back.
+    chart_urns = [builder.make_chart_urn("looker", str(i)) for i in range(100)]
+    workunits = iter(prefetcher.prefetch(_workunits(chart_urns)))
+    pulled.clear()
+    next(workunits)
+    assert len(pulled) == 1
+
+    # Nor are any work units once prefetching is disabled.
+    mock_graph.get_entities.side_effect = Exception("batch endpoint not found")
+    list(prefetcher.prefetch(_workunits(urns[:10])))
+    workunits = iter(prefetcher.prefetch(_workunits(urns)))
+    pulled.clear()
+    next(workunits)
+    assert len(pulled) == 1
+
+
+def test_ownership_patching_with_prefetched_aspects(mock_time):
+    urn = builder.make_dataset_urn("bigquery", "example1")
+    mock_graph = mock.MagicMock()
+    mock_graph.get_entities.return_value = {
+        urn: {"ownership": (gen_owners(["foo"]), None)}
+    }
+    transformer = SimpleAddDatasetOwnership.create(
+        {"owner_urns": ["bar"], "semantics": "PATCH"},
+        PipelineContext(run_id="test-prefetch", graph=mock_graph),
+    )
+    assert transformer.server_aspects() == [models.OwnershipClass]
+
+    prefetcher = ServerAspectPrefetcher(mock_graph)
+    prefetcher.register(transformer.entity_types(), transformer.server_aspects())
+    transformer.aspect_prefetcher = prefetcher
+    list(prefetcher.prefetch([make_generic_dataset_mcp(entity_urn=urn).as_workunit()]))
+
+    outputs = list(
+        transformer.transform(
+            [
+                RecordEnvelope(
+                    make_generic_dataset_mcp(entity_urn=urn, aspect=gen_owners([])),
+                    metadata={},
+                ),
+                RecordEnvelope(EndOfStream(), metadata={}),
+            ]
+        )
+    )
+    ownership = outputs[0].record.aspect
+    assert {owner.owner for owner in ownership.owners} == {"foo", "bar"}
+    mock_graph.get_ownership.assert_not_called()
+
+
 PROPERTIES_TO_ADD = {"my_new_property": "property value"}
 
 
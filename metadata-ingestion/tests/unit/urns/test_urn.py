@@ -14,6 +14,7 @@ from datahub.metadata.urns import (
     Urn,
 )
 from datahub.testing.doctest import assert_doctest
+from datahub.utilities.urns._urn_base import get_urn_parse_cache_info
 from datahub.utilities.urns.error import InvalidUrnError
 
 pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning")
@@ -148,6 +149,35 @@ def test_urn_type_dispatch_4() -> None:
     assert urn2.urn() == urn_str
 
 
+def test_urn_parse_cache() -> None:
+    urn_str = "urn:li:dataset:(urn:li:dataPlatform:abc,cached_table,PROD)"
+
+    # The first parse is a miss. Parsing a dataset urn also parses its platform
+    # urn, so the exact number of misses is not asserted.
+    info = get_urn_parse_cache_info()
+    urn = Urn.from_string(urn_str)
+    assert get_urn_parse_cache_info()["misses"] > info["misses"]
+
+    # Parsing the same string again returns the same object.
+    info = get_urn_parse_cache_info()
+    assert DatasetUrn.from_string(urn_str) is urn
+    assert Urn.from_string(urn_str) is urn
+    assert get_urn_parse_cache_info()["hits"] == info["hits"] + 2
+    assert get_urn_parse_cache_info()["misses"] == info["misses"]
+
+    # Type checks are applied to cached urns as well.
+    with pytest.raises(InvalidUrnError, match="Passed an urn of type dataset"):
+        CorpUserUrn.from_string(urn_str)
+
+    # Invalid urns are not cached, so parsing one again is another miss.
+    misses = []
+    for _ in range(2):
+        with pytest.raises(InvalidUrnError):
+            Urn.from_string("urn:li:dataset:(urn:li:dataPlatform:abc,)")
+        misses.append(get_urn_parse_cache_info()["misses"])
+    assert misses[1] > misses[0]
+
+
 def test_urn_from_urn_simple() -> None:
     # This capability is also tested by a bunch of other tests above.
 
@@ -57,3 +57,35 @@ def test_backpressure_aware_executor_advanced():
         # Validate that the entire process took about 5-10x the task duration.
         # That's because we have 2 workers and 10 tasks.
         assert 5 * task_duration < timer.elapsed_seconds() < 10 * task_duration
+
+
+def test_backpressure_aware_executor_ordered():
+    def task(i):
+        # The first tasks take the longest, but are still yielded first.
+        time.sleep(0.01 * (10 - i))
+        return i
+
+    assert [
+        res.result()
+        for res in BackpressureAwareExecutor.map_ordered(
+            task, ((i,) for i in range(10)), max_workers=4, max_pending=4
+        )
+    ] == list(range(10))
+
+
+def test_backpressure_aware_executor_ordered_limits_pending():
+    started = set()
+
+    def task(i):
+        started.add(i)
+        return i
+
+    results = BackpressureAwareExecutor.map_ordered(
+        task, ((i,) for i in range(100)), max_workers=2, max_pending=4
+    )
+    assert next(results).result() == 0
+    time.sleep(0.1)
+
+    # Only the tasks that fit in the pending list have been submitted.
+    assert started.issubset(set(range(5)))
+    assert [r.result() for r in results] == list(range(1, 100))
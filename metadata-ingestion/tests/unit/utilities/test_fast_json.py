@@ -0,0 +1,103 @@
+import json
+import pathlib
+from typing import Any, List
+
+import pytest
+
+from datahub.utilities import fast_json
+
+_RESOURCES_DIR = pathlib.Path(__file__).parent.parent
+
+GOLDEN_FILES = [
+    _RESOURCES_DIR / "serde/test_serde_patch.json",
+    _RESOURCES_DIR / "serde/test_serde_profile.json",
+    _RESOURCES_DIR / "serde/test_domain_properties.json",
+    _RESOURCES_DIR / "sql_parsing/aggregator_goldens/test_basic_lineage.json",
+    _RESOURCES_DIR / "sql_parsing/aggregator_goldens/test_aggregate_operations.json",
+]
+
+
+@pytest.fixture(params=["stdlib", "orjson"])
+def json_backend(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> str:
+    if request.param == "stdlib":
+        monkeypatch.setattr(fast_json, "_orjson", None)
+    else:
+        orjson = pytest.importorskip("orjson")
+        monkeypatch.setattr(fast_json, "_orjson", orjson)
+    assert fast_json.get_json_backend() == request.param
+    return request.param
+
+
+def _write_like_file_sink(records: List[Any]) -> str:
+    # Mirrors the framing used by the file sink.
+    return "[\n" + ",\n".join(fast_json.dumps(r, indent=4) for r in records) + "\n]"
+
+
+@pytest.mark.parametrize("golden_file", GOLDEN_FILES, ids=lambda p: p.name)
+def test_fast_json_golden_files(json_backend: str, golden_file: pathlib.Path) -> None:
+    golden = golden_file.read_text()
+    records = json.loads(golden)
+
+    # These goldens are pure ASCII, so both backends must reproduce them exactly.
+    assert _write_like_file_sink(records) == golden
+    assert fast_json.loads(golden) == records
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        {"a": 1, "b": [1, 2, {"c": None}], "d": "text", "e": True, "f": 1.5},
+        [],
+        {},
+        {"nested": {"empty_list": [], "empty_dict": {}}},
+        {"multiline": "line 1\nline 2\n  indented"},
+        {"big_int": 2**70},
+    ],
+)
+def test_fast_json_matches_stdlib(json_backend: str, obj: Any) -> None:
+    for indent in [None, 2, 4]:
+        serialized = fast_json.dumps(obj, indent=indent)
+        assert json.loads(serialized) == obj
+        if json_backend == "stdlib":
+            assert serialized == json.dumps(obj, indent=indent)
+    assert fast_json.loads(json.dumps(obj)) == obj
+
+
+def test_fast_json_non_ascii(json_backend: str) -> None:
+    obj = {"name": "ünïcödé ✓"}
+    serialized = fast_json.dumps(obj)
+    assert json.loads(serialized) == obj
+    assert fast_json.loads(serialized) == obj
+    assert fast_json.loads(serialized.encode()) == obj
+
+
+def test_fast_json_stdlib_only_inputs(json_backend: str) -> None:
+    # The stdlib accepts NaN literals, which orjson rejects.
+    parsed = fast_json.loads('{"value": NaN}')
+    assert parsed["value"] != parsed["value"]
+
+    with pytest.raises(json.JSONDecodeError):
+        fast_json.loads("{not json")
+
+    with pytest.raises(TypeError):
+        fast_json.dumps({"value": object()})
+
+
+def test_fast_json_stdlib_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("DATAHUB_JSON_BACKEND", raising=False)
+    assert fast_json._load_orjson() is None
+
+    monkeypatch.setenv("DATAHUB_JSON_BACKEND", "orjson")
+    orjson = pytest.importorskip("orjson")
+    assert fast_json._load_orjson() is orjson
+
+
+def test_fast_json_non_finite_floats(json_backend: str) -> None:
+    obj = {"nan": float("nan"), "inf": float("inf")}
+    if json_backend == "stdlib":
+        assert fast_json.dumps(obj) == json.dumps(obj)
+    else:
+        # orjson can't write the non-standard literals, which is why it is opt-in.
+        assert fast_json.loads(fast_json.dumps(obj)) == {"nan": None, "inf": None}
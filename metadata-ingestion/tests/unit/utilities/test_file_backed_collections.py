@@ -12,6 +12,7 @@ import pytest
 from datahub.utilities.file_backed_collections import (
     ConnectionWrapper,
     FileBackedDict,
+    FileBackedDictEvictionPolicy,
     FileBackedList,
 )
 
@@ -46,12 +47,16 @@ def test_set_use_sqlite_on_conflict():
         assert cache._use_sqlite_on_conflict is False
 
 
+@pytest.mark.parametrize("eviction_policy", list(FileBackedDictEvictionPolicy))
 @pytest.mark.parametrize("use_sqlite_on_conflict", [True, False])
-def test_file_dict(use_sqlite_on_conflict: bool) -> None:
+def test_file_dict(
+    use_sqlite_on_conflict: bool, eviction_policy: FileBackedDictEvictionPolicy
+) -> None:
     cache = FileBackedDict[int](
         tablename="cache",
         cache_max_size=10,
         cache_eviction_batch_size=10,
+        cache_eviction_policy=eviction_policy,
         _use_sqlite_on_conflict=use_sqlite_on_conflict,
     )
 
@@ -125,6 +130,108 @@ def test_file_dict(use_sqlite_on_conflict: bool) -> None:
         cache["a"] = 1
 
 
+@pytest.mark.parametrize(
+    "eviction_policy,expected_hot_hits",
+    [
+        (FileBackedDictEvictionPolicy.LRU, 0),
+        (FileBackedDictEvictionPolicy.SEGMENTED_LRU, 10),
+    ],
+)
+def test_file_dict_scan_resistance(
+    eviction_policy: FileBackedDictEvictionPolicy, expected_hot_hits: int
+) -> None:
+    cache = FileBackedDict[int](
+        cache_max_size=20,
+        cache_eviction_batch_size=5,
+        cache_eviction_policy=eviction_policy,
+    )
+    for i in range(100):
+        cache[f"key-{i}"] = i
+    cache.flush()
+
+    hot_keys = [f"key-{i}" for i in range(10)]
+    for _ in range(2):
+        for key in hot_keys:
+            assert cache[key] == int(key.split("-")[1])
+
+    # A single pass over every key shouldn't flush out the hot keys.
+    for i in range(10, 100):
+        assert cache[f"key-{i}"] == i
+
+    hits_before = cache.cache_stats.hits
+    for key in hot_keys:
+        cache[key]
+    assert cache.cache_stats.hits - hits_before == expected_hot_hits
+
+
+def test_file_dict_cache_stats() -> None:
+    cache = FileBackedDict[int](cache_max_size=4, cache_eviction_batch_size=2)
+
+    for i in range(5):
+        cache[f"key-{i}"] = i
+    assert cache.cache_stats.evictions == 2
+    assert cache.cache_stats.writebacks == 2
+
+    assert cache["key-4"] == 4
+    assert cache["key-0"] == 0
+    assert cache.cache_stats.hits == 1
+    assert cache.cache_stats.misses == 1
+
+    with pytest.raises(KeyError):
+        cache["missing"]
+    assert cache.cache_stats.misses == 2
+
+    # Flushing writes back the dirty entries, but doesn't count as eviction.
+    cache.flush()
+    assert cache.cache_stats.evictions == 2
+    assert cache.cache_stats.writebacks == 5
+    assert len(cache) == 5
+
+    # The flushed entries stay cached, and are now clean.
+    assert sorted(cache) == [f"key-{i}" for i in range(5)]
+    assert cache["key-4"] == 4
+    assert cache.cache_stats.hits == 2
+    assert cache.cache_stats.writebacks == 5
+
+    cache.mark_dirty("key-4")
+    assert dict(cache.items_snapshot()) == {f"key-{i}": i for i in range(5)}
+    assert cache.cache_stats.writebacks == 6
+
+
+def test_file_dict_sql_query_modifications() -> None:
+    cache = FileBackedDict[int](extra_columns={"v": lambda v: v})
+    for i in range(5):
+        cache[f"key-{i}"] = i
+    # The entries stay cached after a flush.
+    assert sorted(cache) == [f"key-{i}" for i in range(5)]
+
+    cache.sql_query(f"DELETE FROM {cache.tablename} WHERE v < 2")
+
+    # Changes made by the query aren't hidden behind cached values.
+    assert len(cache) == 3
+    assert "key-0" not in cache
+    with pytest.raises(KeyError):
+        cache["key-1"]
+    assert cache["key-2"] == 2
+
+
+def test_file_dict_cache_max_bytes() -> None:
+    cache = FileBackedDict[str](
+        cache_max_size=100,
+        cache_eviction_batch_size=1,
+        cache_max_bytes=10_000,
+    )
+    for i in range(50):
+        cache[f"key-{i}"] = str(i) * 1000
+    cache.flush()
+
+    for i in range(50):
+        assert cache[f"key-{i}"] == str(i) * 1000
+        assert cache._active_object_cache.total_size <= 10_000
+    assert 1 < len(cache._active_object_cache) < 10
+    assert len(cache) == 50
+
+
 @pytest.mark.parametrize("use_sqlite_on_conflict", [True, False])
 def test_custom_serde(use_sqlite_on_conflict: bool) -> None:
     @dataclass(frozen=True)
@@ -381,6 +488,27 @@ def test_shared_connection(use_sqlite_on_conflict: bool) -> None:
         assert list(cur)[0][0] == 3
 
 
+def test_connection_lookups() -> None:
+    with ConnectionWrapper() as connection:
+        assert connection.fetchone("PRAGMA mmap_size")[0] > 0  # type: ignore
+
+        cache = FileBackedDict[int](shared_connection=connection, cache_max_size=1)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert connection.fetchone("SELECT key FROM data WHERE key = ?", ("a",)) == (
+            "a",
+        )
+        assert connection.fetchone("SELECT key FROM data WHERE key = ?", ("c",)) is None
+
+        # Lookups don't change the row type returned by other queries.
+        assert cache["a"] == 1
+        row = connection.execute(
+            "SELECT key FROM data WHERE key = ?", ("a",)
+        ).fetchone()
+        assert isinstance(row, sqlite3.Row)
+        assert row["key"] == "a"
+
+
 def test_file_list() -> None:
     my_list = FileBackedList[int](
         serializer=lambda x: x,
@@ -431,3 +559,17 @@ def test_file_cleanup():
     assert filename.exists()
     cache.close()
     assert not filename.exists()
+
+
+def test_file_dict_persistent_with_extra_columns(tmp_path: pathlib.Path) -> None:
+    filename = tmp_path / "persistent.db"
+    for run in range(2):
+        with ConnectionWrapper(filename=filename) as connection:
+            cache = FileBackedDict[int](
+                shared_connection=connection,
+                tablename="persisted",
+                extra_columns={"is_even": lambda v: v % 2 == 0},
+            )
+            cache[f"key-{run}"] = run
+            cache.flush()
+            assert sorted(cache.items()) == [(f"key-{i}", i) for i in range(run + 1)]
@@ -1,3 +1,8 @@
+import time
+from typing import Dict, Set
+
+import pytest
+
 from datahub.utilities.threaded_iterator_executor import ThreadedIteratorExecutor
 
 
@@ -12,3 +17,75 @@ def test_threaded_iterator_executor():
             table_of, [(i,) for i in range(1, 30)], max_workers=2
         )
     } == {x for i in range(1, 30) for x in table_of(i)}
+
+
+def test_threaded_iterator_executor_ordered():
+    def table_of(i):
+        for j in range(1, 11):
+            # Make later tasks finish first.
+            time.sleep(0.0002 * (30 - i))
+            yield f"{i}x{j}={i * j}"
+
+    assert list(
+        ThreadedIteratorExecutor.process_ordered(
+            table_of, [(i,) for i in range(1, 30)], max_workers=4
+        )
+    ) == [x for i in range(1, 30) for x in table_of(i)]
+
+
+def test_threaded_iterator_executor_ordered_error():
+    def worker(i):
+        yield i
+        if i == 2:
+            raise ValueError("worker failed")
+        yield i * 10
+
+    results = []
+    with pytest.raises(ValueError, match="worker failed"):
+        for item in ThreadedIteratorExecutor.process_ordered(
+            worker, [(i,) for i in range(1, 5)], max_workers=2
+        ):
+            results.append(item)
+    assert results == [1, 10, 2]
+
+
+def test_threaded_iterator_executor_ordered_backpressure():
+    produced: Dict[int, int] = {}
+    started: Set[int] = set()
+    first_task_snapshot: Dict[str, object] = {}
+
+    def worker(i):
+        started.add(i)
+        if i == 0:
+            # Wait for the other tasks to fill up their queues.
+            time.sleep(0.5)
+            first_task_snapshot["started"] = set(started)
+            first_task_snapshot["produced"] = dict(produced)
+        for j in range(100):
+            produced[i] = j + 1
+            yield (i, j)
+
+    results = list(
+        ThreadedIteratorExecutor.process_ordered(
+            worker, [(i,) for i in range(5)], max_workers=2, max_backpressure=3
+        )
+    )
+
+    assert results == [(i, j) for i in range(5) for j in range(100)]
+    # Only as many tasks as workers were started, and the second one stopped once
+    # its queue was full, while the first one was still running.
+    assert first_task_snapshot["started"] == {0, 1}
+    assert first_task_snapshot["produced"] == {1: 4}
+
+
+def test_threaded_iterator_executor_ordered_stop_early():
+    def worker(i):
+        yield from range(i * 1000, (i + 1) * 1000)
+
+    items = ThreadedIteratorExecutor.process_ordered(
+        worker, [(i,) for i in range(10)], max_workers=2, max_backpressure=2
+    )
+    assert next(items) == 0
+
+    # The workers blocked on their full queues give up, instead of hanging.
+    items.close()  # type: ignore[attr-defined]
@@ -0,0 +1,72 @@
+import gc
+
+import pytest
+
+from datahub.utilities.urn_set import UrnSet
+
+
+def _urn(i: int) -> str:
+    return f"urn:li:dataset:(urn:li:dataPlatform:hive,db.table_{i},PROD)"
+
+
+@pytest.mark.parametrize("max_in_memory_urns", [1_000, 10])
+def test_urn_set(max_in_memory_urns: int) -> None:
+    urns = [_urn(i) for i in reversed(range(100))]
+    urn_set = UrnSet(urns, max_in_memory_urns=max_in_memory_urns)
+    urn_set.add(_urn(50))
+
+    assert urn_set.is_spilled == (max_in_memory_urns < 100)
+    assert len(urn_set) == 100
+    assert _urn(50) in urn_set
+    assert _urn(100) not in urn_set
+    assert list(urn_set) == urns
+    assert list(urn_set.iter_sorted()) == sorted(urns)
+    urn_set.close()
+
+
+def test_urn_set_cleanup() -> None:
+    urn_set = UrnSet([_urn(i) for i in range(100)], max_in_memory_urns=10)
+    assert urn_set._conn is not None
+    filename = urn_set._conn.filename
+    assert filename.exists()
+
+    # A set that is never closed removes its database once it is garbage collected.
+    urn_set.self_reference = urn_set  # type: ignore[attr-defined]
+    del urn_set
+    gc.collect()
+    assert not filename.parent.exists()
+
+    closed_set = UrnSet([_urn(i) for i in range(100)], max_in_memory_urns=10)
+    closed_set.close()
+    assert not closed_set.is_spilled
+
+
+@pytest.mark.parametrize("spill_first", [False, True])
+@pytest.mark.parametrize("spill_second", [False, True])
+def test_urn_set_difference(spill_first: bool, spill_second: bool) -> None:
+    first = UrnSet(
+        [_urn(i) for i in range(0, 1200)],
+        max_in_memory_urns=10 if spill_first else 1_000_000,
+    )
+    second = UrnSet(
+        [_urn(i) for i in range(0, 1200, 3)],
+        max_in_memory_urns=10 if spill_second else 1_000_000,
+    )
+
+    expected = [_urn(i) for i in range(1200) if i % 3 != 0]
+    assert list(first.difference(second)) == expected
+    assert list(first.difference(second, sort=True)) == sorted(expected)
+    assert list(second.difference(first)) == []
+
+    assert first.count_contained(second) == 400
+    assert second.count_contained(_urn(i) for i in range(6)) == 2
+
+    first.close()
+    second.close()
+
+
+def test_urn_set_equality() -> None:
+    urns = [_urn(i) for i in range(100)]
+    assert UrnSet(urns) == UrnSet(reversed(urns), max_in_memory_urns=10)
+    assert UrnSet(urns) != UrnSet(urns[1:])
+    assert UrnSet(urns[1:] + [_urn(100)]) != UrnSet(urns)